@@ -1,7 +1,10 @@
 import os
+import re
 from datetime import datetime
+from urllib.parse import urlparse
 
 import allure
+import allure_commons
 import pytest
 from dotenv import load_dotenv
 from playwright.sync_api import Page
@@ -20,6 +23,17 @@ from locators.qube.elire_locators import ElireLocators
 from locators.vibe.arsenal_locators import ArsenalLocators
 from locators.wellcube.tranquil_locators import TranquilLocators
 from pages.base_page import BasePage
+from pages.core.auth_state import AuthStateStore
+from pages.core.wait_engine import WaitEngine
+from pages.core.web_vitals import WEB_VITALS_MODES, WebVitals
+from utils.api_client import attach_api_calls
+from utils.asset_cache import AssetCache
+from utils.context_pool import ContextPool
+from utils.metrics_file import get_metrics_path
+from utils.perf_history import PerfHistory
+from utils.request_blocker import RequestBlocker
+from utils.stand_in_server import StandInCatalog
+from utils.timings_db import TimingsDB, get_nodeid_browser
 
 # ==================== МОБИЛЬНЫЕ УСТРОЙСТВА ====================
 
@@ -41,10 +55,516 @@ MOBILE_DEVICES = {
 }
 
 
-def _create_environment_properties():
+# Браузеры, в которых Playwright умеет эмулировать мобильные устройства
+# (firefox не поддерживает is_mobile)
+MOBILE_BROWSERS = ("chromium", "webkit")
+
+
+# Режимы работы с сетью (--network-mode)
+NETWORK_MODES = ("live", "record", "replay")
+# Директория с HAR архивами тестов
+HAR_DIR = os.getenv("HAR_DIR", "hars")
+
+
+# ==================== МАТРИЦА БРАУЗЕРОВ И УСТРОЙСТВ ====================
+
+
+def pytest_addoption(parser):
+    """Опции матричного запуска и режима работы с сетью."""
+    group = parser.getgroup("matrix", "Матрица браузеров и устройств")
+    group.addoption(
+        "--matrix",
+        action="store_true",
+        default=False,
+        help="Параметризовать тесты по (браузер, устройство) в одном запуске",
+    )
+    group.addoption(
+        "--matrix-devices",
+        default=",".join(MOBILE_DEVICES),
+        help="Мобильные устройства матрицы через запятую (по умолчанию все)",
+    )
+
+    network = parser.getgroup("network", "Сеть")
+    network.addoption(
+        "--network-mode",
+        choices=NETWORK_MODES,
+        default=os.getenv("NETWORK_MODE", "live"),
+        help="live - живые хосты, record - запись HAR на тест, replay - ответы из HAR",
+    )
+    network.addoption(
+        "--asset-cache",
+        action="store_true",
+        default=os.getenv("ASSET_CACHE", "false").lower() == "true",
+        help="Отдавать статику из общего дискового кэша (ASSET_CACHE_DIR)",
+    )
+    network.addoption(
+        "--block-profile",
+        choices=("off", "on", "audit"),
+        default=os.getenv("BLOCK_PROFILE", "off"),
+        help="Блокировка аналитики/чатов/CDN шрифтов по профилю проекта "
+        "(audit - только учитывать и измерять объем)",
+    )
+
+    pool = parser.getgroup("context_pool", "Пул контекстов браузера")
+    pool.addoption(
+        "--context-pool",
+        type=int,
+        default=int(os.getenv("CONTEXT_POOL_SIZE", "0")),
+        help="Сколько теплых контекстов держать на (браузер, устройство, проект), "
+        "0 - новый контекст на каждый тест",
+    )
+    pool.addoption(
+        "--context-prewarm",
+        action="store_true",
+        default=os.getenv("CONTEXT_PREWARM", "false").lower() == "true",
+        help="Заранее открывать base URL проекта в свободных контекстах пула",
+    )
+
+    perf = parser.getgroup("web_vitals", "Метрики производительности")
+    perf.addoption(
+        "--web-vitals",
+        choices=WEB_VITALS_MODES,
+        default=os.getenv("WEB_VITALS", "off"),
+        help="open - Navigation Timing/LCP/CLS/long tasks после открытия страниц, "
+        "steps - дополнительно прирост за каждый allure.step (WEB_VITALS_FILE)",
+    )
+    perf.addoption(
+        "--perf-history",
+        action="store_true",
+        default=os.getenv("PERF_HISTORY", "false").lower() == "true",
+        help="Сохранить длительности тестов и web vitals прогона в PERF_HISTORY_DB",
+    )
+
+    bench = parser.getgroup("benchmark", "Бенчмарки (tests/perf)")
+    bench.addoption(
+        "--bench-iterations",
+        type=int,
+        default=int(os.getenv("BENCH_ITERATIONS", "5")),
+        help="Сколько раз повторять каждый замер",
+    )
+    bench.addoption(
+        "--bench-concurrency",
+        type=int,
+        default=int(os.getenv("BENCH_CONCURRENCY", "1")),
+        help="Сколько итераций выполнять одновременно (отдельные контексты)",
+    )
+
+
+def _is_matrix_run(config) -> bool:
+    """Проверить, что включен матричный режим."""
+    return config.getoption("matrix")
+
+
+def _is_mobile_test(path, rootpath) -> bool:
+    """Тесты из tests/ui/mobile - мобильные, остальные - десктопные."""
+    return "mobile" in path.relative_to(rootpath).parts
+
+
+def _get_matrix_devices(config) -> list:
+    """Мобильные устройства матрицы из --matrix-devices."""
+    devices = [
+        name.strip()
+        for name in config.getoption("matrix_devices").split(",")
+        if name.strip()
+    ]
+    unknown = [name for name in devices if name not in MOBILE_DEVICES]
+    if unknown:
+        raise pytest.UsageError(
+            f"Неизвестные устройства: {unknown}, доступны: {list(MOBILE_DEVICES)}"
+        )
+    return devices
+
+
+def pytest_generate_tests(metafunc):
+    """
+    В матричном режиме параметризуем тесты по устройству.
+
+    Ось браузеров дает pytest-playwright (--browser можно указать несколько раз),
+    ось устройств - MOBILE_DEVICES для мобильных тестов и desktop для остальных.
+    """
+    config = metafunc.config
+    if not _is_matrix_run(config) or "device_name" not in metafunc.fixturenames:
+        return
+
+    if _is_mobile_test(metafunc.definition.path, config.rootpath):
+        devices = _get_matrix_devices(config)
+    else:
+        devices = ["desktop"]
+    metafunc.parametrize("device_name", devices, scope="session")
+
+
+def _deselect_unsupported_mobile_browsers(config, items: list):
+    """Убрать мобильные тесты в браузерах без эмуляции мобильных устройств."""
+    selected, deselected = [], []
+    for item in items:
+        params = getattr(item, "callspec", None)
+        params = params.params if params else {}
+        if (
+            params.get("device_name", "desktop") != "desktop"
+            and params.get("browser_name", "chromium") not in MOBILE_BROWSERS
+        ):
+            deselected.append(item)
+        else:
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session")
+def device_name():
+    """
+    Устройство теста: desktop или ключ MOBILE_DEVICES.
+
+    Вне матрицы берется из MOBILE_DEVICE, в матрице фикстура параметризуется.
+    """
+    return os.getenv("MOBILE_DEVICE", "desktop")
+
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright):
+    """Запущенные браузеры по имени: запускаются по первому запросу и живут всю сессию."""
+    browsers = {}
+    yield browsers
+    for browser in browsers.values():
+        browser.close()
+
+
+def _get_pooled_browser(browser_pool: dict, browser_name: str, launch_browser):
+    """Взять браузер из пула, запустив его при первом обращении."""
+    if browser_name not in browser_pool:
+        browser_pool[browser_name] = launch_browser()
+    return browser_pool[browser_name]
+
+
+@pytest.fixture
+def browser(browser_pool, browser_name, launch_browser):
+    """
+    Браузер текущего теста из пула.
+
+    Переопределяет фикстуру pytest-playwright: при смене параметра browser_name
+    браузер не закрывается, а остается теплым до конца сессии.
+    """
+    return _get_pooled_browser(browser_pool, browser_name, launch_browser)
+
+
+# Статистика пула контекстов за прогон (в главном процессе - сумма по воркерам)
+_context_pool_stats = {}
+
+
+@pytest.fixture(scope="session")
+def context_pool(pytestconfig, network_mode, browser_pool):
+    """
+    Пул теплых контекстов (--context-pool N), None если выключен.
+
+    Работает только в live: record пишет HAR каждого теста в свой контекст.
+    С трейсингом и видео pytest-playwright тоже не используется - артефакты
+    пишутся только для контекстов, созданных через new_context.
+    Зависит от browser_pool, чтобы контексты закрылись раньше браузеров.
+    """
+    size = pytestconfig.getoption("context_pool")
+    if (
+        size <= 0
+        or network_mode != "live"
+        or pytestconfig.getoption("tracing") != "off"
+        or pytestconfig.getoption("video") != "off"
+    ):
+        yield None
+        return
+
+    pool = ContextPool(size, prewarm=pytestconfig.getoption("context_prewarm"))
+    yield pool
+    pool.close()
+
+    # Доля переиспользования - в итог прогона (с воркеров - через workeroutput)
+    if hasattr(pytestconfig, "workeroutput"):
+        pytestconfig.workeroutput["context_pool_stats"] = pool.stats
+    else:
+        ContextPool.merge_stats(_context_pool_stats, pool.stats)
+
+
+def _acquire_pooled_context(context_pool: ContextPool, request):
+    """Взять контекст из пула по ключу (браузер, устройство, проект теста)."""
+    browser = request.getfixturevalue("browser")
+    context_args = request.getfixturevalue("browser_context_args")
+    group = _get_project_group(request.node)
+    key = (
+        request.getfixturevalue("browser_name"),
+        request.getfixturevalue("device_name"),
+        group,
+    )
+    warm_url = _get_urls_by_environment().get(GROUP_URL_KEYS.get(group))
+    return context_pool.acquire(
+        key, lambda: browser.new_context(**context_args), warm_url=warm_url
+    )
+
+
+# ==================== АВТОРИЗАЦИЯ ЗАКРЫТЫХ ПРОЕКТОВ ====================
+
+
+def _login_elire(page: Page):
+    """Авторизоваться в Elire через форму на странице проекта."""
+    from pages.projects.qube.elire_page import ElirePage
+
+    elire_page = ElirePage(page, _get_urls_by_environment()["map"])
+    page.goto(elire_page.project_url_template.format(project="elire"))
+    elire_page.click_residences_button()
+    elire_page.handle_auth_modal_if_present()
+
+
+# Закрытые проекты: имя проекта (в имени файла теста) -> функция логина
+AUTH_LOGINS = {
+    "elire": _login_elire,
+}
+
+
+def _get_gated_project(item):
+    """
+    Закрытый проект теста, для которого нужна сохраненная авторизация.
+
+    Форма авторизации есть только на PROD и требует USERNAME_ELIRE/PASSWORD_ELIRE.
+    """
+    for project in AUTH_LOGINS:
+        if project in item.path.name and _is_auth_required(project):
+            return project
+    return None
+
+
+def _is_auth_required(project: str) -> bool:
+    """Нужна ли проекту сохраненная авторизация в текущем окружении."""
+    if project not in AUTH_LOGINS:
+        return False
+    if os.getenv("TEST_ENVIRONMENT", "dev") != "prod":
+        return False
+    return bool(os.getenv("USERNAME_ELIRE") and os.getenv("PASSWORD_ELIRE"))
+
+
+@pytest.fixture(scope="session")
+def auth_state_store(browser_pool, browser_name, launch_browser):
+    """Хранилище авторизаций закрытых проектов: один логин на воркер и браузер."""
+    return AuthStateStore(
+        _get_pooled_browser(browser_pool, browser_name, launch_browser),
+        browser_name,
+        AUTH_LOGINS,
+    )
+
+
+# ==================== ЗАПИСЬ И ВОСПРОИЗВЕДЕНИЕ СЕТИ (HAR) ====================
+
+
+def _get_har_path(item) -> str:
+    """
+    Путь к HAR архиву теста.
+
+    tests/ui/qube/test_x.py::test_y[chromium-map] ->
+    hars/tests/ui/qube/test_x/test_y[chromium-map].har.zip
+    """
+    module, _, name = item.nodeid.partition("::")
+    name = re.sub(r"[^\w.\[\]-]", "_", name)
+    return os.path.join(HAR_DIR, os.path.splitext(module)[0], f"{name}.har.zip")
+
+
+@pytest.fixture(scope="session")
+def network_mode(pytestconfig) -> str:
+    """Режим работы с сетью: live, record или replay."""
+    return pytestconfig.getoption("network_mode")
+
+
+# Статистика кэша статики за прогон (в главном процессе - сумма по воркерам)
+_asset_cache_stats = {}
+
+
+@pytest.fixture(scope="session")
+def asset_cache(pytestconfig, network_mode):
+    """
+    Дисковый кэш статики (--asset-cache), общий для всех контекстов и воркеров.
+
+    В replay не используется: там все ответы и так отдаются из HAR.
+    """
+    if not pytestconfig.getoption("asset_cache") or network_mode == "replay":
+        yield None
+        return
+
+    cache = AssetCache()
+    yield cache
+
+    # Воркер xdist передает статистику в главный процесс через workeroutput
+    if hasattr(pytestconfig, "workeroutput"):
+        pytestconfig.workeroutput["asset_cache_stats"] = cache.stats
+    else:
+        AssetCache.merge_stats(_asset_cache_stats, cache.stats)
+
+
+# ==================== БЛОКИРОВКА НЕОБЯЗАТЕЛЬНЫХ ЗАПРОСОВ ====================
+
+# Аналитика, пиксели, чаты и шрифты с CDN - функциональным тестам не нужны.
+# Блокировщик срабатывает раньше кэша статики, поэтому с --block-profile=on
+# шрифты не попадают и в кэш (AssetCache.HOST_RULES)
+BLOCKLIST_COMMON = [
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+    r"googleadservices\.com",
+    r"hotjar\.(com|io)",
+    r"clarity\.ms",
+    r"fonts\.googleapis\.com",
+    r"fonts\.gstatic\.com",
+    r"use\.typekit\.net",
+]
+
+# Никогда не блокируем карты: без них не загрузится MapComponent
+ALLOWLIST_COMMON = [
+    r"maps\.googleapis\.com/maps/(api|vt)",
+    r"maps\.gstatic\.com",
+    r"api-maps\.yandex\.ru",
+]
+
+# Профиль по умолчанию: международные пиксели и чаты (qube, capstone, wellcube,
+# vibe, abra, msg используют одни и те же сервисы)
+BLOCK_PROFILE_DEFAULT = {
+    "block": [
+        r"connect\.facebook\.net",
+        r"facebook\.com/tr",
+        r"snap\.licdn\.com",
+        r"analytics\.tiktok\.com",
+        r"widget\.intercom\.io",
+        r"embed\.tawk\.to",
+    ],
+    "allow": [],
+}
+# Группы проектов (tests/ui/[mobile/]<группа>), чей профиль отличается от
+# профиля по умолчанию: российские счетчики и чаты LSR
+BLOCK_PROFILES = {
+    "lsr": {
+        "block": [
+            r"mc\.yandex\.(ru|com)",
+            r"top-fwz1\.mail\.ru",
+            r"vk\.com/rtrg",
+            r"code\.jivo(site)?\.(ru|com)",
+            r"mod\.calltouch\.ru",
+            r"callibri\.ru",
+        ],
+        "allow": [],
+    },
+}
+
+# Итог блокировки по тестам: nodeid -> {"requests": N, "bytes": N}
+_blocked_requests = {}
+
+
+def _create_request_blocker(config, item):
+    """Создать блокировщик по профилю проекта теста (None, если выключено)."""
+    mode = config.getoption("block_profile")
+    if mode == "off":
+        return None
+    profile = BLOCK_PROFILES.get(_get_project_group(item), BLOCK_PROFILE_DEFAULT)
+    return RequestBlocker(
+        block=BLOCKLIST_COMMON + profile.get("block", []),
+        allow=ALLOWLIST_COMMON + profile.get("allow", []),
+        audit=mode == "audit",
+    )
+
+
+@pytest.fixture
+def context(new_context, network_mode, asset_cache, context_pool, request):
+    """
+    Контекст браузера с учетом --network-mode, --asset-cache и --block-profile.
+
+    Для закрытых проектов (AUTH_LOGINS) подставляется сохраненная авторизация.
+    С --context-pool контекст берется из пула и возвращается в него после теста
+    (кроме закрытых проектов и тестов с маркером browser_context_args).
+
+    record - весь трафик теста пишется в HAR (сохраняется при закрытии контекста),
+    replay - ответы отдаются из HAR, запросы вне архива обрываются, сеть не нужна.
+    Service workers блокируются, иначе их запросы идут мимо записи и роутинга.
+    """
+    har_path = _get_har_path(request.node)
+    pooled = False
+
+    # Закрытые проекты открываются уже авторизованными
+    context_kwargs = {}
+    gated_project = _get_gated_project(request.node)
+    if gated_project and network_mode != "replay":
+        storage_state = request.getfixturevalue("auth_state_store").get_state(
+            gated_project
+        )
+        if storage_state:
+            context_kwargs["storage_state"] = storage_state
+
+    if network_mode == "replay":
+        if not os.path.exists(har_path):
+            pytest.skip(
+                f"HAR не записан: {har_path} (запустите с --network-mode=record)"
+            )
+        context = new_context(service_workers="block")
+        context.route_from_har(har_path, not_found="abort")
+    elif network_mode == "record":
+        os.makedirs(os.path.dirname(har_path), exist_ok=True)
+        context = new_context(
+            record_har_path=har_path,
+            record_har_mode="full",
+            service_workers="block",
+            **context_kwargs,
+        )
+    elif (
+        context_pool
+        and not context_kwargs
+        and not request.node.get_closest_marker("browser_context_args")
+    ):
+        pooled = True
+        context = _acquire_pooled_context(context_pool, request)
+    else:
+        context = new_context(**context_kwargs)
+
+    if "storage_state" in context_kwargs:
+        AuthStateStore.register(context, context_kwargs["storage_state"])
+
+    if asset_cache:
+        asset_cache.attach(context)
+
+    # Блокировщик подключается последним, чтобы срабатывать раньше кэша и HAR
+    blocker = _create_request_blocker(request.config, request.node)
+    if blocker:
+        blocker.attach(context)
+
+    yield context
+
+    if blocker:
+        allure.attach(
+            blocker.format_report(),
+            name="Blocked requests",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        # user_properties попадают в отчет teardown и доходят до главного процесса xdist
+        request.node.user_properties.append(("blocked_requests", blocker.get_summary()))
+
+    if pooled:
+        if blocker:
+            blocker.detach(context)
+        page = context_pool.get_page(context)
+        if page:
+            # Журнал ожиданий привязан к странице, а страница переживет тест
+            WaitEngine.for_page(page).records.clear()
+        context_pool.release(context)
+
+
+@pytest.fixture
+def page(context, context_pool):
+    """
+    Страница теста.
+
+    Переопределяет фикстуру pytest-playwright: для контекста из пула
+    отдается его уже открытая (прогретая) страница.
+    """
+    pooled_page = context_pool.get_page(context) if context_pool else None
+    return pooled_page or context.new_page()
+
+
+def _create_environment_properties(device: str = None):
     """Создает файл environment.properties для Allure отчета"""
     env = os.getenv("TEST_ENVIRONMENT", "dev")
-    device = os.getenv("MOBILE_DEVICE", "desktop")
+    device = device or os.getenv("MOBILE_DEVICE", "desktop")
 
     # Создаем директорию для результатов если её нет
     os.makedirs("reports/allure-results", exist_ok=True)
@@ -71,24 +591,36 @@ def _create_environment_properties():
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_environment():
+def setup_environment(pytestconfig):
     """Фикстура для настройки окружения перед запуском тестов"""
-    _create_environment_properties()
+    device = None
+    if _is_matrix_run(pytestconfig):
+        device = "matrix: desktop, " + ", ".join(_get_matrix_devices(pytestconfig))
+    _create_environment_properties(device)
     return _get_urls_by_environment()
 
 
 @pytest.fixture(autouse=True)
-def setup_test_parameters(page: Page, request):
+def setup_test_parameters(page: Page, request, device_name, monkeypatch):
     """Устанавливает параметры OS для каждого теста и делает скриншот при падении."""
     # Устанавливаем параметры OS для Allure
     os_name = os.getenv("OS_NAME", "Unknown")
     os_platform = os.getenv("OS_PLATFORM", "Unknown")
-    device = os.getenv("MOBILE_DEVICE", "desktop")
+    device = device_name
+
+    # Страницы определяют мобильную верстку по MOBILE_DEVICE,
+    # в матрице устройство меняется от теста к тесту
+    if _is_matrix_run(request.config):
+        monkeypatch.setenv("MOBILE_DEVICE", device)
 
     allure.dynamic.parameter("Operating System", os_name)
     allure.dynamic.parameter("Platform", os_platform)
     allure.dynamic.parameter("Device", device)
 
+    # Замеры шагов привязываются к странице текущего теста
+    vitals = WebVitals.for_page(page)
+    _web_vitals_steps.vitals = vitals
+
     # Добавляем информацию об устройстве в Allure
     if device != "desktop":
         allure.dynamic.label("device", device)
@@ -101,6 +633,13 @@ def setup_test_parameters(page: Page, request):
 
     yield
 
+    # Прикрепляем журнал фактических длительностей ожиданий
+    WaitEngine.for_page(page).attach_report()
+    _web_vitals_steps.vitals = None
+    vitals.attach_report()
+    # Журнал API запросов теста - одним вложением
+    attach_api_calls()
+
     if request.node.rep_call.failed:
         # Создаем директорию для скриншотов если её нет
         os.makedirs("reports/screenshots", exist_ok=True)
@@ -125,9 +664,9 @@ def setup_test_parameters(page: Page, request):
 
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
+def browser_context_args(browser_context_args, device_name):
     """Настройки контекста браузера с поддержкой мобильных устройств."""
-    device = os.getenv("MOBILE_DEVICE", "desktop")
+    device = device_name
 
     # Если указано мобильное устройство, используем его настройки
     if device != "desktop" and device in MOBILE_DEVICES:
@@ -173,6 +712,20 @@ def browser_type_launch_args(browser_type):
     return {"headless": headless, "args": args}
 
 
+@pytest.fixture
+def bench_config(
+    pytestconfig, browser_name, browser_type_launch_args, browser_context_args
+) -> dict:
+    """Параметры utils.benchmark.run_iterations для браузера и устройства теста."""
+    return {
+        "iterations": pytestconfig.getoption("bench_iterations"),
+        "concurrency": pytestconfig.getoption("bench_concurrency"),
+        "browser_name": browser_name,
+        "launch_args": browser_type_launch_args,
+        "context_args": browser_context_args,
+    }
+
+
 @pytest.fixture(scope="session")
 def base_url():
     """Base URL в зависимости от окружения"""
@@ -187,6 +740,38 @@ def fake():
     return Faker(["ru_RU", "en_US"])
 
 
+@pytest.fixture(scope="session")
+def stand_in_catalog():
+    """
+    Локальная подмена каталога на всю сессию (utils.stand_in_server).
+
+    Задержка ответов - STAND_IN_LATENCY_MS, разброс - STAND_IN_JITTER_MS,
+    seed разброса - STAND_IN_SEED.
+    """
+    seed = os.getenv("STAND_IN_SEED")
+    with StandInCatalog(
+        latency_ms=int(os.getenv("STAND_IN_LATENCY_MS", "0")),
+        jitter_ms=int(os.getenv("STAND_IN_JITTER_MS", "0")),
+        seed=int(seed) if seed else None,
+    ) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def stand_in(stand_in_catalog, monkeypatch):
+    """
+    Направить URL Qube проектов теста на подмену каталога (офлайн прогон).
+
+    Задержку можно поменять на время теста (stand_in.latency_ms = 200),
+    после теста она возвращается к значениям сессии.
+    """
+    for name, value in stand_in_catalog.environ().items():
+        monkeypatch.setenv(name, value)
+    latency_ms, jitter_ms = stand_in_catalog.latency_ms, stand_in_catalog.jitter_ms
+    yield stand_in_catalog
+    stand_in_catalog.latency_ms, stand_in_catalog.jitter_ms = latency_ms, jitter_ms
+
+
 # Фикстуры по типам страниц
 @pytest.fixture
 def map_page(page: Page, request):
@@ -222,6 +807,267 @@ def pytest_runtest_makereport(item, call):
         item.rep_call = call
 
 
+# ==================== ПАРАЛЛЕЛЬНЫЙ ЗАПУСК ====================
+
+# Группа проектов (директория в tests/ui) -> ключ URL в _get_urls_by_environment()
+GROUP_URL_KEYS = {
+    "qube": "map",
+    "capstone": "capstone_map",
+    "wellcube": "wellcube_map",
+    "lsr": "lsr_mark",
+    "vibe": "vibe_arsenal",
+    "abra": "abra_willows_residences",
+    "msg": "msg_edgewater",
+}
+
+
+def _is_parallel_run(config) -> bool:
+    """Проверить, что тесты запущены через pytest-xdist (-n N)."""
+    return hasattr(config, "workerinput") or bool(
+        getattr(config.option, "numprocesses", None)
+    )
+
+
+def _get_project_group(item) -> str:
+    """Определить группу проекта по пути теста: tests/ui/[mobile/]<группа>/..."""
+    return _get_nodeid_group(item.nodeid)
+
+
+def _get_nodeid_group(nodeid: str) -> str:
+    """Группа проекта по nodeid (контроллер xdist не собирает items)."""
+    for part in nodeid.split("::")[0].split("/"):
+        if part in GROUP_URL_KEYS:
+            return part
+    return "unknown"
+
+
+def _get_test_host(nodeid: str, urls: dict) -> str:
+    """Определить хост каталога, в который ходит тест."""
+    url_key = GROUP_URL_KEYS.get(_get_nodeid_group(nodeid))
+    if not url_key:
+        return "unknown"
+    return urlparse(urls[url_key]).netloc
+
+
+def _spread_items_by_host(items: list) -> list:
+    """
+    Перемешать тесты так, чтобы тесты одного хоста были равномерно
+    распределены по всей очереди.
+
+    xdist (--dist load) раздает тесты воркерам по порядку очереди, поэтому
+    одновременно выполняются соседние тесты - и они попадают на разные хосты
+    (qube, catalog.evometa.io, catalog-ru...). Порядок детерминирован, что
+    обязательно для xdist: все воркеры должны собрать одинаковый список.
+
+    Args:
+        items: Собранные тесты
+
+    Returns:
+        list: Тесты в новом порядке
+    """
+    urls = _get_urls_by_environment()
+    groups = {}
+    for item in items:
+        groups.setdefault(_get_test_host(item.nodeid, urls), []).append(item)
+
+    # Позиция j-го теста из группы размера n - (j + 0.5) / n
+    keyed = []
+    for host, group in groups.items():
+        for index, item in enumerate(group):
+            keyed.append(((index + 0.5) / len(group), host, item))
+    keyed.sort(key=lambda entry: (entry[0], entry[1]))
+    return [item for _, _, item in keyed]
+
+
+def pytest_collection_modifyitems(config, items):
+    """При параллельном запуске разносим тесты одного хоста по очереди."""
+    if _is_matrix_run(config):
+        _deselect_unsupported_mobile_browsers(config, items)
+    if _is_parallel_run(config):
+        items[:] = _spread_items_by_host(items)
+
+
+# ==================== WEB VITALS ====================
+
+
+class _WebVitalsStepListener:
+    """Замеры web vitals вокруг каждого allure.step (--web-vitals=steps)."""
+
+    def __init__(self):
+        self.vitals = None
+        self._steps = {}
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        if self.vitals is None:
+            return
+        state = self.vitals.start_step(title)
+        if state:
+            state["depth"] = len(self._steps)
+            self._steps[uuid] = state
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        state = self._steps.pop(uuid, None)
+        if state and self.vitals is not None:
+            self.vitals.stop_step(state, state["depth"], failed=exc_type is not None)
+
+
+_web_vitals_steps = _WebVitalsStepListener()
+
+
+# ==================== ИСТОРИЯ ДЛИТЕЛЬНОСТЕЙ ====================
+
+# База длительностей (только в главном процессе, воркеры xdist ее не пишут)
+_timings_db = None
+# Накопленная длительность фаз текущих тестов: nodeid -> сек
+_timings_pending = {}
+# Замеры прогона для истории производительности (--perf-history)
+_perf_records = []
+# Размер WEB_VITALS_FILE на старте сессии: в историю идут только новые строки
+_web_vitals_offset = None
+
+
+def _get_test_device(nodeid: str) -> str:
+    """Устройство теста: из параметров nodeid (матрица) или из MOBILE_DEVICE."""
+    if "[" in nodeid:
+        params = nodeid[nodeid.index("[") + 1 : -1].split("-")
+        for name in ["desktop", *MOBILE_DEVICES]:
+            if name in params:
+                return name
+    return os.getenv("MOBILE_DEVICE", "desktop")
+
+
+def pytest_configure(config):
+    """Загружаем базу длительностей в главном процессе и включаем web vitals."""
+    global _timings_db, _web_vitals_offset
+    if not hasattr(config, "workerinput"):
+        _timings_db = TimingsDB()
+        if config.getoption("perf_history"):
+            path = get_metrics_path()
+            _web_vitals_offset = os.path.getsize(path) if os.path.exists(path) else 0
+
+    # Страницы читают режим из окружения (как MOBILE_DEVICE)
+    mode = config.getoption("web_vitals")
+    os.environ["WEB_VITALS"] = mode
+    if mode == "steps":
+        allure_commons.plugin_manager.register(_web_vitals_steps)
+
+
+def pytest_runtest_logreport(report):
+    """Суммируем setup + call + teardown и записываем в базу после teardown."""
+    if report.when == "teardown":
+        for name, value in report.user_properties:
+            if name == "blocked_requests":
+                _blocked_requests[report.nodeid] = value
+
+    if _timings_db is None:
+        return
+    nodeid = report.nodeid
+    _timings_pending[nodeid] = _timings_pending.get(nodeid, 0.0) + report.duration
+    if report.when == "teardown":
+        duration = _timings_pending.pop(nodeid)
+        browser, device = get_nodeid_browser(nodeid), _get_test_device(nodeid)
+        _timings_db.record(nodeid, browser, device, duration)
+        if _web_vitals_offset is not None:
+            _perf_records.append(
+                {
+                    "kind": "test",
+                    "name": "test",
+                    "test": nodeid,
+                    "browser": browser,
+                    "device": device,
+                    "duration_ms": round(duration * 1000, 1),
+                }
+            )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Сохраняем базу длительностей и историю метрик, ужимаем кэш статики."""
+    if _timings_db is not None and _timings_db.data:
+        _timings_db.save()
+
+    if _web_vitals_offset is not None:
+        history = PerfHistory()
+        run_id = history.start_run(label="pytest")
+        count = history.add_records(run_id, _perf_records)
+        count += history.import_jsonl(
+            run_id,
+            get_metrics_path(),
+            offset=_web_vitals_offset,
+        )
+        history.close()
+        print(f"\n📈 История производительности: прогон {run_id}, {count} значений")
+
+    # Вытеснение делает только главный процесс, чтобы воркеры не удаляли блобы наперегонки
+    config = session.config
+    if config.getoption("asset_cache") and not hasattr(config, "workerinput"):
+        AssetCache().evict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Собираем статистику кэша статики и пула контекстов с воркеров xdist."""
+    workeroutput = getattr(node, "workeroutput", {})
+    stats = workeroutput.get("asset_cache_stats")
+    if stats:
+        AssetCache.merge_stats(_asset_cache_stats, stats)
+    stats = workeroutput.get("context_pool_stats")
+    if stats:
+        ContextPool.merge_stats(_context_pool_stats, stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Итог кэша статики, пула контекстов и блокировки запросов."""
+    if _asset_cache_stats:
+        terminalreporter.write_sep("-", "Кэш статики")
+        terminalreporter.write_line(AssetCache.format_stats(_asset_cache_stats))
+
+    if _context_pool_stats:
+        terminalreporter.write_sep("-", "Пул контекстов")
+        terminalreporter.write_line(ContextPool.format_stats(_context_pool_stats))
+
+    if _blocked_requests:
+        audit = config.getoption("block_profile") == "audit"
+        title = "совпало с профилем (audit)" if audit else "заблокировано"
+        terminalreporter.write_sep("-", f"Блокировка запросов: {title}")
+        ranked = sorted(
+            _blocked_requests.items(), key=lambda entry: -entry[1]["requests"]
+        )
+        for nodeid, summary in ranked:
+            size = f", {summary['bytes'] / 1024:.1f} КБ" if audit else ""
+            terminalreporter.write_line(f"{summary['requests']:>5}{size}  {nodeid}")
+
+        total_requests = sum(s["requests"] for s in _blocked_requests.values())
+        total_bytes = sum(s["bytes"] for s in _blocked_requests.values())
+        total_size = f", {total_bytes / 1024 / 1024:.1f} МБ" if audit else ""
+        terminalreporter.write_line(f"Итого: {total_requests} запросов{total_size}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """
+    При --dist load и наличии истории раздаем тесты по убыванию длительности.
+
+    Без истории возвращаем None - xdist использует стандартный планировщик.
+    Тесты одного хоста чередуются, как в _spread_items_by_host.
+    """
+    if config.getvalue("dist") != "load" or not (_timings_db and _timings_db.data):
+        return None
+
+    from utils.duration_scheduler import DurationScheduling
+
+    urls = _get_urls_by_environment()
+    return DurationScheduling(
+        config,
+        log,
+        estimate=lambda nodeid: _timings_db.estimate(
+            nodeid, get_nodeid_browser(nodeid), _get_test_device(nodeid)
+        ),
+        host=lambda nodeid: _get_test_host(nodeid, urls),
+    )
+
+
 def _get_urls_by_environment() -> dict:
     """Получить все URL-ы для текущего окружения"""
     env = os.getenv("TEST_ENVIRONMENT", "dev")
@@ -392,9 +1238,13 @@ def _get_mobile_base_url(route_type: str = "map", project_type: str = "qube") ->
 
 
 @pytest.fixture(scope="function")
-def mobile_device_info():
+def mobile_device_info(device_name):
     """Фикстура для получения информации о текущем мобильном устройстве."""
-    device = os.getenv("MOBILE_DEVICE", "iphone_13")
+    device = (
+        device_name
+        if device_name in MOBILE_DEVICES
+        else os.getenv("MOBILE_DEVICE", "iphone_13")
+    )
     config = get_mobile_device_config(device)
 
     return {
@@ -0,0 +1,140 @@
+"""Асинхронная базовая страница."""
+
+from playwright.async_api import Page
+
+from locators.base_locators import BaseLocators
+from locators.map_locators import MapLocators
+from pages.aio.components.amenities_component import AsyncAmenitiesComponent
+from pages.aio.components.map_component import AsyncMapComponent
+from pages.aio.core.assertions import AsyncAssertions
+from pages.aio.core.browser_actions import AsyncBrowserActions
+from pages.base_page import BasePage
+
+
+class AsyncBasePage:
+    """
+    Асинхронный аналог BasePage для сценариев с несколькими страницами сразу.
+
+    Ответственность:
+    - Инициализация Page объекта (async API)
+    - Композиция асинхронных компонентов
+    - Базовая навигация
+
+    Локаторы и построение URL проектов общие с BasePage.
+    """
+
+    DEFAULT_TIMEOUT = BasePage.DEFAULT_TIMEOUT
+    PROJECT_URL_KEYS = BasePage.PROJECT_URL_KEYS
+    ROUTE_URL_KEYS = BasePage.ROUTE_URL_KEYS
+    PROJECT_URL_SLUGS = BasePage.PROJECT_URL_SLUGS
+
+    # Построение URL не обращается к странице - берем реализацию BasePage
+    get_project_url = BasePage.get_project_url
+    _get_project_root_url = BasePage._get_project_root_url
+
+    def __init__(self, page: Page, base_url: str = None, locators_class: type = None):
+        """
+        Инициализация базовой страницы.
+
+        Args:
+            page: Playwright Page объект (async API)
+            base_url: Базовый URL приложения
+            locators_class: Класс локаторов проекта
+        """
+        self.page = page
+        self.base_url = base_url
+
+        self.map_locators = MapLocators()
+        self.project_locators = locators_class() if locators_class else BaseLocators()
+
+        if base_url and "/map" in base_url:
+            self.project_url_template = base_url.replace(
+                "/map", "/project/{project}/area"
+            )
+            self.map_url = base_url
+            self.has_map = True
+        else:
+            self.has_map = False
+
+        self.browser = AsyncBrowserActions(page)
+        self.assertions = AsyncAssertions(page)
+
+        if self.has_map:
+            self.map = AsyncMapComponent(page, self.project_locators)
+
+        self.amenities = AsyncAmenitiesComponent(page, self.project_locators)
+
+    async def open(self, path: str = "", route_type: str = None):
+        """
+        Открыть страницу.
+
+        Args:
+            path: Дополнительный путь к базовому URL
+            route_type: Тип роута - "client", "agent" или "map"
+        """
+        url = self.base_url
+        if route_type in ["agent", "client"] and self.has_map and "/map" in url:
+            url = url.replace("/map", f"/{route_type}/map")
+        if path:
+            url = f"{url.rstrip('/')}/{path.lstrip('/')}"
+
+        await self._goto(url)
+
+        if route_type and self.has_map:
+            self.assertions.assert_that(
+                route_type in self.page.url,
+                f"Не открылась страница {route_type}. URL: {self.page.url}",
+            )
+
+    async def goto_project(
+        self,
+        project: str,
+        page_type: str = "area",
+        building: str = None,
+        floor: str = None,
+        apartment: str = None,
+        route_type: str = None,
+    ) -> str:
+        """
+        Открыть страницу проекта напрямую по URL, минуя карту и Explore.
+
+        Args:
+            project: Название проекта (arisha, elire, mark, willows_residences...)
+            page_type: Тип страницы (area, catalog_2d)
+            building: Здание
+            floor: Этаж (нужен building)
+            apartment: Идентификатор апартамента
+            route_type: Роут - "map" (по умолчанию), "agent" или "client"
+
+        Returns:
+            str: URL после перехода
+        """
+        url = self.get_project_url(
+            project, page_type, building, floor, apartment, route_type
+        )
+        await self._goto(url)
+
+        slug = self.PROJECT_URL_SLUGS.get(project.lower(), project.lower())
+        self.assertions.assert_url_contains(
+            f"/project/{slug}", f"Не открылась страница проекта {project}"
+        )
+        return self.page.url
+
+    async def return_to_map(self):
+        """Вернуться на карту через кнопку навигации."""
+        button = await self.browser.resolve_visible(
+            self.project_locators.NAV_MAP_BUTTON, timeout=20000
+        )
+        if button is None:
+            raise AssertionError("Кнопка возврата на карту не отображается за 20000ms.")
+        await button.click()
+        await self.browser.wait_for_dom_stable(quiet_ms=300, timeout=2000)
+
+    async def _goto(self, url: str):
+        """Перейти по URL и дождаться загрузки."""
+        await self.page.goto(url)
+        await self.page.wait_for_load_state("domcontentloaded")
+
+        # Принудительно сбрасываем масштаб страницы
+        await self.page.evaluate("document.body.style.zoom = '1'")
+        await self.page.evaluate("document.documentElement.style.zoom = '1'")
@@ -0,0 +1,122 @@
+"""Асинхронный компонент для работы с Explore Amenities."""
+
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.aio.core.browser_actions import AsyncBrowserActions
+
+
+class AsyncAmenitiesComponent:
+    """
+    Асинхронный аналог AmenitiesComponent.
+
+    Ответственность:
+    - Открытие модального окна amenities
+    - Навигация по слайдеру
+    - Проверки отображения
+    """
+
+    def __init__(self, page: Page, project_locators):
+        """
+        Инициализация компонента amenities.
+
+        Args:
+            page: Playwright Page объект (async API)
+            project_locators: Локаторы проекта
+        """
+        self.page = page
+        self.locators = project_locators
+        self.browser = AsyncBrowserActions(page)
+
+    async def click_explore_button(self):
+        """Открыть модальное окно Explore Amenities."""
+        button = await self.browser.resolve_visible(
+            self.locators.EXPLORE_AMENITIES_BUTTON, timeout=20000
+        )
+        if button is None:
+            raise AssertionError("Кнопка Explore Amenities не отображается за 20000ms.")
+        await button.click()
+
+    async def verify_modal_displayed(self):
+        """Проверить отображение модального окна."""
+        modal = self.page.locator(self.locators.AMENITIES_MODAL)
+        try:
+            await modal.wait_for(state="visible", timeout=20000)
+        except PlaywrightTimeoutError:
+            raise AssertionError("Модальное окно amenities не появилось за 20000ms.")
+        assert await modal.is_visible(), "Модальное окно amenities не отображается"
+
+    async def verify_modal_title(self):
+        """Проверить наличие заголовка модального окна."""
+        modal = self.page.locator(self.locators.AMENITIES_MODAL)
+        await modal.wait_for(state="visible", timeout=20000)
+
+        headings = modal.locator("h1, h2, h3, h4, h5, h6")
+        if await headings.count() > 0:
+            first_heading = headings.first
+            await first_heading.wait_for(state="visible", timeout=20000)
+            assert (
+                await first_heading.is_visible()
+            ), "Заголовок модального окна не найден"
+            return
+
+        text = (await modal.inner_text(timeout=20000) or "").strip()
+        assert text, "Модалка amenities пустая (нет текста/заголовка)"
+
+    async def verify_modal_close_button(self):
+        """Проверить наличие кнопки закрытия."""
+        close_button = self.page.locator(self.locators.AMENITIES_MODAL_CLOSE_BUTTON)
+        await close_button.wait_for(state="visible", timeout=20000)
+        assert await close_button.is_visible(), "Кнопка закрытия не найдена"
+
+    async def verify_slider_displayed(self):
+        """Проверить отображение слайдера."""
+        slider = self.page.locator(self.locators.AMENITIES_SLIDER)
+        await slider.wait_for(state="visible", timeout=20000)
+        assert await slider.is_visible(), "Слайдер amenities не отображается"
+
+    async def verify_slider_images(self) -> int:
+        """Проверить наличие изображений в слайдере."""
+        count = await self.page.locator(self.locators.AMENITIES_SLIDER_IMAGES).count()
+        assert count > 0, "Изображения в слайдере amenities не найдены"
+        return count
+
+    async def verify_slider_indicators(self) -> int:
+        """Проверить наличие индикаторов слайдера."""
+        indicators = self.page.locator(self.locators.AMENITIES_SLIDER_INDICATORS)
+        count = await indicators.count()
+        assert count > 0, "Индикаторы слайдера amenities не найдены"
+        return count
+
+    async def navigate_slider(self, direction: str, count: int = 1):
+        """
+        Навигация по слайдеру.
+
+        Args:
+            direction: Направление ("next" или "prev")
+            count: Количество кликов
+        """
+        if direction == "next":
+            selector = self.locators.AMENITIES_SLIDER_NEXT_BUTTON
+        else:
+            selector = self.locators.AMENITIES_SLIDER_PREV_BUTTON
+
+        button = self.page.locator(selector)
+        for _ in range(count):
+            await button.click()
+            await self.browser.wait_for_animations(
+                self.locators.AMENITIES_SLIDER, timeout=800
+            )
+
+    async def close_modal(self):
+        """Закрыть модальное окно."""
+        close_button = self.page.locator(self.locators.AMENITIES_MODAL_CLOSE_BUTTON)
+        await close_button.click()
+
+        modal = self.page.locator(self.locators.AMENITIES_MODAL)
+        await modal.wait_for(state="hidden", timeout=5000)
+
+    async def verify_modal_closed(self):
+        """Проверить что модальное окно закрыто."""
+        modal = self.page.locator(self.locators.AMENITIES_MODAL)
+        await modal.wait_for(state="hidden", timeout=5000)
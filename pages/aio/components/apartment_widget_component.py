@@ -0,0 +1,157 @@
+"""Асинхронный компонент для работы с виджетом апартамента."""
+
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.aio.core.browser_actions import AsyncBrowserActions
+from pages.components.apartment_widget_component import (
+    _WIDGET_READY_JS,
+    ApartmentWidgetComponent,
+    to_page_timeline,
+)
+from utils.logger import get_logger
+
+
+class AsyncApartmentWidgetComponent:
+    """
+    Асинхронный аналог ApartmentWidgetComponent.
+
+    Ответственность:
+    - Загрузка виджета
+    - Переключение режимов 2D/3D
+    - Проверки отображения
+    """
+
+    def __init__(self, page: Page, project_locators, project_name: str = "arisha"):
+        """
+        Инициализация компонента виджета.
+
+        Args:
+            page: Playwright Page объект (async API)
+            project_locators: Локаторы проекта
+            project_name: Название проекта (для получения специфичных локаторов)
+        """
+        self.page = page
+        self.project_name = project_name
+        self.browser = AsyncBrowserActions(page)
+        self.locators = getattr(project_locators, "ApartmentWidget", None)
+
+    # Селекторы не зависят от API Playwright - общие с sync версией
+    get_widget_selector = ApartmentWidgetComponent.get_widget_selector
+    get_control_selectors = ApartmentWidgetComponent.get_control_selectors
+    RECOGNIZE_TIMEOUT = ApartmentWidgetComponent.RECOGNIZE_TIMEOUT
+
+    def get_widget_frame(self):
+        """Получить frame_locator для виджета апартамента."""
+        return self.page.frame_locator(self.get_widget_selector())
+
+    async def wait_for_widget_load(self):
+        """Ожидать готовности виджета (см. ApartmentWidgetComponent)."""
+        readiness = await self.probe_readiness(recognize_timeout=self.RECOGNIZE_TIMEOUT)
+        if readiness["ready"]:
+            return
+
+        get_logger("ApartmentWidget").warning(
+            f"Проба готовности виджета {self.project_name} не дождалась: {readiness}"
+        )
+        body = self.get_widget_frame().locator("body")
+        await self.browser.wait_for_network_idle("widget", idle_ms=300, timeout=2000)
+        await self.browser.wait_for_dom_stable(body, quiet_ms=500, timeout=2000)
+
+    async def probe_readiness(
+        self, timeout: int = 20000, recognize_timeout: int = None
+    ) -> dict:
+        """
+        Замерить готовность виджета (см. ApartmentWidgetComponent.probe_readiness).
+
+        Returns:
+            dict: ready, recognized, scene, frame_attach_ms, first_paint_ms,
+                interactive_ms
+        """
+        await self.page.wait_for_selector(self.get_widget_selector(), timeout=timeout)
+        body = self.get_widget_frame().locator("body")
+        await body.wait_for(state="visible", timeout=timeout)
+
+        probe = await body.evaluate(
+            _WIDGET_READY_JS,
+            [self.get_control_selectors(), 100, timeout, recognize_timeout or 0],
+        )
+        return to_page_timeline(
+            probe, await self.page.evaluate("performance.timeOrigin")
+        )
+
+    async def switch_to_2d_mode(self):
+        """Переключиться в режим 2D."""
+        self._check_locators()
+        frame_locator = self.get_widget_frame()
+
+        view_2d_button = frame_locator.locator(self.locators.VIEW_2D_BUTTON)
+        try:
+            await view_2d_button.wait_for(state="visible", timeout=15000)
+        except PlaywrightTimeoutError:
+            raise AssertionError(
+                "Кнопка переключения в режим 2D не найдена за 15000ms."
+            )
+
+        if "active" in (await view_2d_button.get_attribute("class") or ""):
+            return
+
+        await view_2d_button.click()
+        await self.browser.wait_for_class(view_2d_button, "active", timeout=3000)
+
+        # В MARK стрелки появляются только в 3D, в Arisha - с задержкой
+        if self.project_name not in ["mark", "arisha"]:
+            next_arrow = frame_locator.locator(self.locators.NEXT_ARROW).first
+            await next_arrow.wait_for(state="visible", timeout=20000)
+
+    async def switch_to_3d_mode(self):
+        """Переключиться в режим 3D."""
+        self._check_locators()
+        view_3d_button = self.get_widget_frame().locator(self.locators.VIEW_3D_BUTTON)
+        await view_3d_button.wait_for(state="visible", timeout=15000)
+
+        if "active" in (await view_3d_button.get_attribute("class") or ""):
+            return
+
+        await view_3d_button.click()
+        await self.browser.wait_for_class(view_3d_button, "active", timeout=3000)
+
+    async def check_mode_button_active(self, mode: str) -> bool:
+        """
+        Проверить, что кнопка режима активна.
+
+        Args:
+            mode: Режим ('2D' или '3D')
+
+        Returns:
+            bool: True если кнопка активна
+        """
+        if not self.locators:
+            return False
+
+        if mode == "2D":
+            selector = self.locators.VIEW_2D_BUTTON
+        elif mode == "3D":
+            selector = self.locators.VIEW_3D_BUTTON
+        else:
+            raise ValueError(f"Неизвестный режим: {mode}")
+
+        button = self.get_widget_frame().locator(selector)
+        button_class = await button.get_attribute("class")
+        return "active" in button_class if button_class else False
+
+    async def take_widget_screenshot(self) -> bytes:
+        """
+        Сделать скриншот виджета.
+
+        Returns:
+            bytes: Скриншот в формате PNG
+        """
+        return await self.page.locator("iframe").screenshot()
+
+    def _check_locators(self):
+        """Проверить, что для проекта есть локаторы виджета."""
+        if not self.locators:
+            raise ValueError(
+                f"Локаторы виджета не найдены для проекта {self.project_name}"
+            )
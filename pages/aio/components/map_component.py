@@ -0,0 +1,167 @@
+"""Асинхронный компонент для работы с картой."""
+
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from locators.map_locators import MapLocators
+from pages.aio.core.browser_actions import AsyncBrowserActions
+from pages.components.map_component import _MAP_LOAD_PROBE_JS, MapComponent
+
+
+class AsyncMapComponent:
+    """
+    Асинхронный аналог MapComponent.
+
+    Ответственность:
+    - Загрузка карты
+    - Клик по проектам на карте
+    - Навигация к проектам
+
+    Селекторы проектов и кнопок Explore берутся из MapComponent.
+    """
+
+    MAP_LOAD_TIMEOUT = MapComponent.MAP_LOAD_TIMEOUT
+
+    # Выбор селекторов не зависит от API Playwright - общий с sync версией
+    _get_project_selector = MapComponent._get_project_selector
+    _get_explore_button_selector = MapComponent._get_explore_button_selector
+
+    def __init__(self, page: Page, project_locators):
+        """
+        Инициализация компонента карты.
+
+        Args:
+            page: Playwright Page объект (async API)
+            project_locators: Локаторы проекта
+        """
+        self.page = page
+        self.project_locators = project_locators
+        self.locators = MapLocators()
+        self.browser = AsyncBrowserActions(page)
+
+    async def wait_for_map_loaded(self):
+        """Ожидать загрузки карты и проектов."""
+        try:
+            await self.page.wait_for_selector(
+                self.locators.MAP_CONTAINER,
+                state="visible",
+                timeout=self.MAP_LOAD_TIMEOUT,
+            )
+            await self.page.wait_for_selector(
+                self.locators.ALL_PROJECTS_SELECTOR,
+                state="visible",
+                timeout=self.MAP_LOAD_TIMEOUT,
+            )
+            await self.browser.wait_for_dom_stable(
+                self.locators.MAP_CONTAINER, quiet_ms=300, timeout=2000
+            )
+        except Exception as e:
+            print(f"Ошибка при ожидании загрузки карты: {e}")
+
+    async def measure_load(
+        self, marker_selector: str = None, quiet_ms: int = 1000, timeout: int = None
+    ) -> dict:
+        """
+        Замерить этапы загрузки карты (см. MapComponent.measure_load).
+
+        Args:
+            marker_selector: Маркеры проектов (по умолчанию ALL_PROJECTS_SELECTOR)
+            quiet_ms: Сколько число маркеров не должно меняться
+            timeout: Максимальное время замера (по умолчанию MAP_LOAD_TIMEOUT)
+
+        Returns:
+            dict: Времена этапов в мс от начала навигации и число маркеров
+        """
+        return await self.page.evaluate(
+            _MAP_LOAD_PROBE_JS,
+            [
+                self.locators.MAP_CONTAINER,
+                marker_selector or self.locators.ALL_PROJECTS_SELECTOR,
+                quiet_ms,
+                timeout or self.MAP_LOAD_TIMEOUT,
+            ],
+        )
+
+    async def check_map_loaded(self):
+        """Проверить что карта загружена."""
+        element = self.page.locator(self.locators.MAP_CONTAINER)
+        try:
+            await element.wait_for(state="visible", timeout=self.MAP_LOAD_TIMEOUT)
+        except PlaywrightTimeoutError:
+            raise AssertionError(f"Карта не загружена за {self.MAP_LOAD_TIMEOUT}ms.")
+        assert await element.is_visible(), "Карта не загружена"
+
+    async def click_project(self, project_name: str):
+        """
+        Кликнуть по проекту на карте.
+
+        Args:
+            project_name: Название проекта (arisha, elire, etc.)
+        """
+        selector = self._get_project_selector(project_name)
+        try:
+            await self.page.wait_for_selector(selector, state="visible", timeout=20000)
+        except PlaywrightTimeoutError:
+            raise AssertionError(
+                f"Проект '{project_name}' не найден на карте за 20000ms."
+            )
+
+        # Для изображений Peylaa и маркеров Edgewater нужен force клик (как в sync)
+        if project_name.lower() == "peylaa" and "img" in selector:
+            await self.page.locator(selector).click(force=True)
+        elif project_name.lower() == "edgewater":
+            await self.page.locator(selector).first.click(force=True)
+        else:
+            await self.page.locator(selector).click()
+
+    async def click_explore_project(self, project_name: str):
+        """
+        Кликнуть на кнопку Explore Project.
+
+        Args:
+            project_name: Название проекта
+        """
+        button_selector = self._get_explore_button_selector(project_name)
+
+        try:
+            await self.page.wait_for_selector(
+                self.locators.PROJECT_INFO_WINDOW, state="visible", timeout=5000
+            )
+        except PlaywrightTimeoutError:
+            pass
+
+        button = self.page.locator(button_selector)
+        try:
+            await button.wait_for(state="visible", timeout=20000)
+        except PlaywrightTimeoutError:
+            raise AssertionError(
+                f"Кнопка Explore Project для {project_name} не найдена за 20000ms."
+            )
+
+        assert (
+            await button.is_enabled()
+        ), f"Кнопка Explore Project заблокирована для {project_name} - баг в UI"
+
+        await button.click()
+
+        try:
+            await self.page.wait_for_url(
+                self.project_locators.PROJECT_URL_PATTERN,
+                wait_until="domcontentloaded",
+                timeout=20000,
+            )
+        except PlaywrightTimeoutError:
+            raise AssertionError(
+                f"Не перешли на страницу проекта {project_name} за 20000ms. Текущий URL: {self.page.url}"
+            )
+
+    async def navigate_to_project(self, project_name: str):
+        """
+        Полная навигация: загрузка карты -> клик на проект -> Explore.
+
+        Args:
+            project_name: Название проекта
+        """
+        await self.wait_for_map_loaded()
+        await self.click_project(project_name)
+        await self.click_explore_project(project_name)
@@ -0,0 +1,79 @@
+"""Асинхронный поиск доступных апартаментов одним запросом в страницу."""
+
+from typing import List
+
+from playwright.async_api import Locator, Page
+
+from pages.core.apartment_scanner import _SCAN_JS, ApartmentScanner
+
+
+class AsyncApartmentScanner:
+    """
+    Асинхронный аналог ApartmentScanner.
+
+    Ответственность:
+    - Тот же скан (_SCAN_JS) с теми же аргументами и режимами замка
+    - Клик по метке скана
+
+    Шаги и вложения Allure не создаются: параллельные корутины
+    перемешали бы их вложенность.
+    """
+
+    LOCK_SELECTOR = ApartmentScanner.LOCK_SELECTOR
+    SCAN_ATTR = ApartmentScanner.SCAN_ATTR
+    CATALOG_SCAN = ApartmentScanner.CATALOG_SCAN
+
+    find_available = staticmethod(ApartmentScanner.find_available)
+
+    def __init__(self, page: Page):
+        """
+        Инициализация.
+
+        Args:
+            page: Playwright Page объект (async API)
+        """
+        self.page = page
+
+    async def scan(
+        self,
+        selector: str,
+        lock_mode: str = "inside",
+        limit: int = None,
+        click_closest: str = None,
+        nearby_px: int = 300,
+        lock_selector: str = None,
+    ) -> List[dict]:
+        """
+        Просканировать апартаменты за один round trip.
+
+        Args:
+            Те же, что у ApartmentScanner.scan()
+
+        Returns:
+            List[dict]: index, scan_id, id, href, text, visible, locked, box
+        """
+        return await self.page.evaluate(
+            _SCAN_JS,
+            ApartmentScanner.scan_args(
+                selector, lock_mode, limit, click_closest, nearby_px, lock_selector
+            ),
+        )
+
+    def locator(self, apartment: dict) -> Locator:
+        """Locator апартамента по метке скана."""
+        return self.page.locator(ApartmentScanner.target_selector(apartment))
+
+    async def click(self, apartment: dict, js_click: bool = False, **kwargs):
+        """
+        Кликнуть по апартаменту, найденному сканом.
+
+        Args:
+            apartment: Запись из scan()
+            js_click: Кликнуть через element.click() в странице
+            **kwargs: Параметры Locator.click() (timeout...)
+        """
+        target = self.locator(apartment)
+        if js_click:
+            await target.evaluate("(el) => el.click()")
+        else:
+            await target.click(**kwargs)
@@ -0,0 +1,348 @@
+"""Асинхронные обёртки над Playwright API (playwright.async_api)."""
+
+import asyncio
+import re
+import time
+import weakref
+from collections import deque
+from typing import Optional, Union
+
+from playwright.async_api import Locator, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import expect
+
+from pages.core.browser_actions import _FIRST_VISIBLE_JS
+from pages.core.wait_engine import (
+    _ANIMATIONS_DONE_JS,
+    _DOM_QUIET_JS,
+    WaitEngine,
+    _is_wait_timeout,
+)
+
+
+class AsyncBrowserActions:
+    """
+    Асинхронный аналог BrowserActions.
+
+    Ответственность:
+    - Обёртки над Playwright методами async API
+    - Унифицированная обработка ошибок (как в sync версии)
+    - Событийные ожидания (те же JS условия, что и в WaitEngine)
+
+    Позволяет одному процессу вести несколько страниц одновременно через
+    asyncio.gather. Журнал длительностей ожиданий не ведется.
+    """
+
+    DEFAULT_TIMEOUT = 20000
+    WAIT_TIMEOUT = WaitEngine.DEFAULT_TIMEOUT
+    POLL_INTERVAL_MS = WaitEngine.POLL_INTERVAL_MS
+
+    # Page -> (запросы в полете, завершенные запросы) для wait_for_network_idle
+    _network = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page):
+        """
+        Инициализация.
+
+        Args:
+            page: Playwright Page объект (async API)
+        """
+        self.page = page
+        # Подписка на события сети для wait_for_network_idle (одна на страницу)
+        self._get_network()
+
+    async def wait_for_element(self, selector: str, timeout: int = None) -> Locator:
+        """
+        Ожидать появления элемента.
+
+        Args:
+            selector: CSS селектор элемента
+            timeout: Таймаут ожидания (мс)
+
+        Returns:
+            Locator объект
+
+        Raises:
+            AssertionError: Если элемент не найден
+        """
+        if timeout is None:
+            timeout = self.DEFAULT_TIMEOUT
+
+        locator = await self.resolve_visible(selector, timeout)
+        if locator is None:
+            raise AssertionError(f"Элемент '{selector}' не найден за {timeout}ms.")
+        return locator
+
+    async def resolve_visible(
+        self, selector: str, timeout: int = None
+    ) -> Optional[Locator]:
+        """
+        Найти первый видимый элемент селектора одним запросом в страницу.
+
+        Args:
+            selector: Селектор элемента (любой синтаксис Playwright)
+            timeout: Сколько ждать появления видимого элемента (мс), None - не ждать
+
+        Returns:
+            Optional[Locator]: Locator первого видимого элемента или None
+        """
+        locator = self.page.locator(selector)
+        if timeout:
+            try:
+                await locator.filter(visible=True).first.wait_for(
+                    state="visible", timeout=timeout
+                )
+            except PlaywrightTimeoutError:
+                return None
+
+        index = await locator.evaluate_all(_FIRST_VISIBLE_JS)
+        if index < 0:
+            return None
+        return locator.nth(index)
+
+    async def click(self, selector: str, timeout: int = None, **kwargs):
+        """
+        Кликнуть по элементу.
+
+        Args:
+            selector: CSS селектор элемента
+            timeout: Таймаут ожидания
+            **kwargs: Дополнительные параметры для click()
+        """
+        element = await self.wait_for_element(selector, timeout)
+        assert await element.is_enabled(), f"Элемент {selector} неактивен - баг в UI"
+        await element.click(**kwargs)
+
+    async def fill(self, selector: str, text: str, timeout: int = None):
+        """
+        Заполнить поле ввода.
+
+        Args:
+            selector: CSS селектор поля
+            text: Текст для ввода
+            timeout: Таймаут ожидания
+        """
+        element = await self.wait_for_element(selector, timeout)
+        await element.fill(text)
+
+    async def get_text(self, selector: str, timeout: int = None) -> str:
+        """
+        Получить текст элемента.
+
+        Args:
+            selector: CSS селектор элемента
+            timeout: Таймаут ожидания
+
+        Returns:
+            Текстовое содержимое элемента
+        """
+        element = await self.wait_for_element(selector, timeout)
+        return await element.text_content()
+
+    async def is_visible(self, selector: str, timeout: int = None) -> bool:
+        """
+        Проверить видимость элемента.
+
+        Args:
+            selector: CSS селектор элемента
+            timeout: Таймаут ожидания
+
+        Returns:
+            True если элемент виден, иначе False
+        """
+        try:
+            await self.wait_for_element(selector, timeout)
+            return True
+        except AssertionError:
+            return False
+
+    async def expect_visible(self, selector: str, timeout: int = None):
+        """
+        Ожидать видимости элемента.
+
+        Args:
+            selector: CSS селектор
+            timeout: Таймаут ожидания
+        """
+        element = await self.wait_for_element(selector, timeout)
+        assert (
+            await element.is_visible()
+        ), f"Элемент {selector} не отображается - баг в UI"
+
+    async def get_element_count(self, selector: str) -> int:
+        """
+        Получить количество элементов.
+
+        Args:
+            selector: CSS селектор
+
+        Returns:
+            Количество найденных элементов
+        """
+        return await self.page.locator(selector).count()
+
+    async def wait_for_dom_stable(
+        self, scope=None, quiet_ms: int = None, timeout: int = None
+    ) -> bool:
+        """
+        Ожидать затишья DOM вместо фиксированной паузы.
+
+        Args:
+            scope: Селектор или Locator поддерева (по умолчанию весь документ)
+            quiet_ms: Сколько мс без мутаций считать затишьем
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если затишье наступило, False по таймауту
+        """
+        quiet_ms = WaitEngine.DEFAULT_QUIET_MS if quiet_ms is None else quiet_ms
+        timeout = self.WAIT_TIMEOUT if timeout is None else timeout
+        try:
+            if scope is None:
+                return await self.page.evaluate(
+                    f"(args) => ({_DOM_QUIET_JS})(document.documentElement, args)",
+                    [quiet_ms, timeout],
+                )
+            return await self._locator(scope).evaluate(
+                _DOM_QUIET_JS, [quiet_ms, timeout], timeout=timeout
+            )
+        except Exception as e:
+            if not _is_wait_timeout(e):
+                raise
+            return False
+
+    async def wait_for_animations(self, scope=None, timeout: int = None) -> bool:
+        """
+        Ожидать окончания CSS анимаций/transition.
+
+        Args:
+            scope: Селектор или Locator поддерева (по умолчанию весь документ)
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если анимации завершились, False по таймауту
+        """
+        timeout = self.WAIT_TIMEOUT if timeout is None else timeout
+        try:
+            if scope is None:
+                return await self.page.evaluate(
+                    f"(t) => ({_ANIMATIONS_DONE_JS})(document.documentElement, t)",
+                    timeout,
+                )
+            return await self._locator(scope).evaluate(
+                _ANIMATIONS_DONE_JS, timeout, timeout=timeout
+            )
+        except Exception as e:
+            if not _is_wait_timeout(e):
+                raise
+            return False
+
+    async def wait_for_network_idle(
+        self, request_set=None, idle_ms: int = None, timeout: int = None
+    ) -> bool:
+        """
+        Ожидать простоя сети для именованного набора запросов.
+
+        Запросы учитываются с момента создания первого AsyncBrowserActions
+        для страницы (события request*).
+
+        Args:
+            request_set: Имя набора из WaitEngine.REQUEST_SETS или список подстрок URL
+            idle_ms: Сколько мс без активности считать простоем
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если сеть затихла, False по таймауту
+        """
+        idle_ms = WaitEngine.DEFAULT_IDLE_MS if idle_ms is None else idle_ms
+        timeout = self.WAIT_TIMEOUT if timeout is None else timeout
+        if isinstance(request_set, str):
+            patterns = WaitEngine.REQUEST_SETS[request_set]
+        else:
+            patterns = tuple(request_set) if request_set else None
+
+        def matches(url: str) -> bool:
+            return patterns is None or any(p in url for p in patterns)
+
+        inflight, finished = self._get_network()
+        deadline = time.monotonic() + timeout / 1000
+        while time.monotonic() < deadline:
+            now = time.monotonic()
+            busy = any(matches(url) for url in inflight.values())
+            last = max((ts for ts, url in finished if matches(url)), default=0)
+            if not busy and (now - last) * 1000 >= idle_ms:
+                return True
+            await asyncio.sleep(self.POLL_INTERVAL_MS / 1000)
+        return False
+
+    async def wait_for_class(
+        self, target, class_name: str, present: bool = True, timeout: int = None
+    ) -> bool:
+        """
+        Ожидать появления/исчезновения CSS класса (например, active).
+
+        Args:
+            target: Селектор или Locator
+            class_name: Имя класса
+            present: True - ждать появления, False - исчезновения
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если условие выполнено, False по таймауту
+        """
+        timeout = self.WAIT_TIMEOUT if timeout is None else timeout
+        pattern = re.compile(rf"(^|\s){re.escape(class_name)}(\s|$)")
+        assertion = expect(self._locator(target).first)
+        try:
+            if present:
+                await assertion.to_have_class(pattern, timeout=timeout)
+            else:
+                await assertion.not_to_have_class(pattern, timeout=timeout)
+            return True
+        except AssertionError:
+            return False
+
+    async def wait_for_state(
+        self, target, state: str = "visible", timeout: int = None
+    ) -> bool:
+        """
+        Мягко ожидать состояния элемента (без исключения по таймауту).
+
+        Args:
+            target: Селектор или Locator
+            state: visible, hidden, attached или detached
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если состояние достигнуто, False по таймауту
+        """
+        timeout = self.WAIT_TIMEOUT if timeout is None else timeout
+        try:
+            await self._locator(target).first.wait_for(state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    def _locator(self, target: Union[str, Locator]) -> Locator:
+        """Привести селектор к Locator."""
+        if isinstance(target, str):
+            return self.page.locator(target)
+        return target
+
+    def _get_network(self) -> tuple:
+        """Трекинг сетевой активности страницы (подписка при первом вызове)."""
+        network = self._network.get(self.page)
+        if network is None:
+            inflight, finished = {}, deque(maxlen=500)
+
+            def on_done(request):
+                url = inflight.pop(request, request.url)
+                finished.append((time.monotonic(), url))
+
+            self.page.on(
+                "request", lambda request: inflight.__setitem__(request, request.url)
+            )
+            self.page.on("requestfinished", on_done)
+            self.page.on("requestfailed", on_done)
+            network = self._network[self.page] = (inflight, finished)
+        return network
@@ -0,0 +1,99 @@
+"""Запуск асинхронных сценариев на нескольких страницах одновременно."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict
+
+from playwright.async_api import Page, async_playwright
+
+Scenario = Callable[[Page], Awaitable]
+
+
+async def run_on_pages(
+    scenarios: Dict[str, Scenario],
+    browser_name: str = "chromium",
+    launch_args: dict = None,
+    context_args: dict = None,
+    concurrency: int = None,
+) -> Dict[str, dict]:
+    """
+    Выполнить сценарии параллельно: каждый в своем контексте одного браузера.
+
+    Пример - amenities всех проектов разом:
+
+        async def check_amenities(page, project, locators_class):
+            base = AsyncBasePage(page, urls["map"], locators_class)
+            await base.goto_project(project)
+            await base.amenities.click_explore_button()
+            await base.amenities.verify_modal_displayed()
+
+        results = run_scenarios({
+            name: partial(check_amenities, project=name, locators_class=cls)
+            for name, cls in PROJECTS.items()
+        })
+
+    Args:
+        scenarios: Имя -> корутина-функция, принимающая Page
+        browser_name: chromium, firefox или webkit
+        launch_args: Параметры запуска браузера
+        context_args: Параметры контекста (viewport, устройство...)
+        concurrency: Сколько сценариев выполнять одновременно (по умолчанию все)
+
+    Returns:
+        Dict[str, dict]: Имя -> {"ok", "result", "error", "duration"}
+    """
+    semaphore = asyncio.Semaphore(concurrency or max(len(scenarios), 1))
+
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch(**(launch_args or {}))
+
+        async def run(name: str, scenario: Scenario):
+            async with semaphore:
+                started = time.perf_counter()
+                context = await browser.new_context(**(context_args or {}))
+                try:
+                    result = await scenario(await context.new_page())
+                    outcome = {"ok": True, "result": result, "error": None}
+                except Exception as e:
+                    outcome = {"ok": False, "result": None, "error": e}
+                finally:
+                    await context.close()
+                outcome["duration"] = round(time.perf_counter() - started, 2)
+                return name, outcome
+
+        try:
+            results = await asyncio.gather(
+                *(run(name, scenario) for name, scenario in scenarios.items())
+            )
+        finally:
+            await browser.close()
+
+    return dict(results)
+
+
+def run_scenarios(scenarios: Dict[str, Scenario], **kwargs) -> Dict[str, dict]:
+    """
+    Синхронная обертка над run_on_pages для вызова из обычных тестов.
+
+    Event loop запускается в отдельном потоке: в основном потоке уже
+    работает sync Playwright из pytest-playwright.
+
+    Args:
+        scenarios: Имя -> корутина-функция, принимающая Page
+        **kwargs: Параметры run_on_pages
+
+    Returns:
+        Dict[str, dict]: Результаты run_on_pages
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_on_pages(scenarios, **kwargs)).result()
+
+
+def format_results(results: Dict[str, dict]) -> str:
+    """Таблица результатов для вложения в Allure."""
+    lines = []
+    for name, outcome in results.items():
+        status = "ok" if outcome["ok"] else f"FAIL: {outcome['error']}"
+        lines.append(f"{name:<22} {outcome['duration']:>7.2f}s  {status}")
+    return "\n".join(lines)
@@ -1,13 +1,18 @@
 """Базовая страница - минимальная ответственность."""
 
+import allure
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from locators.base_locators import BaseLocators
 from locators.map_locators import MapLocators
 from pages.components.amenities_component import AmenitiesComponent
 from pages.components.map_component import MapComponent
+from pages.components.navigation_component import NavigationComponent
 from pages.core.assertions import Assertions
+from pages.core.auth_state import AuthStateStore
 from pages.core.browser_actions import BrowserActions
+from pages.core.web_vitals import WebVitals
 
 
 class BasePage:
@@ -26,6 +31,31 @@ class BasePage:
     SHORT_TIMEOUT = 5000
     MAP_LOAD_TIMEOUT = 20000
 
+    # Проект -> ключ URL окружения в _get_urls_by_environment()
+    PROJECT_URL_KEYS = {
+        "arisha": "map",
+        "cubix": "map",
+        "elire": "map",
+        "peylaa": "capstone_map",
+        "tranquil": "wellcube_map",
+        "mark": "lsr_mark",
+        "arsenal": "vibe_arsenal",
+        "willows_residences": "abra_willows_residences",
+        "edgewater": "msg_edgewater",
+    }
+
+    # Ключ URL роута agent/client для ключа проекта (AGENT_/CLIENT_ переменные).
+    # Для остальных проектов роут добавляется к корню каталога: {root}/agent
+    ROUTE_URL_KEYS = {
+        "map": {"agent": "agent", "client": "client"},
+    }
+
+    # Slug проекта в URL, если он отличается от PROJECT_NAME
+    PROJECT_URL_SLUGS = {
+        "willows_residences": "willows-residences",
+        "edgewater": "edgewater-residences-3",
+    }
+
     def __init__(self, page: Page, base_url: str = None, locators_class: type = None):
         """
         Инициализация базовой страницы.
@@ -58,6 +88,7 @@ class BasePage:
         # Композиция компонентов
         self.browser = BrowserActions(page)
         self.assertions = Assertions(page)
+        self.vitals = WebVitals.for_page(page)
 
         # MapComponent создаем только если есть /map роут
         if self.has_map:
@@ -88,12 +119,8 @@ class BasePage:
         if path:
             url = f"{url.rstrip('/')}/{path.lstrip('/')}"
 
-        self.page.goto(url)
-        self.wait_for_page_load()
-
-        # Принудительно сбрасываем масштаб страницы
-        self.page.evaluate("document.body.style.zoom = '1'")
-        self.page.evaluate("document.documentElement.style.zoom = '1'")
+        self._goto(url)
+        self.measure_page_load("open", route_type)
 
         current_url = self.get_current_url()
 
@@ -104,6 +131,47 @@ class BasePage:
                 f"Не открылась страница {route_type}. URL: {current_url}",
             )
 
+    def _goto(self, url: str):
+        """Перейти по URL и дождаться загрузки."""
+        self.page.goto(url)
+        self.wait_for_page_load()
+
+        # Принудительно сбрасываем масштаб страницы
+        self.page.evaluate("document.body.style.zoom = '1'")
+        self.page.evaluate("document.documentElement.style.zoom = '1'")
+
+    def measure_page_load(
+        self, name: str, route_type: str = None, project: str = None
+    ) -> dict:
+        """
+        Снять метрики загрузки страницы (при WEB_VITALS=open/steps).
+
+        Args:
+            name: Имя замера
+            route_type: Тип роута - "map", "agent" или "client"
+            project: Проект (по умолчанию PROJECT_NAME локаторов)
+
+        Returns:
+            dict: Замер или None, если сбор выключен
+        """
+        return self.vitals.measure(
+            name,
+            project=project or getattr(self.project_locators, "PROJECT_NAME", "map"),
+            route_type=route_type or "map",
+        )
+
+    def get_downloads_dir(self) -> str:
+        """
+        Получить директорию для скачанных файлов.
+
+        При параллельном запуске (pytest-xdist) у каждого воркера своя
+        поддиректория, чтобы cleanup одного теста не удалял файлы другого.
+        """
+        import os
+
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        return os.path.join("downloads", worker) if worker else "downloads"
+
     def get_current_url(self) -> str:
         """Получить текущий URL."""
         return self.page.url
@@ -115,76 +183,180 @@ class BasePage:
     def return_to_map(self):
         """Вернуться на карту через кнопку навигации."""
         # Ищем видимую кнопку, т.к. на некоторых страницах (Cubix) может быть несколько элементов с этим локатором
-        map_buttons = self.page.locator(self.project_locators.NAV_MAP_BUTTON)
-        button_count = map_buttons.count()
-
-        # Пробуем найти видимую кнопку
-        visible_button = None
-        for i in range(button_count):
-            button = map_buttons.nth(i)
-            try:
-                if button.is_visible(timeout=1000):
-                    visible_button = button
-                    break
-            except Exception:
-                continue
-
-        # Если видимая не найдена, используем последнюю (для обратной совместимости)
+        visible_button = self.browser.resolve_visible(
+            self.project_locators.NAV_MAP_BUTTON, timeout=20000
+        )
         if visible_button is None:
-            visible_button = map_buttons.last
-
-        # Ждем видимости и кликаем
-        visible_button.wait_for(state="visible", timeout=20000)
+            raise AssertionError("Кнопка возврата на карту не отображается за 20000ms.")
         visible_button.click()
-        self.page.wait_for_timeout(2000)
-
-    def get_project_url(self, project_name: str, page_type: str = "catalog_2d"):
+        self.browser.wait_for_dom_stable(quiet_ms=300, timeout=2000)
+
+    def get_project_url(
+        self,
+        project_name: str,
+        page_type: str = "catalog_2d",
+        building: str = None,
+        floor: str = None,
+        apartment: str = None,
+        route_type: str = None,
+    ) -> str:
         """
         Получить URL для конкретного проекта и типа страницы.
 
+        Самый конкретный из building/floor/apartment определяет страницу:
+        apartment -> /apartment/{apartment}, floor -> /floor/{building}/{floor},
+        building -> /building/{building}. Иначе используется page_type.
+
         Args:
-            project_name: Название проекта
+            project_name: Название проекта (PROJECT_NAME локаторов)
             page_type: Тип страницы (catalog_2d, area, map)
+            building: Здание (1, mark-k1...)
+            floor: Этаж (нужен building)
+            apartment: Идентификатор апартамента
+            route_type: Роут - "map" (по умолчанию), "agent" или "client"
 
         Returns:
             str: URL для проекта
         """
-        from conftest import _get_urls_by_environment
-
-        urls = _get_urls_by_environment()
         project_name_lower = project_name.lower()
+        root_url = self._get_project_root_url(project_name_lower, route_type)
+
+        if page_type == "map" and not (building or floor or apartment):
+            return f"{root_url}/map"
+
+        slug = self.PROJECT_URL_SLUGS.get(project_name_lower, project_name_lower)
+        project_url = f"{root_url}/project/{slug}"
+
+        if apartment:
+            return f"{project_url}/apartment/{apartment}"
+        if floor:
+            if not building:
+                raise ValueError("Для перехода на этаж нужно указать здание")
+            return f"{project_url}/floor/{building}/{floor}"
+        if building:
+            return f"{project_url}/building/{building}"
+        if page_type in ("catalog_2d", "area"):
+            return f"{project_url}/{page_type}"
+        raise ValueError(f"Неизвестный тип страницы: {page_type}")
+
+    def goto_project(
+        self,
+        project: str,
+        page_type: str = "area",
+        building: str = None,
+        floor: str = None,
+        apartment: str = None,
+        route_type: str = None,
+    ) -> str:
+        """
+        Открыть страницу проекта напрямую по URL, минуя карту и Explore.
+
+        Полный путь через карту (open + map.navigate_to_project) нужен только
+        тестам самой карты - остальным достаточно сразу оказаться на странице.
+
+        Args:
+            project: Название проекта (arisha, elire, mark, willows_residences...)
+            page_type: Тип страницы (area, catalog_2d)
+            building: Здание
+            floor: Этаж (нужен building)
+            apartment: Идентификатор апартамента
+            route_type: Роут - "map" (по умолчанию), "agent" или "client"
+
+        Returns:
+            str: URL после перехода
+        """
+        url = self.get_project_url(
+            project, page_type, building, floor, apartment, route_type
+        )
+        with allure.step(f"Открываем страницу проекта {project.upper()}: {url}"):
+            self._goto(url)
+            self.measure_page_load("goto_project", route_type, project.lower())
+
+            slug = self.PROJECT_URL_SLUGS.get(project.lower(), project.lower())
+            self.assertions.assert_url_contains(
+                f"/project/{slug}",
+                f"Не открылась страница проекта {project}",
+            )
+            return self.get_current_url()
+
+    def open_available_apartment(self, project: str, route_type: str = None) -> str:
+        """
+        Открыть доступный апартамент проекта.
+
+        Апартамент берется из AvailableUnitsProvider (API каталога или
+        инвентарь обхода) и открывается прямой ссылкой. Если источник ничего
+        не знает или ссылка увела со страницы апартамента - открывается
+        каталог All units и апартамент ищется в UI, как раньше.
+
+        Args:
+            project: Название проекта
+            route_type: Роут - "map" (по умолчанию), "agent" или "client"
+
+        Returns:
+            str: Идентификатор апартамента (из провайдера) или текст
+                выбранного в каталоге апартамента
+        """
+        from utils.units_provider import AvailableUnitsProvider
+
+        provider = AvailableUnitsProvider.shared()
+        unit = provider.get_available_unit(project)
+        if unit:
+            self.goto_project(project, apartment=unit, route_type=route_type)
+            if f"/apartment/{unit}" in self.get_current_url():
+                return unit
+            provider.invalidate(project, unit)
+
+        with allure.step(f"Ищем доступный апартамент {project} в каталоге"):
+            self.goto_project(project, page_type="catalog_2d", route_type=route_type)
+            if hasattr(self, "find_and_click_available_apartment"):
+                # Мобильная версия ищет апартамент в своей верстке каталога
+                return self.find_and_click_available_apartment(project)
+            navigation = getattr(self, "navigation", None) or NavigationComponent(
+                self.page, self.project_locators
+            )
+            return navigation.find_and_click_available_apartment(project)
+
+    def _get_project_root_url(self, project_name: str, route_type: str = None) -> str:
+        """
+        Корневой URL каталога проекта (часть до /map или /project/).
+
+        Для agent/client берется URL роута из окружения (AGENT_/CLIENT_
+        переменные, ROUTE_URL_KEYS), если он задан для проекта.
+
+        Args:
+            project_name: Название проекта в нижнем регистре
+            route_type: Роут - "map" (по умолчанию), "agent" или "client"
+
+        Returns:
+            str: Корневой URL текущего окружения
+        """
+        from conftest import _get_urls_by_environment
 
-        # Определяем к какой группе относится проект
-        qube_projects = ["arisha", "cubix", "elire"]
-        capstone_projects = ["peylaa"]
-        wellcube_projects = ["tranquil"]
-
-        # Определяем базовый URL
-        if project_name_lower in qube_projects:
-            base_url = urls["map"].replace("/map", "")
-            map_url = urls["map"]
-        elif project_name_lower in capstone_projects:
-            base_url = urls["capstone_map"].replace("/map", "")
-            map_url = urls["capstone_map"]
-        elif project_name_lower in wellcube_projects:
-            base_url = urls["wellcube_map"].replace("/map", "")
-            map_url = urls["wellcube_map"]
+        url_key = self.PROJECT_URL_KEYS.get(project_name)
+        route_key = self.ROUTE_URL_KEYS.get(url_key, {}).get(route_type)
+        if url_key:
+            url = _get_urls_by_environment()[route_key or url_key]
+        elif getattr(self, "project_url_template", None):
+            url = self.project_url_template
         else:
             raise ValueError(f"Неизвестный проект: {project_name}")
 
-        # Формируем URL
-        if page_type == "catalog_2d":
-            return f"{base_url}/project/{project_name_lower}/catalog_2d"
-        elif page_type == "area":
-            return f"{base_url}/project/{project_name_lower}/area"
-        elif page_type == "map":
-            return map_url
+        for marker in ("/project/", "/map"):
+            if marker in url:
+                url = url.split(marker, 1)[0]
+                break
+        root_url = url.rstrip("/")
+        if route_type in ("agent", "client") and not route_key:
+            root_url = f"{root_url}/{route_type}"
+        return root_url
 
     def handle_auth_modal_if_present(self):
         """Обработать модальное окно авторизации для Elire."""
         import os
 
-        if self.browser.is_visible(".ant-modal-content", timeout=5000):
+        # С сохраненной авторизацией форма не появляется - проверяем коротко
+        probe_timeout = 2000 if AuthStateStore.has_state(self.page.context) else 5000
+        if self.browser.is_visible(".ant-modal-content", timeout=probe_timeout):
             username = os.getenv("USERNAME_ELIRE")
             password = os.getenv("PASSWORD_ELIRE")
 
@@ -198,6 +370,8 @@ class BasePage:
                         self.page.wait_for_selector(
                             ".ant-modal-content", state="hidden", timeout=15000
                         )
+                        # Сохраненное состояние было недействительным - обновляем
+                        AuthStateStore.refresh(self.page.context)
                     except PlaywrightTimeoutError:
                         raise AssertionError(
                             "Модальное окно авторизации не закрылось за 15000ms."
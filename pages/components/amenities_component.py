@@ -4,6 +4,8 @@ import allure
 from playwright.sync_api import Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
+from pages.core.browser_actions import BrowserActions
+
 
 class AmenitiesComponent:
     """
@@ -25,28 +27,20 @@ class AmenitiesComponent:
         """
         self.page = page
         self.locators = project_locators
+        self.browser = BrowserActions(page)
 
     def click_explore_button(self):
         """Открыть модальное окно Explore Amenities."""
         with allure.step("Кликаем на Explore Amenities"):
-            buttons = self.page.locator(self.locators.EXPLORE_AMENITIES_BUTTON)
-            buttons.first.wait_for(state="attached", timeout=20000)
-
-            # Avoid strict-mode issues if there are duplicates: click first visible.
-            clicked = False
-            for i in range(buttons.count()):
-                b = buttons.nth(i)
-                try:
-                    if b.is_visible(timeout=500) and b.is_enabled():
-                        b.click()
-                        clicked = True
-                        break
-                except Exception:
-                    continue
-
-            if not clicked:
-                buttons.first.wait_for(state="visible", timeout=20000)
-                buttons.first.click()
+            # Кнопок может быть несколько (дубликаты в DOM) - кликаем первую видимую
+            button = self.browser.resolve_visible(
+                self.locators.EXPLORE_AMENITIES_BUTTON, timeout=20000
+            )
+            if button is None:
+                raise AssertionError(
+                    "Кнопка Explore Amenities не отображается за 20000ms."
+                )
+            button.click()
 
     def verify_modal_displayed(self):
         """Проверить отображение модального окна."""
@@ -126,7 +120,10 @@ class AmenitiesComponent:
 
             for i in range(count):
                 button.click()
-                self.page.wait_for_timeout(800)
+                # Ждем окончания анимации перелистывания слайда
+                self.browser.wait_for_animations(
+                    self.locators.AMENITIES_SLIDER, timeout=800
+                )
 
     def click_indicator(self, index: int):
         """
@@ -138,7 +135,9 @@ class AmenitiesComponent:
         with allure.step(f"Кликаем на индикатор #{index + 1}"):
             indicators = self.page.locator(self.locators.AMENITIES_SLIDER_INDICATORS)
             indicators.nth(index).click()
-            self.page.wait_for_timeout(800)
+            self.browser.wait_for_animations(
+                self.locators.AMENITIES_SLIDER, timeout=800
+            )
 
     def click_slider_next(self):
         """Кликнуть на кнопку 'следующий'."""
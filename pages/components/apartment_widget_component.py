@@ -2,6 +2,98 @@
 
 import allure
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.core.browser_actions import BrowserActions
+from utils.logger import get_logger
+
+# Готовность виджета изнутри iframe: опрос на каждом кадре (rAF) до момента,
+# когда отрисована первая сцена (img/canvas/video не меньше minScenePx по
+# сторонам) и хотя бы одна кнопка 2D/3D интерактивна (видима, не disabled,
+# не перекрыта - elementFromPoint). Время - мс от начала навигации фрейма.
+# Если за recognizeMs во фрейме нет ни img/canvas/video, ни кнопок 2D/3D -
+# верстка не распознана (recognized = false), проба выходит сразу.
+_WIDGET_READY_JS = """
+async (body, [controlSelectors, minScenePx, timeoutMs, recognizeMs]) => {
+    const result = {
+        time_origin: performance.timeOrigin,
+        scene_painted_ms: null, interactive_ms: null, scene: null, ready: false,
+        recognized: null,
+    };
+    const find = (selector) => {
+        if (!/^(xpath=|\\/\\/|\\(\\/\\/)/.test(selector)) {
+            return Array.from(document.querySelectorAll(selector));
+        }
+        const snapshot = document.evaluate(
+            selector.replace(/^xpath=/, ''), document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const nodes = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+        return nodes;
+    };
+    const isLarge = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width >= minScenePx && rect.height >= minScenePx
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const isInteractive = (el) => {
+        const rect = el.getBoundingClientRect();
+        if (!rect.width || !rect.height || el.disabled) return false;
+        if (getComputedStyle(el).pointerEvents === 'none') return false;
+        const hit = document.elementFromPoint(
+            rect.left + rect.width / 2, rect.top + rect.height / 2
+        );
+        return !!hit && (hit === el || el.contains(hit));
+    };
+    const paintedScene = () => {
+        if (Array.from(document.images).some(
+            (img) => img.complete && img.naturalWidth > 0 && isLarge(img)
+        )) return 'img';
+        if (Array.from(document.querySelectorAll('canvas')).some(
+            (canvas) => canvas.width > 0 && isLarge(canvas)
+        )) return 'canvas';
+        if (Array.from(document.querySelectorAll('video')).some(
+            (video) => video.readyState >= 2 && isLarge(video)
+        )) return 'video';
+        return null;
+    };
+
+    const hasWidgetElements = () =>
+        !!document.querySelector('img, canvas, video')
+        || controlSelectors.some((selector) => find(selector).length > 0);
+
+    const started = performance.now();
+    const deadline = started + timeoutMs;
+    while (performance.now() < deadline) {
+        const now = performance.now();
+        if (!result.recognized) {
+            result.recognized = hasWidgetElements();
+            if (!result.recognized && recognizeMs && now - started >= recognizeMs) break;
+        }
+        if (result.scene_painted_ms === null) {
+            const scene = paintedScene();
+            if (scene) {
+                result.scene_painted_ms = Math.round(now * 10) / 10;
+                result.scene = scene;
+            }
+        }
+        if (result.interactive_ms === null
+            && controlSelectors.some((selector) => find(selector).some(isInteractive))) {
+            result.interactive_ms = Math.round(now * 10) / 10;
+        }
+        if (result.scene_painted_ms !== null && result.interactive_ms !== null) {
+            result.ready = true;
+            break;
+        }
+        await new Promise((resolve) => requestAnimationFrame(resolve));
+    }
+    return result;
+}
+"""
+
+# Кнопки режимов виджета, если у проекта нет своих локаторов ApartmentWidget
+DEFAULT_WIDGET_CONTROLS = ".widget-control-button"
 
 
 class ApartmentWidgetComponent:
@@ -15,6 +107,10 @@ class ApartmentWidgetComponent:
     - Проверки отображения
     """
 
+    # Сколько ждать сцену или кнопки 2D/3D, прежде чем считать верстку
+    # нераспознанной и перейти к запасному ожиданию (мс)
+    RECOGNIZE_TIMEOUT = 3000
+
     def __init__(self, page: Page, project_locators, project_name: str = "arisha"):
         """
         Инициализация компонента виджета.
@@ -26,6 +122,7 @@ class ApartmentWidgetComponent:
         """
         self.page = page
         self.project_name = project_name
+        self.browser = BrowserActions(page)
 
         # Получаем локаторы виджета для конкретного проекта
         # project_locators это КЛАСС локаторов (например, ArishaLocators)
@@ -35,30 +132,69 @@ class ApartmentWidgetComponent:
             # Fallback на базовые локаторы
             self.locators = None
 
+    def get_widget_selector(self) -> str:
+        """Селектор iframe виджета (для MARK - универсальный)."""
+        return "iframe" if self.project_name == "mark" else "iframe[class*='_iframe_']"
+
     def get_widget_frame(self):
         """Получить frame_locator для виджета апартамента."""
-        # Для MARK используем универсальный селектор iframe
-        if self.project_name == "mark":
-            return self.page.frame_locator("iframe")
-        return self.page.frame_locator("iframe[class*='_iframe_']")
+        return self.page.frame_locator(self.get_widget_selector())
+
+    def get_control_selectors(self) -> list:
+        """Селекторы кнопок 2D/3D, по которым проверяется интерактивность."""
+        if self.locators:
+            return [self.locators.VIEW_2D_BUTTON, self.locators.VIEW_3D_BUTTON]
+        return [DEFAULT_WIDGET_CONTROLS]
 
     def wait_for_widget_load(self):
-        """Ожидать загрузки виджета."""
+        """
+        Ожидать готовности виджета.
+
+        Готовность определяет проба внутри iframe: первая сцена отрисована
+        и кнопки 2D/3D интерактивны. Если проба не дождалась (другая верстка
+        виджета), ждем догрузки ресурсов и затишья DOM во фрейме. Верстку без
+        сцены и кнопок проба отбрасывает за RECOGNIZE_TIMEOUT, а не за полный
+        таймаут.
+        """
         with allure.step("Ожидаем загрузки виджета апартамента"):
-            # Для MARK используем универсальный селектор iframe
-            iframe_selector = (
-                "iframe" if self.project_name == "mark" else "iframe[class*='_iframe_']"
+            readiness = self.probe_readiness(recognize_timeout=self.RECOGNIZE_TIMEOUT)
+            if readiness["ready"]:
+                return
+
+            get_logger("ApartmentWidget").warning(
+                f"Проба готовности виджета {self.project_name} не дождалась: "
+                f"{readiness}"
             )
+            body = self.get_widget_frame().locator("body")
+            self.browser.wait_for_network_idle("widget", idle_ms=300, timeout=2000)
+            self.browser.wait_for_dom_stable(body, quiet_ms=500, timeout=2000)
+
+    def probe_readiness(
+        self, timeout: int = 20000, recognize_timeout: int = None
+    ) -> dict:
+        """
+        Замерить готовность виджета.
 
-            # Ждем появления iframe (увеличенный таймаут для мобильных устройств в CI)
-            self.page.wait_for_selector(iframe_selector, timeout=20000)
+        Args:
+            timeout: Максимальное ожидание (мс) каждого этапа
+            recognize_timeout: Через сколько мс прекратить пробу, если во
+                фрейме нет ни сцены, ни кнопок 2D/3D (None - ждать timeout)
 
-            # Ждем загрузки содержимого iframe
-            iframe = self.get_widget_frame()
-            iframe.locator("body").wait_for(state="visible", timeout=20000)
+        Returns:
+            dict: ready, recognized, scene (img/canvas/video) и времена в мс от начала
+                навигации страницы: frame_attach_ms (старт навигации iframe),
+                first_paint_ms (первая сцена), interactive_ms (кнопки 2D/3D)
+        """
+        # Ждем появления iframe (увеличенный таймаут для мобильных устройств в CI)
+        self.page.wait_for_selector(self.get_widget_selector(), timeout=timeout)
+        body = self.get_widget_frame().locator("body")
+        body.wait_for(state="visible", timeout=timeout)
 
-            # Дополнительная пауза
-            self.page.wait_for_timeout(4000)
+        probe = body.evaluate(
+            _WIDGET_READY_JS,
+            [self.get_control_selectors(), 100, timeout, recognize_timeout or 0],
+        )
+        return to_page_timeline(probe, self.page.evaluate("performance.timeOrigin"))
 
     def _close_modal_if_present(self):
         """Закрыть модальное окно, если оно перекрывает виджет (только на client route)."""
@@ -75,7 +211,9 @@ class ApartmentWidgetComponent:
             if modal_close_button.is_visible(timeout=1000):
                 with allure.step("Закрываем модальное окно client route"):
                     modal_close_button.click()
-                    self.page.wait_for_timeout(1500)
+                    self.browser.wait_for_state(
+                        modal_close_button, "hidden", timeout=1500
+                    )
         except Exception:
             # Модалки нет - это нормально
             pass
@@ -109,7 +247,7 @@ class ApartmentWidgetComponent:
             view_2d_button.click()
 
             # Ждем активации кнопки
-            self.page.wait_for_timeout(1000)
+            self.browser.wait_for_class(view_2d_button, "active", timeout=3000)
 
             # Ждем появления стрелочек навигации в режиме 2D (только для проектов, где стрелки есть в 2D)
             # В MARK стрелки появляются только в 3D режиме
@@ -142,7 +280,7 @@ class ApartmentWidgetComponent:
             view_3d_button.click()
 
             # Ждем активации кнопки
-            self.page.wait_for_timeout(1000)
+            self.browser.wait_for_class(view_3d_button, "active", timeout=3000)
 
     def click_zoom_button(self) -> bool:
         """
@@ -160,7 +298,9 @@ class ApartmentWidgetComponent:
 
             if zoom_button.count() > 0 and zoom_button.first.is_visible():
                 zoom_button.first.click()
-                self.page.wait_for_timeout(500)
+                self.browser.wait_for_animations(
+                    frame_locator.locator("body"), timeout=500
+                )
                 return True
             return False
 
@@ -196,8 +336,10 @@ class ApartmentWidgetComponent:
                         # Используем JavaScript клик
                         next_arrow.evaluate("element => element.click()")
 
-                        # Пауза для стабилизации
-                        self.page.wait_for_timeout(500)
+                        # Ждем перерисовки сцены
+                        self.browser.wait_for_dom_stable(
+                            frame_locator.locator("body"), quiet_ms=150, timeout=500
+                        )
 
                         # Ждем изменения сцены
                         if scene_indicator.count() > 0:
@@ -340,3 +482,30 @@ class ApartmentWidgetComponent:
         """
         iframe_element = self.page.locator("iframe")
         return iframe_element.screenshot()
+
+
+def to_page_timeline(probe: dict, page_time_origin: float) -> dict:
+    """
+    Перевести времена пробы из шкалы iframe в шкалу страницы.
+
+    Args:
+        probe: Результат _WIDGET_READY_JS
+        page_time_origin: performance.timeOrigin страницы
+
+    Returns:
+        dict: ready, recognized, scene, frame_attach_ms, first_paint_ms,
+            interactive_ms
+    """
+    frame_attach_ms = probe["time_origin"] - page_time_origin
+
+    def shift(value):
+        return None if value is None else round(frame_attach_ms + value, 1)
+
+    return {
+        "ready": probe["ready"],
+        "recognized": probe.get("recognized"),
+        "scene": probe["scene"],
+        "frame_attach_ms": round(frame_attach_ms, 1),
+        "first_paint_ms": shift(probe["scene_painted_ms"]),
+        "interactive_ms": shift(probe["interactive_ms"]),
+    }
@@ -3,6 +3,130 @@
 import allure
 from playwright.sync_api import Page
 
+from pages.core.browser_actions import BrowserActions
+
+# Общие функции проб тура: поиск по CSS/XPath и видимость
+_TOUR_HELPERS_JS = """
+    const find = (selector) => {
+        if (!/^(xpath=|\\/\\/|\\(\\/\\/)/.test(selector)) {
+            return Array.from(document.querySelectorAll(selector));
+        }
+        const snapshot = document.evaluate(
+            selector.replace(/^xpath=/, ''), document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const nodes = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+        return nodes;
+    };
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+"""
+
+# Первый кадр тура: видимый img загружен, video может играть, canvas или
+# iframe получили размер. Время - абсолютное (timeOrigin + now), чтобы
+# сравнивать замеры страницы и iframe панорамы.
+_FIRST_FRAME_JS = (
+    """
+async (_, [selector, timeoutMs]) => {
+"""
+    + _TOUR_HELPERS_JS
+    + """
+    const painted = (el) => {
+        if (!isVisible(el)) return false;
+        if (el.tagName === 'IMG') return el.complete && el.naturalWidth > 0;
+        if (el.tagName === 'VIDEO') return el.readyState >= 2;
+        return true;
+    };
+    const deadline = performance.now() + timeoutMs;
+    while (performance.now() < deadline) {
+        const frame = find(selector).find(painted);
+        if (frame) {
+            return { at: performance.timeOrigin + performance.now(), kind: frame.tagName.toLowerCase() };
+        }
+        await new Promise((resolve) => requestAnimationFrame(resolve));
+    }
+    return { at: null, kind: null };
+}
+"""
+)
+
+# Вращение тура: на каждом кадре (rAF) элементу тура отправляется drag
+# (pointer + mouse события) влево-вправо на половину его ширины, интервалы
+# между кадрами дают FPS во время вращения.
+_ROTATION_FPS_JS = (
+    """
+async (_, [selector, durationMs]) => {
+"""
+    + _TOUR_HELPERS_JS
+    + """
+    const target = find(selector).find(isVisible);
+    if (!target) return null;
+    const rect = target.getBoundingClientRect();
+    const y = rect.top + rect.height / 2;
+    const x0 = rect.left + rect.width * 0.25;
+    const span = rect.width * 0.5;
+    const fire = (type, x) => {
+        const init = {
+            bubbles: true, cancelable: true, clientX: x, clientY: y,
+            buttons: type.endsWith('up') ? 0 : 1,
+            pointerId: 1, pointerType: 'mouse', isPrimary: true,
+        };
+        target.dispatchEvent(new PointerEvent(type.replace('mouse', 'pointer'), init));
+        target.dispatchEvent(new MouseEvent(type, init));
+    };
+
+    const frames = [];
+    fire('mousedown', x0);
+    const start = performance.now();
+    await new Promise((resolve) => {
+        const step = (now) => {
+            frames.push(now);
+            const progress = (now - start) / durationMs;
+            if (progress >= 1) return resolve();
+            const phase = (progress * 4) % 2;
+            fire('mousemove', x0 + span * (phase < 1 ? phase : 2 - phase));
+            requestAnimationFrame(step);
+        };
+        requestAnimationFrame(step);
+    });
+    fire('mouseup', x0);
+
+    const intervals = frames.slice(1).map((t, i) => t - frames[i]).sort((a, b) => a - b);
+    const duration = frames[frames.length - 1] - frames[0];
+    return {
+        frames: frames.length,
+        fps: duration > 0 ? Math.round((frames.length - 1) / duration * 10000) / 10 : null,
+        p95_frame_ms: intervals.length
+            ? Math.round(intervals[Math.floor(intervals.length * 0.95)] * 10) / 10 : null,
+        long_frames: intervals.filter((t) => t > 50).length,
+    };
+}
+"""
+)
+
+# Память декодированных изображений документа: RGBA 4 байта на пиксель
+# загруженных img и буферы canvas
+_DECODED_IMAGES_JS = """
+() => {
+    let bytes = 0;
+    let images = 0;
+    for (const img of document.images) {
+        if (img.complete && img.naturalWidth > 0) {
+            bytes += img.naturalWidth * img.naturalHeight * 4;
+            images += 1;
+        }
+    }
+    for (const canvas of document.querySelectorAll('canvas')) {
+        bytes += canvas.width * canvas.height * 4;
+    }
+    return { decoded_images: images, decoded_image_mb: Math.round(bytes / 1048576 * 10) / 10 };
+}
+"""
+
 
 class AreaTour360Component:
     """
@@ -24,6 +148,7 @@ class AreaTour360Component:
         """
         self.page = page
         self.locators = project_locators
+        self.browser = BrowserActions(page)
 
     def click_360_button(self):
         """Кликнуть на кнопку 360 Area Tour."""
@@ -44,20 +169,11 @@ class AreaTour360Component:
                 # Десктопный или другой проект
                 locator = self.page.locator(self.locators.AREA_TOUR_360_BUTTON)
                 if project_name == "mark" and locator.count() > 1:
-                    # Ищем первую видимую кнопку
-                    button = None
-                    for idx in range(locator.count()):
-                        candidate = locator.nth(idx)
-                        try:
-                            if candidate.is_visible():
-                                button = candidate
-                                break
-                        except Exception:
-                            continue
-
-                    # Если видимая не найдена, берём последнюю
-                    if button is None:
-                        button = locator.last
+                    # Первая видимая кнопка, если видимой нет - берём последнюю
+                    button = (
+                        self.browser.resolve_visible(self.locators.AREA_TOUR_360_BUTTON)
+                        or locator.last
+                    )
 
                     button.click(force=True)
                 else:
@@ -157,3 +273,79 @@ class AreaTour360Component:
             # Ждем закрытия модального окна
             modal = self.page.locator(self.locators.AREA_TOUR_360_MODAL)
             modal.first.wait_for(state="hidden", timeout=5000)
+
+    def benchmark(self, menu_item: str = None, rotate_ms: int = 3000) -> dict:
+        """
+        Замерить тяжесть 360 тура: первый кадр, FPS вращения, картинки.
+
+        Панорамы MARK (yard, lobby-k1...) открываются в iframe - пробы
+        выполняются внутри него, остальные туры - в модальном окне.
+
+        Args:
+            menu_item: Пункт меню панорам MARK (None - кнопка 360 тура)
+            rotate_ms: Сколько вращать тур
+
+        Returns:
+            dict: first_frame_ms (от клика), content (img/canvas/video/iframe),
+                fps, p95_frame_ms, long_frames, image_requests, image_kb,
+                decoded_images, decoded_image_mb
+        """
+        with allure.step(f"Замер 360 тура {menu_item or ''}".strip()):
+            fetched = {"image_requests": 0, "image_bytes": 0}
+
+            def on_request_finished(request):
+                if request.resource_type != "image":
+                    return
+                fetched["image_requests"] += 1
+                try:
+                    fetched["image_bytes"] += max(
+                        request.sizes()["responseBodySize"], 0
+                    )
+                except Exception:
+                    # Размер недоступен (страница уже ушла) - учитываем только запрос
+                    pass
+
+            in_iframe = menu_item not in (None, "rotation")
+            if in_iframe:
+                root = self.page.frame_locator("iframe").first.locator("body")
+                content = "canvas, img, video"
+            else:
+                root = self.page.locator("body")
+                content = self.locators.AREA_TOUR_360_CONTENT
+
+            self.page.on("requestfinished", on_request_finished)
+            try:
+                if menu_item:
+                    self.click_360_button()
+                started = self.page.evaluate(
+                    "performance.timeOrigin + performance.now()"
+                )
+                if menu_item:
+                    self.click_360_menu_item(menu_item)
+                else:
+                    self.click_360_button()
+
+                first_frame = root.evaluate(_FIRST_FRAME_JS, [content, 30000])
+                rotation = root.evaluate(_ROTATION_FPS_JS, [content, rotate_ms]) or {}
+                memory = root.evaluate(f"(_) => ({_DECODED_IMAGES_JS})()")
+            finally:
+                self.page.remove_listener("requestfinished", on_request_finished)
+
+            result = {
+                "first_frame_ms": (
+                    round(first_frame["at"] - started, 1) if first_frame["at"] else None
+                ),
+                "content": first_frame["kind"],
+                "fps": rotation.get("fps"),
+                "p95_frame_ms": rotation.get("p95_frame_ms"),
+                "long_frames": rotation.get("long_frames"),
+                "image_requests": fetched["image_requests"],
+                "image_kb": round(fetched["image_bytes"] / 1024, 1),
+                **memory,
+            }
+            allure.attach(
+                "\n".join(f"{key}: {value}" for key, value in result.items()),
+                name="360 tour benchmark",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+            return result
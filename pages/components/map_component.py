@@ -5,6 +5,67 @@ from playwright.sync_api import Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from locators.map_locators import MapLocators
+from pages.core.browser_actions import BrowserActions
+
+# Замер загрузки карты изнутри страницы: опрос на каждом кадре (rAF), время -
+# performance.now(), то есть мс от начала навигации документа.
+# markers_rendered_ms - момент последнего изменения числа видимых маркеров,
+# после которого оно не менялось quietMs; first_clickable_ms - первый маркер,
+# центр которого не перекрыт другими элементами (elementFromPoint).
+_MAP_LOAD_PROBE_JS = """
+async ([containerSelector, markerSelector, quietMs, timeoutMs]) => {
+    const result = {
+        container_visible_ms: null, first_marker_ms: null,
+        first_clickable_ms: null, markers_rendered_ms: null, markers: 0,
+    };
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const isClickable = (el) => {
+        const rect = el.getBoundingClientRect();
+        const x = rect.left + rect.width / 2;
+        const y = rect.top + rect.height / 2;
+        if (x < 0 || y < 0 || x > innerWidth || y > innerHeight) return false;
+        const hit = document.elementFromPoint(x, y);
+        return !!hit && (hit === el || el.contains(hit) || hit.contains(el));
+    };
+
+    let lastCount = 0;
+    let lastChange = null;
+    const deadline = performance.now() + timeoutMs;
+    while (performance.now() < deadline) {
+        const now = performance.now();
+        if (result.container_visible_ms === null) {
+            const container = document.querySelector(containerSelector);
+            if (container && isVisible(container)) result.container_visible_ms = now;
+        }
+        const markers = Array.from(document.querySelectorAll(markerSelector)).filter(isVisible);
+        if (markers.length && result.first_marker_ms === null) result.first_marker_ms = now;
+        if (result.first_clickable_ms === null && markers.some(isClickable)) {
+            result.first_clickable_ms = now;
+        }
+        if (markers.length !== lastCount) {
+            lastCount = markers.length;
+            lastChange = now;
+        }
+        if (lastCount && result.first_clickable_ms !== null && now - lastChange >= quietMs) {
+            result.markers_rendered_ms = lastChange;
+            break;
+        }
+        await new Promise((resolve) => requestAnimationFrame(resolve));
+    }
+
+    result.markers = lastCount;
+    for (const key of Object.keys(result)) {
+        if (key.endsWith('_ms') && result[key] !== null) {
+            result[key] = Math.round(result[key] * 10) / 10;
+        }
+    }
+    return result;
+}
+"""
 
 
 class MapComponent:
@@ -30,6 +91,7 @@ class MapComponent:
         self.page = page
         self.project_locators = project_locators
         self.locators = MapLocators()
+        self.browser = BrowserActions(page)
 
     def wait_for_map_loaded(self):
         """Ожидать загрузки карты и проектов."""
@@ -49,11 +111,38 @@ class MapComponent:
                     timeout=self.MAP_LOAD_TIMEOUT,
                 )
 
-                # Пауза для стабилизации
-                self.page.wait_for_timeout(2000)
+                # Ждем, пока маркеры перестанут перерисовываться (не дольше 2с)
+                self.browser.wait_for_dom_stable(
+                    self.locators.MAP_CONTAINER, quiet_ms=300, timeout=2000
+                )
             except Exception as e:
                 print(f"Ошибка при ожидании загрузки карты: {e}")
 
+    def measure_load(
+        self, marker_selector: str = None, quiet_ms: int = 1000, timeout: int = None
+    ) -> dict:
+        """
+        Замерить этапы загрузки карты (вызывать сразу после начала навигации).
+
+        Args:
+            marker_selector: Маркеры проектов (по умолчанию ALL_PROJECTS_SELECTOR)
+            quiet_ms: Сколько число маркеров не должно меняться
+            timeout: Максимальное время замера (по умолчанию MAP_LOAD_TIMEOUT)
+
+        Returns:
+            dict: container_visible_ms, first_marker_ms, first_clickable_ms,
+                markers_rendered_ms (None - этап не наступил) и markers
+        """
+        return self.page.evaluate(
+            _MAP_LOAD_PROBE_JS,
+            [
+                self.locators.MAP_CONTAINER,
+                marker_selector or self.locators.ALL_PROJECTS_SELECTOR,
+                quiet_ms,
+                timeout or self.MAP_LOAD_TIMEOUT,
+            ],
+        )
+
     def check_map_loaded(self):
         """Проверить что карта загружена."""
         element = self.page.locator(self.locators.MAP_CONTAINER)
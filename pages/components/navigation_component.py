@@ -2,6 +2,10 @@
 
 import allure
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.core.apartment_scanner import ApartmentScanner
+from pages.core.browser_actions import BrowserActions
 
 
 class NavigationComponent:
@@ -25,6 +29,8 @@ class NavigationComponent:
         """
         self.page = page
         self.locators = project_locators
+        self.browser = BrowserActions(page)
+        self.scanner = ApartmentScanner(page)
 
     def navigate_to_building(self, building_number: int) -> str:
         """
@@ -80,7 +86,7 @@ class NavigationComponent:
 
             # Ждем появления и стабилизации дропдауна
             self.page.wait_for_selector(floor_button, state="visible", timeout=5000)
-            self.page.wait_for_timeout(500)  # Ждем завершения анимации
+            self.browser.wait_for_animations(floor_button, timeout=500)
 
             button = self.page.locator(floor_button)
             button.click()
@@ -123,7 +129,7 @@ class NavigationComponent:
                 f"/project/{project_name}/floor/{building_number}/{floor_number}",
             )
             self.page.goto(floor_url)
-            self.page.wait_for_timeout(1000)
+            self.browser.wait_for_dom_stable(quiet_ms=300, timeout=1000)
 
             current_url = self.page.url
             allure.attach(
@@ -152,29 +158,19 @@ class NavigationComponent:
             # Ждем загрузки апартаментов
             self.page.wait_for_selector(apartment_selector, timeout=20000)
 
-            apartment_elements = self.page.locator(apartment_selector)
-            apartment_count = apartment_elements.count()
-
-            if apartment_count == 0:
-                return False
+            # Один evaluate вместо count() замка на каждый апартамент
+            apartments = self.scanner.scan(
+                apartment_selector, lock_mode="inside", limit=max_attempts
+            )
 
-            # Ищем первый доступный апартамент (без замка)
-            for i in range(min(apartment_count, max_attempts)):
+            # Кликаем первый видимый апартамент без замка по метке скана
+            for apartment in apartments:
+                if not apartment["visible"] or apartment["locked"]:
+                    continue
                 try:
-                    apartment = apartment_elements.nth(i)
-
-                    # Проверяем, есть ли замок
-                    lock_icon = apartment.locator(
-                        "xpath=.//span[@role='img' and @aria-label='lock']"
-                    )
-                    has_lock = lock_icon.count() > 0
-
-                    if not has_lock:
-                        apartment.click()
-                        # Небольшая пауза после клика
-                        self.page.wait_for_timeout(500)
-                        return True
-
+                    self.scanner.click(apartment)
+                    self.browser.wait_for_dom_stable(quiet_ms=200, timeout=500)
+                    return True
                 except Exception:
                     continue
 
@@ -228,104 +224,30 @@ class NavigationComponent:
             try:
                 apartment_titles.first.wait_for(state="attached", timeout=20000)
             except Exception:
-                # Если не дождались, пробуем еще раз с небольшим ожиданием
-                self.page.wait_for_timeout(1000)
+                # Если не дождались, даем каталогу дорендериться
+                self.browser.wait_for_dom_stable(quiet_ms=300, timeout=1000)
 
-            apartment_count = apartment_titles.count()
+            # Сканируем первые 6 апартаментов одним evaluate: замок ищем
+            # в section кнопки и в его родителе, кликать будем по кнопке
+            apartments = self.scanner.scan(
+                self.locators.ALL_APARTMENT_TITLES, **ApartmentScanner.CATALOG_SCAN
+            )
 
             # Проверяем, что апартаменты найдены на странице
             assert (
-                apartment_count > 0
+                apartments
             ), f"Апартаменты не найдены на странице - {project_name or 'неизвестный'}"
 
-            # Ищем первый доступный апартамент (без замка)
-            # Проверяем первые 6 апартаментов по порядку, пока не найдем доступный
-            max_to_check = min(6, apartment_count)
-            for i in range(max_to_check):
-                apartment_title = apartment_titles.nth(i)
-
-                # Получаем button_id и проверяем замок (ТОЧНО как в скрипте)
-                try:
-                    # Используем точно такую же логику, как в скрипте (включая проверку родительского section)
-                    info = apartment_title.evaluate(
-                        """
-                        (el) => {
-                            // Элемент находится в кнопке
-                            const button = el.closest('button');
-                            if (!button) return {error: 'no button'};
-                            
-                            // Находим родительский section этой кнопки
-                            const section = button.closest('section');
-                            if (!section) return {error: 'no section'};
-                            
-                            // Ищем замок ТОЛЬКО внутри этого section
-                            // Замок: <span role="img" aria-label="lock" class="anticon anticon-lock">
-                            const locks = section.querySelectorAll('span[aria-label="lock"], span.anticon-lock');
-                            
-                            // Также проверяем родительский элемент section (если есть) - как в скрипте
-                            let parentSection = section.parentElement;
-                            let lockInParent = null;
-                            if (parentSection) {
-                                const parentLocks = parentSection.querySelectorAll('span[aria-label="lock"], span.anticon-lock');
-                                if (parentLocks.length > 0) {
-                                    // Проверяем, что замок относится к этому section
-                                    for (let lock of parentLocks) {
-                                        // Если замок находится перед или после нашего section в том же контейнере
-                                        if (lock.compareDocumentPosition(section) & Node.DOCUMENT_POSITION_FOLLOWING ||
-                                            lock.compareDocumentPosition(section) & Node.DOCUMENT_POSITION_PRECEDING) {
-                                            lockInParent = lock;
-                                            break;
-                                        }
-                                    }
-                                }
-                            }
-                            
-                            const hasLock = locks.length > 0 || lockInParent !== null;
-                            
-                            return {
-                                hasLock: hasLock,
-                                buttonId: button.getAttribute('data-test-id'),
-                                lockCount: locks.length + (lockInParent ? 1 : 0)
-                            };
-                        }
-                    """
-                    )
-
-                    if "error" in info:
-                        continue
-
-                    has_lock = info.get("hasLock", True)
-                    button_id = info.get("buttonId")
-
-                except Exception:
-                    # Если ошибка, пропускаем
-                    continue
-
-                # Если есть замок - пропускаем и ищем дальше
-                if has_lock:
-                    continue
-
-                # Если замка нет - это доступный апартамент, кликаем на него (как в скрипте)
-                try:
-                    # Используем evaluate для клика на кнопку (как в скрипте)
-                    apartment_text = apartment_title.text_content()
-                    apartment_title.evaluate(
-                        """
-                        (el) => {
-                            const button = el.closest('button');
-                            if (button) {
-                                button.click();
-                            }
-                        }
-                    """
-                    )
-                    allure.attach(
-                        f"Выбран доступный апартамент: {apartment_text}, button_id={button_id}",
-                        name="Selected Apartment",
-                    )
-                    return apartment_text
-                except Exception:
-                    continue
+            apartment = self.scanner.find_available(apartments, visible_only=False)
+            if apartment:
+                # Клик через button.click() в странице, как и раньше
+                self.scanner.click(apartment, js_click=True)
+                allure.attach(
+                    f"Выбран доступный апартамент: {apartment['text']}, "
+                    f"button_id={apartment['id']}",
+                    name="Selected Apartment",
+                )
+                return apartment["text"]
 
             # Если не найден ни один доступный апартамент
             raise AssertionError(
@@ -0,0 +1,229 @@
+"""Поиск доступных апартаментов одним запросом в страницу."""
+
+import time
+from typing import List, Optional
+
+import allure
+from playwright.sync_api import Page
+
+from utils.logger import get_logger
+
+# Один проход по DOM: видимость, бокс, замок, ссылка и метка для клика.
+# Режимы проверки замка:
+#   inside  - замок внутри элемента (план этажа)
+#   section - замок в section кнопки или в родителе section (каталог)
+#   card    - замок в любом предке div с классом ant-card (мобильный каталог)
+#   nearby  - замок внутри элемента или в радиусе nearbyPx от его угла (Arisha mobile)
+_SCAN_JS = """
+([selector, lockSelector, lockMode, nearbyPx, clickClosest, limit, attr]) => {
+    document.querySelectorAll(`[${attr}]`).forEach((el) => el.removeAttribute(attr));
+
+    let elements = [];
+    if (/^(xpath=|\\/\\/|\\(\\/\\/)/.test(selector)) {
+        const snapshot = document.evaluate(
+            selector.replace(/^xpath=/, ''), document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            elements.push(snapshot.snapshotItem(i));
+        }
+    } else {
+        elements = Array.from(document.querySelectorAll(selector));
+    }
+    if (limit) elements = elements.slice(0, limit);
+
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+
+    const lockBoxes = lockMode === 'nearby'
+        ? Array.from(document.querySelectorAll(lockSelector))
+            .map((lock) => lock.getBoundingClientRect())
+            .filter((rect) => rect.width > 0 || rect.height > 0)
+        : [];
+
+    const hasLock = (el, rect) => {
+        if (lockMode === 'inside') return !!el.querySelector(lockSelector);
+        if (lockMode === 'nearby') {
+            return !!el.querySelector(lockSelector) || lockBoxes.some((box) =>
+                Math.abs(box.x - rect.x) < nearbyPx && Math.abs(box.y - rect.y) < nearbyPx
+            );
+        }
+        if (lockMode === 'card') {
+            for (let node = el.parentElement; node; node = node.parentElement) {
+                if (node.tagName === 'DIV' && String(node.className).includes('ant-card')
+                    && node.querySelector(lockSelector)) return true;
+            }
+            return false;
+        }
+        // section: замок в section кнопки или в его родительском контейнере
+        const button = el.closest('button');
+        const section = button && button.closest('section');
+        if (!section) return null;
+        if (section.querySelector(lockSelector)) return true;
+        const parent = section.parentElement;
+        return !!(parent && parent.querySelector(lockSelector));
+    };
+
+    return elements.map((el, index) => {
+        const rect = el.getBoundingClientRect();
+        const target = (clickClosest && el.closest(clickClosest)) || el;
+        target.setAttribute(attr, String(index));
+        const testIdHolder = el.closest('[data-test-id]');
+        const link = el.closest('a[href]') || el.querySelector('a[href]');
+        return {
+            index,
+            scan_id: String(index),
+            id: testIdHolder ? testIdHolder.getAttribute('data-test-id') : el.id || null,
+            href: link ? link.href : null,
+            text: (el.textContent || '').trim().slice(0, 100),
+            visible: isVisible(el),
+            locked: hasLock(el, rect),
+            box: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+        };
+    });
+}
+"""
+
+
+class ApartmentScanner:
+    """
+    Сканер доступности апартаментов.
+
+    Вместо цикла nth(i) -> is_visible() -> bounding_box() -> count() замков
+    (несколько round trip на каждый элемент) делает один page.evaluate и
+    возвращает компактный список: видимость, бокс, наличие замка и метку,
+    по которой затем кликается выбранный элемент.
+    """
+
+    LOCK_SELECTOR = 'span[aria-label="lock"], span.anticon-lock'
+    # Атрибут-метка, которую сканер ставит элементам для последующего клика
+    SCAN_ATTR = "data-autotest-scan-id"
+    # Каталог All units: первые 6 апартаментов, замок в section кнопки
+    # или в его родителе, кликается кнопка
+    CATALOG_SCAN = {"lock_mode": "section", "limit": 6, "click_closest": "button"}
+
+    def __init__(self, page: Page):
+        """
+        Инициализация.
+
+        Args:
+            page: Playwright Page объект
+        """
+        self.page = page
+        self.logger = get_logger("ApartmentScanner")
+
+    def scan(
+        self,
+        selector: str,
+        lock_mode: str = "inside",
+        limit: int = None,
+        click_closest: str = None,
+        nearby_px: int = 300,
+        lock_selector: str = None,
+    ) -> List[dict]:
+        """
+        Просканировать апартаменты за один round trip.
+
+        Args:
+            selector: CSS или XPath (//...) селектор апартаментов
+            lock_mode: Как искать замок - inside, section, card или nearby
+            limit: Сколько первых совпадений проверять (None - все)
+            click_closest: CSS селектор предка, по которому кликать (например, button)
+            nearby_px: Радиус поиска замка для режима nearby
+            lock_selector: CSS селектор замка (по умолчанию LOCK_SELECTOR)
+
+        Returns:
+            List[dict]: index, scan_id, id, href, text, visible, locked, box
+                (locked = None, если замок определить не удалось,
+                href - абсолютная ссылка элемента или его предка/потомка)
+        """
+        started = time.perf_counter()
+        apartments = self.page.evaluate(
+            _SCAN_JS,
+            self.scan_args(
+                selector, lock_mode, limit, click_closest, nearby_px, lock_selector
+            ),
+        )
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        available = sum(1 for a in apartments if a["visible"] and a["locked"] is False)
+        summary = (
+            f"Просканировано апартаментов: {len(apartments)}, "
+            f"видимых без замка: {available}, за {duration_ms:.0f} мс"
+        )
+        self.logger.info(summary)
+        allure.attach(summary, name="Apartment scan")
+        return apartments
+
+    @classmethod
+    def scan_args(
+        cls,
+        selector: str,
+        lock_mode: str = "inside",
+        limit: int = None,
+        click_closest: str = None,
+        nearby_px: int = 300,
+        lock_selector: str = None,
+    ) -> list:
+        """
+        Аргументы _SCAN_JS (общие для sync и async сканера).
+
+        Args:
+            Те же, что у scan()
+
+        Returns:
+            list: Позиционные аргументы скрипта скана
+        """
+        return [
+            selector,
+            lock_selector or cls.LOCK_SELECTOR,
+            lock_mode,
+            nearby_px,
+            click_closest,
+            limit or 0,
+            cls.SCAN_ATTR,
+        ]
+
+    @classmethod
+    def target_selector(cls, apartment: dict) -> str:
+        """Селектор элемента по метке скана (для клика)."""
+        return f'[{cls.SCAN_ATTR}="{apartment["scan_id"]}"]'
+
+    @staticmethod
+    def find_available(
+        apartments: List[dict], visible_only: bool = True
+    ) -> Optional[dict]:
+        """
+        Первый апартамент без замка из результата scan().
+
+        Args:
+            apartments: Результат scan()
+            visible_only: Пропускать невидимые элементы
+
+        Returns:
+            Optional[dict]: Запись апартамента или None
+        """
+        for apartment in apartments:
+            if apartment["locked"] is not False:
+                continue
+            if visible_only and not apartment["visible"]:
+                continue
+            return apartment
+        return None
+
+    def click(self, apartment: dict, js_click: bool = False):
+        """
+        Кликнуть по апартаменту, найденному сканом.
+
+        Args:
+            apartment: Запись из scan()
+            js_click: Кликнуть через element.click() в странице (без проверок actionability)
+        """
+        target = self.page.locator(self.target_selector(apartment))
+        if js_click:
+            target.evaluate("(el) => el.click()")
+        else:
+            target.click()
@@ -0,0 +1,139 @@
+"""Сохраненная авторизация (storage state) для закрытых проектов."""
+
+import json
+import os
+import time
+import weakref
+from typing import Callable, Dict, Optional
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from utils.logger import get_logger
+
+
+class AuthStateStore:
+    """
+    Хранилище состояний авторизации закрытых проектов (Elire и др.).
+
+    Логин выполняется один раз на воркер и браузер, cookies/localStorage
+    сохраняются в storage state файл и подставляются в новые контексты.
+    Состояние считается устаревшим, если файл старше TTL или истекли его
+    cookies - тогда логин повторяется. Если сервер все же показал форму
+    авторизации, BasePage после входа вызывает refresh() и файл обновляется.
+    """
+
+    STATE_DIR = ".auth"
+    TTL_SECONDS = 12 * 60 * 60
+    # Запас до истечения cookie, чтобы она не протухла посреди теста
+    EXPIRY_MARGIN_SECONDS = 5 * 60
+
+    # Контекст -> путь к его storage state (для refresh после повторного входа)
+    _contexts = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        browser: Browser,
+        browser_name: str,
+        logins: Dict[str, Callable[[Page], None]],
+    ):
+        """
+        Инициализация.
+
+        Args:
+            browser: Браузер, в котором выполняется логин
+            browser_name: Имя браузера (часть имени файла состояния)
+            logins: Проект -> функция логина на открытой странице
+        """
+        self.browser = browser
+        self.browser_name = browser_name
+        self.logins = logins
+        self.logger = get_logger("AuthStateStore")
+
+    def get_state_path(self, project: str) -> str:
+        """Путь к файлу состояния проекта для текущего воркера и браузера."""
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        return os.path.join(
+            self.STATE_DIR, f"{project}_{self.browser_name}_{worker}.json"
+        )
+
+    def get_state(self, project: str) -> Optional[str]:
+        """
+        Получить актуальный storage state проекта, при необходимости залогиниться.
+
+        Args:
+            project: Имя проекта (ключ logins)
+
+        Returns:
+            Optional[str]: Путь к файлу состояния или None, если логин не удался
+        """
+        path = self.get_state_path(project)
+        if self.is_fresh(path):
+            return path
+
+        try:
+            self._login(project, path)
+        except Exception as e:
+            self.logger.warning(f"Не удалось сохранить авторизацию {project}: {e}")
+            return None
+        return path
+
+    def is_fresh(self, path: str) -> bool:
+        """
+        Проверить, что файл состояния существует, не старше TTL и cookies живы.
+
+        Args:
+            path: Путь к файлу состояния
+
+        Returns:
+            bool: True, если состоянием можно пользоваться
+        """
+        try:
+            if time.time() - os.path.getmtime(path) > self.TTL_SECONDS:
+                return False
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        deadline = time.time() + self.EXPIRY_MARGIN_SECONDS
+        for cookie in state.get("cookies", []):
+            # expires = -1 у сессионных cookies
+            if 0 < cookie.get("expires", -1) < deadline:
+                return False
+        return True
+
+    @classmethod
+    def register(cls, context: BrowserContext, path: str):
+        """Запомнить, что контекст создан из storage state path."""
+        cls._contexts[context] = path
+
+    @classmethod
+    def has_state(cls, context: BrowserContext) -> bool:
+        """Проверить, создан ли контекст с сохраненной авторизацией."""
+        return context in cls._contexts
+
+    @classmethod
+    def refresh(cls, context: BrowserContext):
+        """
+        Перезаписать storage state из контекста после повторного входа.
+
+        Вызывается, когда сохраненное состояние оказалось недействительным
+        и тесту пришлось авторизоваться через форму.
+        """
+        path = cls._contexts.get(context)
+        if path:
+            context.storage_state(path=path)
+
+    def _login(self, project: str, path: str):
+        """Залогиниться в отдельном контексте и сохранить состояние."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        context = self.browser.new_context(
+            viewport={"width": 1920, "height": 1080}, ignore_https_errors=True
+        )
+        try:
+            page = context.new_page()
+            self.logins[project](page)
+            context.storage_state(path=path)
+            self.logger.info(f"Авторизация {project} сохранена: {path}")
+        finally:
+            context.close()
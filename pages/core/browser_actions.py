@@ -1,8 +1,22 @@
 """Обёртки над Playwright API для взаимодействия с браузером."""
 
+from typing import Optional
+
 from playwright.sync_api import Locator, Page
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
+from pages.core.wait_engine import WaitEngine
+
+# Индекс первого видимого элемента среди совпадений селектора (-1 - нет).
+# Видимость: ненулевой размер и не visibility: hidden
+_FIRST_VISIBLE_JS = """
+(elements) => elements.findIndex((el) => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0
+        && getComputedStyle(el).visibility !== 'hidden';
+})
+"""
+
 
 class BrowserActions:
     """
@@ -12,6 +26,7 @@ class BrowserActions:
     - Обёртки над Playwright методами
     - Унифицированная обработка ошибок
     - Базовые действия (click, fill, wait, etc.)
+    - Событийные ожидания (через WaitEngine)
     """
 
     DEFAULT_TIMEOUT = 20000
@@ -24,6 +39,7 @@ class BrowserActions:
             page: Playwright Page объект
         """
         self.page = page
+        self.waits = WaitEngine.for_page(page)
 
     def wait_for_element(self, selector: str, timeout: int = None) -> Locator:
         """
@@ -42,29 +58,38 @@ class BrowserActions:
         if timeout is None:
             timeout = self.DEFAULT_TIMEOUT
 
-        locator = self.page.locator(selector)
-
-        try:
-            # If selector matches multiple elements, avoid strict-mode violations by waiting
-            # for *any* element to become visible, then pick the first visible.
-            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-
-            count = locator.count()
-            if count <= 1:
-                return locator
-
-            for i in range(count):
-                item = locator.nth(i)
-                try:
-                    if item.is_visible(timeout=500):
-                        return item
-                except Exception:
-                    continue
-
-            # Fallback: return first (at least one is visible due to wait_for_selector)
-            return locator.first
-        except PlaywrightTimeoutError:
+        locator = self.resolve_visible(selector, timeout)
+        if locator is None:
             raise AssertionError(f"Элемент '{selector}' не найден за {timeout}ms.")
+        return locator
+
+    def resolve_visible(self, selector: str, timeout: int = None) -> Optional[Locator]:
+        """
+        Найти первый видимый элемент селектора одним запросом в страницу.
+
+        Вместо цикла count() -> nth(i).is_visible() индекс считается одним
+        evaluate_all.
+
+        Args:
+            selector: Селектор элемента (любой синтаксис Playwright)
+            timeout: Сколько ждать появления видимого элемента (мс), None - не ждать
+
+        Returns:
+            Optional[Locator]: Locator первого видимого элемента или None
+        """
+        locator = self.page.locator(selector)
+        if timeout:
+            try:
+                locator.filter(visible=True).first.wait_for(
+                    state="visible", timeout=timeout
+                )
+            except PlaywrightTimeoutError:
+                return None
+
+        index = locator.evaluate_all(_FIRST_VISIBLE_JS)
+        if index < 0:
+            return None
+        return locator.nth(index)
 
     def click(self, selector: str, timeout: int = None, **kwargs):
         """
@@ -142,6 +167,99 @@ class BrowserActions:
         """
         self.page.wait_for_timeout(timeout)
 
+    def wait_for_dom_stable(
+        self, scope=None, quiet_ms: int = None, timeout: int = None
+    ) -> bool:
+        """
+        Ожидать затишья DOM вместо фиксированной паузы.
+
+        Args:
+            scope: Селектор или Locator поддерева (по умолчанию весь документ)
+            quiet_ms: Сколько мс без мутаций считать затишьем
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если затишье наступило, False по таймауту
+        """
+        return self.waits.wait_for_dom_stable(scope, quiet_ms, timeout)
+
+    def wait_for_animations(self, scope=None, timeout: int = None) -> bool:
+        """
+        Ожидать окончания CSS анимаций/transition.
+
+        Args:
+            scope: Селектор или Locator поддерева (по умолчанию весь документ)
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если анимации завершились, False по таймауту
+        """
+        return self.waits.wait_for_animations(scope, timeout)
+
+    def wait_for_network_idle(
+        self, request_set=None, idle_ms: int = None, timeout: int = None
+    ) -> bool:
+        """
+        Ожидать простоя сети для именованного набора запросов.
+
+        Args:
+            request_set: Имя набора из WaitEngine.REQUEST_SETS или список подстрок URL
+            idle_ms: Сколько мс без активности считать простоем
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если сеть затихла, False по таймауту
+        """
+        return self.waits.wait_for_network_idle(request_set, idle_ms, timeout)
+
+    def wait_for_class(
+        self, target, class_name: str, present: bool = True, timeout: int = None
+    ) -> bool:
+        """
+        Ожидать появления/исчезновения CSS класса (например, active).
+
+        Args:
+            target: Селектор или Locator
+            class_name: Имя класса
+            present: True - ждать появления, False - исчезновения
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если условие выполнено, False по таймауту
+        """
+        return self.waits.wait_for_class(target, class_name, present, timeout)
+
+    def wait_for_attribute(self, target, name: str, value, timeout: int = None) -> bool:
+        """
+        Ожидать значения атрибута элемента.
+
+        Args:
+            target: Селектор или Locator
+            name: Имя атрибута
+            value: Ожидаемое значение (строка или regex)
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если условие выполнено, False по таймауту
+        """
+        return self.waits.wait_for_attribute(target, name, value, timeout)
+
+    def wait_for_state(
+        self, target, state: str = "visible", timeout: int = None
+    ) -> bool:
+        """
+        Мягко ожидать состояния элемента (без исключения по таймауту).
+
+        Args:
+            target: Селектор или Locator
+            state: visible, hidden, attached или detached
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если состояние достигнуто, False по таймауту
+        """
+        return self.waits.wait_for_state(target, state, timeout)
+
     def get_element_count(self, selector: str) -> int:
         """
         Получить количество элементов.
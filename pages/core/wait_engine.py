@@ -0,0 +1,419 @@
+"""Событийные ожидания вместо фиксированных пауз wait_for_timeout."""
+
+import re
+import time
+import weakref
+from collections import deque
+from typing import Iterable, Optional, Union
+
+import allure
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import expect
+
+from utils.logger import get_logger
+
+# MutationObserver: резолвится, когда в поддереве root нет мутаций quietMs мс,
+# либо false по истечении timeoutMs.
+_DOM_QUIET_JS = """
+(root, [quietMs, timeoutMs]) => new Promise((resolve) => {
+    root = root || document.documentElement;
+    let quietTimer = null;
+    const observer = new MutationObserver(() => arm());
+    const finish = (ok) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(ok);
+    };
+    const arm = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    };
+    const deadline = setTimeout(() => finish(false), timeoutMs);
+    observer.observe(root, {
+        subtree: true, childList: true, attributes: true, characterData: true,
+    });
+    arm();
+})
+"""
+
+# Web Animations API: ждём завершения всех конечных CSS анимаций/transition
+# в поддереве root. Бесконечные анимации (спиннеры) игнорируются.
+_ANIMATIONS_DONE_JS = """
+async (root, timeoutMs) => {
+    root = root || document.documentElement;
+    // transition стартует на следующем style recalc - даём браузеру два кадра
+    await new Promise((r) => requestAnimationFrame(() => requestAnimationFrame(r)));
+    if (!root.getAnimations) return true;
+    const animations = root.getAnimations({ subtree: true }).filter(
+        (a) => a.effect && a.effect.getComputedTiming().endTime !== Infinity
+    );
+    if (!animations.length) return true;
+    return Promise.race([
+        Promise.all(animations.map((a) => a.finished.catch(() => null))).then(() => true),
+        new Promise((r) => setTimeout(() => r(false), timeoutMs)),
+    ]);
+}
+"""
+
+# Ошибки навигации во время ожидания: страница ушла, условие не дождались
+_NAVIGATION_ERRORS = (
+    "Execution context was destroyed",
+    "Frame was detached",
+)
+
+
+def _is_wait_timeout(error: Exception) -> bool:
+    """
+    Ошибка ожидания означает "не дождались", а не баг теста.
+
+    Таймаут wait_for/evaluate, неуспешный expect (AssertionError) или контекст,
+    разрушенный навигацией. Нарушение strict mode, неверный селектор и ошибки
+    JS в условии сюда не относятся.
+    """
+    if isinstance(error, (PlaywrightTimeoutError, AssertionError)):
+        return True
+    return isinstance(error, PlaywrightError) and any(
+        marker in str(error) for marker in _NAVIGATION_ERRORS
+    )
+
+
+class WaitEngine:
+    """
+    Движок ожиданий по реальным сигналам приложения.
+
+    Ответственность:
+    - Ожидание затишья DOM (MutationObserver)
+    - Ожидание окончания CSS анимаций и transition
+    - Ожидание network-idle для именованного набора запросов
+    - Ожидание смены класса/атрибута (например, active у кнопок 2D/3D)
+    - Учет фактической длительности каждого ожидания
+
+    Один экземпляр на Page (см. for_page), чтобы все компоненты страницы
+    писали длительности в общий журнал.
+    """
+
+    DEFAULT_TIMEOUT = 5000
+    DEFAULT_QUIET_MS = 300
+    DEFAULT_IDLE_MS = 500
+    POLL_INTERVAL_MS = 50
+
+    # Именованные наборы запросов для wait_for_network_idle (подстроки URL)
+    REQUEST_SETS = {
+        "map": ("maps.googleapis.com", "maps.gstatic.com", "/tiles/", "mapbox"),
+        "widget": ("widget", ".glb", ".gltf", ".ktx2", ".basis"),
+        "images": (".jpg", ".jpeg", ".png", ".webp", ".avif"),
+        "api": ("/api/", "graphql"),
+    }
+
+    _instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page):
+        """
+        Инициализация.
+
+        Args:
+            page: Playwright Page объект
+        """
+        self.page = page
+        self.records = []
+        self.logger = get_logger("WaitEngine")
+
+        # Трекинг сетевой активности для wait_for_network_idle
+        self._inflight = {}
+        self._finished = deque(maxlen=500)
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "WaitEngine":
+        """
+        Получить (или создать) движок ожиданий для страницы.
+
+        Args:
+            page: Playwright Page объект
+
+        Returns:
+            WaitEngine, общий для всех компонентов этой страницы
+        """
+        engine = cls._instances.get(page)
+        if engine is None:
+            engine = cls(page)
+            cls._instances[page] = engine
+        return engine
+
+    # ==================== УСЛОВИЯ ОЖИДАНИЯ ====================
+
+    def wait_for_dom_stable(
+        self,
+        scope: Union[str, Locator] = None,
+        quiet_ms: int = None,
+        timeout: int = None,
+    ) -> bool:
+        """
+        Ожидать, пока DOM перестанет меняться.
+
+        Args:
+            scope: Селектор или Locator поддерева (по умолчанию весь документ)
+            quiet_ms: Сколько мс без мутаций считать затишьем
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если затишье наступило, False по таймауту
+        """
+        quiet_ms = self.DEFAULT_QUIET_MS if quiet_ms is None else quiet_ms
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+
+        def condition():
+            if scope is None:
+                return self.page.evaluate(
+                    f"(args) => ({_DOM_QUIET_JS})(document.documentElement, args)",
+                    [quiet_ms, timeout],
+                )
+            return self._locator(scope).evaluate(
+                _DOM_QUIET_JS, [quiet_ms, timeout], timeout=timeout
+            )
+
+        return self._run("dom_stable", scope, timeout, condition)
+
+    def wait_for_animations(
+        self, scope: Union[str, Locator] = None, timeout: int = None
+    ) -> bool:
+        """
+        Ожидать окончания CSS анимаций и transition.
+
+        Args:
+            scope: Селектор или Locator поддерева (по умолчанию весь документ)
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если анимации завершились, False по таймауту
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+
+        def condition():
+            if scope is None:
+                return self.page.evaluate(
+                    f"(t) => ({_ANIMATIONS_DONE_JS})(document.documentElement, t)",
+                    timeout,
+                )
+            return self._locator(scope).evaluate(
+                _ANIMATIONS_DONE_JS, timeout, timeout=timeout
+            )
+
+        return self._run("animations", scope, timeout, condition)
+
+    def wait_for_network_idle(
+        self,
+        request_set: Union[str, Iterable[str]] = None,
+        idle_ms: int = None,
+        timeout: int = None,
+    ) -> bool:
+        """
+        Ожидать отсутствия сетевой активности для набора запросов.
+
+        Args:
+            request_set: Имя набора из REQUEST_SETS или список подстрок URL.
+                         None - любые запросы страницы.
+            idle_ms: Сколько мс без активности считать простоем
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если сеть затихла, False по таймауту
+        """
+        idle_ms = self.DEFAULT_IDLE_MS if idle_ms is None else idle_ms
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        patterns = self._resolve_request_set(request_set)
+
+        def condition():
+            deadline = time.monotonic() + timeout / 1000
+            while time.monotonic() < deadline:
+                now = time.monotonic()
+                busy = any(
+                    self._matches(url, patterns) for url in self._inflight.values()
+                )
+                last = max(
+                    (ts for ts, url in self._finished if self._matches(url, patterns)),
+                    default=0,
+                )
+                if not busy and (now - last) * 1000 >= idle_ms:
+                    return True
+                # wait_for_timeout прокачивает event loop - события request* доходят
+                self.page.wait_for_timeout(self.POLL_INTERVAL_MS)
+            return False
+
+        target = request_set if isinstance(request_set, str) else "custom"
+        return self._run("network_idle", target, timeout, condition)
+
+    def wait_for_class(
+        self,
+        target: Union[str, Locator],
+        class_name: str,
+        present: bool = True,
+        timeout: int = None,
+    ) -> bool:
+        """
+        Ожидать появления (или исчезновения) CSS класса у элемента.
+
+        Args:
+            target: Селектор или Locator (в т.ч. внутри frame_locator)
+            class_name: Имя класса, например "active"
+            present: True - ждать появления, False - исчезновения
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если условие выполнено, False по таймауту
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        pattern = re.compile(rf"(^|\s){re.escape(class_name)}(\s|$)")
+
+        def condition():
+            assertion = expect(self._locator(target).first)
+            if present:
+                assertion.to_have_class(pattern, timeout=timeout)
+            else:
+                assertion.not_to_have_class(pattern, timeout=timeout)
+            return True
+
+        return self._run(f"class:{class_name}", target, timeout, condition)
+
+    def wait_for_attribute(
+        self,
+        target: Union[str, Locator],
+        name: str,
+        value: Union[str, re.Pattern],
+        timeout: int = None,
+    ) -> bool:
+        """
+        Ожидать, пока атрибут элемента примет значение.
+
+        Args:
+            target: Селектор или Locator
+            name: Имя атрибута
+            value: Ожидаемое значение (строка или regex)
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если условие выполнено, False по таймауту
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+
+        def condition():
+            expect(self._locator(target).first).to_have_attribute(
+                name, value, timeout=timeout
+            )
+            return True
+
+        return self._run(f"attribute:{name}", target, timeout, condition)
+
+    def wait_for_state(
+        self, target: Union[str, Locator], state: str = "visible", timeout: int = None
+    ) -> bool:
+        """
+        Ожидать состояния элемента (visible/hidden/attached/detached).
+
+        Args:
+            target: Селектор или Locator
+            state: Ожидаемое состояние
+            timeout: Максимальное время ожидания (мс)
+
+        Returns:
+            True если условие выполнено, False по таймауту
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+
+        def condition():
+            self._locator(target).first.wait_for(state=state, timeout=timeout)
+            return True
+
+        return self._run(f"state:{state}", target, timeout, condition)
+
+    # ==================== ЖУРНАЛ ДЛИТЕЛЬНОСТЕЙ ====================
+
+    def total_duration_ms(self) -> float:
+        """Суммарное время, проведенное в ожиданиях."""
+        return round(sum(r["duration_ms"] for r in self.records), 1)
+
+    def attach_report(self, name: str = "Wait timings"):
+        """Прикрепить журнал ожиданий к Allure отчету."""
+        if not self.records:
+            return
+        lines = [
+            f"{r['wait']:<22} {r['duration_ms']:>8.1f}ms "
+            f"{'ok' if r['success'] else 'timeout':<7} {r['target']}"
+            for r in self.records
+        ]
+        lines.append(
+            f"ИТОГО: {self.total_duration_ms()}ms в {len(self.records)} ожиданиях"
+        )
+        allure.attach(
+            "\n".join(lines), name=name, attachment_type=allure.attachment_type.TEXT
+        )
+
+    # ==================== ВНУТРЕННИЕ МЕТОДЫ ====================
+
+    def _run(self, wait_name: str, target, timeout: int, condition) -> bool:
+        """Выполнить условие, измерить и записать длительность."""
+        started = time.perf_counter()
+        try:
+            success = bool(condition())
+        except Exception as e:
+            # Таймаут expect/wait_for или разрушенный контекст при навигации -
+            # "не дождались", остальное (strict mode, селектор, JS) - ошибка
+            if not _is_wait_timeout(e):
+                raise
+            success = False
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        self.records.append(
+            {
+                "wait": wait_name,
+                "target": self._describe(target),
+                "duration_ms": duration_ms,
+                "timeout_ms": timeout,
+                "success": success,
+            }
+        )
+        self.logger.debug(
+            f"{wait_name} [{self._describe(target)}]: {duration_ms}ms "
+            f"({'ok' if success else 'timeout'})"
+        )
+        return success
+
+    def _locator(self, target: Union[str, Locator]) -> Locator:
+        """Привести селектор к Locator."""
+        if isinstance(target, str):
+            return self.page.locator(target)
+        return target
+
+    @staticmethod
+    def _describe(target) -> str:
+        """Короткое описание цели ожидания для журнала."""
+        if target is None:
+            return "document"
+        return str(target)[:120]
+
+    def _resolve_request_set(self, request_set) -> Optional[tuple]:
+        """Получить список подстрок URL для набора запросов."""
+        if request_set is None:
+            return None
+        if isinstance(request_set, str):
+            if request_set not in self.REQUEST_SETS:
+                raise ValueError(f"Неизвестный набор запросов: {request_set}")
+            return self.REQUEST_SETS[request_set]
+        return tuple(request_set)
+
+    @staticmethod
+    def _matches(url: str, patterns: Optional[tuple]) -> bool:
+        """Проверить, относится ли URL к набору запросов."""
+        return patterns is None or any(p in url for p in patterns)
+
+    def _on_request(self, request):
+        self._inflight[request] = request.url
+
+    def _on_request_done(self, request):
+        url = self._inflight.pop(request, request.url)
+        self._finished.append((time.monotonic(), url))
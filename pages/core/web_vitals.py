@@ -0,0 +1,254 @@
+"""Метрики загрузки страницы: Navigation Timing, paint, LCP, CLS, long tasks."""
+
+import json
+import os
+import time
+import weakref
+from typing import Optional
+
+import allure
+from playwright.sync_api import Page
+
+from utils.logger import get_logger
+from utils.metrics_file import append_record
+
+# Режимы сбора (WEB_VITALS / --web-vitals)
+WEB_VITALS_MODES = ("off", "open", "steps")
+
+# Init script: PerformanceObserver'ы ставятся до скриптов страницы, чтобы
+# не пропустить LCP, сдвиги верстки и long tasks первой загрузки.
+# Неподдерживаемые браузером типы записей (LCP/longtask в Firefox и WebKit)
+# остаются null, а не 0.
+_VITALS_INIT_JS = """
+(() => {
+    if (window.__autotestVitals) return;
+    const supported = (PerformanceObserver.supportedEntryTypes || []);
+    const vitals = window.__autotestVitals = {
+        lcp: null,
+        cls: supported.includes('layout-shift') ? 0 : null,
+        longTasks: supported.includes('longtask') ? 0 : null,
+        longTaskMs: supported.includes('longtask') ? 0 : null,
+        blockingMs: supported.includes('longtask') ? 0 : null,
+    };
+    const observe = (type, callback) => {
+        if (!supported.includes(type)) return;
+        new PerformanceObserver((list) => list.getEntries().forEach(callback))
+            .observe({ type, buffered: true });
+    };
+    observe('largest-contentful-paint', (entry) => {
+        vitals.lcp = entry.renderTime || entry.loadTime || entry.startTime;
+    });
+    observe('layout-shift', (entry) => {
+        if (!entry.hadRecentInput) vitals.cls += entry.value;
+    });
+    observe('longtask', (entry) => {
+        vitals.longTasks += 1;
+        vitals.longTaskMs += entry.duration;
+        vitals.blockingMs += Math.max(0, entry.duration - 50);
+    });
+})();
+"""
+
+# Снимок метрик текущего документа (мс от начала навигации)
+_COLLECT_JS = """
+() => {
+    const round = (value) => value == null ? null : Math.round(value * 10) / 10;
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = {};
+    performance.getEntriesByType('paint').forEach((p) => { paint[p.name] = p.startTime; });
+    const vitals = window.__autotestVitals || {};
+    return {
+        url: location.href,
+        time_origin: performance.timeOrigin,
+        ttfb: nav ? round(nav.responseStart - nav.startTime) : null,
+        dom_content_loaded: nav ? round(nav.domContentLoadedEventEnd - nav.startTime) : null,
+        load: nav && nav.loadEventEnd ? round(nav.loadEventEnd - nav.startTime) : null,
+        transfer_kb: nav ? round(nav.transferSize / 1024) : null,
+        first_paint: round(paint['first-paint']),
+        fcp: round(paint['first-contentful-paint']),
+        lcp: round(vitals.lcp),
+        cls: vitals.cls == null ? null : Math.round(vitals.cls * 10000) / 10000,
+        long_tasks: vitals.longTasks ?? null,
+        long_task_ms: round(vitals.longTaskMs),
+        total_blocking_ms: round(vitals.blockingMs),
+    };
+}
+"""
+
+# Накопительные счетчики, по которым считается прирост за шаг
+_STEP_COUNTERS = ("cls", "long_tasks", "long_task_ms", "total_blocking_ms")
+
+
+class WebVitals:
+    """
+    Сбор метрик производительности страницы.
+
+    Ответственность:
+    - Установка PerformanceObserver'ов (LCP, CLS, long tasks) на страницу
+    - Снимок Navigation Timing и paint после открытия страницы
+    - Прирост CLS и long tasks за время allure.step (режим steps)
+    - Запись замеров в JSONL файл метрик и в Allure
+
+    Каждый замер помечается проектом, типом роута, браузером и устройством.
+    Один экземпляр на Page (см. for_page), как у WaitEngine.
+    """
+
+    _instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page):
+        """
+        Инициализация.
+
+        Args:
+            page: Playwright Page объект
+        """
+        self.page = page
+        self.records = []
+        self.logger = get_logger("WebVitals")
+
+        browser = page.context.browser
+        self.tags = {
+            "browser": browser.browser_type.name if browser else None,
+            "device": os.getenv("MOBILE_DEVICE", "desktop"),
+        }
+
+        if self.get_mode() != "off":
+            page.add_init_script(script=_VITALS_INIT_JS)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "WebVitals":
+        """
+        Получить (или создать) сборщик метрик для страницы.
+
+        Args:
+            page: Playwright Page объект
+
+        Returns:
+            WebVitals, общий для всех компонентов этой страницы
+        """
+        vitals = cls._instances.get(page)
+        if vitals is None:
+            vitals = cls(page)
+            cls._instances[page] = vitals
+        return vitals
+
+    @staticmethod
+    def get_mode() -> str:
+        """Режим сбора: off, open (после открытия страниц) или steps (+ шаги)."""
+        return os.getenv("WEB_VITALS", "off").lower()
+
+    def measure(self, name: str, **tags) -> Optional[dict]:
+        """
+        Снять метрики загрузки текущего документа.
+
+        Args:
+            name: Имя замера (open, goto_project...)
+            **tags: Метки замера (project, route_type); запоминаются для шагов
+
+        Returns:
+            dict: Замер или None, если сбор выключен или страница недоступна
+        """
+        if self.get_mode() == "off":
+            return None
+        self.tags.update(tags)
+
+        metrics = self._collect()
+        if metrics is None:
+            return None
+        metrics.pop("time_origin")
+        record = self._record("navigation", name, metrics)
+
+        self.logger.info(
+            f"{name}: TTFB {metrics['ttfb']}ms, FCP {metrics['fcp']}ms, "
+            f"LCP {metrics['lcp']}ms, CLS {metrics['cls']}, "
+            f"long tasks {metrics['long_tasks']} ({metrics['long_task_ms']}ms)"
+        )
+        return record
+
+    def start_step(self, title: str) -> Optional[dict]:
+        """
+        Снимок перед шагом (режим steps).
+
+        Args:
+            title: Заголовок allure.step
+
+        Returns:
+            dict: Состояние для stop_step или None
+        """
+        if self.get_mode() != "steps":
+            return None
+        snapshot = self._collect()
+        if snapshot is None:
+            return None
+        return {"title": title, "started": time.perf_counter(), "before": snapshot}
+
+    def stop_step(self, state: dict, depth: int = 0, failed: bool = False):
+        """
+        Записать прирост метрик за шаг.
+
+        Если за шаг была навигация, счетчики нового документа берутся целиком.
+
+        Args:
+            state: Результат start_step
+            depth: Вложенность шага
+            failed: Шаг завершился исключением
+        """
+        duration_ms = round((time.perf_counter() - state["started"]) * 1000, 1)
+        after = self._collect()
+        if after is None:
+            return
+
+        before = state["before"]
+        navigated = after["time_origin"] != before["time_origin"]
+        metrics = {
+            "url": after["url"],
+            "duration_ms": duration_ms,
+            "depth": depth,
+            "failed": failed,
+            "navigated": navigated,
+            "lcp": after["lcp"],
+        }
+        for counter in _STEP_COUNTERS:
+            if after[counter] is None:
+                metrics[counter] = None
+            elif navigated or before[counter] is None:
+                metrics[counter] = after[counter]
+            else:
+                metrics[counter] = round(after[counter] - before[counter], 4)
+        self._record("step", state["title"], metrics)
+
+    def attach_report(self, name: str = "Web vitals"):
+        """Прикрепить замеры теста к Allure (JSON) и очистить журнал."""
+        if not self.records:
+            return
+        allure.attach(
+            json.dumps(self.records, ensure_ascii=False, indent=2),
+            name=name,
+            attachment_type=allure.attachment_type.JSON,
+        )
+        self.records = []
+
+    # ==================== ВНУТРЕННИЕ МЕТОДЫ ====================
+
+    def _collect(self) -> Optional[dict]:
+        """Снимок метрик из страницы (None, если страница закрыта или навигирует)."""
+        try:
+            return self.page.evaluate(_COLLECT_JS)
+        except Exception as e:
+            self.logger.debug(f"Метрики не сняты: {e}")
+            return None
+
+    def _record(self, kind: str, name: str, metrics: dict) -> dict:
+        """Добавить замер в журнал и дописать в файл метрик."""
+        record = {
+            "ts": round(time.time(), 3),
+            "kind": kind,
+            "name": name,
+            "test": os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0],
+            "environment": os.getenv("TEST_ENVIRONMENT", "dev"),
+            **self.tags,
+            **metrics,
+        }
+        self.records.append(record)
+        append_record(record)
+        return record
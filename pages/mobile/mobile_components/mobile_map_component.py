@@ -10,6 +10,7 @@ from locators.mobile_locators import (
     MOBILE_MODAL_MASK,
     MOBILE_PROJECT_INFO_MODAL,
 )
+from pages.core.browser_actions import BrowserActions
 
 
 class MobileMapComponent:
@@ -30,6 +31,7 @@ class MobileMapComponent:
             page: Playwright Page объект
         """
         self.page = page
+        self.browser = BrowserActions(page)
 
     def get_mobile_project_selector(self, project_name: str) -> str:
         """Получить мобильный селектор для проекта."""
@@ -117,12 +119,12 @@ class MobileMapComponent:
                         """
                         )
                         # Ждем завершения анимации панорамирования
-                        self.page.wait_for_timeout(1000)
+                        self.browser.wait_for_animations(timeout=1000)
             except Exception:
                 # Если не удалось панорамировать, пробуем просто скролл
                 try:
                     project_element.scroll_into_view_if_needed()
-                    self.page.wait_for_timeout(500)
+                    self.browser.wait_for_animations(timeout=500)
                 except Exception:
                     pass  # Продолжаем без панорамирования
 
@@ -137,8 +139,8 @@ class MobileMapComponent:
             # Ждем появления мобильного модального окна
             # Для willows_residences модальное окно может не появляться сразу или иметь другую структуру
             if project_name.lower() == "willows_residences":
-                # Ждем немного и проверяем наличие кнопки Explore Project
-                self.page.wait_for_timeout(2000)
+                # Ждем дорисовки карточки и проверяем наличие кнопки Explore Project
+                self.browser.wait_for_dom_stable(quiet_ms=300, timeout=2000)
                 explore_button = self.page.locator(
                     '[data-test-id*="map-project-point-button-mobile-willows"]'
                 )
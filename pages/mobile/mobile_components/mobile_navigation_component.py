@@ -13,6 +13,8 @@ from locators.mobile_locators import (
     MOBILE_VIEW_BUTTON,
     get_mobile_building_selector,
 )
+from pages.core.apartment_scanner import ApartmentScanner
+from pages.core.browser_actions import BrowserActions
 
 
 class MobileNavigationComponent:
@@ -33,6 +35,8 @@ class MobileNavigationComponent:
             page: Playwright Page объект
         """
         self.page = page
+        self.browser = BrowserActions(page)
+        self.scanner = ApartmentScanner(page)
 
     def close_zoom_modal(self) -> bool:
         """Закрывает модальное окно 'Zoom and drag screen'."""
@@ -150,13 +154,14 @@ class MobileNavigationComponent:
 
                     if floor_text.strip() == floor_number:
                         floor_element.click(force=True)
-                        self.page.wait_for_timeout(500)
 
                         # Проверяем появление кнопки "View floor"
                         view_floor_button = self.page.locator(
                             'button:has-text("View floor")'
                         )
-                        if view_floor_button.is_visible():
+                        if self.browser.wait_for_state(
+                            view_floor_button, "visible", timeout=500
+                        ):
                             allure.attach(
                                 f"Кнопка 'View floor' найдена после клика по этажу {floor_number}",
                                 name="View Floor Found",
@@ -317,7 +322,7 @@ class MobileNavigationComponent:
             menu_toggle = self.page.locator('[data-test-id="nav-mobile-menu-toggle"]')
             menu_toggle.wait_for(state="visible", timeout=20000)
             menu_toggle.click()
-            self.page.wait_for_timeout(1000)
+            self.browser.wait_for_animations(timeout=1000)
             return True
         except Exception as e:
             allure.attach(
@@ -333,7 +338,7 @@ class MobileNavigationComponent:
             building_menu = self.page.locator('[data-test-id="nav-mobile-building"]')
             building_menu.wait_for(state="visible", timeout=5000)
             building_menu.click()
-            self.page.wait_for_timeout(1000)
+            self.browser.wait_for_animations(timeout=1000)
             return True
         except Exception as e:
             allure.attach(
@@ -351,7 +356,6 @@ class MobileNavigationComponent:
             )
             building_item.wait_for(state="visible", timeout=5000)
             building_item.click()
-            self.page.wait_for_timeout(2000)
 
             # Проверяем переход
             self.page.wait_for_url(
@@ -372,7 +376,7 @@ class MobileNavigationComponent:
             floor_item = self.page.locator(f'xpath=//div[@data-key="{floor_number}"]')
             floor_item.wait_for(state="visible", timeout=20000)
             floor_item.first.click()
-            self.page.wait_for_timeout(1000)
+            self.browser.wait_for_animations(timeout=1000)
             return True
         except Exception as e:
             allure.attach(
@@ -390,7 +394,7 @@ class MobileNavigationComponent:
             )
             view_floor_button.wait_for(state="visible", timeout=5000)
             view_floor_button.click()
-            self.page.wait_for_timeout(2000)
+            self.browser.wait_for_dom_stable(quiet_ms=300, timeout=2000)
             return True
         except Exception as e:
             allure.attach(
@@ -409,7 +413,7 @@ class MobileNavigationComponent:
 
             apartment_number = first_apartment.text_content()
             first_apartment.click()
-            self.page.wait_for_timeout(2000)
+            self.browser.wait_for_dom_stable(quiet_ms=300, timeout=2000)
 
             return apartment_number
         except Exception as e:
@@ -430,10 +434,10 @@ class MobileNavigationComponent:
 
             # Скроллим к кнопке, чтобы она была видна
             view_apartment_button.scroll_into_view_if_needed()
-            self.page.wait_for_timeout(500)
+            self.browser.wait_for_animations(view_apartment_button, timeout=500)
 
             view_apartment_button.click()
-            self.page.wait_for_timeout(3000)
+            self.browser.wait_for_dom_stable(quiet_ms=500, timeout=3000)
             return True
         except Exception as e:
             allure.attach(
@@ -449,7 +453,7 @@ class MobileNavigationComponent:
             view_3d_button = self.page.get_by_role("button", name="Посмотреть 3D Тур")
             view_3d_button.wait_for(state="visible", timeout=20000)
             view_3d_button.first.click()
-            self.page.wait_for_timeout(3000)
+            self.browser.wait_for_dom_stable(quiet_ms=500, timeout=3000)
             return True
         except Exception as e:
             allure.attach(
@@ -468,85 +472,37 @@ class MobileNavigationComponent:
                          Если указан "arisha", используется оптимизированная логика проверки замков.
         """
         with allure.step("Ищем свободный apartment"):
-            self.page.wait_for_timeout(MOBILE_TIMEOUTS["apartment_load"])
-
-            # Ищем все apartments
-            apartment_titles = self.page.locator(MOBILE_APARTMENT_SELECTOR)
-            apartment_count = apartment_titles.count()
-
-            if apartment_count == 0:
-                raise AssertionError("Apartments не найдены")
+            # Ждем появления каталога и окончания его дорисовки
+            self.browser.wait_for_state(
+                MOBILE_APARTMENT_SELECTOR,
+                "attached",
+                timeout=MOBILE_TIMEOUTS["apartment_load"],
+            )
+            self.browser.wait_for_dom_stable(quiet_ms=300, timeout=1000)
 
-            # Для Arisha используем оптимизированную логику (проверка замков рядом)
+            # Для Arisha замок может стоять рядом с заголовком, а не в карточке:
+            # учитываем замки в радиусе 300px
             is_arisha = project_name and project_name.lower() == "arisha"
 
-            if is_arisha:
-                # Оптимизированная логика для Arisha: находим все замки заранее
-                all_lock_elements = self.page.locator(MOBILE_APARTMENT_LOCK_ICON)
-                lock_count = all_lock_elements.count()
-
-                # Сохраняем координаты всех замков
-                lock_positions = []
-                for j in range(lock_count):
-                    try:
-                        lock = all_lock_elements.nth(j)
-                        box = lock.bounding_box()
-                        if box:
-                            lock_positions.append({"x": box["x"], "y": box["y"]})
-                    except:
-                        pass
-
-            # Ищем первый доступный apartment (без замка)
-            for i in range(apartment_count):
-                apartment_title = apartment_titles.nth(i)
-
-                if not apartment_title.is_visible():
-                    continue
+            # Видимость, боксы и замки всех apartments - одним evaluate
+            apartments = self.scanner.scan(
+                MOBILE_APARTMENT_SELECTOR,
+                lock_mode="nearby" if is_arisha else "card",
+                lock_selector=MOBILE_APARTMENT_LOCK_ICON,
+            )
 
-                has_lock = False
+            if not apartments:
+                raise AssertionError("Apartments не найдены")
 
-                if is_arisha:
-                    # Для Arisha: проверяем замки рядом с элементом (в радиусе 300px)
-                    try:
-                        apt_box = apartment_title.bounding_box()
-                        if apt_box:
-                            # Проверяем замки внутри элемента
-                            lock_icon_inside = apartment_title.locator(
-                                "xpath=.//span[@role='img' and @aria-label='lock']"
-                            )
-                            has_lock_inside = lock_icon_inside.count() > 0
-
-                            # Проверяем замки рядом
-                            has_lock_nearby = False
-                            for lock_pos in lock_positions:
-                                distance_x = abs(lock_pos["x"] - apt_box["x"])
-                                distance_y = abs(lock_pos["y"] - apt_box["y"])
-                                if distance_x < 300 and distance_y < 300:
-                                    has_lock_nearby = True
-                                    break
-
-                            has_lock = has_lock_inside or has_lock_nearby
-                    except:
-                        # Если не удалось проверить, используем стандартную логику
-                        parent_card = apartment_title.locator(
-                            'xpath=ancestor::div[contains(@class, "ant-card")]'
-                        )
-                        has_lock = (
-                            parent_card.locator(MOBILE_APARTMENT_LOCK_ICON).count() > 0
-                        )
-                else:
-                    # Стандартная логика для других проектов
-                    parent_card = apartment_title.locator(
-                        'xpath=ancestor::div[contains(@class, "ant-card")]'
+            apartment = self.scanner.find_available(apartments)
+            if apartment:
+                with allure.step(
+                    f"Кликаем на доступный apartment {apartment['index'] + 1}"
+                ):
+                    self.scanner.click(apartment)
+                    self.browser.wait_for_dom_stable(
+                        quiet_ms=500, timeout=MOBILE_TIMEOUTS["medium"]
                     )
-                    has_lock = (
-                        parent_card.locator(MOBILE_APARTMENT_LOCK_ICON).count() > 0
-                    )
-
-                if not has_lock:
-                    with allure.step(f"Кликаем на доступный apartment {i+1}"):
-                        apartment_title.click()
-                        self.page.wait_for_timeout(MOBILE_TIMEOUTS["medium"])
-                        return True
+                    return True
 
             raise AssertionError("Доступные apartments не найдены")
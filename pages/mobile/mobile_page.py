@@ -125,10 +125,11 @@ class MobilePage(BasePage):
     def wait_for_apartment_widget_load(self):
         """Ожидание полной загрузки виджета апартамента."""
         with allure.step("Ожидаем полной загрузки виджета апартамента"):
-            # Ждем появления iframe (увеличенный таймаут для мобильных устройств в CI)
-            self.page.wait_for_selector("iframe[class*='_iframe_']", timeout=20000)
-            # Ждем загрузки содержимого внутри iframe
-            self.page.wait_for_timeout(4000)
+            # Та же проба готовности, что и на десктопе (сцена + кнопки 2D/3D)
+            widget = self.apartment_widget or ApartmentWidgetComponent(
+                self.page, self.project_locators
+            )
+            widget.wait_for_widget_load()
 
     def verify_elire_services_modal_displayed(self):
         """Проверить отображение модального окна Services & Amenities для Elire."""
@@ -155,7 +156,9 @@ class MobilePage(BasePage):
             if right_arrow.count() > 0:
                 for i in range(3):
                     right_arrow.first.click(force=True)
-                    self.page.wait_for_timeout(800)
+                    self.browser.wait_for_animations(
+                        self.project_locators.AMENITIES_SLIDER, timeout=800
+                    )
 
         with allure.step("Тестируем навигацию по слайдеру - кликаем влево"):
             left_arrow = self.page.locator(
@@ -164,7 +167,9 @@ class MobilePage(BasePage):
             if left_arrow.count() > 0:
                 for i in range(2):
                     left_arrow.first.click(force=True)
-                    self.page.wait_for_timeout(800)
+                    self.browser.wait_for_animations(
+                        self.project_locators.AMENITIES_SLIDER, timeout=800
+                    )
 
     def close_elire_services_modal(self):
         """Закрыть модальное окно Services & Amenities."""
@@ -277,7 +282,7 @@ class MobilePage(BasePage):
                 arisha_button = self.page.locator(MOBILE_ARISHA_MENU_BUTTON)
                 arisha_button.wait_for(state="visible", timeout=20000)
                 arisha_button.click()
-                self.page.wait_for_timeout(1000)  # Ждем открытия меню
+                self.browser.wait_for_animations(timeout=1000)  # Ждем открытия меню
 
                 # 5. Кликаем на "ALL UNITS"
                 all_units_button = self.page.locator(MOBILE_ALL_UNITS_BUTTON)
@@ -302,7 +307,7 @@ class MobilePage(BasePage):
                 )
                 menu_button.wait_for(state="visible", timeout=20000)
                 menu_button.click()
-                self.page.wait_for_timeout(1000)  # Ждем открытия меню
+                self.browser.wait_for_animations(timeout=1000)  # Ждем открытия меню
 
                 # 2. Кликаем на ALL UNITS в меню
                 all_units_button = self.page.locator(
@@ -371,7 +376,9 @@ class MobilePage(BasePage):
                     if parent_tag.lower() == "button":
                         with allure.step(f"Кликаем на PDF кнопку {i+1}"):
                             parent_button.click()
-                            self.page.wait_for_timeout(MOBILE_TIMEOUTS["medium"])
+                            self.browser.wait_for_dom_stable(
+                                quiet_ms=500, timeout=MOBILE_TIMEOUTS["medium"]
+                            )
 
                             # Проверяем, появился ли диалог скачивания
                             download_dialogs = self.page.locator(
@@ -480,7 +487,7 @@ class MobilePage(BasePage):
             self.page.mouse.wheel(distance, 0)
 
         # Ждем завершения прокрутки
-        self.page.wait_for_timeout(500)
+        self.browser.wait_for_animations(timeout=500)
 
     def simulate_mobile_swipe(self, start_x: int, start_y: int, end_x: int, end_y: int):
         """Симулировать свайп на мобильном устройстве."""
@@ -533,7 +540,7 @@ class MobilePage(BasePage):
 
         if view_3d_button.count() > 1:
             view_3d_button.nth(1).click(force=True)
-            self.page.wait_for_timeout(3000)
+            self.browser.wait_for_dom_stable(quiet_ms=500, timeout=3000)
             return "/apartment/" in self.page.url
         return False
 
@@ -97,6 +97,8 @@ class MarkPage(BasePage):
         self.page.evaluate("document.body.style.zoom = '1'")
         self.page.evaluate("document.documentElement.style.zoom = '1'")
 
+        self.measure_page_load("open")
+
     def download_pdf_and_verify(self):
         """
         Скачать и проверить PDF для mark.
@@ -161,8 +163,9 @@ class MarkPage(BasePage):
                 modal_pdf_button.click()
 
                 download = download_info.value
-                file_path = os.path.join("downloads", download.suggested_filename)
-                os.makedirs("downloads", exist_ok=True)
+                downloads_dir = self.get_downloads_dir()
+                file_path = os.path.join(downloads_dir, download.suggested_filename)
+                os.makedirs(downloads_dir, exist_ok=True)
                 download.save_as(file_path)
 
         allure.attach(
@@ -180,8 +183,9 @@ class MarkPage(BasePage):
         import os
         import shutil
 
-        if os.path.exists("downloads"):
-            shutil.rmtree("downloads")
+        downloads_dir = self.get_downloads_dir()
+        if os.path.exists(downloads_dir):
+            shutil.rmtree(downloads_dir)
             print("Удалены скачанные файлы")
 
     def click_mobile_pdf_button(self):
@@ -193,7 +197,7 @@ class MarkPage(BasePage):
             pdf_button = self.page.locator(self.project_locators.DOWNLOAD_PDF_BUTTON)
             pdf_button.wait_for(state="visible", timeout=20000)
             pdf_button.click()
-            self.page.wait_for_timeout(1000)
+            self.browser.wait_for_dom_stable(quiet_ms=300, timeout=1000)
             return True
 
     def check_mobile_viewport_adaptation(self):
@@ -221,7 +225,7 @@ class MarkPage(BasePage):
 
             # Ждем появления и стабилизации дропдауна
             self.page.wait_for_selector(building_button, state="visible", timeout=5000)
-            self.page.wait_for_timeout(500)  # Ждем завершения анимации
+            self.browser.wait_for_animations(building_button, timeout=500)
 
             button = self.page.locator(building_button)
             button.click()
@@ -249,7 +253,7 @@ class MarkPage(BasePage):
 
             # Ждем появления и стабилизации дропдауна
             self.page.wait_for_selector(floor_button, state="visible", timeout=5000)
-            self.page.wait_for_timeout(500)  # Ждем завершения анимации
+            self.browser.wait_for_animations(floor_button, timeout=500)
 
             button = self.page.locator(floor_button)
             button.click()
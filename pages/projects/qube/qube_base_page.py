@@ -94,8 +94,9 @@ class QubeBasePage(BasePage):
             self.browser.click(self.project_locators.DOWNLOAD_PDF_BUTTON, timeout=15000)
 
         download = download_info.value
-        file_path = os.path.join("downloads", download.suggested_filename)
-        os.makedirs("downloads", exist_ok=True)
+        downloads_dir = self.get_downloads_dir()
+        file_path = os.path.join(downloads_dir, download.suggested_filename)
+        os.makedirs(downloads_dir, exist_ok=True)
         download.save_as(file_path)
 
         allure.attach(
@@ -113,6 +114,7 @@ class QubeBasePage(BasePage):
         import os
         import shutil
 
-        if os.path.exists("downloads"):
-            shutil.rmtree("downloads")
+        downloads_dir = self.get_downloads_dir()
+        if os.path.exists(downloads_dir):
+            shutil.rmtree(downloads_dir)
             print("Удалены скачанные файлы")
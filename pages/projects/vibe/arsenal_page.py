@@ -47,3 +47,5 @@ class ArsenalPage(QubeBasePage):
         # Принудительно сбрасываем масштаб страницы
         self.page.evaluate("document.body.style.zoom = '1'")
         self.page.evaluate("document.documentElement.style.zoom = '1'")
+
+        self.measure_page_load("open")
@@ -0,0 +1 @@
+"""Бенчмарки производительности каталогов."""
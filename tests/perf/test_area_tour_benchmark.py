@@ -0,0 +1,116 @@
+import json
+
+import allure
+import pytest
+
+from pages.page_factory import PageFactory
+from utils.benchmark import format_summary, record_results, summarize_results
+from utils.logger import get_logger
+
+logger = get_logger("Benchmark")
+
+# (проект, пункт меню панорам MARK или None - кнопка 360 тура)
+AREA_TOURS = [
+    ("peylaa", None),
+    ("arisha", None),
+    ("mark", "yard"),
+    ("mark", "lobby-k1"),
+    ("mark", "lobby-k2"),
+    ("mark", "lobby-k3"),
+]
+
+TOUR_METRICS = (
+    "first_frame_ms",
+    "fps",
+    "p95_frame_ms",
+    "long_frames",
+    "image_requests",
+    "image_kb",
+    "decoded_image_mb",
+)
+
+
+@allure.feature("Производительность - 360 тур")
+@pytest.mark.benchmark
+class TestAreaTourBenchmark:
+    """Тяжесть 360 туров: первый кадр, FPS вращения, картинки и их память."""
+
+    @allure.story("Рендеринг 360 тура")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize(
+        "project, menu_item",
+        AREA_TOURS,
+        ids=[f"{project}-{item or 'tour'}" for project, item in AREA_TOURS],
+    )
+    def test_area_tour_rendering(
+        self,
+        browser,
+        browser_context_args,
+        project,
+        menu_item,
+        bench_config,
+        device_name,
+    ):
+        """
+        Открыть 360 тур N раз, повращать его и посчитать median/p95/p99.
+
+        Итерации идут последовательно, каждая в новом контексте: FPS
+        зависит от загрузки машины, поэтому --bench-concurrency не учитывается.
+        """
+        results = []
+        for iteration in range(bench_config["iterations"]):
+            context = browser.new_context(**browser_context_args)
+            try:
+                with allure.step(f"Итерация #{iteration + 1}"):
+                    project_page = PageFactory.get_page_by_project(
+                        context.new_page(), project
+                    )
+                    if project == "mark":
+                        project_page.open()
+                    else:
+                        project_page.goto_project(project)
+                    results.append(
+                        {
+                            "ok": True,
+                            "result": project_page.area_tour_360.benchmark(menu_item),
+                            "error": None,
+                        }
+                    )
+            except Exception as e:
+                results.append({"ok": False, "result": None, "error": e})
+            finally:
+                context.close()
+
+        tour = f"{project} {menu_item or 'tour'}"
+        summaries = summarize_results(
+            [r["result"] for r in results if r["ok"]], TOUR_METRICS
+        )
+        report = format_summary(
+            f"{tour} {bench_config['browser_name']}/{device_name}", summaries
+        )
+        logger.info(f"\n{report}")
+        allure.attach(
+            report, name="360 tour", attachment_type=allure.attachment_type.TEXT
+        )
+        allure.attach(
+            json.dumps(summaries, indent=2),
+            name="360 tour summary",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        # Панорамы MARK - отдельные замеры: tour_360_yard, tour_360_lobby_k1...
+        record_results(
+            f"tour_360_{menu_item.replace('-', '_')}" if menu_item else "tour_360",
+            results,
+            project=project,
+            browser=bench_config["browser_name"],
+            device=device_name,
+        )
+
+        with allure.step("Проверяем, что тур отрисовался во всех итерациях"):
+            errors = [str(r["error"]) for r in results if not r["ok"]]
+            assert not errors, f"Итерации с ошибкой: {errors}"
+            missing = summaries["first_frame_ms"]["missing"]
+            assert not missing, (
+                f"Первый кадр тура {tour} не отрисовался в {missing} "
+                f"из {len(results)} итераций"
+            )
@@ -0,0 +1,39 @@
+import allure
+import pytest
+
+from utils.load_generator import (
+    JOURNEYS,
+    LoadGenerator,
+    format_report,
+    run_load,
+)
+from utils.logger import get_logger
+
+logger = get_logger("LoadGenerator")
+
+
+@allure.feature("Производительность - Нагрузочный прогон")
+class TestLoadGeneratorStandIn:
+    """Проверка самого генератора нагрузки на локальной подмене каталога."""
+
+    @allure.story("Сценарии на подмене каталога")
+    @allure.severity(allure.severity_level.MINOR)
+    @pytest.mark.parametrize("journey", JOURNEYS)
+    def test_journey_on_stand_in(self, journey, stand_in, browser_name):
+        """Все посетители проходят сценарий, по каждому шагу есть замеры."""
+        stand_in.latency_ms = 20
+        generator = LoadGenerator(journey, "arisha", stages=[(3, 1)])
+        with allure.step(f"Прогон {journey}: 3 посетителя за 1 секунду"):
+            report = run_load(generator, browser_name=browser_name)
+
+        text = format_report(report, generator.histograms)
+        logger.info(f"\n{text}")
+        allure.attach(
+            text, name="Load report", attachment_type=allure.attachment_type.TEXT
+        )
+
+        with allure.step("Проверяем, что все сценарии прошли"):
+            assert report["journeys"] == {"ok": 3, "failed": 0}, report["errors"]
+            assert report["peak_users"] >= 1
+            for step, summary in report["steps"].items():
+                assert summary["n"] == 3, f"Шаг {step}: {summary}"
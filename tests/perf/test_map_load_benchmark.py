@@ -0,0 +1,104 @@
+import json
+
+import allure
+import pytest
+
+from conftest import _get_urls_by_environment
+from locators.map_locators import MapLocators
+from pages.aio.components.map_component import AsyncMapComponent
+from utils.benchmark import (
+    format_summary,
+    record_results,
+    run_iterations,
+    summarize_results,
+)
+from utils.logger import get_logger
+
+logger = get_logger("Benchmark")
+
+# Карта -> (ключ URL окружения, тип роута, селектор маркеров проектов)
+MAP_ROUTES = {
+    "qube_map": ("map", "map", MapLocators.ALL_PROJECTS_SELECTOR),
+    "qube_agent": ("agent", "agent", MapLocators.ALL_PROJECTS_SELECTOR),
+    "qube_client": ("client", "client", MapLocators.ALL_PROJECTS_SELECTOR),
+    "capstone": ("capstone_map", "map", MapLocators.ALL_PROJECTS_SELECTOR),
+    "wellcube": ("wellcube_map", "map", MapLocators.ALL_PROJECTS_SELECTOR),
+    "vibe_arsenal": ("vibe_arsenal", "map", 'div[aria-label*="ARSENAL"]'),
+    "abra": ("abra_willows_residences", "map", MapLocators.ALL_PROJECTS_SELECTOR),
+    "msg": ("msg_edgewater", "map", MapLocators.ALL_PROJECTS_SELECTOR),
+}
+
+MAP_LOAD_METRICS = (
+    "container_visible_ms",
+    "first_marker_ms",
+    "first_clickable_ms",
+    "markers_rendered_ms",
+)
+
+
+@allure.feature("Производительность - Загрузка карт")
+@pytest.mark.benchmark
+class TestMapLoadBenchmark:
+    """Время загрузки карт застройщиков: контейнер, маркеры, первый клик."""
+
+    @allure.story("Загрузка карты")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize("cache", ["cold", "warm"])
+    @pytest.mark.parametrize("route", MAP_ROUTES)
+    def test_map_load(self, route, cache, bench_config, device_name):
+        """
+        Открыть карту N раз и посчитать median/p95/p99 этапов загрузки.
+
+        cold - каждая итерация в новом контексте с пустым кэшем,
+        warm - в том же контексте карта сначала открывается один раз.
+        """
+        url_key, route_type, marker_selector = MAP_ROUTES[route]
+        url = _get_urls_by_environment()[url_key]
+
+        async def scenario(page):
+            map_component = AsyncMapComponent(page, None)
+            if cache == "warm":
+                await page.goto(url, wait_until="commit")
+                await map_component.measure_load(marker_selector)
+            await page.goto(url, wait_until="commit")
+            return await map_component.measure_load(marker_selector)
+
+        with allure.step(
+            f"Открываем {url} {bench_config['iterations']} раз "
+            f"({cache}, параллельно {bench_config['concurrency']})"
+        ):
+            results = run_iterations(scenario, **bench_config)
+
+        summaries = summarize_results(
+            [r["result"] for r in results if r["ok"]], MAP_LOAD_METRICS
+        )
+        report = format_summary(
+            f"{route} ({cache}) {bench_config['browser_name']}/{device_name}",
+            summaries,
+        )
+        logger.info(f"\n{report}")
+        allure.attach(
+            report, name="Map load", attachment_type=allure.attachment_type.TEXT
+        )
+        allure.attach(
+            json.dumps(summaries, indent=2),
+            name="Map load summary",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        record_results(
+            f"map_load_{cache}",
+            results,
+            project=route,
+            route_type=route_type,
+            browser=bench_config["browser_name"],
+            device=device_name,
+        )
+
+        with allure.step("Проверяем, что карта загрузилась во всех итерациях"):
+            errors = [str(r["error"]) for r in results if not r["ok"]]
+            assert not errors, f"Итерации с ошибкой: {errors}"
+            missing = summaries["markers_rendered_ms"]["missing"]
+            assert not missing, (
+                f"Маркеры проектов не отрисовались за {AsyncMapComponent.MAP_LOAD_TIMEOUT}ms "
+                f"в {missing} из {len(results)} итераций"
+            )
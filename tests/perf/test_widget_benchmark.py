@@ -0,0 +1,117 @@
+import json
+import os
+
+import allure
+import pytest
+
+from conftest import _is_auth_required
+from pages.aio.components.apartment_widget_component import (
+    AsyncApartmentWidgetComponent,
+)
+from pages.base_page import BasePage
+from utils.benchmark import (
+    format_summary,
+    record_results,
+    run_iterations,
+    summarize_results,
+)
+from utils.catalog_crawler import PROJECT_LOCATORS
+from utils.logger import get_logger
+from utils.units_provider import AvailableUnitsProvider
+
+logger = get_logger("Benchmark")
+
+WIDGET_PROJECTS = ["arisha", "elire", "cubix", "mark"]
+
+WIDGET_METRICS = ("frame_attach_ms", "first_paint_ms", "interactive_ms")
+
+
+def _get_benchmark_apartment(project: str):
+    """Апартамент для замера: BENCH_APARTMENT_<PROJECT>, API каталога или инвентарь."""
+    return os.getenv(
+        f"BENCH_APARTMENT_{project.upper()}"
+    ) or AvailableUnitsProvider.shared().get_available_unit(project)
+
+
+@allure.feature("Производительность - Виджет апартамента")
+@pytest.mark.benchmark
+class TestWidgetBenchmark:
+    """Готовность iframe виджета: старт фрейма, первая сцена, кнопки 2D/3D."""
+
+    @allure.story("Готовность виджета")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.parametrize("cache", ["cold", "warm"])
+    @pytest.mark.parametrize("project", WIDGET_PROJECTS)
+    def test_widget_readiness(
+        self, page, request, project, cache, bench_config, device_name
+    ):
+        """
+        Открыть страницу апартамента N раз и посчитать median/p95/p99 готовности.
+
+        Апартамент берется из BENCH_APARTMENT_<PROJECT> или из
+        AvailableUnitsProvider (API каталога, инвентарь make crawl-dev).
+        """
+        apartment = _get_benchmark_apartment(project)
+        if not apartment:
+            pytest.skip(
+                f"Нет апартамента {project}: задайте BENCH_APARTMENT_{project.upper()} "
+                "или запустите make crawl-dev"
+            )
+
+        locators_class = PROJECT_LOCATORS[project]
+        url = BasePage(page, None, locators_class).get_project_url(
+            project, apartment=apartment
+        )
+        context_args = dict(bench_config["context_args"])
+        if _is_auth_required(project):
+            context_args["storage_state"] = request.getfixturevalue(
+                "auth_state_store"
+            ).get_state(project)
+
+        async def scenario(page):
+            widget = AsyncApartmentWidgetComponent(page, locators_class, project)
+            if cache == "warm":
+                await page.goto(url, wait_until="commit")
+                await widget.probe_readiness()
+            await page.goto(url, wait_until="commit")
+            return await widget.probe_readiness()
+
+        with allure.step(
+            f"Открываем {url} {bench_config['iterations']} раз "
+            f"({cache}, параллельно {bench_config['concurrency']})"
+        ):
+            results = run_iterations(
+                scenario, **{**bench_config, "context_args": context_args}
+            )
+
+        ready = [r["result"] for r in results if r["ok"]]
+        summaries = summarize_results(ready, WIDGET_METRICS)
+        report = format_summary(
+            f"{project} ({cache}) {bench_config['browser_name']}/{device_name}",
+            summaries,
+        )
+        logger.info(f"\n{report}")
+        allure.attach(
+            report, name="Widget readiness", attachment_type=allure.attachment_type.TEXT
+        )
+        allure.attach(
+            json.dumps(summaries, indent=2),
+            name="Widget readiness summary",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        record_results(
+            f"widget_{cache}",
+            results,
+            project=project,
+            browser=bench_config["browser_name"],
+            device=device_name,
+        )
+
+        with allure.step("Проверяем, что виджет был готов во всех итерациях"):
+            errors = [str(r["error"]) for r in results if not r["ok"]]
+            assert not errors, f"Итерации с ошибкой: {errors}"
+            not_ready = [r for r in ready if not r["ready"]]
+            assert not not_ready, (
+                f"Виджет {project} не стал готов в {len(not_ready)} из "
+                f"{len(results)} итераций: {not_ready}"
+            )
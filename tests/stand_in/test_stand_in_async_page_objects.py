@@ -0,0 +1,115 @@
+import allure
+import pytest
+
+from locators.qube.arisha_locators import ArishaLocators
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.components.apartment_widget_component import (
+    AsyncApartmentWidgetComponent,
+)
+from pages.aio.core.apartment_scanner import AsyncApartmentScanner
+from pages.aio.runner import format_results, run_scenarios
+from utils.stand_in_server import STAND_IN_AMENITIES_SLIDES
+
+# Все тесты модуля идут против локальной подмены каталога
+pytestmark = pytest.mark.usefixtures("stand_in")
+
+
+def _assert_all_ok(results: dict):
+    """Все сценарии выполнены, иначе - таблица результатов в сообщении."""
+    report = format_results(results)
+    allure.attach(
+        report, name="Async scenarios", attachment_type=allure.attachment_type.TEXT
+    )
+    assert all(outcome["ok"] for outcome in results.values()), report
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Асинхронный слой")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_async_page_objects(stand_in, browser_name):
+    """Асинхронные компоненты проходят те же сценарии, что и sync, одновременно."""
+    map_url = f"{stand_in.base_url}/map"
+
+    async def explore_project(page):
+        base = AsyncBasePage(page, map_url, ArishaLocators)
+        await base.open(route_type="agent")
+        await base.map.navigate_to_project("arisha")
+        base.assertions.assert_url_contains(
+            "/project/arisha/area", "Не перешли на страницу проекта с карты"
+        )
+
+    async def amenities(page):
+        base = AsyncBasePage(page, map_url, ArishaLocators)
+        await base.goto_project("arisha", page_type="catalog_2d")
+        await base.amenities.click_explore_button()
+        await base.amenities.verify_modal_displayed()
+        await base.amenities.verify_modal_title()
+        await base.amenities.verify_slider_displayed()
+        assert await base.amenities.verify_slider_images() == STAND_IN_AMENITIES_SLIDES
+        await base.amenities.navigate_slider("next", 2)
+        await base.amenities.close_modal()
+        await base.amenities.verify_modal_closed()
+
+    async def apartment_widget(page):
+        base = AsyncBasePage(page, map_url, ArishaLocators)
+        await base.goto_project("arisha", apartment="102")
+        widget = AsyncApartmentWidgetComponent(page, ArishaLocators, "arisha")
+        readiness = await widget.probe_readiness()
+        assert readiness["ready"], f"Виджет не готов: {readiness}"
+        await widget.switch_to_2d_mode()
+        assert await widget.check_mode_button_active("2D")
+        await widget.switch_to_3d_mode()
+        assert await widget.check_mode_button_active("3D")
+
+    async def floor_scan(page):
+        base = AsyncBasePage(page, map_url, ArishaLocators)
+        await base.goto_project("arisha", building="2", floor="3")
+        scanner = AsyncApartmentScanner(page)
+        apartments = await scanner.scan(ArishaLocators.FLOOR_PLAN_APARTMENTS)
+        # Первый апартамент этажа под замком - доступен второй
+        assert apartments[0]["locked"] is True
+        apartment = scanner.find_available(apartments)
+        await scanner.click(apartment)
+        await page.wait_for_url("**/apartment/2302", timeout=5000)
+
+    _assert_all_ok(
+        run_scenarios(
+            {
+                "explore_project": explore_project,
+                "amenities": amenities,
+                "apartment_widget": apartment_widget,
+                "floor_scan": floor_scan,
+            },
+            browser_name=browser_name,
+        )
+    )
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Асинхронный слой")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_run_scenarios_isolates_failures(stand_in, browser_name):
+    """Упавший сценарий не прерывает остальные, у каждого свой контекст."""
+    url = f"{stand_in.base_url}/project/arisha/area"
+
+    async def broken(page):
+        await page.goto(url)
+        await page.evaluate("localStorage.setItem('leak', '1')")
+        raise AssertionError("сценарий упал")
+
+    async def isolated(page):
+        await page.goto(url)
+        return await page.evaluate("localStorage.getItem('leak')")
+
+    results = run_scenarios(
+        {"broken": broken, "isolated": isolated},
+        browser_name=browser_name,
+        concurrency=1,
+    )
+
+    assert list(results) == ["broken", "isolated"]
+    assert not results["broken"]["ok"]
+    assert isinstance(results["broken"]["error"], AssertionError)
+    assert results["isolated"]["ok"], format_results(results)
+    assert results["isolated"]["result"] is None, "Данные утекли между контекстами"
+    assert all(outcome["duration"] >= 0 for outcome in results.values())
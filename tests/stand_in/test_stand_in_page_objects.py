@@ -0,0 +1,149 @@
+import allure
+import pytest
+
+from utils.stand_in_server import STAND_IN_AMENITIES_SLIDES, STAND_IN_PAGE_SIZE
+from utils.units_provider import AvailableUnitsProvider
+
+# Все тесты модуля идут против локальной подмены каталога
+pytestmark = pytest.mark.usefixtures("stand_in")
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Карта и Explore Project")
+@allure.severity(allure.severity_level.MINOR)
+@pytest.mark.parametrize("route_type", ["map", "agent", "client"])
+def test_stand_in_map_explore_project(arisha_page, route_type):
+    """Карта открывается, проект выбирается маркером и кнопкой Explore."""
+    arisha_page.open(route_type=route_type)
+    arisha_page.map.navigate_to_project("arisha")
+    arisha_page.assertions.assert_url_contains(
+        "/project/arisha/area", "Не перешли на страницу проекта с карты"
+    )
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Навигация по зданиям и этажам")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_building_floor_navigation(arisha_page):
+    """nav-desktop-building-* и nav-desktop-floor-* ведут на план этажа."""
+    arisha_page.goto_project("arisha")
+
+    arisha_page.navigate_to_building(building_number=2)
+    arisha_page.assertions.assert_url_contains("/building/2", "Не перешли к зданию")
+
+    arisha_page.navigate_to_floor(floor_number=3)
+    arisha_page.assertions.assert_url_contains("/floor/2/3", "Не перешли к этажу")
+
+    with allure.step("Первый апартамент под замком - кликается следующий"):
+        assert arisha_page.navigation.click_apartment_on_floor()
+        arisha_page.page.wait_for_url("**/apartment/2302", timeout=5000)
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Explore Amenities")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_amenities(arisha_page):
+    """Модалка public-zone-info-flow-modal: заголовок, слайдер, точки, закрытие."""
+    arisha_page.goto_project("arisha", page_type="catalog_2d")
+    arisha_page.amenities.click_explore_button()
+    arisha_page.amenities.verify_modal_displayed()
+    arisha_page.amenities.verify_modal_title()
+    arisha_page.amenities.verify_modal_close_button()
+    arisha_page.amenities.verify_slider_displayed()
+    assert arisha_page.amenities.verify_slider_images() == STAND_IN_AMENITIES_SLIDES
+    assert arisha_page.amenities.verify_slider_indicators() == STAND_IN_AMENITIES_SLIDES
+
+    arisha_page.amenities.click_indicator(1)
+    arisha_page.page.wait_for_selector(
+        f"{arisha_page.project_locators.AMENITIES_SLIDER_INDICATORS}"
+        ":nth-child(2)[class*='active']",
+        timeout=2000,
+    )
+    arisha_page.amenities.click_slider_prev()
+    arisha_page.page.wait_for_selector(
+        f"{arisha_page.project_locators.AMENITIES_SLIDER_INDICATORS}"
+        ":nth-child(1)[class*='active']",
+        timeout=2000,
+    )
+
+    arisha_page.amenities.close_modal()
+    arisha_page.amenities.verify_modal_closed()
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("360 Area Tour")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_area_tour_360(arisha_page):
+    """Модалка rotation-view-360-modal открывается с кадром тура и закрывается."""
+    arisha_page.goto_project("arisha")
+    arisha_page.area_tour_360.click_360_button()
+    arisha_page.area_tour_360.verify_modal_displayed()
+    arisha_page.area_tour_360.verify_content()
+    arisha_page.area_tour_360.close_modal()
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Виджет апартамента")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_apartment_widget(arisha_page):
+    """Виджет в iframe готов, control-2d/control-360 переключают режим."""
+    arisha_page.goto_project("arisha", apartment="102")
+    arisha_page.apartment_widget.wait_for_widget_load()
+
+    arisha_page.apartment_widget.switch_to_2d_mode()
+    assert arisha_page.apartment_widget.check_mode_button_active("2D")
+    assert not arisha_page.apartment_widget.check_mode_button_active("3D")
+
+    arisha_page.apartment_widget.switch_to_3d_mode()
+    assert arisha_page.apartment_widget.check_mode_button_active("3D")
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Пагинация каталога")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_catalog_pagination(arisha_page, stand_in):
+    """li.ant-pagination-item-2 переключает страницу каталога."""
+    arisha_page.goto_project("arisha", page_type="catalog_2d")
+    sections = arisha_page.page.locator("section")
+    visible = arisha_page.page.locator("section:visible")
+    assert visible.count() == STAND_IN_PAGE_SIZE
+
+    arisha_page.page.locator("li.ant-pagination-item-2").click()
+    arisha_page.page.wait_for_selector(
+        "li.ant-pagination-item-2.ant-pagination-item-active", timeout=2000
+    )
+    assert visible.count() == sections.count() - STAND_IN_PAGE_SIZE
+    assert visible.first.inner_text().startswith(str(101 + STAND_IN_PAGE_SIZE))
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Доступный апартамент")
+@allure.severity(allure.severity_level.MINOR)
+@pytest.mark.parametrize("source", ["api", "catalog"])
+def test_stand_in_open_available_apartment(arisha_page, stand_in, source, monkeypatch):
+    """Апартамент открывается прямой ссылкой из API или находится в каталоге."""
+    provider = AvailableUnitsProvider(stand_in.api_url if source == "api" else None)
+    monkeypatch.setattr(AvailableUnitsProvider, "_shared", provider)
+    if source == "catalog":
+        # Источник ничего не знает - остается поиск в UI
+        monkeypatch.setattr(provider, "_fetch", lambda project: [])
+
+    unit = arisha_page.open_available_apartment("arisha", route_type="agent")
+    if source == "api":
+        assert unit == "102", f"Открыт не первый доступный апартамент: {unit}"
+    # Первый апартамент каталога под замком - открывается второй
+    arisha_page.page.wait_for_url("**/agent/project/arisha/apartment/102")
+
+
+@allure.feature("Самопроверка - Page objects на подмене каталога")
+@allure.story("Sales Offer")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_sales_offer_pdf(arisha_page):
+    """На агентском роуте Sales Offer скачивает PDF."""
+    arisha_page.goto_project("arisha", apartment="102", route_type="agent")
+    arisha_page.click_sales_offer_button()
+    try:
+        success, file_path = arisha_page.download_pdf_and_verify()
+        assert success, f"PDF не скачан: {file_path}"
+    finally:
+        arisha_page.cleanup_pdf_after_test()
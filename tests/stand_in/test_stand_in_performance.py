@@ -0,0 +1,88 @@
+import time
+
+import allure
+import pytest
+
+from pages.components.map_component import MapComponent
+from utils.benchmark import summarize
+
+pytestmark = pytest.mark.usefixtures("stand_in")
+
+# Задержка подмены, которую должны увидеть замеры
+LATENCY_MS = 150
+
+
+@allure.feature("Самопроверка - Замеры на подмене каталога")
+@allure.story("Загрузка карты")
+@allure.severity(allure.severity_level.MINOR)
+@pytest.mark.parametrize("latency_ms", [0, LATENCY_MS])
+def test_stand_in_map_load_probe(page, stand_in, latency_ms):
+    """Проба загрузки карты видит все маркеры и не раньше задержки сервера."""
+    stand_in.latency_ms = latency_ms
+    page.goto(stand_in.environ()["DEV_BASE_URL"], wait_until="commit")
+    result = MapComponent(page, None).measure_load(quiet_ms=300, timeout=10000)
+    allure.attach(str(result), name="Map load")
+
+    assert result["markers"] == 3, result
+    assert result["first_clickable_ms"] is not None, result
+    assert result["first_marker_ms"] >= latency_ms, result
+    assert (
+        result["container_visible_ms"]
+        <= result["first_marker_ms"]
+        <= result["markers_rendered_ms"]
+    ), result
+
+
+@allure.feature("Самопроверка - Замеры на подмене каталога")
+@allure.story("Готовность виджета")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_widget_readiness_probe(arisha_page, stand_in):
+    """Первая сцена виджета отрисована не раньше, чем пришел документ iframe."""
+    arisha_page.goto_project("arisha", apartment="102")
+    stand_in.latency_ms = LATENCY_MS
+    arisha_page.page.reload(wait_until="commit")
+    probe = arisha_page.apartment_widget.probe_readiness(timeout=10000)
+    allure.attach(str(probe), name="Widget readiness")
+
+    assert probe["ready"] and probe["scene"] == "canvas", probe
+    assert probe["frame_attach_ms"] >= LATENCY_MS, probe
+    assert probe["first_paint_ms"] - probe["frame_attach_ms"] >= LATENCY_MS, probe
+    assert probe["interactive_ms"] >= probe["frame_attach_ms"], probe
+
+
+@allure.feature("Самопроверка - Замеры на подмене каталога")
+@allure.story("Бенчмарк 360 тура")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_area_tour_benchmark(arisha_page, stand_in):
+    """Первый кадр тура учитывает задержку картинки, вращение дает FPS."""
+    arisha_page.goto_project("arisha")
+    stand_in.latency_ms = LATENCY_MS
+    result = arisha_page.area_tour_360.benchmark(rotate_ms=1000)
+
+    assert result["content"] == "img", result
+    assert result["first_frame_ms"] >= LATENCY_MS, result
+    assert result["fps"] and result["fps"] > 0, result
+    assert result["image_requests"] >= 1, result
+
+
+@allure.feature("Самопроверка - Замеры на подмене каталога")
+@allure.story("Задержка и разброс подмены")
+@allure.severity(allure.severity_level.MINOR)
+def test_stand_in_latency_jitter(page, stand_in):
+    """Время ответа лежит в latency_ms +- jitter_ms и действительно разбросано."""
+    stand_in.latency_ms, stand_in.jitter_ms = 100, 50
+    url = f"{stand_in.base_url}/img/jitter.svg"
+
+    durations = []
+    for _ in range(20):
+        started = time.perf_counter()
+        response = page.request.get(url)
+        durations.append((time.perf_counter() - started) * 1000)
+        assert response.ok
+    summary = summarize(durations)
+    allure.attach(str(summary), name="Stand-in latency")
+
+    # Сверху - запас на накладные расходы локального запроса
+    assert summary["min"] >= 50, summary
+    assert summary["max"] <= 150 + 100, summary
+    assert summary["max"] - summary["min"] > 10, summary
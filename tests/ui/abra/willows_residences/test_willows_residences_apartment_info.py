@@ -9,14 +9,13 @@ import pytest
 @pytest.mark.ui
 def test_willows_residences_apartment_info(willows_residences_page):
     """Тест отображения информации об аппарте для проекта Willows Residences."""
-    with allure.step("Открываем карту Abra"):
-        willows_residences_page.open(route_type="map")
-
-    with allure.step("Кликаем на проект Willows Residences"):
-        willows_residences_page.map.navigate_to_project("willows_residences")
+    with allure.step("Открываем страницу проекта Willows Residences"):
+        willows_residences_page.goto_project(
+            "willows_residences", page_type="catalog_2d"
+        )
 
-    with allure.step("Проверяем, что мы на странице catalog_2d после Explore Project"):
-        # После navigate_to_project мы уже на catalog_2d
+    with allure.step("Проверяем, что мы на странице catalog_2d"):
+        # После goto_project мы уже на catalog_2d
         willows_residences_page.page.wait_for_load_state("domcontentloaded")
         willows_residences_page.page.wait_for_timeout(2000)
         willows_residences_page.assertions.assert_url_contains(
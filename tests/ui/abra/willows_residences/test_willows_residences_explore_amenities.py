@@ -9,11 +9,10 @@ import pytest
 @pytest.mark.ui
 def test_willows_residences_explore_amenities(willows_residences_page):
     """Тест Explore Amenities для проекта Willows Residences."""
-    with allure.step("Открываем карту Abra"):
-        willows_residences_page.open(route_type="map")
-
-    with allure.step("Кликаем на проект Willows Residences"):
-        willows_residences_page.map.navigate_to_project("willows_residences")
+    with allure.step("Открываем страницу проекта Willows Residences"):
+        willows_residences_page.goto_project(
+            "willows_residences", page_type="catalog_2d"
+        )
 
     with allure.step("Проверяем наличие кнопки Explore Amenities"):
         willows_residences_page.browser.expect_visible(
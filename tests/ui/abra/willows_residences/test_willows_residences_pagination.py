@@ -9,11 +9,10 @@ import pytest
 @pytest.mark.ui
 def test_willows_residences_catalog_pagination(willows_residences_page):
     """Тест пагинации каталога аппартов для проекта Willows Residences."""
-    with allure.step("Открываем карту Abra"):
-        willows_residences_page.open(route_type="map")
-
-    with allure.step("Кликаем на проект Willows Residences"):
-        willows_residences_page.map.navigate_to_project("willows_residences")
+    with allure.step("Открываем страницу проекта Willows Residences"):
+        willows_residences_page.goto_project(
+            "willows_residences", page_type="catalog_2d"
+        )
 
     with allure.step("Проверяем, что мы на странице catalog_2d"):
         willows_residences_page.page.wait_for_load_state("domcontentloaded")
@@ -9,11 +9,10 @@ import pytest
 @pytest.mark.ui
 def test_willows_residences_view_brochures(willows_residences_page):
     """Тест View Brochures для проекта Willows Residences - проверка открытия Google таблицы."""
-    with allure.step("Открываем карту Abra"):
-        willows_residences_page.open(route_type="map")
-
-    with allure.step("Кликаем на проект Willows Residences"):
-        willows_residences_page.map.navigate_to_project("willows_residences")
+    with allure.step("Открываем страницу проекта Willows Residences"):
+        willows_residences_page.goto_project(
+            "willows_residences", page_type="catalog_2d"
+        )
 
     with allure.step("Проверяем наличие кнопки View Brochures"):
         # Ищем кнопку View Brochures (для desktop используем второй элемент, индекс 1)
@@ -9,11 +9,8 @@ import pytest
 @pytest.mark.ui
 def test_peylaa_360_area_tour(peylaa_page):
     """Тест 360 Area Tour для проекта Peylaa."""
-    with allure.step("Открываем карту Capstone"):
-        peylaa_page.open()
-
-    with allure.step("Кликаем на проект Peylaa"):
-        peylaa_page.map.navigate_to_project("peylaa")
+    with allure.step("Открываем страницу проекта Peylaa"):
+        peylaa_page.goto_project("peylaa")
 
     with allure.step("Кликаем на кнопку Area tour"):
         peylaa_page.area_tour_360.click_360_button()
@@ -9,17 +9,8 @@ import pytest
 @pytest.mark.ui
 def test_mark_apartment_widget_full_functionality(mark_page):
     """Тест полного функционала виджета апартамента MARK."""
-    with allure.step("Открываем главную страницу MARK"):
-        mark_page.open()
-
-    with allure.step("Кликаем на кнопку All units"):
-        mark_page.click_all_units_button()
-        mark_page.assertions.assert_url_contains(
-            "catalog_2d", "Не перешли на страницу каталога"
-        )
-
-    with allure.step("Ищем и кликаем на первый доступный апартамент"):
-        mark_page.navigation.find_and_click_available_apartment(project_name="mark")
+    with allure.step("Открываем доступный апартамент MARK"):
+        mark_page.open_available_apartment("mark")
 
     with allure.step("Ожидаем полной загрузки виджета апартамента"):
         mark_page.apartment_widget.wait_for_widget_load()
@@ -12,14 +12,8 @@ def test_mark_download_pdf(mark_page):
     downloaded_file_path = ""
 
     try:
-        with allure.step("Открываем главную страницу MARK"):
-            mark_page.open()
-
-        with allure.step("Кликаем на кнопку All units для перехода на catalog2d"):
-            mark_page.click_all_units_button()
-
-        with allure.step("Ищем и кликаем на первый доступный апартамент"):
-            mark_page.navigation.find_and_click_available_apartment(project_name="mark")
+        with allure.step("Открываем доступный апартамент MARK"):
+            mark_page.open_available_apartment("mark")
 
         with allure.step("Ожидаем полной загрузки виджета апартамента"):
             mark_page.apartment_widget.wait_for_widget_load()
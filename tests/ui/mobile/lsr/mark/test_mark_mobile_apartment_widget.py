@@ -9,24 +9,8 @@ import pytest
 @pytest.mark.mobile
 def test_mark_mobile_apartment_widget_full_functionality(mark_page):
     """Тест полного функционала виджета апартамента MARK на мобильном устройстве."""
-    with allure.step("Открываем главную страницу MARK (mobile)"):
-        mark_page.open()
-
-    with allure.step("Переходим в каталог через мобильное меню"):
-        menu_toggle = mark_page.page.locator(
-            mark_page.project_locators.NAV_MOBILE_MENU_TOGGLE
-        )
-        menu_toggle.wait_for(state="visible", timeout=20000)
-        menu_toggle.click()
-
-        catalog_button = mark_page.page.locator(
-            mark_page.project_locators.NAV_MOBILE_CATALOG2D
-        )
-        catalog_button.wait_for(state="visible", timeout=20000)
-        catalog_button.click()
-
-    with allure.step("Ищем и кликаем на первый доступный апартамент"):
-        mark_page.navigation.find_and_click_available_apartment(project_name="mark")
+    with allure.step("Открываем доступный апартамент MARK (mobile)"):
+        mark_page.open_available_apartment("mark")
 
     with allure.step("Ожидаем полной загрузки виджета апартамента"):
         mark_page.apartment_widget.wait_for_widget_load()
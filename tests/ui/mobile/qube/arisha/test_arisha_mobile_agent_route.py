@@ -15,18 +15,10 @@ class TestArishaMobileAgentRoute:
         """Тест скачивания PDF на странице каталога Arisha на мобильном устройстве."""
 
         try:
-            with allure.step("Переходим на страницу каталога Arisha"):
-                mobile_page.navigate_to_mobile_catalog_page("arisha")
-                current_url = mobile_page.page.url
-                mobile_page.assertions.assert_that(
-                    "catalog_2d" in current_url or "/area" in current_url,
-                    "Не перешли на страницу каталога или area",
-                )
-
-            with allure.step("Ищем и кликаем на первый доступный апартамент"):
-                mobile_page.mobile_navigation.find_and_click_available_apartment(
-                    project_name="arisha"
-                )
+            with allure.step(
+                "Открываем доступный апартамент Arisha на агентском роуте"
+            ):
+                mobile_page.open_available_apartment("arisha", route_type="agent")
                 mobile_page.page.wait_for_timeout(5000)
 
             with allure.step("Кликаем на кнопку PDF"):
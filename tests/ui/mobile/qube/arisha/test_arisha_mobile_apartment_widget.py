@@ -15,18 +15,8 @@ def test_arisha_mobile_apartment_widget_full_functionality(mobile_page, route_ty
     if route_type == "client":
         pytest.skip("Тест нестабилен в CI/CD для client route")
 
-    with allure.step(f"Открываем страницу {route_type} и переходим к проекту Arisha"):
-        mobile_page.open(route_type=route_type)
-        mobile_page.mobile_map.click_project("arisha")
-
-    with allure.step("Кликаем на Explore Project"):
-        mobile_page.mobile_map.click_explore_project("arisha")
-
-    with allure.step("Кликаем на All units"):
-        mobile_page.navigate_to_mobile_arisha_all_units()
-
-    with allure.step("Ищем и кликаем на первый доступный апартамент"):
-        mobile_page.mobile_navigation.find_and_click_available_apartment()
+    with allure.step(f"Открываем доступный апартамент Arisha на роуте {route_type}"):
+        mobile_page.open_available_apartment("arisha", route_type=route_type)
 
     mobile_page.wait_for_apartment_widget_load()
 
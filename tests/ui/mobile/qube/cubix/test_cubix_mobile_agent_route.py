@@ -14,17 +14,8 @@ class TestCubixMobileAgentRoute:
         """Тест скачивания PDF на странице каталога Cubix на мобильном устройстве."""
 
         try:
-            with allure.step("Открываем агентскую страницу"):
-                mobile_page.open(route_type="agent")
-
-            with allure.step("Кликаем на проект Cubix на карте"):
-                mobile_page.mobile_map.click_project("cubix")
-
-            with allure.step("Кликаем на Explore Project"):
-                mobile_page.mobile_map.click_explore_project("cubix")
-
-            with allure.step("Ищем и кликаем на первый доступный апартамент"):
-                mobile_page.mobile_navigation.find_and_click_available_apartment()
+            with allure.step("Открываем доступный апартамент Cubix на агентском роуте"):
+                mobile_page.open_available_apartment("cubix", route_type="agent")
                 mobile_page.page.wait_for_timeout(1000)
 
             with allure.step("Кликаем на кнопку PDF"):
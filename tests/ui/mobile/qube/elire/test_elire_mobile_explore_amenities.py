@@ -11,11 +11,8 @@ import pytest
 @pytest.mark.skip(reason="Пофиксить")
 def test_elire_mobile_explore_amenities(mobile_page, route_type):
     """Тест Explore Amenities для проекта Elire на всех роутах."""
-    with allure.step(f"Открываем страницу {route_type}"):
-        mobile_page.open(route_type=route_type)
-
-    with allure.step("Кликаем на проект Elire"):
-        mobile_page.map.navigate_to_project("elire")
+    with allure.step(f"Открываем страницу проекта Elire на роуте {route_type}"):
+        mobile_page.goto_project("elire", route_type=route_type)
 
     with allure.step("Кликаем на кнопку Services & Amenities"):
         mobile_page.click_services_amenities_button()
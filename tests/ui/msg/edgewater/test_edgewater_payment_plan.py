@@ -9,11 +9,8 @@ import pytest
 @pytest.mark.ui
 def test_edgewater_payment_plan(edgewater_page):
     """Тест Payment Plan для проекта Edgewater."""
-    with allure.step("Открываем карту MSG"):
-        edgewater_page.open(route_type="map")
-
-    with allure.step("Кликаем на проект Edgewater"):
-        edgewater_page.map.navigate_to_project("edgewater")
+    with allure.step("Открываем страницу проекта Edgewater"):
+        edgewater_page.goto_project("edgewater")
 
     with allure.step("Кликаем на кнопку All Units для перехода на catalog2d"):
         edgewater_page.browser.expect_visible(
@@ -11,11 +11,8 @@ import pytest
 @pytest.mark.parametrize("route_type", ["map", "agent", "client"])
 def test_arisha_360_area_tour(arisha_page, route_type):
     """Тест 360 Area Tour для проекта Arisha на всех роутах."""
-    with allure.step(f"Открываем страницу {route_type}"):
-        arisha_page.open(route_type=route_type)
-
-    with allure.step("Кликаем на проект Arisha"):
-        arisha_page.map.navigate_to_project("arisha")
+    with allure.step(f"Открываем страницу проекта Arisha на роуте {route_type}"):
+        arisha_page.goto_project("arisha", route_type=route_type)
 
     with allure.step("Кликаем на кнопку 360 Area Tour"):
         arisha_page.area_tour_360.click_360_button()
@@ -13,20 +13,8 @@ def test_arisha_download_pdf_on_agent_page(arisha_page):
     downloaded_file_path = ""
 
     try:
-        with allure.step("Открываем агентскую страницу"):
-            arisha_page.open(route_type="agent")
-
-        with allure.step("Кликаем на проект Arisha"):
-            arisha_page.map.navigate_to_project("arisha")
-
-        with allure.step("Кликаем на кнопку All units"):
-            arisha_page.click_all_units_button()
-            arisha_page.assertions.assert_url_contains(
-                "catalog_2d", "Не перешли на страницу каталога"
-            )
-
-        with allure.step("Ищем и кликаем на первый доступный апартамент"):
-            arisha_page.navigation.find_and_click_available_apartment()
+        with allure.step("Открываем доступный апартамент Arisha на агентском роуте"):
+            arisha_page.open_available_apartment("arisha", route_type="agent")
             arisha_page.browser.wait_for_timeout(1000)
 
         with allure.step("Кликаем на кнопку Sales Offer"):
@@ -18,18 +18,8 @@ import pytest
 def test_arisha_apartment_widget_full_functionality(arisha_page, route_type):
     """Тест полного функционала виджета апартамента Arisha на всех роутах."""
 
-    with allure.step(f"Открываем страницу {route_type} и переходим к проекту Arisha"):
-        arisha_page.open(route_type=route_type)
-        arisha_page.map.navigate_to_project("arisha")
-
-    with allure.step("Кликаем на кнопку All units"):
-        arisha_page.click_all_units_button()
-        arisha_page.assertions.assert_url_contains(
-            "catalog_2d", "Не перешли на страницу каталога"
-        )
-
-    with allure.step("Ищем и кликаем на первый доступный апартамент"):
-        arisha_page.navigation.find_and_click_available_apartment()
+    with allure.step(f"Открываем доступный апартамент Arisha на роуте {route_type}"):
+        arisha_page.open_available_apartment("arisha", route_type=route_type)
 
     with allure.step("Ожидаем полной загрузки виджета апартамента"):
         arisha_page.apartment_widget.wait_for_widget_load()
@@ -94,18 +84,8 @@ def test_arisha_apartment_widget_full_functionality(arisha_page, route_type):
 def test_arisha_apartment_information(arisha_page, route_type):
     """Тест проверки информации об апартаменте Arisha на всех роутах."""
 
-    with allure.step(f"Открываем страницу {route_type} и переходим к проекту Arisha"):
-        arisha_page.open(route_type=route_type)
-        arisha_page.map.navigate_to_project("arisha")
-
-    with allure.step("Кликаем на кнопку All units"):
-        arisha_page.click_all_units_button()
-        arisha_page.assertions.assert_url_contains(
-            "catalog_2d", "Не перешли на страницу каталога"
-        )
-
-    with allure.step("Ищем и кликаем на первый доступный апартамент"):
-        arisha_page.navigation.find_and_click_available_apartment()
+    with allure.step(f"Открываем доступный апартамент Arisha на роуте {route_type}"):
+        arisha_page.open_available_apartment("arisha", route_type=route_type)
 
     with allure.step("Ожидаем полной загрузки страницы апартамента"):
         arisha_page.apartment_info.wait_for_info_to_appear()
@@ -12,9 +12,8 @@ import pytest
 def test_arisha_building_floor_apartment_navigation(arisha_page, route_type):
     """Тест навигации по зданиям, этажам и апартаментам проекта Arisha на всех роутах."""
 
-    with allure.step(f"Открываем страницу {route_type} и переходим к проекту Arisha"):
-        arisha_page.open(route_type=route_type)
-        arisha_page.map.navigate_to_project("arisha")
+    with allure.step(f"Открываем страницу проекта Arisha на роуте {route_type}"):
+        arisha_page.goto_project("arisha", route_type=route_type)
 
     with allure.step("Выбираем здание 1"):
         arisha_page.navigate_to_building(building_number=1)
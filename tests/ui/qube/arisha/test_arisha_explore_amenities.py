@@ -11,11 +11,8 @@ import pytest
 @pytest.mark.parametrize("route_type", ["map", "agent", "client"])
 def test_arisha_explore_amenities(arisha_page, route_type):
     """Тест Explore Amenities для проекта Arisha на всех роутах."""
-    with allure.step(f"Открываем страницу {route_type}"):
-        arisha_page.open(route_type=route_type)
-
-    with allure.step("Кликаем на проект Arisha"):
-        arisha_page.map.navigate_to_project("arisha")
+    with allure.step(f"Открываем страницу проекта Arisha на роуте {route_type}"):
+        arisha_page.goto_project("arisha", route_type=route_type)
 
     with allure.step("Кликаем на кнопку All units для перехода на catalog2d"):
         arisha_page.click_all_units_button()
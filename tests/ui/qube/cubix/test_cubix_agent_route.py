@@ -13,14 +13,8 @@ def test_cubix_download_pdf_on_agent_page(cubix_page):
     downloaded_file_path = ""
 
     try:
-        with allure.step("Открываем агентскую страницу"):
-            cubix_page.open(route_type="agent")
-
-        with allure.step("Кликаем на проект Cubix"):
-            cubix_page.map.navigate_to_project("cubix")
-
-        with allure.step("Ищем и кликаем на первый доступный апартамент"):
-            cubix_page.navigation.find_and_click_available_apartment()
+        with allure.step("Открываем доступный апартамент Cubix на агентском роуте"):
+            cubix_page.open_available_apartment("cubix", route_type="agent")
 
         with allure.step("Кликаем на кнопку Sales Offer"):
             cubix_page.click_sales_offer_button()
@@ -10,11 +10,8 @@ import pytest
 @pytest.mark.parametrize("route_type", ["map", "agent", "client"])
 def test_cubix_explore_amenities(cubix_page, route_type):
     """Тест Explore Amenities для проекта Cubix на всех роутах."""
-    with allure.step(f"Открываем страницу {route_type}"):
-        cubix_page.open(route_type=route_type)
-
-    with allure.step("Кликаем на проект Cubix"):
-        cubix_page.map.navigate_to_project("cubix")
+    with allure.step(f"Открываем страницу проекта Cubix на роуте {route_type}"):
+        cubix_page.goto_project("cubix", route_type=route_type)
 
     with allure.step("Проверяем наличие кнопки Explore Amenities"):
         cubix_page.browser.expect_visible(
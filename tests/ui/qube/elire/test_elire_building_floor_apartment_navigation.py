@@ -17,9 +17,8 @@ def test_elire_building_floor_apartment_navigation(elire_page, route_type):
     # Получаем окружение для условной логики
     env = os.getenv("TEST_ENVIRONMENT", "prod")
 
-    with allure.step(f"Открываем страницу {route_type} и переходим к проекту Elire"):
-        elire_page.open(route_type=route_type)
-        elire_page.map.navigate_to_project("elire")
+    with allure.step(f"Открываем страницу проекта Elire на роуте {route_type}"):
+        elire_page.goto_project("elire", route_type=route_type)
 
     with allure.step("Кликаем на Residences"):
         elire_page.click_residences_button()
@@ -10,11 +10,8 @@ import pytest
 @pytest.mark.parametrize("route_type", ["map", "agent", "client"])
 def test_elire_explore_amenities(elire_page, route_type):
     """Тест Explore Amenities для проекта Elire на всех роутах."""
-    with allure.step(f"Открываем страницу {route_type}"):
-        elire_page.open(route_type=route_type)
-
-    with allure.step("Кликаем на проект Elire"):
-        elire_page.map.navigate_to_project("elire")
+    with allure.step(f"Открываем страницу проекта Elire на роуте {route_type}"):
+        elire_page.goto_project("elire", route_type=route_type)
 
     with allure.step("Кликаем на кнопку Services & Amenities"):
         elire_page.click_services_amenities_button()
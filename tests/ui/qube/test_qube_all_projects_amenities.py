@@ -28,11 +28,8 @@ def test_all_qube_projects_explore_amenities(page, project_name):
     # Динамически создаем нужную страницу проекта
     project_page = PageFactory.get_page_by_project(page, project_name)
 
-    with allure.step(f"Открываем карту для проекта {project_name.upper()}"):
-        project_page.open(route_type="map")
-
-    with allure.step(f"Переходим к проекту {project_name.upper()}"):
-        project_page.map.navigate_to_project(project_name)
+    with allure.step(f"Открываем страницу проекта {project_name.upper()}"):
+        project_page.goto_project(project_name)
 
     # Каждый проект сам знает как открыть amenities
     # Arisha: click_all_units_button() → amenities.click_explore_button()
@@ -13,11 +13,8 @@ import pytest
 def test_tranquil_download_ownership_offer(tranquil_page):
     """Тест скачивания PDF на проекте Tranquil."""
 
-    with allure.step("Открываем карту Wellcube"):
-        tranquil_page.open(route_type="map")
-
-    with allure.step("Кликаем на проект Tranquil"):
-        tranquil_page.map.navigate_to_project("tranquil")
+    with allure.step("Открываем страницу проекта Tranquil"):
+        tranquil_page.goto_project("tranquil")
 
     with allure.step("Кликаем на кнопку Fraction Ownership Offer"):
         tranquil_page.click_fraction_ownership_offer_button()
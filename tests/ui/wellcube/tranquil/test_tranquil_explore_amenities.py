@@ -10,11 +10,8 @@ import pytest
 @pytest.mark.skip(reason="не поддерживаем клиента")
 def test_tranquil_explore_amenities(tranquil_page):
     """Тест Explore Amenities для проекта Tranquil."""
-    with allure.step("Открываем карту Wellcube"):
-        tranquil_page.open(route_type="map")
-
-    with allure.step("Кликаем на проект Tranquil"):
-        tranquil_page.map.navigate_to_project("tranquil")
+    with allure.step("Открываем страницу проекта Tranquil"):
+        tranquil_page.goto_project("tranquil")
 
     with allure.step("Проверяем наличие кнопки Explore Amenities"):
         tranquil_page.browser.expect_visible(
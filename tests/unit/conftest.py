@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def setup_test_parameters():
+    """
+    Тесты утилит без браузера.
+
+    Подменяет одноименную autouse фикстуру корневого conftest.py: она
+    запрашивает page и запускала бы браузер для чистого Python.
+    """
+    yield
@@ -0,0 +1,74 @@
+import os
+import time
+
+import allure
+import pytest
+
+from utils.asset_cache import AssetCache
+
+DAY = 86400
+
+
+@allure.feature("Утилиты - Кэш статики")
+@allure.story("Неизменяемые ресурсы")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "path, cache_control, ttl",
+    [
+        ("/assets/main.3f2a9c1b.js", "", AssetCache.IMMUTABLE_TTL),
+        ("/assets/index-BdH3kLm9.js", "max-age=60", AssetCache.IMMUTABLE_TTL),
+        ("/static/app.css", "public, max-age=31536000, immutable", 31536000),
+        ("/static/app.js", "public, immutable", AssetCache.IMMUTABLE_TTL),
+        ("/static/app.js", "max-age=604800", 7 * DAY),
+        ("/static/app.js", "max-age=600", None),
+        ("/static/app.js", "", None),
+        ("/media/photo_20240101.jpg", "", None),
+        ("/media/slide-1.png", "public", None),
+        ("/assets/main.3f2a9c1b.js", "no-store", None),
+        ("/static/app.js", "no-cache, max-age=604800", None),
+    ],
+)
+def test_ttl_requires_fingerprint_or_long_max_age(tmp_path, path, cache_control, ttl):
+    """Без хэша в имени, immutable и длинного max-age ресурс не кэшируется."""
+    cache = AssetCache(str(tmp_path))
+    headers = {"cache-control": cache_control} if cache_control else {}
+    assert cache.get_ttl(f"https://dev.example.com{path}", headers) == ttl
+
+
+@allure.feature("Утилиты - Кэш статики")
+@allure.story("Срок жизни записи")
+@allure.severity(allure.severity_level.NORMAL)
+def test_expired_entry_is_not_served(tmp_path, monkeypatch):
+    """Запись отдается до срока из индекса, после - считается промахом."""
+    cache = AssetCache(str(tmp_path))
+    url = "https://dev.example.com/static/app.js"
+    cache._store(url, 200, {"content-type": "text/javascript"}, b"v1", ttl=DAY)
+
+    meta, body = cache._load(url)
+    assert body == b"v1" and meta["expires"] > time.time()
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + DAY + 1)
+    assert cache._load(url) is None
+    assert cache.stats["expired"] == 1
+
+
+@allure.feature("Утилиты - Кэш статики")
+@allure.story("Очистка")
+@allure.severity(allure.severity_level.NORMAL)
+def test_evict_prunes_index_of_evicted_blobs(tmp_path):
+    """Вместе с давно не использованным блобом удаляется его запись индекса."""
+    cache = AssetCache(str(tmp_path))
+    old_url = "https://dev.example.com/assets/old.3f2a9c1b.js"
+    new_url = "https://dev.example.com/assets/new.7c9d0e2f.js"
+    cache._store(old_url, 200, {}, b"old" * 100, ttl=DAY)
+    cache._store(new_url, 200, {}, b"new" * 100, ttl=DAY)
+    old_blob = cache._blob_path(cache._load(old_url)[0]["blob"])
+    os.utime(old_blob, (time.time() - DAY, time.time() - DAY))
+    cache.max_bytes = 300
+
+    assert cache.evict() > 300
+
+    assert not os.path.exists(cache._index_path(old_url))
+    assert cache._load(old_url) is None
+    assert cache._load(new_url)[1] == b"new" * 100
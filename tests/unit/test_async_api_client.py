@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+
+from utils.api_client import AsyncAPIClient
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """Отвечает 200 с задержкой, чтобы запросы ждали семафор пула."""
+
+    def do_GET(self):
+        time.sleep(0.05)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Локальный HTTP сервер на свободном порту."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@allure.feature("Утилиты - API клиент")
+@allure.story("Асинхронный клиент")
+@allure.severity(allure.severity_level.NORMAL)
+def test_client_reused_across_event_loops(server_url):
+    """Один клиент работает в нескольких asyncio.run подряд."""
+    client = AsyncAPIClient(server_url, pool_size=2, retries=0)
+
+    async def burst():
+        responses = await asyncio.gather(*(client.get("/units") for _ in range(6)))
+        return [response.status_code for response in responses]
+
+    # Запросов больше размера пула: вторая волна ждет семафор
+    assert asyncio.run(burst()) == [200] * 6
+    assert asyncio.run(burst()) == [200] * 6
@@ -0,0 +1,54 @@
+import json
+
+import allure
+import pytest
+
+from utils.catalog_crawler import CatalogCrawler
+
+
+@allure.feature("Утилиты - Обход каталога")
+@allure.story("Апартаменты плана этажа")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://catalog.evometa.io/mark/apartment/k1-405", "k1-405"),
+        ("https://qube.evometa.io/map/project/arisha/apartment/12/?tab=2d", "12"),
+        ("https://qube.evometa.io/map/project/arisha/floor/1/4", None),
+        (None, None),
+    ],
+)
+def test_apartment_id_from_url(url, expected):
+    """Id апартамента читается из ссылки плана или URL страницы."""
+    assert CatalogCrawler._apartment_id(url) == expected
+
+
+@allure.feature("Утилиты - Обход каталога")
+@allure.story("Продолжение обхода")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "unit, retried",
+    [
+        ({"apartment": "12", "clicked": True, "status": "widget_failed"}, True),
+        ({"apartment": "unopened-3", "status": "page_failed"}, True),
+        ({"apartment": "12", "status": "widget_failed"}, False),
+    ],
+    ids=["clicked", "unopened", "linked"],
+)
+def test_retry_failed_recrawls_floor_of_clicked_units(tmp_path, unit, retried):
+    """Апартамент вне children этажа перепроверяется повторным обходом этажа."""
+    floor = {"project": "mark", "building": "1", "floor": "4"}
+    output = tmp_path / "inventory.jsonl"
+    records = [
+        {**floor, "type": "floor", "status": "ok", "children": []},
+        {**floor, "type": "apartment", **unit},
+    ]
+    output.write_text(
+        "".join(json.dumps(record) + "\n" for record in records), encoding="utf-8"
+    )
+
+    crawler = CatalogCrawler(str(output), retry_failed=True)
+    crawler._load_journal()
+
+    floor_key = CatalogCrawler.task_key({**floor, "type": "floor"})
+    assert (floor_key not in crawler._done) is retried
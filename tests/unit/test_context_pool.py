@@ -0,0 +1,118 @@
+import allure
+import pytest
+
+from utils.context_pool import ContextPool
+
+
+class _FakePage:
+    """Страница: помнит текущий URL и очищает хранилище своего origin."""
+
+    def __init__(self, context):
+        self.context = context
+        self.url = ContextPool.BLANK_URL
+        self.viewport_size = {"width": 1920, "height": 1080}
+        self.routes = []
+
+    def is_closed(self):
+        return False
+
+    def goto(self, url, **kwargs):
+        self.url = url
+
+    def evaluate(self, script):
+        self.context.origins.discard(self.url.rstrip("/"))
+
+    def route(self, url, handler):
+        self.routes.append(url)
+
+    def unroute(self, url, handler):
+        self.routes.remove(url)
+
+
+class _FakeContext:
+    """Контекст с данными в хранилищах origins (как у iframe)."""
+
+    def __init__(self, origins=(), sticky=()):
+        self.origins = set(origins)
+        # Origin, которые навигацией не очищаются (например, partitioned storage)
+        self.sticky = set(sticky)
+        self.pages = []
+
+    def new_page(self):
+        page = _FakePage(self)
+        self.pages.append(page)
+        return page
+
+    def unroute_all(self, behavior=None):
+        pass
+
+    def clear_cookies(self):
+        pass
+
+    def clear_permissions(self):
+        pass
+
+    def storage_state(self):
+        return {"origins": [{"origin": o} for o in sorted(self.origins | self.sticky)]}
+
+    def close(self):
+        pass
+
+
+@allure.feature("Утилиты - Пул контекстов")
+@allure.story("Очистка контекста")
+@allure.severity(allure.severity_level.NORMAL)
+def test_iframe_origins_are_cleared_and_context_reused():
+    """Данные iframe других origin очищаются, контекст возвращается в пул."""
+    pool = ContextPool(size=1)
+    context = _FakeContext(["https://widget.evometa.io", "https://maps.google.com"])
+    pool.acquire("key", lambda: context)
+
+    pool.release(context)
+
+    assert pool._idle["key"] == [context]
+    assert pool.stats["origins_cleared"] == 2
+    assert pool.stats["discarded"] == 0
+    assert context.pages[0].url == ContextPool.BLANK_URL
+    assert context.pages[0].routes == []
+
+
+@allure.feature("Утилиты - Пул контекстов")
+@allure.story("Очистка контекста")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "origins, sticky",
+    [
+        ([], ["https://widget.evometa.io"]),
+        (
+            [f"https://o{i}.example" for i in range(ContextPool.MAX_ORIGIN_CLEARS + 1)],
+            [],
+        ),
+    ],
+    ids=["not-cleared", "too-many-origins"],
+)
+def test_dirty_context_is_discarded(origins, sticky):
+    """Контекст, который не удалось очистить, заменяется новым."""
+    pool = ContextPool(size=1)
+    dirty = _FakeContext(origins, sticky)
+    pool.acquire("key", lambda: dirty)
+
+    fresh = _FakeContext()
+    pool._leased[dirty] = ("key", lambda: fresh, None)
+    pool.release(dirty)
+
+    assert pool._idle["key"] == [fresh]
+    assert pool.stats["discarded"] == 1
+
+
+@allure.feature("Утилиты - Пул контекстов")
+@allure.story("Статистика")
+@allure.severity(allure.severity_level.MINOR)
+def test_format_stats_reports_reuse_and_discard_rates():
+    """Итог показывает долю переиспользованных и отброшенных контекстов."""
+    stats = {}
+    ContextPool.merge_stats(stats, {"created": 2, "reused": 6, "released": 8})
+    ContextPool.merge_stats(stats, {"discarded": 2, "origins_cleared": 5})
+    summary = ContextPool.format_stats(stats)
+    assert "переиспользовано 6 из 8 (75%)" in summary
+    assert "отброшено 2 из 8 (25%)" in summary
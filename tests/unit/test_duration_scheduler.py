@@ -0,0 +1,55 @@
+import allure
+
+from utils.duration_scheduler import order_longest_first
+
+
+def _hosts_in_window(order: list, hosts: list, window: int) -> bool:
+    """Во всех окнах из window соседних тестов хосты разные."""
+    picked = [hosts[i] for i in order]
+    return all(
+        len(set(picked[i : i + window])) == window
+        for i in range(len(picked) - window + 1)
+    )
+
+
+@allure.feature("Утилиты - Параллельный запуск")
+@allure.story("Планировщик по длительности")
+@allure.severity(allure.severity_level.NORMAL)
+def test_longest_first_with_hosts_interleaved():
+    """Длинные тесты идут первыми, соседние тесты - на разные хосты."""
+    # Хост a - все самые длинные тесты: простая сортировка собрала бы их подряд
+    estimates = [90, 80, 70, 60, 50, 40, 30, 20, 10]
+    hosts = ["a", "a", "a", "b", "b", "b", "c", "c", "c"]
+
+    order = order_longest_first(estimates, hosts, window=3)
+
+    assert sorted(order) == list(range(len(estimates)))
+    assert _hosts_in_window(order, hosts, 3)
+    assert order[0] == 0
+    # Внутри хоста порядок по убыванию длительности
+    for host in "abc":
+        durations = [estimates[i] for i in order if hosts[i] == host]
+        assert durations == sorted(durations, reverse=True)
+    # Длинные тесты не уезжают в хвост: первый круг - самые длинные каждого хоста
+    assert order[:3] == [0, 3, 6]
+
+
+@allure.feature("Утилиты - Параллельный запуск")
+@allure.story("Планировщик по длительности")
+@allure.severity(allure.severity_level.NORMAL)
+def test_single_host_keeps_longest_first():
+    """С одним хостом порядок - обычный LPT, стабильный при равных оценках."""
+    estimates = [5, 30, 5, 10]
+    order = order_longest_first(estimates, ["a"] * 4, window=2)
+    assert order == [1, 3, 0, 2]
+
+
+@allure.feature("Утилиты - Параллельный запуск")
+@allure.story("Планировщик по длительности")
+@allure.severity(allure.severity_level.MINOR)
+def test_dominant_host_falls_back_to_longest():
+    """Когда другие хосты закончились, берется самый длинный из оставшихся."""
+    estimates = [50, 40, 30, 20, 45]
+    hosts = ["a", "a", "a", "a", "b"]
+    order = order_longest_first(estimates, hosts, window=2)
+    assert order == [0, 4, 1, 2, 3]
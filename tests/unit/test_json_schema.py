@@ -0,0 +1,305 @@
+import io
+import json
+
+import allure
+import pytest
+import requests
+
+from utils.api_client import APIClient
+from utils.catalog_schemas import UNIT_SCHEMA, UNITS_SCHEMA
+from utils.json_schema import (
+    clear_schema_cache,
+    compile_schema,
+    iter_json_array,
+    validate,
+    validate_items,
+)
+
+
+def _unit(**overrides) -> dict:
+    """Апартамент, проходящий UNIT_SCHEMA."""
+    unit = {"id": 1, "slug": "unit-1", "status": "available", "price": 250000}
+    unit.update(overrides)
+    return unit
+
+
+def _keywords(errors: list) -> list:
+    """Пары (путь, ключевое слово) ошибок."""
+    return [(e["location"], e["keyword"]) for e in errors]
+
+
+def _response(body: bytes, url: str = "https://api.example.com/units"):
+    """Ответ requests с готовым телом (для потоковой проверки - через raw)."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Ключевые слова")
+@allure.severity(allure.severity_level.MINOR)
+@pytest.mark.parametrize(
+    "schema, value, expected",
+    [
+        ({"type": "integer"}, True, [((), "type")]),
+        ({"type": "integer"}, 1.5, [((), "type")]),
+        ({"type": ["string", "null"]}, 0, [((), "type")]),
+        ({"enum": [1, "a"]}, True, [((), "enum")]),
+        ({"const": 0}, False, [((), "const")]),
+        ({"const": [1, "a"]}, [True, "a"], [((), "const")]),
+        (
+            {"type": "object", "required": ["id", "slug"]},
+            {"id": 1},
+            [((), "required")],
+        ),
+        (
+            {"properties": {"id": {"type": "integer"}}},
+            {"id": "1"},
+            [(("id",), "type")],
+        ),
+        (
+            {"properties": {"id": {}}, "additionalProperties": False},
+            {"id": 1, "extra": 2},
+            [((), "additionalProperties")],
+        ),
+        (
+            {"additionalProperties": {"type": "string"}},
+            {"name": 1},
+            [(("name",), "type")],
+        ),
+        ({"items": {"type": "string"}}, ["a", 2], [((1,), "type")]),
+        ({"minItems": 2}, [1], [((), "minItems")]),
+        ({"maxItems": 1}, [1, 2], [((), "maxItems")]),
+        ({"minLength": 2}, "a", [((), "minLength")]),
+        ({"maxLength": 1}, "ab", [((), "maxLength")]),
+        ({"pattern": "^unit-\\d+$"}, "unit-x", [((), "pattern")]),
+        ({"minimum": 0}, -1, [((), "range")]),
+        ({"maximum": 10}, 11, [((), "range")]),
+        ({"exclusiveMinimum": 0}, 0, [((), "range")]),
+        ({"exclusiveMaximum": 10}, 10, [((), "range")]),
+        (
+            {"allOf": [{"type": "number"}, {"minimum": 5}]},
+            1,
+            [((), "range")],
+        ),
+        ({"anyOf": [{"type": "string"}, {"type": "null"}]}, 1, [((), "anyOf")]),
+        (
+            {"oneOf": [{"type": "number"}, {"type": "integer"}]},
+            1,
+            [((), "oneOf")],
+        ),
+        ({"oneOf": [{"type": "string"}]}, 1, [((), "oneOf")]),
+        ({"not": {"type": "null"}}, None, [((), "not")]),
+        (False, 1, [((), "false")]),
+        (
+            {
+                "definitions": {"id": {"type": "integer", "minimum": 1}},
+                "properties": {"id": {"$ref": "#/definitions/id"}},
+            },
+            {"id": 0},
+            [(("id",), "range")],
+        ),
+    ],
+)
+def test_invalid_values_are_reported(schema, value, expected):
+    """Каждое поддерживаемое ключевое слово отклоняет неподходящее значение."""
+    errors = []
+    compile_schema(schema)(value, (), errors)
+    assert _keywords(errors) == expected
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Ключевые слова")
+@allure.severity(allure.severity_level.MINOR)
+@pytest.mark.parametrize(
+    "schema, value",
+    [
+        ({"type": "number"}, 1),
+        ({"enum": [1, "a"]}, 1),
+        ({"type": "integer"}, 1.0),
+        ({"enum": [1, "a"]}, 1.0),
+        ({"const": 1.0}, 1),
+        ({"const": [1, {"id": 2}]}, [1.0, {"id": 2.0}]),
+        ({"minimum": 0}, "строки не сравниваются с числом"),
+        ({"required": ["id"]}, ["не объект"]),
+        ({"anyOf": [{"type": "string"}, {"type": "null"}]}, None),
+        ({"oneOf": [{"type": "string"}, {"type": "null"}]}, "a"),
+        (True, {"any": "value"}),
+    ],
+)
+def test_valid_values_pass(schema, value):
+    """Подходящие значения и ключевые слова другого типа не дают ошибок."""
+    errors = []
+    compile_schema(schema)(value, (), errors)
+    assert errors == []
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Пути ошибок")
+@allure.severity(allure.severity_level.NORMAL)
+def test_error_paths_point_to_the_field():
+    """Ошибка в элементе списка указывает на поле: ("data", 3, "price")."""
+    body = {"data": [_unit(id=i) for i in range(1, 6)]}
+    body["data"][3]["price"] = "дорого"
+
+    errors = validate(body, UNITS_SCHEMA)
+
+    assert [e["location"] for e in errors] == [("data", 3, "price")]
+    assert errors[0]["path"] == "$.data[3].price"
+    assert errors[0]["keyword"] == "type"
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Пути ошибок")
+@allure.severity(allure.severity_level.MINOR)
+def test_recursive_ref_paths():
+    """Рекурсивный $ref проверяет вложенные уровни с полными путями."""
+    schema = {
+        "$defs": {
+            "node": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "children": {"items": {"$ref": "#/$defs/node"}},
+                },
+            }
+        },
+        "$ref": "#/$defs/node",
+    }
+    tree = {"name": "a", "children": [{"name": "b", "children": [{"name": 1}]}]}
+
+    errors = validate(tree, schema)
+
+    assert _keywords(errors) == [(("children", 0, "children", 0, "name"), "type")]
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Кэш схем")
+@allure.severity(allure.severity_level.MINOR)
+def test_compiled_schema_is_cached():
+    """Схема компилируется один раз на $id, новая схема с тем же id() - заново."""
+    clear_schema_cache()
+    assert compile_schema(UNIT_SCHEMA) is compile_schema(UNIT_SCHEMA)
+
+    first = {"type": "string"}
+    check = compile_schema(first)
+    assert compile_schema(first) is check
+    assert compile_schema({"type": "integer"}, schema_id="other") is not check
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Потоковая проверка")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_iter_json_array_across_chunk_boundaries(chunk_size):
+    """Элементы собираются целиком при разрезе частей внутри строк, чисел и UTF-8."""
+    items = [
+        {"id": 12345, "slug": "квартира-1", "price": 1.25e6},
+        [1, 2, {"nested": "]"}],
+        'строка с \\"кавычками\\" и ,',
+        -0.5,
+        987654321,
+        True,
+        None,
+    ]
+    body = json.dumps({"meta": {"total": 7}, "data": items}, ensure_ascii=False)
+    raw = body.encode()
+    chunks = [raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size)]
+
+    assert list(iter_json_array(chunks, "data")) == items
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Потоковая проверка")
+@allure.severity(allure.severity_level.MINOR)
+def test_iter_json_array_errors():
+    """Нет массива или массив оборван - ValueError, корневой массив читается."""
+    assert list(iter_json_array([b"[1, ", b"2]"])) == [1, 2]
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"items": []}'], "data"))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"data": [1, 2'], "data"))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"meta": {"data": [9]}}'], "data"))
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Потоковая проверка")
+@allure.severity(allure.severity_level.MINOR)
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_iter_json_array_reads_root_key_only(chunk_size):
+    """Ключ массива ищется в корне: вложенный "data" и строки с ним пропускаются."""
+    body = json.dumps(
+        {
+            "note": '"data": [0]',
+            "meta": {"data": [9], "links": [{"data": [8]}]},
+            "total": 12345,
+            "data": [1, 2],
+        }
+    ).encode()
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    assert list(iter_json_array(chunks, "data")) == [1, 2]
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("Потоковая проверка")
+@allure.severity(allure.severity_level.MINOR)
+def test_validate_items_paths_and_limit():
+    """Ошибки элементов - с индексом в массиве, проверка останавливается на лимите."""
+    units = [_unit(id=i) for i in range(10)]
+    units[2]["status"] = 5
+    units[7]["id"] = [7]
+
+    count, errors = validate_items(iter(units), UNIT_SCHEMA, path=("data",))
+    assert count == 10
+    assert [e["location"][:3] for e in errors] == [
+        ("data", 2, "status"),
+        ("data", 7, "id"),
+    ]
+
+    count, errors = validate_items(
+        iter(units), UNIT_SCHEMA, path=("data",), max_errors=1
+    )
+    assert count == 3 and len(errors) == 1
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("APIClient.expect_json_schema")
+@allure.severity(allure.severity_level.NORMAL)
+def test_expect_json_schema_raise_on_error():
+    """Ошибки схемы падают с AssertionError или возвращаются списком."""
+    client = APIClient(retries=0)
+    body = json.dumps({"data": [_unit(), _unit(id=2.5)]}).encode()
+
+    with pytest.raises(AssertionError, match=r"\$\.data\[1\]\.id"):
+        client.expect_json_schema(_response(body), UNITS_SCHEMA)
+
+    errors = client.expect_json_schema(
+        _response(body), UNITS_SCHEMA, raise_on_error=False
+    )
+    assert _keywords(errors) == [(("data", 1, "id"), "type")]
+
+    valid = json.dumps({"data": [_unit()]}).encode()
+    assert client.expect_json_schema(_response(valid), UNITS_SCHEMA) == []
+
+
+@allure.feature("Утилиты - JSON схемы")
+@allure.story("APIClient.expect_json_schema")
+@allure.severity(allure.severity_level.MINOR)
+def test_expect_json_schema_stream():
+    """Потоковая проверка находит ошибку элемента по индексу в массиве."""
+    client = APIClient(retries=0)
+    units = [_unit(id=i) for i in range(1, 200)]
+    units[150]["price"] = "дорого"
+    body = json.dumps({"data": units}).encode()
+
+    errors = client.expect_json_schema(
+        _response(body),
+        UNIT_SCHEMA,
+        stream=True,
+        list_key="data",
+        raise_on_error=False,
+    )
+    assert [e["location"] for e in errors] == [("data", 150, "price")]
@@ -0,0 +1,122 @@
+import json
+import time
+
+import allure
+import pytest
+
+from utils.benchmark import format_summary, record_results, summarize_results
+from utils.catalog_schemas import UNIT_SCHEMA, UNITS_SCHEMA
+from utils.json_schema import (
+    STREAM_CHUNK_SIZE,
+    SchemaCompiler,
+    iter_json_array,
+    validate,
+    validate_items,
+)
+from utils.logger import get_logger
+
+logger = get_logger("Benchmark")
+
+# Длительность одного замера, секунды
+ROUND_SECONDS = 0.5
+# Размер страницы и полного инвентаря апартаментов
+PAGE_UNITS = 20
+INVENTORY_UNITS = 20000
+
+SCHEMA_METRICS = ("compiled_per_s", "recompiled_per_s", "stream_items_per_s")
+
+
+def _units(count: int) -> list:
+    """Апартаменты в формате API каталога."""
+    return [
+        {
+            "id": 1000 + i,
+            "slug": f"unit-{i}",
+            "status": "available" if i % 3 else "sold",
+            "locked": i % 3 == 0,
+            "price": 250000 + i * 10.5,
+            "area": 45.5,
+            "floor": i % 30,
+        }
+        for i in range(count)
+    ]
+
+
+def _rate(action, seconds: float = ROUND_SECONDS) -> float:
+    """Сколько раз в секунду выполняется action (за seconds секунд)."""
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        count += action()
+    return count / (time.perf_counter() - started)
+
+
+def _measure_round(page_body: dict, inventory: bytes) -> dict:
+    """Один замер: проверки в секунду с кэшем, без кэша и потоком."""
+
+    def compiled():
+        assert not validate(page_body, UNITS_SCHEMA)
+        return 1
+
+    def recompiled():
+        errors = []
+        SchemaCompiler(UNITS_SCHEMA).compile(UNITS_SCHEMA)(page_body, (), errors)
+        assert not errors
+        return 1
+
+    def stream():
+        chunks = (
+            inventory[i : i + STREAM_CHUNK_SIZE]
+            for i in range(0, len(inventory), STREAM_CHUNK_SIZE)
+        )
+        count, errors = validate_items(
+            iter_json_array(chunks, "data"), UNIT_SCHEMA, path=("data",)
+        )
+        assert not errors
+        return count
+
+    return {
+        "compiled_per_s": round(_rate(compiled)),
+        "recompiled_per_s": round(_rate(recompiled)),
+        "stream_items_per_s": round(_rate(stream)),
+    }
+
+
+@allure.feature("Производительность - Проверка JSON схем")
+@pytest.mark.benchmark
+class TestJsonSchemaBenchmark:
+    """Скорость проверки ответов API каталога по схемам."""
+
+    @allure.story("Проверок в секунду")
+    @allure.severity(allure.severity_level.MINOR)
+    def test_validations_per_second(self, pytestconfig):
+        """
+        Проверок страницы апартаментов в секунду со скомпилированной схемой
+        и с компиляцией на каждый вызов, апартаментов в секунду при потоковой
+        проверке полного инвентаря.
+        """
+        iterations = pytestconfig.getoption("bench_iterations")
+        page_body = {"data": _units(PAGE_UNITS)}
+        inventory = json.dumps({"data": _units(INVENTORY_UNITS)}).encode()
+
+        with allure.step(f"{iterations} замеров по {ROUND_SECONDS} с"):
+            results = [
+                {"ok": True, "result": _measure_round(page_body, inventory)}
+                for _ in range(iterations)
+            ]
+
+        summaries = summarize_results([r["result"] for r in results], SCHEMA_METRICS)
+        report = format_summary(
+            f"JSON схемы: страница {PAGE_UNITS}, инвентарь {INVENTORY_UNITS}", summaries
+        )
+        logger.info(f"\n{report}")
+        allure.attach(
+            report, name="JSON schema", attachment_type=allure.attachment_type.TEXT
+        )
+        record_results("json_schema", results)
+
+        with allure.step("Скомпилированная схема быстрее компиляции на каждый вызов"):
+            compiled = summaries["compiled_per_s"]["median"]
+            recompiled = summaries["recompiled_per_s"]["median"]
+            assert compiled > recompiled, f"{compiled} <= {recompiled} проверок/с"
@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import allure
+import pytest
+
+from utils.load_generator import SESSION_STEP, LoadGenerator
+
+
+class _FakeContext:
+    """Контекст, у которого не открывается страница."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        raise RuntimeError("Target page, context or browser has been closed")
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    """Браузер: new_context падает или отдает контекст без страниц."""
+
+    def __init__(self, context_fails: bool):
+        self.context_fails = context_fails
+        self.contexts = []
+
+    async def new_context(self, **kwargs):
+        if self.context_fails:
+            raise RuntimeError("Browser has been closed")
+        context = _FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+@allure.feature("Утилиты - Нагрузочный прогон")
+@allure.story("Ошибки посетителей")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize("context_fails", [True, False], ids=["context", "page"])
+def test_session_failure_is_a_failed_journey(context_fails):
+    """Сбой создания контекста или страницы - неудачный сценарий, а не исключение."""
+    generator = LoadGenerator("catalog", "arisha")
+    browser = _FakeBrowser(context_fails)
+
+    asyncio.run(generator._user(browser, 0, 0, time.perf_counter(), {}))
+
+    report = generator.report()
+    assert report["journeys"] == {"ok": 0, "failed": 1}
+    assert list(report["errors"]) == [SESSION_STEP]
+    assert generator.active_users == 0
+    assert all(context.closed for context in browser.contexts)
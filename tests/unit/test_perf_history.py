@@ -0,0 +1,94 @@
+import allure
+import pytest
+
+from utils.perf_history import PERF_BUDGETS, PerfHistory, get_budget, get_min_delta
+
+
+@pytest.fixture
+def history(tmp_path):
+    """Пустая история в каталоге теста."""
+    history = PerfHistory(str(tmp_path / "perf.sqlite"))
+    yield history
+    history.close()
+
+
+def _add_runs(history: PerfHistory, values: list, metric: str = "cls") -> int:
+    """Прогоны с одним замером open.<metric> каждый, возвращает id последнего."""
+    run_id = None
+    for value in values:
+        run_id = history.start_run(environment="dev", label="test")
+        history.add_records(
+            run_id,
+            [
+                {
+                    "kind": "navigation",
+                    "name": "open",
+                    "project": "arisha",
+                    "browser": "chromium",
+                    "device": "desktop",
+                    metric: value,
+                }
+            ],
+        )
+    return run_id
+
+
+def _regressions(findings: list) -> list:
+    """Метрики со значимым замедлением."""
+    return [f["metric"] for f in findings if f["type"] == "regression"]
+
+
+@allure.feature("Утилиты - История метрик")
+@allure.story("Регрессии")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "metric, base, current",
+    [
+        ("cls", 0, 0.001),
+        ("total_blocking_ms", 0, 30),
+        ("long_tasks", 0, 1),
+    ],
+)
+def test_zero_baseline_noise_is_not_regression(history, metric, base, current):
+    """Шум над нулевой базой с нулевым MAD не считается замедлением."""
+    run_id = _add_runs(history, [base] * 4 + [current], metric)
+    assert _regressions(history.compare(run_id, budgets={})) == []
+
+
+@allure.feature("Утилиты - История метрик")
+@allure.story("Регрессии")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "metric, base, current",
+    [
+        ("cls", 0, 0.1),
+        ("total_blocking_ms", 0, 200),
+        ("lcp", 2000, 2600),
+    ],
+)
+def test_real_regression_is_reported(history, metric, base, current):
+    """Изменение выше порога метрики остается регрессией."""
+    run_id = _add_runs(history, [base] * 4 + [current], metric)
+    assert _regressions(history.compare(run_id, budgets={})) == [f"open.{metric}"]
+
+
+@allure.feature("Утилиты - История метрик")
+@allure.story("Регрессии")
+@allure.severity(allure.severity_level.MINOR)
+def test_min_delta_lookup():
+    """Порог ищется по точному имени, затем по шаблону."""
+    assert get_min_delta("cls") == 0.05
+    assert get_min_delta("markers_rendered_ms") == 50
+    assert get_min_delta("compiled_per_s") == 0
+
+
+@allure.feature("Утилиты - История метрик")
+@allure.story("Бюджеты")
+@allure.severity(allure.severity_level.MINOR)
+def test_budget_lookup():
+    """Бюджет ищется по точному имени, затем по шаблону, сначала в проекте."""
+    assert get_budget(PERF_BUDGETS, "mark", "goto_project.lcp") == 6000
+    assert get_budget(PERF_BUDGETS, "arisha", "goto_project.lcp") == 5000
+    assert get_budget(PERF_BUDGETS, "mark", "tour_360_lobby_k1.fps") == 30
+    assert get_budget(PERF_BUDGETS, "arisha", "tour_360.first_frame_ms") == 8000
+    assert get_budget(PERF_BUDGETS, "arisha", "tour_360.image_kb") is None
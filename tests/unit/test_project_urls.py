@@ -0,0 +1,65 @@
+import allure
+import pytest
+
+from pages.base_page import BasePage
+
+
+@pytest.fixture
+def base_page(monkeypatch):
+    """BasePage без браузера: построение URL к странице не обращается."""
+    monkeypatch.setenv("TEST_ENVIRONMENT", "dev")
+    return object.__new__(BasePage)
+
+
+@allure.feature("Утилиты - URL проектов")
+@allure.story("Прямые ссылки")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize("route_type", ["agent", "client"])
+def test_route_deep_link_uses_route_base_url(base_page, monkeypatch, route_type):
+    """Ссылка agent/client строится от URL роута, а не от URL карты."""
+    monkeypatch.setenv(
+        f"DEV_{route_type.upper()}_BASE_URL", f"https://{route_type}.example.com/map"
+    )
+    url = base_page.get_project_url("arisha", apartment="12", route_type=route_type)
+    assert url == f"https://{route_type}.example.com/project/arisha/apartment/12"
+
+
+@allure.feature("Утилиты - URL проектов")
+@allure.story("Прямые ссылки")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "project, route_type, expected",
+    [
+        (
+            "arisha",
+            None,
+            "https://qube-dev-next.evometa.io/project/arisha/catalog_2d",
+        ),
+        (
+            "arisha",
+            "agent",
+            "https://qube-dev-next.evometa.io/agent/project/arisha/catalog_2d",
+        ),
+        (
+            "tranquil",
+            "client",
+            "https://catalog-dev.evometa.io/wellcube/client/project/tranquil/catalog_2d",
+        ),
+        (
+            "mark",
+            None,
+            "https://catalog-ru-dev.evometa.io/lsr/project/mark/catalog_2d",
+        ),
+    ],
+)
+def test_default_project_urls(base_page, monkeypatch, project, route_type, expected):
+    """Без переменных окружения URL берутся из значений по умолчанию."""
+    for name in (
+        "DEV_BASE_URL",
+        "DEV_AGENT_BASE_URL",
+        "DEV_CLIENT_BASE_URL",
+        "DEV_WELLCUBE_BASE_URL",
+        "DEV_LSR_MARK_BASE_URL",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    assert base_page.get_project_url(project, route_type=route_type) == expected
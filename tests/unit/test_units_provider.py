@@ -0,0 +1,44 @@
+import allure
+import pytest
+
+from utils.units_provider import parse_units
+
+
+@allure.feature("Утилиты - Доступные апартаменты")
+@allure.story("Разбор ответа API")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "unit, available",
+    [
+        ({"id": 1, "status": "sold", "locked": False}, False),
+        ({"id": 1, "status": "available", "locked": True}, True),
+        ({"id": 1, "available": False, "status": "available"}, False),
+        ({"id": 1, "available": True, "status": "sold", "locked": True}, True),
+        ({"id": 1, "available": None, "status": "Free"}, True),
+        ({"id": 1, "status": "", "locked": False}, True),
+        ({"id": 1, "locked": True}, False),
+        ({"id": 1}, False),
+    ],
+)
+def test_most_specific_field_wins(unit, available):
+    """Доступность решает available, затем status, затем locked."""
+    assert parse_units([unit]) == (["1"] if available else [])
+
+
+@allure.feature("Утилиты - Доступные апартаменты")
+@allure.story("Разбор ответа API")
+@allure.severity(allure.severity_level.MINOR)
+def test_ids_and_list_keys():
+    """Список берется из data/items/units/results, id 0 не пропускается."""
+    body = {
+        "items": [
+            {"id": 0, "available": True},
+            {"id": "", "slug": "unit-2", "status": "on_sale"},
+            {"number": 3, "locked": False},
+            {"status": "available"},
+            "не апартамент",
+        ]
+    }
+    assert parse_units(body) == ["0", "unit-2", "3"]
+    assert parse_units({"meta": {}}) == []
+    assert parse_units("not json") == []
@@ -0,0 +1,74 @@
+import allure
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.core.wait_engine import WaitEngine
+
+
+class _FakePage:
+    """Страница без браузера: WaitEngine только подписывается на события."""
+
+    def on(self, event, handler):
+        pass
+
+
+@pytest.fixture
+def engine():
+    """WaitEngine поверх страницы-заглушки."""
+    return WaitEngine(_FakePage())
+
+
+def _raise(error: Exception):
+    def condition():
+        raise error
+
+    return condition
+
+
+@allure.feature("Утилиты - Ожидания")
+@allure.story("Обработка ошибок")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.parametrize(
+    "error",
+    [
+        PlaywrightTimeoutError("Timeout 800ms exceeded."),
+        AssertionError("Locator expected to have class 'active'"),
+        PlaywrightError(
+            "Execution context was destroyed, most likely because of a navigation"
+        ),
+    ],
+    ids=["timeout", "expect", "navigation"],
+)
+def test_timeout_is_recorded_as_false(engine, error):
+    """Таймаут и навигация - это "не дождались": False и запись в журнале."""
+    assert engine._run("animations", ".slider", 800, _raise(error)) is False
+    assert engine.records[-1]["success"] is False
+
+
+@allure.feature("Утилиты - Ожидания")
+@allure.story("Обработка ошибок")
+@allure.severity(allure.severity_level.CRITICAL)
+@pytest.mark.parametrize(
+    "error",
+    [
+        PlaywrightError("strict mode violation: locator('.slider') resolved to 2"),
+        PlaywrightError("Unexpected token '>' while parsing selector"),
+        PlaywrightError("ReferenceError: foo is not defined"),
+        ValueError("bug"),
+    ],
+    ids=["strict-mode", "selector", "js", "python"],
+)
+def test_other_errors_are_raised(engine, error):
+    """Ошибки теста не превращаются в мгновенный False."""
+    with pytest.raises(type(error)):
+        engine._run("animations", ".slider", 800, _raise(error))
+
+
+@allure.feature("Утилиты - Ожидания")
+@allure.story("Обработка ошибок")
+@allure.severity(allure.severity_level.MINOR)
+def test_success_is_recorded(engine):
+    """Выполненное условие - True с длительностью в журнале."""
+    assert engine._run("dom_stable", None, 500, lambda: True) is True
+    assert engine.records[-1]["target"] == "document"
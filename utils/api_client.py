@@ -1,46 +1,279 @@
-from typing import Any, Dict, Optional
+import asyncio
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import allure
 import requests
-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.json_schema import (
+    STREAM_CHUNK_SIZE,
+    format_errors,
+    iter_json_array,
+    validate,
+    validate_items,
+)
 from utils.logger import get_logger
 
+# Методы, которые можно безопасно повторить при обрыве или 429/5xx
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Статусы, при которых идемпотентный запрос повторяется
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Признак, что тело ответа еще не разбиралось
+_UNPARSED = object()
+
+# Журнал запросов теста для Allure: одно вложение на тест (attach_api_calls)
+# вместо вложения на каждый запрос. При переполнении сбрасывается частями.
+_API_CALLS_FLUSH_LINES = 500
+_api_calls = []
+_api_calls_lock = threading.Lock()
+
+
+def _journal_api_call(line: str):
+    """Добавить запрос в журнал теста."""
+    with _api_calls_lock:
+        _api_calls.append(line)
+        full = len(_api_calls) >= _API_CALLS_FLUSH_LINES
+    if full:
+        attach_api_calls()
+
+
+def attach_api_calls(name: str = "API calls"):
+    """Прикрепить журнал запросов к Allure одним вложением и очистить его."""
+    with _api_calls_lock:
+        lines = _api_calls[:]
+        _api_calls.clear()
+    if lines:
+        allure.attach(
+            "\n".join(lines), name=name, attachment_type=allure.attachment_type.TEXT
+        )
+
+
+def parse_body(response: requests.Response) -> Any:
+    """
+    Тело ответа: JSON или текст.
+
+    Разбирается один раз и кэшируется на объекте ответа - логирование,
+    Allure и проверки берут уже разобранное значение.
+
+    Args:
+        response: Response объект
+
+    Returns:
+        Разобранный JSON или текст, если тело не JSON
+    """
+    body = getattr(response, "_parsed_body", _UNPARSED)
+    if body is _UNPARSED:
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        response._parsed_body = body
+    return body
+
+
+def enable_http2() -> bool:
+    """
+    Включить HTTP/2 для HTTPS соединений urllib3 (requests).
+
+    Работает, если установлен пакет h2 (urllib3 >= 2.3). Протокол
+    согласуется через ALPN, серверы без HTTP/2 остаются на HTTP/1.1.
+    Включается на весь процесс.
+
+    Returns:
+        bool: True, если HTTP/2 доступен и включен
+    """
+    try:
+        import h2  # noqa: F401
+        from urllib3.http2 import inject_into_urllib3
+    except ImportError:
+        return False
+    inject_into_urllib3()
+    return True
+
 
 class APIClient:
-    """Базовый класс для работы с API."""
+    """
+    Базовый класс для работы с API.
+
+    Ответственность:
+    - Пул соединений (размер, keep-alive, HTTP/2 при наличии h2)
+    - Повтор идемпотентных запросов с экспоненциальной задержкой
+    - Пакетные запросы через пул потоков (batch)
+    - Ленивое выборочное логирование и журнал запросов для Allure
+
+    Настройки по умолчанию берутся из окружения: API_POOL_SIZE,
+    API_RETRIES, API_RETRY_BACKOFF, API_KEEP_ALIVE, API_HTTP2,
+    API_LOG_SAMPLE, API_LOG_BODY_LIMIT.
+    """
+
+    def __init__(
+        self,
+        base_url: str = None,
+        timeout: int = None,
+        pool_size: int = None,
+        retries: int = None,
+        backoff: float = None,
+        keep_alive: bool = None,
+        http2: bool = None,
+        log_sample: int = None,
+        log_body_limit: int = None,
+    ):
+        """
+        Инициализация клиента.
 
-    def __init__(self, base_url: str = None, timeout: int = None):
+        Args:
+            base_url: Базовый URL API
+            timeout: Таймаут запроса (секунды)
+            pool_size: Соединений в пуле на хост (и потоков batch)
+            retries: Сколько раз повторять идемпотентный запрос
+            backoff: Множитель задержки между повторами (секунды)
+            keep_alive: Переиспользовать соединения между запросами
+            http2: Включить HTTP/2, если установлен h2
+            log_sample: Логировать каждый N-й успешный запрос (ошибки - всегда)
+            log_body_limit: Сколько символов тела писать в debug лог (0 - все)
+        """
         self.base_url = base_url or "https://api.example.com"
         self.timeout = timeout or 30
+        self.pool_size = pool_size or int(os.getenv("API_POOL_SIZE", "10"))
         self.session = requests.Session()
         self.logger = get_logger("APIClient")
+        self.log_sample = max(1, log_sample or int(os.getenv("API_LOG_SAMPLE", "1")))
+        if log_body_limit is None:
+            log_body_limit = int(os.getenv("API_LOG_BODY_LIMIT", "2000"))
+        self.log_body_limit = log_body_limit
+        # Счетчик успешных запросов для выборки (next() атомарен в CPython)
+        self._log_counter = itertools.count()
+
+        if retries is None:
+            retries = int(os.getenv("API_RETRIES", "3"))
+        if backoff is None:
+            backoff = float(os.getenv("API_RETRY_BACKOFF", "0.5"))
+        if keep_alive is None:
+            keep_alive = os.getenv("API_KEEP_ALIVE", "true").lower() == "true"
+        if http2 is None:
+            http2 = os.getenv("API_HTTP2", "false").lower() == "true"
+
+        # Повторы только для идемпотентных методов: POST/PATCH не дублируются
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            backoff_jitter=backoff / 2,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        if http2 and not enable_http2():
+            self.logger.warning(
+                "HTTP/2 недоступен (нет пакета h2), используется HTTP/1.1"
+            )
 
         # Устанавливаем заголовки по умолчанию
-        self.session.headers.update(
-            {"Content-Type": "application/json", "Accept": "application/json"}
+        self.session.headers.update(self._default_headers(keep_alive))
+        self.keep_alive = keep_alive
+
+    @staticmethod
+    def _default_headers(keep_alive: bool = True) -> Dict[str, str]:
+        """Заголовки по умолчанию."""
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if not keep_alive:
+            headers["Connection"] = "close"
+        return headers
+
+    def _truncate(self, value: Any) -> str:
+        """Строка для лога, обрезанная до log_body_limit символов."""
+        text = str(value)
+        if self.log_body_limit and len(text) > self.log_body_limit:
+            return f"{text[: self.log_body_limit]}... ({len(text)} символов)"
+        return text
+
+    def _should_log(self, status_code: int) -> bool:
+        """Ошибки логируются всегда, успешные ответы - каждый log_sample-й."""
+        if status_code >= 400:
+            return True
+        return next(self._log_counter) % self.log_sample == 0
+
+    def _log_exchange(
+        self, method: str, url: str, response: requests.Response, **kwargs
+    ):
+        """
+        Логирует запрос и ответ одной записью.
+
+        Строки формируются, только если запрос попал в выборку и уровень
+        логгера включен: заголовки и тело (разобранное один раз) - для DEBUG.
+        """
+        if not self._should_log(response.status_code):
+            return
+        self.logger.info(
+            "%s %s -> %s (%.0f ms)",
+            method,
+            url,
+            response.status_code,
+            response.elapsed.total_seconds() * 1000,
         )
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if kwargs.get("json") is not None:
+            self.logger.debug("Request body: %s", self._truncate(kwargs["json"]))
+        if kwargs.get("params") is not None:
+            self.logger.debug("Request params: %s", kwargs["params"])
+        self.logger.debug("Response headers: %s", dict(response.headers))
+        self.logger.debug("Response body: %s", self._truncate(parse_body(response)))
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Выполнить запрос без шагов Allure (безопасно из любого потока).
+
+        Args:
+            method: HTTP метод
+            endpoint: Конечная точка API
+            **kwargs: Дополнительные параметры запроса
 
-    def _log_request(self, method: str, url: str, **kwargs):
-        """Логирует информацию о запросе."""
-        self.logger.info(f"{method} {url}")
-        if "json" in kwargs:
-            self.logger.debug(f"Request body: {kwargs['json']}")
-        if "params" in kwargs:
-            self.logger.debug(f"Request params: {kwargs['params']}")
-
-    def _log_response(self, response: requests.Response):
-        """Логирует информацию об ответе."""
-        self.logger.info(f"Response status: {response.status_code}")
-        self.logger.debug(f"Response headers: {dict(response.headers)}")
+        Returns:
+            Response объект
+        """
+        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        kwargs.setdefault("timeout", self.timeout)
+        started = time.perf_counter()
         try:
-            self.logger.debug(f"Response body: {response.json()}")
-        except:
-            self.logger.debug(f"Response body: {response.text}")
+            response = self.session.request(method=method, url=url, **kwargs)
+        except requests.RequestException as e:
+            self.logger.warning("%s %s -> %s", method, url, e)
+            _journal_api_call(f"{method} {url} -> {type(e).__name__}: {e}")
+            raise
+
+        self._log_exchange(method, url, response, **kwargs)
+        _journal_api_call(
+            f"{method} {response.url} -> {response.status_code} "
+            f"({(time.perf_counter() - started) * 1000:.0f} ms)"
+        )
+        return response
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
         Выполняет HTTP запрос.
 
+        Запрос попадает в журнал, который прикладывается к Allure одним
+        вложением в конце теста (attach_api_calls).
+
         Args:
             method: HTTP метод (GET, POST, PUT, DELETE)
             endpoint: Конечная точка API
@@ -49,25 +282,8 @@ class APIClient:
         Returns:
             Response объект
         """
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-
         with allure.step(f"{method} {endpoint}"):
-            self._log_request(method, url, **kwargs)
-
-            response = self.session.request(
-                method=method, url=url, timeout=self.timeout, **kwargs
-            )
-
-            self._log_response(response)
-
-            # Прикрепляем информацию к Allure отчету
-            allure.attach(
-                f"Request: {method} {url}\nResponse: {response.status_code}",
-                name=f"{method}_{endpoint}",
-                attachment_type=allure.attachment_type.TEXT,
-            )
-
-            return response
+            return self._send(method, endpoint, **kwargs)
 
     def get(self, endpoint: str, params: Dict = None, **kwargs) -> requests.Response:
         """
@@ -147,6 +363,61 @@ class APIClient:
         """
         return self._make_request("PATCH", endpoint, data=data, json=json, **kwargs)
 
+    def batch(
+        self,
+        calls: Iterable[Union[dict, tuple]],
+        max_workers: int = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[requests.Response, Exception]]:
+        """
+        Выполнить много запросов параллельно через пул потоков.
+
+        Пример:
+
+            responses = client.batch(
+                ("GET", f"/projects/{project}") for project in projects
+            )
+
+        Args:
+            calls: Запросы - кортежи (method, endpoint) или словари
+                {"method", "endpoint", ...параметры requests}
+            max_workers: Потоков одновременно (по умолчанию размер пула)
+            return_exceptions: Вернуть исключения на месте ответов,
+                иначе пробросить первое
+
+        Returns:
+            List: Ответы (или исключения) в порядке calls
+        """
+        calls = [
+            (
+                dict(call)
+                if isinstance(call, dict)
+                else {"method": call[0], "endpoint": call[1]}
+            )
+            for call in calls
+        ]
+
+        def send(call: dict):
+            call = dict(call)
+            try:
+                return self._send(
+                    call.pop("method").upper(), call.pop("endpoint"), **call
+                )
+            except Exception as e:
+                return e
+
+        with allure.step(f"Пакет из {len(calls)} запросов"):
+            with ThreadPoolExecutor(
+                max_workers=max_workers or self.pool_size
+            ) as executor:
+                results = list(executor.map(send, calls))
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
     def set_auth_token(self, token: str):
         """
         Устанавливает токен авторизации.
@@ -170,9 +441,7 @@ class APIClient:
     def clear_headers(self):
         """Очищает все заголовки кроме Content-Type и Accept."""
         self.session.headers.clear()
-        self.session.headers.update(
-            {"Content-Type": "application/json", "Accept": "application/json"}
-        )
+        self.session.headers.update(self._default_headers(self.keep_alive))
         self.logger.info("Заголовки очищены")
 
     def expect_status_code(self, response: requests.Response, expected_code: int):
@@ -188,21 +457,198 @@ class APIClient:
                 response.status_code == expected_code
             ), f"Ожидался статус код {expected_code}, получен {response.status_code}"
 
-    def expect_json_schema(self, response: requests.Response, schema: Dict):
+    def expect_json_schema(
+        self,
+        response: requests.Response,
+        schema: Dict,
+        schema_id: str = None,
+        stream: bool = False,
+        list_key: str = None,
+        raise_on_error: bool = True,
+    ) -> List[dict]:
         """
         Проверяет JSON схему ответа.
 
+        Схема компилируется один раз и кэшируется по schema_id ($id схемы).
+        Для больших списков (stream=True) элементы массива разбираются и
+        проверяются по одному, не собирая весь ответ в память: тогда schema -
+        схема одного элемента. Запрос для этого делается с stream=True.
+
         Args:
             response: Response объект
-            schema: Ожидаемая JSON схема
+            schema: Ожидаемая JSON схема (при stream - схема элемента)
+            schema_id: Идентификатор схемы для кэша (по умолчанию $id)
+            stream: Проверять элементы массива по мере чтения тела
+            list_key: Ключ массива в корневом объекте ({"data": [...]})
+            raise_on_error: Падать с AssertionError при ошибках
+
+        Returns:
+            List[dict]: Ошибки {"path": "$.data[3].id", "location", "keyword", "message"}
         """
-        # Здесь можно добавить валидацию JSON схемы
-        # Например, используя jsonschema библиотеку
-        with allure.step("Проверяем JSON схему"):
-            try:
-                response_json = response.json()
-                # TODO: Добавить валидацию схемы
-                self.logger.info("JSON схема валидна")
-            except Exception as e:
-                self.logger.error(f"Ошибка валидации JSON схемы: {e}")
-                raise
+        name = schema_id or schema.get("$id") or "ответа"
+        with allure.step(f"Проверяем JSON схему {name}"):
+            started = time.perf_counter()
+            if stream:
+                items = (
+                    parse_body(response) if hasattr(response, "_parsed_body") else None
+                )
+                if items is None:
+                    items = iter_json_array(
+                        response.iter_content(STREAM_CHUNK_SIZE), list_key
+                    )
+                elif list_key is not None:
+                    items = items[list_key]
+                count, errors = validate_items(
+                    items, schema, schema_id, () if list_key is None else (list_key,)
+                )
+                checked = f"{count} элементов"
+            else:
+                errors = validate(parse_body(response), schema, schema_id)
+                checked = "ответ"
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            if errors:
+                report = format_errors(errors)
+                self.logger.error(f"Ошибки JSON схемы {name}:\n{report}")
+                allure.attach(
+                    json.dumps(errors, ensure_ascii=False, indent=2),
+                    name="JSON schema errors",
+                    attachment_type=allure.attachment_type.JSON,
+                )
+                if not raise_on_error:
+                    return errors
+                raise AssertionError(
+                    f"Ответ {response.url} не соответствует схеме {name}:\n{report}"
+                )
+            self.logger.info(
+                f"JSON схема {name} валидна: {checked}, {elapsed_ms:.1f} ms"
+            )
+            return errors
+
+
+class AsyncAPIClient:
+    """
+    Асинхронный аналог APIClient с тем же набором методов.
+
+    Запросы выполняются пулом соединений APIClient в потоках (asyncio.to_thread),
+    одновременно - не больше размера пула. Шаги Allure не создаются:
+    параллельные корутины перемешали бы их вложенность, запросы попадают
+    в общий журнал (attach_api_calls).
+    """
+
+    # Заголовки и проверки не зависят от транспорта - общие с APIClient
+    set_auth_token = APIClient.set_auth_token
+    set_headers = APIClient.set_headers
+    clear_headers = APIClient.clear_headers
+    _default_headers = staticmethod(APIClient._default_headers)
+    expect_status_code = APIClient.expect_status_code
+    expect_json_schema = APIClient.expect_json_schema
+
+    def __init__(self, base_url: str = None, timeout: int = None, **kwargs):
+        """
+        Инициализация клиента.
+
+        Args:
+            base_url: Базовый URL API
+            timeout: Таймаут запроса (секунды)
+            **kwargs: Настройки пула и повторов (см. APIClient)
+        """
+        self.client = APIClient(base_url, timeout, **kwargs)
+        self.session = self.client.session
+        self.keep_alive = self.client.keep_alive
+        self.logger = self.client.logger
+        # event loop -> семафор: клиент можно переиспользовать в новом asyncio.run
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    async def _make_request(
+        self, method: str, endpoint: str, **kwargs
+    ) -> requests.Response:
+        """
+        Выполняет HTTP запрос.
+
+        Args:
+            method: HTTP метод (GET, POST, PUT, DELETE)
+            endpoint: Конечная точка API
+            **kwargs: Дополнительные параметры запроса
+
+        Returns:
+            Response объект
+        """
+        async with self._get_semaphore():
+            response = await asyncio.to_thread(
+                self.client._send, method, endpoint, **kwargs
+            )
+        return response
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Семафор пула для текущего event loop (asyncio объекты привязаны к loop)."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self.client.pool_size
+            )
+        return semaphore
+
+    async def get(
+        self, endpoint: str, params: Dict = None, **kwargs
+    ) -> requests.Response:
+        """Выполняет GET запрос (см. APIClient.get)."""
+        return await self._make_request("GET", endpoint, params=params, **kwargs)
+
+    async def post(
+        self, endpoint: str, data: Dict = None, json: Dict = None, **kwargs
+    ) -> requests.Response:
+        """Выполняет POST запрос (см. APIClient.post)."""
+        return await self._make_request(
+            "POST", endpoint, data=data, json=json, **kwargs
+        )
+
+    async def put(
+        self, endpoint: str, data: Dict = None, json: Dict = None, **kwargs
+    ) -> requests.Response:
+        """Выполняет PUT запрос (см. APIClient.put)."""
+        return await self._make_request("PUT", endpoint, data=data, json=json, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> requests.Response:
+        """Выполняет DELETE запрос (см. APIClient.delete)."""
+        return await self._make_request("DELETE", endpoint, **kwargs)
+
+    async def patch(
+        self, endpoint: str, data: Dict = None, json: Dict = None, **kwargs
+    ) -> requests.Response:
+        """Выполняет PATCH запрос (см. APIClient.patch)."""
+        return await self._make_request(
+            "PATCH", endpoint, data=data, json=json, **kwargs
+        )
+
+    async def batch(
+        self,
+        calls: Iterable[Union[dict, tuple]],
+        max_workers: int = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[requests.Response, Exception]]:
+        """
+        Выполнить много запросов параллельно (см. APIClient.batch).
+
+        Args:
+            calls: Кортежи (method, endpoint) или словари {"method", "endpoint", ...}
+            max_workers: Не используется - параллельность ограничена размером пула
+            return_exceptions: Вернуть исключения на месте ответов
+
+        Returns:
+            List: Ответы (или исключения) в порядке calls
+        """
+        coroutines = []
+        for call in calls:
+            call = (
+                dict(call)
+                if isinstance(call, dict)
+                else {"method": call[0], "endpoint": call[1]}
+            )
+            coroutines.append(
+                self._make_request(
+                    call.pop("method").upper(), call.pop("endpoint"), **call
+                )
+            )
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
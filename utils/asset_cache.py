@@ -0,0 +1,329 @@
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from utils.logger import get_logger
+
+
+class AssetCache:
+    """
+    Дисковый кэш статики (бандлы, тайлы карты, картинки слайдеров и 360 туров).
+
+    Подключается к контексту через route и отдает неизменяемые ресурсы с диска.
+    Сохраняется только статика, которая не может устареть незаметно: имя файла
+    с хэшем содержимого (main.3f2a9c1b.js) или ответ с Cache-Control immutable
+    либо длинным max-age. Срок жизни записи хранится в индексе.
+    Тело хранится по sha256 содержимого (одинаковые файлы с разных URL -
+    один блоб), индекс URL -> блоб лежит отдельными файлами, поэтому кэш
+    безопасно делят все воркеры xdist. Размер ограничен, при превышении
+    удаляются давно не использованные блобы (LRU по mtime).
+    """
+
+    DEFAULT_DIR = ".asset_cache"
+    DEFAULT_MAX_MB = 512
+
+    # Что кэшировать: хост -> регулярное выражение по пути URL.
+    # "*" применяется ко всем хостам, правило хоста дополняет его.
+    # fonts.googleapis.com не кэшируется: CSS шрифтов зависит от User-Agent
+    # и отдается с Cache-Control private. Файлы шрифтов (fonts.gstatic.com)
+    # попадают в кэш только без --block-profile=on - иначе их блокирует
+    # BLOCKLIST_COMMON раньше кэша.
+    HOST_RULES = {
+        "*": r"\.(js|mjs|css|woff2?|ttf|otf|png|jpe?g|webp|avif|gif|svg|glb|ktx2)$",
+        "maps.googleapis.com": r"^/maps/(vt|api/js)",
+        "maps.gstatic.com": r".*",
+        "fonts.gstatic.com": r".*",
+    }
+
+    # Имя файла с хэшем содержимого: main.3f2a9c1b.js, index-BdH3kLm9.js
+    FINGERPRINT_RE = re.compile(
+        r"[.\-_](?:(?=[0-9a-f]*[a-f])[0-9a-f]{8,}"
+        r"|(?=\w*\d)(?=\w*[A-Z])(?=\w*[a-z])\w{8,12})\.\w+$"
+    )
+    # Без хэша в имени и immutable ответ кэшируется, если max-age не меньше (с)
+    MIN_MAX_AGE = 86400
+    # Срок жизни файла с хэшем или immutable ответа без max-age (с)
+    IMMUTABLE_TTL = 30 * 86400
+
+    # Заголовки, которые нельзя отдавать вместе с уже распакованным телом
+    _SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+    def __init__(self, cache_dir: str = None, max_mb: int = None):
+        """
+        Инициализация.
+
+        Args:
+            cache_dir: Директория кэша (по умолчанию ASSET_CACHE_DIR или DEFAULT_DIR)
+            max_mb: Лимит размера блобов в МБ (по умолчанию ASSET_CACHE_MAX_MB)
+        """
+        self.cache_dir = cache_dir or os.getenv("ASSET_CACHE_DIR", self.DEFAULT_DIR)
+        self.max_bytes = (
+            (max_mb or int(os.getenv("ASSET_CACHE_MAX_MB", self.DEFAULT_MAX_MB)))
+            * 1024
+            * 1024
+        )
+        self.logger = get_logger("AssetCache")
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stored": 0,
+            "expired": 0,
+            "not_stored": 0,
+            "bytes_saved": 0,
+        }
+        self._rules = {
+            host: re.compile(pattern) for host, pattern in self.HOST_RULES.items()
+        }
+
+    def attach(self, context):
+        """
+        Подключить кэш к контексту браузера.
+
+        Args:
+            context: BrowserContext Playwright
+        """
+        context.route("**/*", self._handle_route)
+
+    def is_cacheable(self, url: str, method: str = "GET") -> bool:
+        """
+        Проверить, подходит ли запрос под правила кэширования.
+
+        Args:
+            url: URL запроса
+            method: HTTP метод
+
+        Returns:
+            bool: True, если ресурс можно брать из кэша
+        """
+        if method != "GET":
+            return False
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return False
+        for host in ("*", parsed.hostname):
+            rule = self._rules.get(host)
+            if rule and rule.search(parsed.path):
+                return True
+        return False
+
+    def get_ttl(self, url: str, headers: Dict[str, str]) -> Optional[int]:
+        """
+        Сколько секунд ресурс можно отдавать из кэша.
+
+        Args:
+            url: URL ресурса
+            headers: Заголовки ответа (имена в нижнем регистре)
+
+        Returns:
+            Optional[int]: Срок жизни или None, если ресурс не неизменяемый
+                (нет хэша в имени, immutable и длинного max-age)
+        """
+        directives = {}
+        for part in headers.get("cache-control", "").lower().split(","):
+            name, _, value = part.strip().partition("=")
+            directives[name] = value.strip('"')
+        if {"no-store", "no-cache", "private"} & directives.keys():
+            return None
+
+        try:
+            max_age = int(directives["max-age"]) if "max-age" in directives else None
+        except ValueError:
+            max_age = None
+
+        fingerprinted = bool(self.FINGERPRINT_RE.search(urlparse(url).path))
+        if fingerprinted or "immutable" in directives:
+            return max(max_age or 0, self.IMMUTABLE_TTL)
+        if max_age is not None and max_age >= self.MIN_MAX_AGE:
+            return max_age
+        return None
+
+    def evict(self) -> int:
+        """
+        Удалить давно не использованные блобы сверх лимита и записи индекса,
+        блоб которых удален.
+
+        Returns:
+            int: Сколько байт освобождено
+        """
+        blobs_dir = os.path.join(self.cache_dir, "blobs")
+        if not os.path.isdir(blobs_dir):
+            return 0
+
+        blobs = []
+        for root, _, files in os.walk(blobs_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                blobs.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in blobs)
+        freed = 0
+        for _, size, path in sorted(blobs):
+            if total - freed <= self.max_bytes:
+                break
+            os.remove(path)
+            freed += size
+
+        freed += self._prune_index()
+
+        if freed:
+            self.logger.info(f"Кэш статики: удалено {freed // 1024} КБ")
+        return freed
+
+    @staticmethod
+    def merge_stats(target: Dict[str, int], stats: Dict[str, int]):
+        """Сложить статистику (например, воркеров xdist) в target."""
+        for key, value in stats.items():
+            target[key] = target.get(key, 0) + value
+
+    @staticmethod
+    def format_stats(stats: Dict[str, int]) -> str:
+        """Строка итога: попадания, промахи и сэкономленный трафик."""
+        total = stats.get("hits", 0) + stats.get("misses", 0)
+        hit_rate = stats.get("hits", 0) / total * 100 if total else 0.0
+        return (
+            f"попаданий {stats.get('hits', 0)}, промахов {stats.get('misses', 0)} "
+            f"({hit_rate:.1f}% hit), сохранено {stats.get('stored', 0)}, "
+            f"устарело {stats.get('expired', 0)}, "
+            f"не неизменяемых {stats.get('not_stored', 0)}, "
+            f"сэкономлено {stats.get('bytes_saved', 0) / 1024 / 1024:.1f} МБ"
+        )
+
+    def _handle_route(self, route):
+        """Обработчик route: отдать из кэша или загрузить и сохранить."""
+        request = route.request
+        if not self.is_cacheable(request.url, request.method):
+            route.fallback()
+            return
+
+        cached = self._load(request.url)
+        if cached:
+            meta, body = cached
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += len(body)
+            route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+
+        self.stats["misses"] += 1
+        try:
+            response = route.fetch()
+            body = response.body()
+        except Exception:
+            route.fallback()
+            return
+
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in self._SKIP_HEADERS
+        }
+        if response.status == 200:
+            ttl = self.get_ttl(request.url, response.headers)
+            if ttl:
+                self._store(request.url, response.status, headers, body, ttl)
+            else:
+                self.stats["not_stored"] += 1
+        route.fulfill(status=response.status, headers=headers, body=body)
+
+    def _prune_index(self) -> int:
+        """
+        Удалить записи индекса, блоб которых удален.
+
+        Блоб пишется раньше записи индекса, поэтому запись параллельного
+        воркера без блоба не остается.
+
+        Returns:
+            int: Сколько байт освобождено
+        """
+        freed = 0
+        for root, _, files in os.walk(os.path.join(self.cache_dir, "index")):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    with open(path, encoding="utf-8") as f:
+                        blob_path = self._blob_path(json.load(f)["blob"])
+                    if os.path.exists(blob_path):
+                        continue
+                    size = os.path.getsize(path)
+                    os.remove(path)
+                    freed += size
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue
+        return freed
+
+    def _index_path(self, url: str) -> str:
+        """Путь к записи индекса для URL."""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, "index", key[:2], f"{key}.json")
+
+    def _blob_path(self, digest: str) -> str:
+        """Путь к блобу по sha256 содержимого."""
+        return os.path.join(self.cache_dir, "blobs", digest[:2], digest)
+
+    def _load(self, url: str) -> Optional[tuple]:
+        """Прочитать ресурс из кэша: (meta, body) или None."""
+        index_path = self._index_path(url)
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            blob_path = self._blob_path(meta["blob"])
+            with open(blob_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Записи без срока (до проверки неизменяемости) тоже считаются устаревшими
+        if meta.get("expires", 0) <= time.time():
+            self.stats["expired"] += 1
+            return None
+
+        # Отмечаем использование для LRU
+        try:
+            os.utime(blob_path)
+        except OSError:
+            pass
+        return meta, body
+
+    def _store(
+        self,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        ttl: int,
+    ):
+        """Сохранить ресурс: блоб по содержимому и запись индекса со сроком."""
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        try:
+            if not os.path.exists(blob_path):
+                self._write_atomic(blob_path, body)
+            meta = {
+                "url": url,
+                "status": status,
+                "headers": headers,
+                "blob": digest,
+                "expires": round(time.time() + ttl),
+            }
+            self._write_atomic(
+                self._index_path(url),
+                json.dumps(meta, ensure_ascii=False).encode("utf-8"),
+            )
+            self.stats["stored"] += 1
+        except OSError as e:
+            self.logger.warning(f"Не удалось сохранить {url} в кэш: {e}")
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        """Записать файл атомарно (параллельные воркеры не увидят половину)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,140 @@
+"""Повторные замеры сценариев и статистика по ним (median/p95/p99)."""
+
+import os
+import statistics
+import time
+from typing import Dict, Iterable, List, Optional
+
+from pages.aio.runner import Scenario, run_scenarios
+from utils.metrics_file import append_record
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """
+    Перцентиль с линейной интерполяцией между соседними значениями.
+
+    Args:
+        values: Значения
+        q: Перцентиль от 0 до 100
+
+    Returns:
+        float: Значение перцентиля или None для пустого списка
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(values: Iterable[Optional[float]]) -> dict:
+    """
+    Сводка по замерам одной метрики.
+
+    Args:
+        values: Значения (None - этап не наступил за время замера)
+
+    Returns:
+        dict: n, missing, min, median, p95, p99, max
+    """
+    values = list(values)
+    present = [v for v in values if v is not None]
+    summary = {"n": len(present), "missing": len(values) - len(present)}
+    if not present:
+        return {
+            **summary,
+            "min": None,
+            "median": None,
+            "p95": None,
+            "p99": None,
+            "max": None,
+        }
+    return {
+        **summary,
+        "min": round(min(present), 1),
+        "median": round(statistics.median(present), 1),
+        "p95": round(percentile(present, 95), 1),
+        "p99": round(percentile(present, 99), 1),
+        "max": round(max(present), 1),
+    }
+
+
+def summarize_results(results: List[dict], metrics: Iterable[str]) -> Dict[str, dict]:
+    """Сводка по каждой метрике из результатов итераций."""
+    return {metric: summarize(r.get(metric) for r in results) for metric in metrics}
+
+
+def format_summary(title: str, summaries: Dict[str, dict]) -> str:
+    """Таблица сводки для консоли и Allure."""
+    lines = [
+        title,
+        f"{'metric':<24} {'n':>3} {'median':>9} {'p95':>9} {'p99':>9} {'max':>9}",
+    ]
+    for metric, s in summaries.items():
+        cells = [
+            f"{s[key]:>9.1f}" if s[key] is not None else f"{'-':>9}"
+            for key in ("median", "p95", "p99", "max")
+        ]
+        missing = f"  (нет: {s['missing']})" if s["missing"] else ""
+        lines.append(f"{metric:<24} {s['n']:>3} {' '.join(cells)}{missing}")
+    return "\n".join(lines)
+
+
+def run_iterations(
+    scenario: Scenario,
+    iterations: int,
+    concurrency: int = 1,
+    browser_name: str = "chromium",
+    launch_args: dict = None,
+    context_args: dict = None,
+) -> List[dict]:
+    """
+    Выполнить сценарий несколько раз, каждую итерацию в новом контексте.
+
+    Args:
+        scenario: Корутина-функция, принимающая Page и возвращающая замер
+        iterations: Сколько раз выполнить
+        concurrency: Сколько итераций выполнять одновременно
+        browser_name: chromium, firefox или webkit
+        launch_args: Параметры запуска браузера
+        context_args: Параметры контекста (viewport, устройство...)
+
+    Returns:
+        List[dict]: Результаты run_on_pages в порядке итераций
+    """
+    results = run_scenarios(
+        {f"#{i + 1}": scenario for i in range(iterations)},
+        browser_name=browser_name,
+        launch_args=launch_args,
+        context_args=context_args,
+        concurrency=concurrency,
+    )
+    return list(results.values())
+
+
+def record_results(name: str, results: List[dict], **tags):
+    """
+    Записать успешные итерации в файл замеров (попадают в историю метрик).
+
+    Args:
+        name: Имя бенчмарка (map_load_cold...)
+        results: Результаты run_iterations
+        **tags: Метки (project, route_type, browser, device)
+    """
+    for iteration, outcome in enumerate(results, start=1):
+        if not outcome["ok"]:
+            continue
+        append_record(
+            {
+                "ts": round(time.time(), 3),
+                "kind": "benchmark",
+                "name": name,
+                "iteration": iteration,
+                "test": os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0],
+                "environment": os.getenv("TEST_ENVIRONMENT", "dev"),
+                **tags,
+                **outcome["result"],
+            }
+        )
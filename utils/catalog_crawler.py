@@ -0,0 +1,575 @@
+"""
+Обход каталога: все здания, этажи и апартаменты проектов.
+
+Запуск:
+    python -m utils.catalog_crawler --projects arisha,mark --concurrency 4
+
+Найденные апартаменты потоково пишутся в JSONL инвентарь. Прерванный обход
+продолжается с того же места: при повторном запуске с тем же --output
+уже обработанные узлы пропускаются.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import List, Optional, Set
+from urllib.parse import urlparse
+
+from playwright.async_api import Page, async_playwright
+
+from locators.abra.willows_residences_locators import WillowsResidencesLocators
+from locators.capstone.peylaa_locators import PeylaaLocators
+from locators.lsr.mark_locators import MarkLocators
+from locators.msg.edgewater_locators import EdgewaterLocators
+from locators.qube.arisha_locators import ArishaLocators
+from locators.qube.cubix_locators import CubixLocators
+from locators.qube.elire_locators import ElireLocators
+from locators.vibe.arsenal_locators import ArsenalLocators
+from locators.wellcube.tranquil_locators import TranquilLocators
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.components.apartment_widget_component import (
+    AsyncApartmentWidgetComponent,
+)
+from pages.aio.core.apartment_scanner import AsyncApartmentScanner
+from utils.logger import get_logger
+
+PROJECT_LOCATORS = {
+    "arisha": ArishaLocators,
+    "cubix": CubixLocators,
+    "elire": ElireLocators,
+    "peylaa": PeylaaLocators,
+    "tranquil": TranquilLocators,
+    "mark": MarkLocators,
+    "arsenal": ArsenalLocators,
+    "willows_residences": WillowsResidencesLocators,
+    "edgewater": EdgewaterLocators,
+}
+
+# Инвентарь по умолчанию (CRAWL_OUTPUT)
+DEFAULT_OUTPUT = "reports/catalog_inventory.jsonl"
+
+# Итоговые статусы апартамента (на resume не перепроверяются без --retry-failed)
+UNIT_STATUSES = ("ok", "locked", "page_failed", "widget_failed")
+FAILED_STATUSES = ("page_failed", "widget_failed")
+
+# Уровни обхода: глубже - выше приоритет, чтобы апартаменты попадали
+# в инвентарь как можно раньше, а очередь не разрасталась
+LEVELS = ("project", "building", "floor", "apartment")
+
+
+class CatalogCrawler:
+    """
+    Параллельный обход дерева здание -> этаж -> апартамент.
+
+    Здания и этажи берутся из навигационных меню (data-test-id
+    nav-desktop-building-{id} / nav-desktop-floor-{n}), страницы открываются
+    напрямую по URL (/building/{b}, /floor/{b}/{f}, /apartment/{id}) - так же,
+    как NavigationComponent и MarkPage. Идентификатор апартамента берется
+    из ссылки на плане этажа, а для планов без ссылок - из URL после клика.
+
+    Каждая обработанная задача - строка JSONL. Для узлов дерева в строке
+    сохраняются найденные дочерние узлы, поэтому при resume обход
+    продолжается без повторного открытия уже пройденных страниц.
+    """
+
+    NAV_TIMEOUT = 20000
+    MENU_TIMEOUT = 5000
+    CLICK_NAV_TIMEOUT = 10000
+
+    def __init__(
+        self,
+        output: str,
+        concurrency: int = 4,
+        retry_failed: bool = False,
+        storage_state: str = None,
+    ):
+        """
+        Инициализация.
+
+        Args:
+            output: Путь к JSONL инвентарю (он же журнал для resume)
+            concurrency: Сколько страниц обходить одновременно
+            retry_failed: Перепроверить апартаменты с ошибками загрузки
+            storage_state: Storage state с авторизацией (для закрытых проектов)
+        """
+        self.output = output
+        self.concurrency = concurrency
+        self.retry_failed = retry_failed
+        self.storage_state = storage_state
+        self.logger = get_logger("CatalogCrawler")
+        self.stats = {status: 0 for status in UNIT_STATUSES}
+
+        self._done: Set[str] = set()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._seq = 0
+        self._file = None
+
+    async def crawl(
+        self, projects: List[str], browser_name: str = "chromium", headless=True
+    ):
+        """
+        Обойти каталоги проектов.
+
+        Args:
+            projects: Проекты (ключи PROJECT_LOCATORS)
+            browser_name: chromium, firefox или webkit
+            headless: Запуск без окна браузера
+        """
+        self._queue = asyncio.PriorityQueue()
+        pending = self._load_journal()
+
+        for project in projects:
+            if project not in PROJECT_LOCATORS:
+                raise ValueError(f"Неизвестный проект: {project}")
+            self._enqueue({"type": "project", "project": project})
+        for task in pending:
+            if task["project"] in projects:
+                self._enqueue(task)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.output)), exist_ok=True)
+        self._file = open(self.output, "a", encoding="utf-8")
+        try:
+            async with async_playwright() as playwright:
+                browser = await getattr(playwright, browser_name).launch(
+                    headless=headless
+                )
+                workers = [
+                    asyncio.create_task(self._worker(browser))
+                    for _ in range(self.concurrency)
+                ]
+                await self._queue.join()
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                await browser.close()
+        finally:
+            self._file.close()
+
+        self.logger.info(f"Обход завершен: {self.stats}")
+
+    # ==================== ОЧЕРЕДЬ И ЖУРНАЛ ====================
+
+    @staticmethod
+    def task_key(task: dict) -> str:
+        """Ключ узла дерева: project/building/floor/apartment."""
+        parts = [task["project"]]
+        for field in ("building", "floor", "apartment"):
+            if field in task:
+                parts.append(str(task[field]))
+        return f"{task['type']}:{'/'.join(parts)}"
+
+    def _enqueue(self, task: dict):
+        """Добавить задачу, если она еще не выполнена."""
+        key = self.task_key(task)
+        if key in self._done:
+            return
+        self._done.add(key)
+        self._seq += 1
+        priority = -LEVELS.index(task["type"])
+        self._queue.put_nowait((priority, self._seq, task))
+
+    def _load_journal(self) -> List[dict]:
+        """
+        Прочитать журнал прошлых запусков.
+
+        Returns:
+            List[dict]: Задачи, найденные ранее, но еще не выполненные
+        """
+        if not os.path.exists(self.output):
+            return []
+
+        records = []
+        with open(self.output, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Последняя строка могла оборваться при прерывании
+                    continue
+
+        finished, retry_floors = set(), set()
+        for record in records:
+            if record["type"] == "apartment":
+                if record["status"] in FAILED_STATUSES and self.retry_failed:
+                    # Неоткрывшийся или открытый кликом апартамент не входит
+                    # в children этажа - повторяем весь этаж
+                    if record.get("clicked") or str(record["apartment"]).startswith(
+                        "unopened-"
+                    ):
+                        floor = {k: v for k, v in record.items() if k != "apartment"}
+                        retry_floors.add(self.task_key({**floor, "type": "floor"}))
+                    continue
+                self.stats[record["status"]] += 1
+            elif record.get("status") != "ok":
+                # Не удалось открыть узел - повторим
+                continue
+            finished.add(self.task_key(record))
+        finished -= retry_floors
+        self._done |= finished
+
+        pending = []
+        for record in records:
+            if self.task_key(record) in finished:
+                pending.extend(
+                    child
+                    for child in record.get("children", [])
+                    if self.task_key(child) not in finished
+                )
+        if finished:
+            self.logger.info(
+                f"Resume: выполнено {len(finished)} задач, в очереди {len(pending)}"
+            )
+        return pending
+
+    def _write(self, record: dict):
+        """Дописать запись в инвентарь (сразу на диск)."""
+        record["ts"] = round(time.time(), 3)
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    async def _worker(self, browser):
+        """Воркер со своей страницей: берет задачи из очереди по приоритету."""
+        context_args = {"viewport": {"width": 1920, "height": 1080}}
+        if self.storage_state:
+            context_args["storage_state"] = self.storage_state
+        context = await browser.new_context(ignore_https_errors=True, **context_args)
+        page = await context.new_page()
+        try:
+            while True:
+                _, _, task = await self._queue.get()
+                try:
+                    await self._process(page, task)
+                except Exception as e:
+                    self.logger.warning(f"{self.task_key(task)}: {e}")
+                    self._write({**task, "status": "page_failed", "error": str(e)})
+                finally:
+                    self._queue.task_done()
+        finally:
+            await context.close()
+
+    async def _process(self, page: Page, task: dict):
+        """Выполнить задачу своего уровня и поставить в очередь дочерние."""
+        handler = {
+            "project": self._crawl_project,
+            "building": self._crawl_building,
+            "floor": self._crawl_floor,
+            "apartment": self._check_apartment,
+        }[task["type"]]
+        children = await handler(page, task)
+        if children is None:
+            return
+
+        self._write({**task, "status": "ok", "children": children})
+        for child in children:
+            self._enqueue(child)
+
+    # ==================== УРОВНИ ОБХОДА ====================
+
+    def _base_page(self, page: Page, project: str) -> AsyncBasePage:
+        """Асинхронная страница проекта с его локаторами."""
+        return AsyncBasePage(page, None, PROJECT_LOCATORS[project])
+
+    async def _open(self, page: Page, url: str):
+        """Открыть URL и проверить ответ сервера."""
+        response = await page.goto(
+            url, wait_until="domcontentloaded", timeout=self.NAV_TIMEOUT
+        )
+        if response and response.status >= 400:
+            raise RuntimeError(f"HTTP {response.status}: {url}")
+
+    async def _crawl_project(self, page: Page, task: dict) -> List[dict]:
+        """Проект -> здания из меню навигации."""
+        base = self._base_page(page, task["project"])
+        await self._open(page, base.get_project_url(task["project"], "catalog_2d"))
+        buildings = await self._read_menu(
+            page, base.project_locators.BUILDING_NAV_BUTTON, "nav-desktop-building-"
+        )
+        return [{**task, "type": "building", "building": b} for b in buildings]
+
+    async def _crawl_building(self, page: Page, task: dict) -> List[dict]:
+        """Здание -> этажи из меню навигации."""
+        base = self._base_page(page, task["project"])
+        await self._open(
+            page, base.get_project_url(task["project"], building=task["building"])
+        )
+        floors = await self._read_menu(
+            page, base.project_locators.FLOOR_NAV_BUTTON, "nav-desktop-floor-"
+        )
+        return [{**task, "type": "floor", "floor": f} for f in floors]
+
+    async def _crawl_floor(self, page: Page, task: dict) -> List[dict]:
+        """
+        Этаж -> апартаменты плана.
+
+        Id свободного апартамента берется из ссылки на плане (href скана),
+        такие апартаменты проверяются отдельными задачами. Апартаменты без
+        ссылки кликаются по очереди: id берется из URL открывшейся страницы,
+        готовность виджета проверяется там же, без повторного открытия.
+        Апартаменты с замком не открываются и сразу записываются в инвентарь
+        со статусом locked, свободные, клик по которым не открыл страницу
+        апартамента, - со статусом page_failed.
+        """
+        base = self._base_page(page, task["project"])
+        floor_url = base.get_project_url(
+            task["project"], building=task["building"], floor=task["floor"]
+        )
+        selector = base.project_locators.FLOOR_PLAN_APARTMENTS
+
+        await self._open(page, floor_url)
+        apartments = await self._scan_floor(page, selector)
+
+        children, unlinked = [], []
+        for apartment in apartments:
+            if apartment["locked"]:
+                unit = {
+                    **task,
+                    "type": "apartment",
+                    "apartment": f"locked-{apartment['index']}",
+                }
+                if self.task_key(unit) not in self._done:
+                    self._done.add(self.task_key(unit))
+                    self._record_unit(unit, "locked", text=apartment["text"])
+                continue
+
+            apartment_id = self._apartment_id(apartment["href"])
+            if apartment_id:
+                children.append(
+                    {**task, "type": "apartment", "apartment": apartment_id}
+                )
+            else:
+                unlinked.append(apartment)
+
+        for apartment in unlinked:
+            await self._click_through(page, task, apartment, floor_url, selector)
+        return children
+
+    async def _click_through(
+        self, page: Page, task: dict, apartment: dict, floor_url: str, selector: str
+    ):
+        """Открыть апартамент без ссылки кликом и проверить его на месте."""
+        # Каждый клик уводит со страницы этажа - сканируем план заново
+        if page.url != floor_url:
+            await self._open(page, floor_url)
+            await self._scan_floor(page, selector)
+
+        started = time.perf_counter()
+        try:
+            await AsyncApartmentScanner(page).click(
+                apartment, timeout=self.CLICK_NAV_TIMEOUT
+            )
+            await page.wait_for_url("**/apartment/**", timeout=self.CLICK_NAV_TIMEOUT)
+        except Exception as e:
+            # Апартамент без id в инвентаре - иначе этаж записан как ok и
+            # при продолжении обхода апартамент потерян
+            self.logger.warning(f"Апартамент {apartment['index']} не открылся: {e}")
+            unit = {
+                **task,
+                "type": "apartment",
+                "apartment": f"unopened-{apartment['index']}",
+            }
+            if self.task_key(unit) not in self._done:
+                self._done.add(self.task_key(unit))
+                self._record_unit(
+                    unit, "page_failed", text=apartment["text"], error=str(e)
+                )
+            return
+
+        unit = {
+            **task,
+            "type": "apartment",
+            "apartment": self._apartment_id(page.url),
+            "clicked": True,
+        }
+        if self.task_key(unit) in self._done:
+            return
+        self._done.add(self.task_key(unit))
+        await self._probe_apartment(page, unit, page.url, started)
+
+    async def _check_apartment(self, page: Page, task: dict):
+        """Апартамент: страница должна открыться, виджет - стать готовым."""
+        project = task["project"]
+        base = self._base_page(page, project)
+        url = base.get_project_url(project, apartment=task["apartment"])
+        started = time.perf_counter()
+
+        try:
+            await self._open(page, url)
+        except Exception as e:
+            self._record_unit(
+                task, "page_failed", url=url, error=str(e), started=started
+            )
+            return None
+
+        await self._probe_apartment(page, task, url, started)
+        return None
+
+    async def _probe_apartment(self, page: Page, task: dict, url: str, started: float):
+        """Проверить готовность виджета на уже открытой странице апартамента."""
+        project = task["project"]
+        widget = AsyncApartmentWidgetComponent(page, PROJECT_LOCATORS[project], project)
+        try:
+            readiness = await widget.probe_readiness()
+        except Exception as e:
+            self._record_unit(
+                task, "widget_failed", url=url, error=str(e), started=started
+            )
+            return
+
+        timings = {
+            key: readiness[key]
+            for key in ("frame_attach_ms", "first_paint_ms", "interactive_ms")
+        }
+        if not readiness["ready"]:
+            self._record_unit(
+                task,
+                "widget_failed",
+                url=url,
+                error="Виджет не отрисовал сцену или кнопки 2D/3D не интерактивны",
+                started=started,
+                **timings,
+            )
+            return
+
+        self._record_unit(task, "ok", url=url, started=started, **timings)
+
+    @staticmethod
+    def _apartment_id(url: Optional[str]) -> Optional[str]:
+        """Id апартамента из URL вида .../apartment/{id} (None - не апартамент)."""
+        if not url:
+            return None
+        path = urlparse(url).path.rstrip("/")
+        if "/apartment/" not in path:
+            return None
+        return path.split("/apartment/", 1)[1] or None
+
+    def _record_unit(self, task: dict, status: str, started: float = None, **fields):
+        """Записать итог по апартаменту в инвентарь."""
+        if started is not None:
+            fields["duration"] = round(time.perf_counter() - started, 2)
+        self.stats[status] += 1
+        self._write({**task, "status": status, **fields})
+
+    # ==================== ЧТЕНИЕ СТРАНИЦ ====================
+
+    async def _read_menu(self, page: Page, nav_button: str, prefix: str) -> List[str]:
+        """
+        Открыть меню навигации и собрать id пунктов по префиксу data-test-id.
+
+        Returns:
+            List[str]: Суффиксы data-test-id (1, 2, mark-k1...) в порядке меню
+        """
+        button = page.locator(nav_button)
+        try:
+            await button.first.wait_for(state="visible", timeout=self.MENU_TIMEOUT)
+        except Exception:
+            # У проекта нет такого уровня навигации
+            return []
+        await button.first.click()
+        items = page.locator(f'[data-test-id^="{prefix}"]')
+        await items.first.wait_for(state="attached", timeout=self.MENU_TIMEOUT)
+        ids = await items.evaluate_all(
+            "(els, prefix) => els.map((el) => el.getAttribute('data-test-id').slice(prefix.length))",
+            prefix,
+        )
+        await page.keyboard.press("Escape")
+        return list(dict.fromkeys(i for i in ids if i))
+
+    async def _scan_floor(self, page: Page, selector: str) -> List[dict]:
+        """Видимые апартаменты плана этажа с признаком замка (один evaluate)."""
+        await page.wait_for_selector(selector, timeout=self.NAV_TIMEOUT)
+        apartments = await AsyncApartmentScanner(page).scan(
+            selector, lock_mode="inside"
+        )
+        return [apartment for apartment in apartments if apartment["visible"]]
+
+
+def find_inventory_apartments(project: str, path: str = None) -> List[str]:
+    """
+    Апартаменты проекта, которые при последнем обходе загрузились без ошибок.
+
+    Args:
+        project: Проект (ключ PROJECT_LOCATORS)
+        path: Инвентарь (по умолчанию CRAWL_OUTPUT или DEFAULT_OUTPUT)
+
+    Returns:
+        List[str]: Идентификаторы апартаментов, последние проверенные - в конце
+    """
+    path = path or os.getenv("CRAWL_OUTPUT", DEFAULT_OUTPUT)
+    if not os.path.exists(path):
+        return []
+    statuses = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("type") == "apartment" and record["project"] == project:
+                # Более поздняя запись (--retry-failed) важнее ранней
+                statuses.pop(record["apartment"], None)
+                statuses[record["apartment"]] = record["status"]
+    return [apartment for apartment, status in statuses.items() if status == "ok"]
+
+
+def find_inventory_apartment(project: str, path: str = None) -> Optional[str]:
+    """
+    Апартамент проекта, который при последнем обходе загрузился без ошибок.
+
+    Args:
+        project: Проект (ключ PROJECT_LOCATORS)
+        path: Инвентарь (по умолчанию CRAWL_OUTPUT или DEFAULT_OUTPUT)
+
+    Returns:
+        str: Идентификатор апартамента или None
+    """
+    apartments = find_inventory_apartments(project, path)
+    return apartments[-1] if apartments else None
+
+
+def main(argv: List[str] = None) -> int:
+    """Точка входа: python -m utils.catalog_crawler."""
+    parser = argparse.ArgumentParser(description="Обход каталога проектов")
+    parser.add_argument(
+        "--projects",
+        default=",".join(PROJECT_LOCATORS),
+        help="Проекты через запятую (по умолчанию все)",
+    )
+    parser.add_argument(
+        "--output",
+        default=os.getenv("CRAWL_OUTPUT", DEFAULT_OUTPUT),
+        help="JSONL инвентарь; существующий файл продолжается (resume)",
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Перепроверить апартаменты со статусами page_failed/widget_failed",
+    )
+    parser.add_argument(
+        "--storage-state", help="Storage state с авторизацией (например, .auth/...)"
+    )
+    args = parser.parse_args(argv)
+
+    crawler = CatalogCrawler(
+        args.output,
+        concurrency=args.concurrency,
+        retry_failed=args.retry_failed,
+        storage_state=args.storage_state,
+    )
+    projects = [p.strip() for p in args.projects.split(",") if p.strip()]
+    asyncio.run(crawler.crawl(projects, args.browser, headless=not args.headed))
+
+    failed = sum(crawler.stats[status] for status in FAILED_STATUSES)
+    print(
+        f"Инвентарь: {args.output}\n"
+        + ", ".join(f"{status}: {count}" for status, count in crawler.stats.items())
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+"""JSON схемы ответов API каталога (для APIClient.expect_json_schema)."""
+
+# Апартамент в списке проекта: идентификатор как в URL /apartment/{id}
+# и признаки доступности (см. utils.units_provider.parse_units)
+UNIT_SCHEMA = {
+    "$id": "catalog/unit",
+    "type": "object",
+    "properties": {
+        "id": {"type": ["string", "integer"]},
+        "slug": {"type": "string", "minLength": 1},
+        "apartment": {"type": ["string", "integer"]},
+        "number": {"type": ["string", "integer"]},
+        "status": {"type": "string"},
+        "available": {"type": "boolean"},
+        "locked": {"type": "boolean"},
+        "price": {"type": ["number", "null"], "minimum": 0},
+        "area": {"type": ["number", "null"], "minimum": 0},
+        "floor": {"type": ["integer", "null"]},
+    },
+    "anyOf": [
+        {"required": ["id"]},
+        {"required": ["slug"]},
+        {"required": ["apartment"]},
+        {"required": ["number"]},
+    ],
+}
+
+_UNIT_LIST = {"type": "array", "items": {"$ref": "#/definitions/unit"}}
+
+# Список апартаментов проекта (CATALOG_UNITS_ENDPOINT): массив
+# или объект с массивом в data/items/units/results
+UNITS_SCHEMA = {
+    "$id": "catalog/units",
+    "definitions": {"unit": UNIT_SCHEMA},
+    "anyOf": [
+        _UNIT_LIST,
+        {
+            "type": "object",
+            "properties": {
+                key: _UNIT_LIST for key in ("data", "items", "units", "results")
+            },
+            "anyOf": [
+                {"required": [key]} for key in ("data", "items", "units", "results")
+            ],
+        },
+    ],
+}
+
+# Схемы по endpoint (шаблон пути как в CATALOG_UNITS_ENDPOINT)
+CATALOG_SCHEMAS = {
+    "/projects/{project}/units": UNITS_SCHEMA,
+}
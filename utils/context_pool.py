@@ -0,0 +1,277 @@
+import weakref
+from typing import Callable, Dict, Hashable, List, Optional
+
+from playwright.sync_api import BrowserContext, Page
+
+from utils.logger import get_logger
+
+# Очистка хранилищ текущего origin: localStorage, sessionStorage, IndexedDB,
+# Cache Storage и service workers
+_CLEAR_STORAGE_JS = """
+async () => {
+    try { localStorage.clear(); } catch (e) {}
+    try { sessionStorage.clear(); } catch (e) {}
+    try {
+        if (indexedDB.databases) {
+            for (const db of await indexedDB.databases()) indexedDB.deleteDatabase(db.name);
+        }
+    } catch (e) {}
+    try {
+        if (window.caches) {
+            for (const key of await caches.keys()) await caches.delete(key);
+        }
+    } catch (e) {}
+    try {
+        if (navigator.serviceWorker) {
+            for (const r of await navigator.serviceWorker.getRegistrations()) await r.unregister();
+        }
+    } catch (e) {}
+}
+"""
+
+
+class ContextPool:
+    """
+    Пул теплых контекстов браузера на сессию воркера.
+
+    Контексты хранятся по ключу (браузер, устройство, проект): тест получает
+    уже созданный контекст с открытой страницей, а после теста контекст
+    очищается (cookies, хранилища, лишние страницы, route обработчики) и
+    возвращается в пул. HTTP кэш, соединения и скомпилированный JS при этом
+    сохраняются - на этом и экономится холодная загрузка первой страницы.
+    С prewarm страница заранее начинает загрузку base URL проекта.
+
+    Хранилища других origin (iframe виджета, карт, аналитики) очищаются
+    навигацией на пустую страницу этого origin, которую отдает route без
+    сети. Если контекст все равно не удалось очистить, он закрывается и вместо
+    него создается новый. Доля переиспользованных и отброшенных контекстов
+    выводится в итоге прогона (format_stats).
+    """
+
+    BLANK_URL = "about:blank"
+    PREWARM_TIMEOUT = 15000
+    # Больше origin с данными - дешевле создать новый контекст, чем чистить
+    MAX_ORIGIN_CLEARS = 8
+
+    def __init__(self, size: int = 1, prewarm: bool = False):
+        """
+        Инициализация.
+
+        Args:
+            size: Сколько свободных контекстов держать на ключ
+            prewarm: Открывать base URL проекта в свободных контекстах
+        """
+        self.size = size
+        self.prewarm = prewarm
+        self.logger = get_logger("ContextPool")
+        self.stats = {
+            "created": 0,
+            "reused": 0,
+            "released": 0,
+            "discarded": 0,
+            "origins_cleared": 0,
+        }
+
+        # Ключ -> свободные контексты
+        self._idle: Dict[Hashable, List[BrowserContext]] = {}
+        # Выданный тесту контекст -> (ключ, фабрика, URL прогрева)
+        self._leased = {}
+        # Контекст -> основная страница и ее исходный viewport
+        self._pages = weakref.WeakKeyDictionary()
+        self._viewports = weakref.WeakKeyDictionary()
+
+    def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], BrowserContext],
+        warm_url: str = None,
+    ) -> BrowserContext:
+        """
+        Выдать контекст для теста.
+
+        Args:
+            key: Ключ пула, например (браузер, устройство, проект)
+            factory: Создание нового контекста с нужными настройками
+            warm_url: URL для прогрева страницы (base URL проекта)
+
+        Returns:
+            BrowserContext: Свободный контекст из пула или новый
+        """
+        idle = self._idle.setdefault(key, [])
+        if idle:
+            context = idle.pop(0)
+            self.stats["reused"] += 1
+        else:
+            context = self._create(factory, warm_url)
+        self._leased[context] = (key, factory, warm_url)
+        return context
+
+    def get_page(self, context: BrowserContext) -> Optional[Page]:
+        """
+        Основная (уже открытая) страница контекста из пула.
+
+        Args:
+            context: Контекст браузера
+
+        Returns:
+            Optional[Page]: Страница или None, если контекст не из пула
+        """
+        page = self._pages.get(context)
+        if page is None or page.is_closed():
+            return None
+        return page
+
+    def release(self, context: BrowserContext):
+        """
+        Вернуть контекст после теста: очистить и положить в пул.
+
+        Args:
+            context: Контекст, выданный acquire()
+        """
+        key, factory, warm_url = self._leased.pop(context)
+        idle = self._idle.setdefault(key, [])
+        self.stats["released"] += 1
+
+        if self._reset(context):
+            idle.append(context)
+            if self.prewarm and warm_url:
+                self._warm(self._pages[context], warm_url)
+        else:
+            self.stats["discarded"] += 1
+            self._close(context)
+
+        # Держим ровно size свободных контекстов на ключ
+        while len(idle) < self.size:
+            idle.append(self._create(factory, warm_url))
+        while len(idle) > self.size:
+            self._close(idle.pop())
+
+    def close(self):
+        """Закрыть все контексты пула (в конце сессии)."""
+        for idle in self._idle.values():
+            for context in idle:
+                self._close(context)
+        for context in list(self._leased):
+            self._close(context)
+        self._idle.clear()
+        self._leased.clear()
+        self.logger.info(f"Пул контекстов: {self.format_stats(self.stats)}")
+
+    @staticmethod
+    def merge_stats(target: Dict[str, int], stats: Dict[str, int]):
+        """Сложить статистику (например, воркеров xdist) в target."""
+        for key, value in stats.items():
+            target[key] = target.get(key, 0) + value
+
+    @staticmethod
+    def format_stats(stats: Dict[str, int]) -> str:
+        """Строка итога: доля переиспользованных и отброшенных контекстов."""
+        reused, created = stats.get("reused", 0), stats.get("created", 0)
+        released, discarded = stats.get("released", 0), stats.get("discarded", 0)
+        leased = reused + created
+        reuse_rate = reused / leased * 100 if leased else 0.0
+        discard_rate = discarded / released * 100 if released else 0.0
+        return (
+            f"переиспользовано {reused} из {leased} ({reuse_rate:.0f}%), "
+            f"отброшено {discarded} из {released} ({discard_rate:.0f}%), "
+            f"создано {created}, очищено origin {stats.get('origins_cleared', 0)}"
+        )
+
+    def _create(
+        self, factory: Callable[[], BrowserContext], warm_url: str = None
+    ) -> BrowserContext:
+        """Создать контекст с основной страницей и при необходимости прогреть."""
+        context = factory()
+        page = context.new_page()
+        self._pages[context] = page
+        self._viewports[context] = page.viewport_size
+        self.stats["created"] += 1
+        if self.prewarm and warm_url:
+            self._warm(page, warm_url)
+        return context
+
+    def _warm(self, page: Page, url: str):
+        """
+        Начать загрузку URL, не дожидаясь ее окончания.
+
+        Ждем только commit: страница догружается в браузере, пока pytest
+        заканчивает teardown и готовит следующий тест.
+        """
+        try:
+            page.goto(url, wait_until="commit", timeout=self.PREWARM_TIMEOUT)
+        except Exception as e:
+            self.logger.debug(f"Прогрев {url} не удался: {e}")
+
+    def _reset(self, context: BrowserContext) -> bool:
+        """
+        Очистить состояние контекста после теста.
+
+        Returns:
+            bool: True, если контекст можно переиспользовать
+        """
+        try:
+            page = self.get_page(context)
+            for stray in context.pages:
+                if stray is not page:
+                    stray.close()
+
+            context.unroute_all(behavior="ignoreErrors")
+            context.clear_cookies()
+            context.clear_permissions()
+
+            if page is None:
+                page = context.new_page()
+                self._pages[context] = page
+            elif page.url.startswith("http"):
+                page.evaluate(_CLEAR_STORAGE_JS)
+            page.goto(self.BLANK_URL)
+
+            viewport = self._viewports.get(context)
+            if viewport and page.viewport_size != viewport:
+                page.set_viewport_size(viewport)
+
+            # Хранилища других origin (iframe) без навигации на них не очистить
+            leftovers = [o["origin"] for o in context.storage_state()["origins"]]
+            if leftovers and len(leftovers) <= self.MAX_ORIGIN_CLEARS:
+                for origin in leftovers:
+                    self._clear_origin(page, origin)
+                page.goto(self.BLANK_URL)
+                leftovers = [o["origin"] for o in context.storage_state()["origins"]]
+            if leftovers:
+                self.logger.debug(f"Контекст не очищен: данные {leftovers}")
+                return False
+            return True
+        except Exception as e:
+            self.logger.warning(f"Не удалось очистить контекст: {e}")
+            return False
+
+    def _clear_origin(self, page: Page, origin: str):
+        """
+        Очистить хранилища origin: открыть его пустую страницу и стереть данные.
+
+        Страницу отдает route, поэтому запрос не уходит в сеть и не зависит
+        от того, что сервер origin отдает на корневой URL.
+        """
+
+        def is_origin_url(url: str) -> bool:
+            return url.startswith(f"{origin}/")
+
+        def fulfill_blank(route):
+            route.fulfill(status=200, content_type="text/html", body="")
+
+        page.route(is_origin_url, fulfill_blank)
+        try:
+            page.goto(f"{origin}/", wait_until="load", timeout=self.PREWARM_TIMEOUT)
+            page.evaluate(_CLEAR_STORAGE_JS)
+            self.stats["origins_cleared"] += 1
+        except Exception as e:
+            self.logger.debug(f"Не удалось очистить {origin}: {e}")
+        finally:
+            page.unroute(is_origin_url, fulfill_blank)
+
+    def _close(self, context: BrowserContext):
+        """Закрыть контекст, игнорируя уже закрытые."""
+        try:
+            context.close()
+        except Exception:
+            pass
@@ -0,0 +1,114 @@
+from typing import Callable, List, Sequence
+
+from xdist.scheduler import LoadScheduling
+
+
+def order_longest_first(
+    estimates: Sequence[float], hosts: Sequence[str], window: int = 1
+) -> List[int]:
+    """
+    Порядок тестов: по убыванию длительности с чередованием хостов.
+
+    На каждом шаге берется самый длинный из оставшихся тестов, чей хост не
+    встречался среди последних window выбранных (столько тестов выполняется
+    одновременно; при меньшем числе хостов окно сужается). Если таких нет -
+    самый длинный из оставшихся. Так сохраняется LPT и разнесение по хостам
+    из _spread_items_by_host.
+
+    Args:
+        estimates: Оценки длительности тестов (сек)
+        hosts: Хосты тестов (в том же порядке)
+        window: Сколько последних выбранных хостов избегать
+
+    Returns:
+        List[int]: Индексы тестов в порядке раздачи
+    """
+    # Очередь каждого хоста по убыванию длительности (стабильно по коллекции)
+    queues = {}
+    for index in sorted(range(len(estimates)), key=lambda i: -estimates[i]):
+        queues.setdefault(hosts[index], []).append(index)
+    heads = {host: 0 for host in queues}
+
+    order, recent = [], []
+    while len(order) < len(estimates):
+        candidates = [host for host in queues if heads[host] < len(queues[host])]
+        # Хостов меньше окна - избегаем только самых недавних
+        limit = min(window, len(candidates) - 1)
+        avoid = recent[-limit:] if limit > 0 else []
+        fresh = [host for host in candidates if host not in avoid] or candidates
+        host = min(
+            fresh,
+            key=lambda h: (-estimates[queues[h][heads[h]]], queues[h][heads[h]]),
+        )
+        order.append(queues[host][heads[host]])
+        heads[host] += 1
+        recent = (recent + [host])[-window:] if window > 0 else []
+    return order
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    Раздача тестов воркерам xdist по принципу LPT (longest processing time first).
+
+    Очередь сортируется по убыванию исторической длительности, а воркер
+    получает следующий тест только когда освобождается. Так длинные тесты
+    стартуют первыми, а короткие заполняют хвост и выравнивают время шардов.
+    Соседние тесты очереди по возможности идут на разные хосты
+    (order_longest_first), при равных оценках сохраняется порядок коллекции.
+    """
+
+    def __init__(
+        self,
+        config,
+        log=None,
+        estimate: Callable[[str], float] = None,
+        host: Callable[[str], str] = None,
+    ):
+        """
+        Инициализация.
+
+        Args:
+            config: Конфиг pytest
+            log: Логгер xdist
+            estimate: Функция nodeid -> оценка длительности (сек)
+            host: Функция nodeid -> хост каталога теста
+        """
+        super().__init__(config, log)
+        self.estimate = estimate or (lambda nodeid: 0.0)
+        self.host = host or (lambda nodeid: "unknown")
+        # По одному тесту на запрос: воркер не копит очередь из коротких тестов
+        self.maxschedchunk = 1
+
+    def schedule(self):
+        """Первичная раздача тестов после того как все воркеры собрали коллекцию."""
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests were collected between nodes, aborting**")
+            return
+
+        self.collection = list(next(iter(self.node2collection.values())))
+        if not self.collection:
+            return
+
+        self.pending[:] = order_longest_first(
+            [self.estimate(nodeid) for nodeid in self.collection],
+            [self.host(nodeid) for nodeid in self.collection],
+            window=len(self.nodes),
+        )
+
+        # Воркер начинает выполнение, когда в его очереди 2 теста,
+        # поэтому раздаем по одному в два круга: самые длинные уходят первыми
+        for _ in range(2):
+            for node in self.nodes:
+                if self.pending:
+                    self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
@@ -0,0 +1,660 @@
+"""Проверка JSON по схеме: схема компилируется один раз в набор функций."""
+
+import codecs
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, Iterator, List
+
+# Функция проверки: (значение, путь, список ошибок) -> None
+Check = Callable[[Any, tuple, list], None]
+
+# Проверки типов JSON Schema (bool в Python - подкласс int, поэтому исключается).
+# Число без дробной части (1.0) - integer, как в JSON Schema
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: (isinstance(v, int) and not isinstance(v, bool))
+    or (isinstance(v, float) and v.is_integer()),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+# Скомпилированные схемы: ключ -> (схема, функция проверки)
+_compiled: Dict[Any, tuple] = {}
+_compiled_lock = threading.Lock()
+
+# Размер чтения тела ответа при потоковой проверке
+STREAM_CHUNK_SIZE = 64 * 1024
+# Символы, которыми может продолжаться число JSON
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+def format_path(path: tuple) -> str:
+    """Путь до значения в виде $.data[3].id."""
+    parts = ["$"]
+    for part in path:
+        parts.append(f"[{part}]" if isinstance(part, int) else f".{part}")
+    return "".join(parts)
+
+
+def _error(errors: list, path: tuple, keyword: str, message: str):
+    """Добавить ошибку проверки: путь строкой и кортежем ("data", 3, "price")."""
+    errors.append(
+        {
+            "path": format_path(path),
+            "location": path,
+            "keyword": keyword,
+            "message": message,
+        }
+    )
+
+
+class SchemaCompiler:
+    """
+    Компиляция JSON схемы в функции проверки.
+
+    Поддерживается подмножество draft 7, которого хватает схемам API:
+    type, enum, const, properties, required, additionalProperties, items,
+    minItems/maxItems, minLength/maxLength, pattern, minimum/maximum,
+    exclusiveMinimum/exclusiveMaximum, allOf/anyOf/oneOf/not и $ref на
+    #/definitions и #/$defs. Остальные ключевые слова игнорируются.
+    """
+
+    def __init__(self, root: Dict):
+        """
+        Инициализация.
+
+        Args:
+            root: Корневая схема (для $ref)
+        """
+        self.root = root
+        # $ref -> функция проверки (ссылки компилируются один раз, допускают рекурсию)
+        self._refs: Dict[str, Check] = {}
+
+    def compile(self, schema: Any) -> Check:
+        """
+        Скомпилировать схему.
+
+        Args:
+            schema: Схема (dict) или True/False
+
+        Returns:
+            Check: Функция проверки (value, path, errors)
+        """
+        if schema is True or schema == {}:
+            return _accept
+        if schema is False:
+            return _reject
+        if "$ref" in schema:
+            return self._compile_ref(schema["$ref"])
+
+        checks = []
+        if "type" in schema:
+            checks.append(self._compile_type(schema["type"]))
+        if "enum" in schema:
+            checks.append(_compile_enum(schema["enum"]))
+        if "const" in schema:
+            checks.append(_compile_const(schema["const"]))
+        checks.extend(self._compile_object(schema))
+        checks.extend(self._compile_array(schema))
+        checks.extend(_compile_string(schema))
+        checks.extend(_compile_number(schema))
+        checks.extend(self._compile_combinators(schema))
+
+        if not checks:
+            return _accept
+        if len(checks) == 1:
+            return checks[0]
+
+        def check(value, path, errors):
+            for item_check in checks:
+                item_check(value, path, errors)
+
+        return check
+
+    # ==================== ВНУТРЕННИЕ МЕТОДЫ ====================
+
+    def _compile_ref(self, ref: str) -> Check:
+        """Ссылка на определение внутри корневой схемы."""
+        if ref in self._refs:
+            return self._refs[ref]
+        if not ref.startswith("#"):
+            raise ValueError(f"Поддерживаются только локальные $ref: {ref}")
+
+        # Заглушка на время компиляции - для рекурсивных схем
+        target: List[Check] = []
+        self._refs[ref] = lambda value, path, errors: target[0](value, path, errors)
+
+        node = self.root
+        for part in ref.lstrip("#").strip("/").split("/"):
+            if part:
+                node = node[part.replace("~1", "/").replace("~0", "~")]
+        target.append(self.compile(node))
+        self._refs[ref] = target[0]
+        return target[0]
+
+    def _compile_type(self, expected) -> Check:
+        """Проверка type (строка или список типов)."""
+        names = [expected] if isinstance(expected, str) else list(expected)
+        type_checks = [_TYPE_CHECKS[name] for name in names]
+        label = " | ".join(names)
+
+        if len(type_checks) == 1:
+            type_check = type_checks[0]
+
+            def check(value, path, errors):
+                if not type_check(value):
+                    _error(
+                        errors,
+                        path,
+                        "type",
+                        f"ожидался {label}, получен {_kind(value)}",
+                    )
+
+        else:
+
+            def check(value, path, errors):
+                if not any(type_check(value) for type_check in type_checks):
+                    _error(
+                        errors,
+                        path,
+                        "type",
+                        f"ожидался {label}, получен {_kind(value)}",
+                    )
+
+        return check
+
+    def _compile_object(self, schema: Dict) -> List[Check]:
+        """properties, required, additionalProperties."""
+        checks = []
+        properties = {
+            name: self.compile(sub)
+            for name, sub in schema.get("properties", {}).items()
+        }
+        required = list(schema.get("required", []))
+        additional = schema.get("additionalProperties", True)
+
+        if required:
+
+            def check_required(value, path, errors):
+                if isinstance(value, dict):
+                    for name in required:
+                        if name not in value:
+                            _error(
+                                errors,
+                                path,
+                                "required",
+                                f"нет обязательного поля {name}",
+                            )
+
+            checks.append(check_required)
+
+        if properties:
+            items = list(properties.items())
+
+            def check_properties(value, path, errors):
+                if isinstance(value, dict):
+                    for name, property_check in items:
+                        if name in value:
+                            property_check(value[name], path + (name,), errors)
+
+            checks.append(check_properties)
+
+        if additional is not True:
+            additional_check = None if additional is False else self.compile(additional)
+            known = frozenset(properties)
+
+            def check_additional(value, path, errors):
+                if not isinstance(value, dict):
+                    return
+                for name in value.keys() - known:
+                    if additional_check is None:
+                        _error(
+                            errors,
+                            path,
+                            "additionalProperties",
+                            f"лишнее поле {name}",
+                        )
+                    else:
+                        additional_check(value[name], path + (name,), errors)
+
+            checks.append(check_additional)
+        return checks
+
+    def _compile_array(self, schema: Dict) -> List[Check]:
+        """items, minItems, maxItems."""
+        checks = []
+        if "items" in schema and isinstance(schema["items"], dict):
+            item_check = self.compile(schema["items"])
+            if item_check is not _accept:
+
+                def check_items(value, path, errors):
+                    if isinstance(value, list):
+                        for index, item in enumerate(value):
+                            item_check(item, path + (index,), errors)
+
+                checks.append(check_items)
+
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+        if min_items is not None or max_items is not None:
+
+            def check_size(value, path, errors):
+                if not isinstance(value, list):
+                    return
+                if min_items is not None and len(value) < min_items:
+                    _error(
+                        errors,
+                        path,
+                        "minItems",
+                        f"элементов {len(value)}, нужно не меньше {min_items}",
+                    )
+                if max_items is not None and len(value) > max_items:
+                    _error(
+                        errors,
+                        path,
+                        "maxItems",
+                        f"элементов {len(value)}, нужно не больше {max_items}",
+                    )
+
+            checks.append(check_size)
+        return checks
+
+    def _compile_combinators(self, schema: Dict) -> List[Check]:
+        """allOf, anyOf, oneOf, not."""
+        checks = []
+        for sub in schema.get("allOf", []):
+            checks.append(self.compile(sub))
+
+        if "anyOf" in schema:
+            any_checks = [self.compile(sub) for sub in schema["anyOf"]]
+
+            def check_any(value, path, errors):
+                variants = []
+                for any_check in any_checks:
+                    variant_errors = []
+                    any_check(value, path, variant_errors)
+                    if not variant_errors:
+                        return
+                    variants.append(variant_errors)
+                errors.extend(_closest_variant(variants, path))
+
+            checks.append(check_any)
+
+        if "oneOf" in schema:
+            one_checks = [self.compile(sub) for sub in schema["oneOf"]]
+
+            def check_one(value, path, errors):
+                matched = sum(_passes(c, value, path) for c in one_checks)
+                if matched != 1:
+                    _error(
+                        errors,
+                        path,
+                        "oneOf",
+                        f"подходит под {matched} вариантов, нужен ровно один",
+                    )
+
+            checks.append(check_one)
+
+        if "not" in schema:
+            not_check = self.compile(schema["not"])
+
+            def check_not(value, path, errors):
+                if _passes(not_check, value, path):
+                    _error(
+                        errors, path, "not", "значение подходит под запрещенную схему"
+                    )
+
+            checks.append(check_not)
+        return checks
+
+
+def _accept(value, path, errors):
+    """Схема без ограничений."""
+
+
+def _reject(value, path, errors):
+    """Схема false."""
+    _error(errors, path, "false", "значение запрещено схемой")
+
+
+def _passes(check: Check, value: Any, path: tuple) -> bool:
+    """Проходит ли значение проверку (для anyOf/oneOf/not)."""
+    errors = []
+    check(value, path, errors)
+    return not errors
+
+
+def _closest_variant(variants: List[list], path: tuple) -> list:
+    """
+    Ошибки варианта anyOf, под который значение подходит ближе всего.
+
+    Варианты с другим типом на этом же пути отбрасываются, из остальных
+    берется вариант с наименьшим числом ошибок - его пути указывают на
+    настоящую причину. Если подходящих вариантов нет - одна ошибка anyOf.
+    """
+    here = format_path(path)
+    candidates = [
+        variant
+        for variant in variants
+        if not any(e["path"] == here and e["keyword"] == "type" for e in variant)
+    ]
+    if not candidates:
+        errors = []
+        _error(errors, path, "anyOf", "не подходит ни под один вариант")
+        return errors
+    return min(candidates, key=len)
+
+
+def _kind(value: Any) -> str:
+    """Тип значения в терминах JSON."""
+    for name in ("null", "boolean", "integer", "number", "string", "array", "object"):
+        if _TYPE_CHECKS[name](value):
+            return name
+    return type(value).__name__
+
+
+def _json_equal(left: Any, right: Any) -> bool:
+    """
+    Равенство значений по правилам JSON Schema.
+
+    Числа сравниваются по значению (1 == 1.0), bool числом не считается
+    (True != 1), массивы и объекты сравниваются поэлементно.
+    """
+    if isinstance(left, bool) or isinstance(right, bool):
+        return isinstance(left, bool) and isinstance(right, bool) and left == right
+    if _TYPE_CHECKS["number"](left) and _TYPE_CHECKS["number"](right):
+        return left == right
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(
+            _json_equal(a, b) for a, b in zip(left, right)
+        )
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(
+            _json_equal(left[key], right[key]) for key in left
+        )
+    return type(left) is type(right) and left == right
+
+
+def _compile_enum(options: list) -> Check:
+    """Проверка enum."""
+
+    def check(value, path, errors):
+        if not any(_json_equal(value, option) for option in options):
+            _error(errors, path, "enum", f"{value!r} не из {options}")
+
+    return check
+
+
+def _compile_const(expected: Any) -> Check:
+    """Проверка const."""
+
+    def check(value, path, errors):
+        if not _json_equal(value, expected):
+            _error(errors, path, "const", f"ожидалось {expected!r}, получено {value!r}")
+
+    return check
+
+
+def _compile_string(schema: Dict) -> List[Check]:
+    """minLength, maxLength, pattern."""
+    checks = []
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+    if min_length is not None or max_length is not None:
+
+        def check_length(value, path, errors):
+            if not isinstance(value, str):
+                return
+            if min_length is not None and len(value) < min_length:
+                _error(
+                    errors,
+                    path,
+                    "minLength",
+                    f"длина {len(value)}, нужно не меньше {min_length}",
+                )
+            if max_length is not None and len(value) > max_length:
+                _error(
+                    errors,
+                    path,
+                    "maxLength",
+                    f"длина {len(value)}, нужно не больше {max_length}",
+                )
+
+        checks.append(check_length)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value, path, errors):
+            if isinstance(value, str) and not pattern.search(value):
+                _error(
+                    errors,
+                    path,
+                    "pattern",
+                    f"{value!r} не соответствует {pattern.pattern}",
+                )
+
+        checks.append(check_pattern)
+    return checks
+
+
+def _compile_number(schema: Dict) -> List[Check]:
+    """minimum, maximum, exclusiveMinimum, exclusiveMaximum."""
+    bounds = [
+        (schema.get("minimum"), lambda v, b: v >= b, ">="),
+        (schema.get("maximum"), lambda v, b: v <= b, "<="),
+        (schema.get("exclusiveMinimum"), lambda v, b: v > b, ">"),
+        (schema.get("exclusiveMaximum"), lambda v, b: v < b, "<"),
+    ]
+    bounds = [(bound, test, sign) for bound, test, sign in bounds if bound is not None]
+    if not bounds:
+        return []
+
+    def check(value, path, errors):
+        if not _TYPE_CHECKS["number"](value):
+            return
+        for bound, test, sign in bounds:
+            if not test(value, bound):
+                _error(errors, path, "range", f"{value} не {sign} {bound}")
+
+    return [check]
+
+
+def compile_schema(schema: Dict, schema_id: str = None) -> Check:
+    """
+    Скомпилированная проверка схемы (из кэша процесса).
+
+    Ключ кэша - schema_id, $id схемы или сам объект схемы: повторные
+    проверки той же схемы не компилируют ее заново.
+
+    Args:
+        schema: JSON схема
+        schema_id: Идентификатор схемы (по умолчанию $id)
+
+    Returns:
+        Check: Функция проверки (value, path, errors)
+    """
+    key = schema_id or (isinstance(schema, dict) and schema.get("$id")) or id(schema)
+    entry = _compiled.get(key)
+    if entry is not None and (not isinstance(key, int) or entry[0] is schema):
+        return entry[1]
+
+    with _compiled_lock:
+        entry = _compiled.get(key)
+        if entry is None or (isinstance(key, int) and entry[0] is not schema):
+            entry = (schema, SchemaCompiler(schema).compile(schema))
+            _compiled[key] = entry
+    return entry[1]
+
+
+def clear_schema_cache():
+    """Сбросить кэш скомпилированных схем."""
+    with _compiled_lock:
+        _compiled.clear()
+
+
+def validate(value: Any, schema: Dict, schema_id: str = None) -> List[dict]:
+    """
+    Проверить значение по схеме.
+
+    Args:
+        value: Разобранный JSON
+        schema: JSON схема
+        schema_id: Идентификатор схемы для кэша
+
+    Returns:
+        List[dict]: Ошибки {"path": "$.data[3].id", "location", "keyword", "message"}
+    """
+    errors = []
+    compile_schema(schema, schema_id)(value, (), errors)
+    return errors
+
+
+def iter_json_array(chunks: Iterator, list_key: str = None) -> Iterator[Any]:
+    """
+    Элементы JSON массива по мере чтения, без разбора всего тела.
+
+    Args:
+        chunks: Части тела (bytes или str), например response.iter_content()
+        list_key: Ключ массива в корневом объекте ({"data": [...]});
+            None - корень сам массив. Ключ ищется только на верхнем уровне:
+            значения других ключей корня пропускаются целиком
+
+    Yields:
+        Элементы массива по одному
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    missing = f"В ответе нет массива {list_key or ''}".strip()
+    buffer, pos, exhausted = "", 0, False
+    chunks = iter(chunks)
+
+    def read_more() -> bool:
+        nonlocal buffer, pos, exhausted
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            return False
+        buffer = buffer[pos:] + (
+            text.decode(chunk) if isinstance(chunk, bytes) else chunk
+        )
+        pos = 0
+        return True
+
+    def next_char() -> str:
+        """Первый значимый символ с позиции pos (дочитывая тело)."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not read_more():
+                raise ValueError(missing)
+
+    def skip_value() -> Any:
+        """Прочитать одно значение целиком (ключ или значение корня)."""
+        nonlocal pos
+        next_char()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if not read_more():
+                    raise ValueError(missing)
+                continue
+            if end == len(buffer) and not exhausted and read_more():
+                continue
+            pos = end
+            return value
+
+    if list_key is None:
+        if next_char() != "[":
+            raise ValueError(missing)
+    else:
+        if next_char() != "{":
+            raise ValueError(missing)
+        pos += 1
+        while True:
+            if next_char() == "}":
+                raise ValueError(missing)
+            key = skip_value()
+            if next_char() != ":":
+                raise ValueError(missing)
+            pos += 1
+            if key == list_key:
+                if next_char() != "[":
+                    raise ValueError(missing)
+                break
+            skip_value()
+            if next_char() == ",":
+                pos += 1
+    pos += 1
+
+    while True:
+        # Пропускаем пробелы и запятые между элементами
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(buffer):
+            if not read_more():
+                raise ValueError("Массив в ответе оборван")
+            continue
+        if buffer[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if not read_more():
+                raise
+            continue
+        # Число на границе части может быть прочитано не целиком ("1.", "1.2e")
+        cut = end == len(buffer) or (
+            _TYPE_CHECKS["number"](item) and buffer[end] in _NUMBER_CHARS
+        )
+        if cut and not exhausted and read_more():
+            continue
+        pos = end
+        yield item
+
+
+def validate_items(
+    items: Iterator[Any],
+    item_schema: Dict,
+    schema_id: str = None,
+    path: tuple = (),
+    max_errors: int = 100,
+) -> tuple:
+    """
+    Проверить элементы массива по одному (для потоковой проверки).
+
+    Args:
+        items: Элементы (например, iter_json_array)
+        item_schema: Схема одного элемента
+        schema_id: Идентификатор схемы для кэша
+        path: Путь до массива ("data",)
+        max_errors: После скольких ошибок прекратить проверку
+
+    Returns:
+        tuple: (проверено элементов, ошибки)
+    """
+    check = compile_schema(item_schema, schema_id)
+    errors = []
+    count = 0
+    for index, item in enumerate(items):
+        check(item, path + (index,), errors)
+        count += 1
+        if max_errors and len(errors) >= max_errors:
+            break
+    return count, errors
+
+
+def format_errors(errors: List[dict], limit: int = 20) -> str:
+    """Ошибки проверки построчно: путь, ключевое слово, сообщение."""
+    lines = [f"{e['path']}: {e['message']} ({e['keyword']})" for e in errors[:limit]]
+    if len(errors) > limit:
+        lines.append(f"... и еще {len(errors) - limit}")
+    return "\n".join(lines)
@@ -0,0 +1,576 @@
+"""
+Нагрузочный прогон: синтетические посетители каталога в параллельных контекстах.
+
+Каждый посетитель - отдельный контекст браузера, который проходит сценарий
+(journey) из шагов на асинхронных page objects. Посетители подключаются по
+расписанию ramp-up, между шагами делают паузы (think time), время каждого
+шага собирается в гистограмму.
+
+Запуск:
+    python -m utils.load_generator --journey catalog --project arisha --users 50 --ramp-up 60
+    python -m utils.load_generator --ramp 50:60,200:120 --think-time 1-3 --duration 300
+    python -m utils.load_generator --stand-in --users 5
+
+--stand-in поднимает utils.stand_in_server и направляет URL Qube проектов
+на него - так сам генератор проверяется без сети.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+from playwright.async_api import Page, async_playwright
+
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.components.apartment_widget_component import (
+    AsyncApartmentWidgetComponent,
+)
+from pages.aio.core.apartment_scanner import AsyncApartmentScanner
+from utils.benchmark import summarize
+from utils.catalog_crawler import PROJECT_LOCATORS
+from utils.logger import get_logger
+from utils.metrics_file import append_record
+from utils.stand_in_server import StandInCatalog
+
+# Сценарий -> (роут, шаги). Шаг - метод VirtualUser с тем же именем.
+JOURNEYS = {
+    "catalog": (
+        "map",
+        (
+            "open_map",
+            "open_project",
+            "open_all_units",
+            "open_apartment",
+            "widget_ready",
+            "widget_2d",
+            "widget_3d",
+        ),
+    ),
+    "sales_offer": (
+        "agent",
+        (
+            "open_map",
+            "open_project",
+            "open_all_units",
+            "open_apartment",
+            "sales_offer_pdf",
+        ),
+    ),
+}
+
+# Проекты с All units и Sales Offer
+LOAD_PROJECTS = ("arisha", "elire", "cubix")
+
+# Верхние границы корзин гистограммы, мс (последняя корзина - все, что выше)
+HISTOGRAM_BUCKETS_MS = (250, 500, 1000, 2000, 5000, 10000, 20000, 30000)
+
+# Шаг в отчете об ошибках для сбоев создания контекста или страницы посетителя
+SESSION_STEP = "open_session"
+
+
+def parse_ramp(spec: str) -> List[Tuple[int, float]]:
+    """
+    Разобрать расписание подключения посетителей.
+
+    Args:
+        spec: Этапы "пользователей:секунд" через запятую - "50:60,200:120"
+            значит 50 посетителей за первую минуту и еще 150 за две следующие
+
+    Returns:
+        List[Tuple[int, float]]: (посетителей к концу этапа, длительность этапа)
+    """
+    stages = []
+    for part in spec.split(","):
+        users, _, seconds = part.strip().partition(":")
+        stages.append((int(users), float(seconds or 0)))
+    if any(users <= prev for (users, _), (prev, _) in zip(stages[1:], stages)):
+        raise ValueError(f"Число посетителей по этапам должно расти: {spec}")
+    return stages
+
+
+def ramp_offsets(stages: Sequence[Tuple[int, float]]) -> List[float]:
+    """
+    Моменты старта посетителей (секунды от начала прогона).
+
+    Внутри этапа новые посетители распределяются равномерно.
+
+    Args:
+        stages: Результат parse_ramp
+
+    Returns:
+        List[float]: Время старта каждого посетителя
+    """
+    offsets = []
+    users = 0
+    stage_start = 0.0
+    for target, seconds in stages:
+        added = target - users
+        offsets.extend(stage_start + seconds * i / added for i in range(added))
+        users = target
+        stage_start += seconds
+    return offsets
+
+
+def parse_think_time(spec: str) -> Tuple[float, float]:
+    """Пауза между шагами: "2" - ровно 2 с, "1-3" - случайно от 1 до 3 с."""
+    low, _, high = spec.partition("-")
+    return float(low), float(high or low)
+
+
+class LatencyHistogram:
+    """Длительности одного шага: перцентили и гистограмма по корзинам."""
+
+    def __init__(self):
+        """Инициализация."""
+        self.values = []
+        self.errors = 0
+
+    def add(self, duration_ms: float):
+        """Добавить успешное выполнение шага."""
+        self.values.append(duration_ms)
+
+    def add_error(self):
+        """Учесть ошибку шага."""
+        self.errors += 1
+
+    def buckets(self) -> List[Tuple[str, int]]:
+        """Число замеров по корзинам HISTOGRAM_BUCKETS_MS."""
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for value in self.values:
+            index = next(
+                (i for i, bound in enumerate(HISTOGRAM_BUCKETS_MS) if value <= bound),
+                len(HISTOGRAM_BUCKETS_MS),
+            )
+            counts[index] += 1
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BUCKETS_MS]
+        labels.append(f">{HISTOGRAM_BUCKETS_MS[-1]}ms")
+        return list(zip(labels, counts))
+
+    def summary(self) -> dict:
+        """Сводка: n, errors, min, median, p95, p99, max."""
+        return {**summarize(self.values), "errors": self.errors}
+
+    def format(self, width: int = 40) -> str:
+        """Гистограмма для консоли."""
+        buckets = self.buckets()
+        peak = max((count for _, count in buckets), default=0) or 1
+        return "\n".join(
+            f"  {label:>10} {count:>5} {'#' * round(count / peak * width)}"
+            for label, count in buckets
+            if count
+        )
+
+
+class VirtualUser:
+    """
+    Один синтетический посетитель: шаги сценариев на async page objects.
+
+    Каждый публичный async метод - шаг из JOURNEYS.
+    """
+
+    def __init__(self, page: Page, project: str, route_type: str):
+        """
+        Инициализация.
+
+        Args:
+            page: Страница в собственном контексте посетителя (async API)
+            project: Проект (arisha, elire, cubix)
+            route_type: Роут - map или agent
+        """
+        from conftest import _get_urls_by_environment
+
+        locators_class = PROJECT_LOCATORS[project]
+        self.page = page
+        self.project = project
+        self.route_type = route_type
+        self.base = AsyncBasePage(
+            page, _get_urls_by_environment()["map"], locators_class
+        )
+        self.locators = self.base.project_locators
+        self.widget = AsyncApartmentWidgetComponent(page, locators_class, project)
+        self.scanner = AsyncApartmentScanner(page)
+
+    async def open_map(self):
+        """Открыть карту роута и дождаться маркеров."""
+        await self.base.open(route_type=self.route_type)
+        await self.base.map.wait_for_map_loaded()
+
+    async def open_project(self):
+        """Кликнуть по проекту на карте и перейти по Explore."""
+        await self.base.map.click_project(self.project)
+        await self.base.map.click_explore_project(self.project)
+
+    async def open_all_units(self):
+        """Перейти в каталог All units."""
+        await self.base.browser.click(self.locators.ALL_UNITS_BUTTON)
+        await self.page.wait_for_url("**/catalog_2d", timeout=20000)
+
+    async def open_apartment(self):
+        """Открыть первый доступный (без замка) апартамент каталога."""
+        await self.page.wait_for_selector(
+            self.locators.ALL_APARTMENT_TITLES, state="attached", timeout=20000
+        )
+        apartments = await self.scanner.scan(
+            self.locators.ALL_APARTMENT_TITLES, **AsyncApartmentScanner.CATALOG_SCAN
+        )
+        apartment = self.scanner.find_available(apartments, visible_only=False)
+        if apartment is None:
+            raise AssertionError(
+                f"Не найден ни один доступный апартамент для проекта {self.project}"
+            )
+        await self.scanner.click(apartment, js_click=True)
+        await self.page.wait_for_url("**/apartment/**", timeout=20000)
+
+    async def widget_ready(self):
+        """Дождаться готовности виджета апартамента."""
+        await self.widget.wait_for_widget_load()
+
+    async def widget_2d(self):
+        """Переключить виджет в 2D."""
+        await self.widget.switch_to_2d_mode()
+
+    async def widget_3d(self):
+        """Переключить виджет в 3D."""
+        await self.widget.switch_to_3d_mode()
+
+    async def sales_offer_pdf(self):
+        """Sales Offer -> Download PDF, дождаться скачивания файла."""
+        await self.base.browser.click(self.locators.SALES_OFFER_BUTTON, timeout=20000)
+        async with self.page.expect_download(timeout=60000) as download_info:
+            await self.base.browser.click(
+                self.locators.DOWNLOAD_PDF_BUTTON, timeout=15000
+            )
+        download = await download_info.value
+        path = await download.path()
+        with open(path, "rb") as f:
+            if not f.read(4).startswith(b"%PDF"):
+                raise AssertionError(f"Скачан не PDF: {download.suggested_filename}")
+
+
+class LoadGenerator:
+    """
+    Нагрузочный прогон одного сценария.
+
+    Все посетители живут в одном event loop и одном браузере, каждый в своем
+    контексте. Ошибка шага прерывает текущий проход сценария посетителя:
+    следующие шаги от него зависят.
+    """
+
+    def __init__(
+        self,
+        journey: str = "catalog",
+        project: str = "arisha",
+        stages: Sequence[Tuple[int, float]] = ((1, 0),),
+        think_time: Tuple[float, float] = (0, 0),
+        duration: float = 0,
+        storage_state: str = None,
+    ):
+        """
+        Инициализация.
+
+        Args:
+            journey: Сценарий из JOURNEYS
+            project: Проект из LOAD_PROJECTS
+            stages: Расписание подключения (см. parse_ramp)
+            think_time: Пауза между шагами (мин, макс), секунды
+            duration: Сколько секунд повторять сценарий (0 - один проход)
+            storage_state: Storage state с авторизацией (Elire)
+        """
+        if journey not in JOURNEYS:
+            raise ValueError(f"Неизвестный сценарий: {journey}")
+        self.journey = journey
+        self.project = project
+        self.route_type, self.steps = JOURNEYS[journey]
+        self.stages = list(stages)
+        self.think_time = think_time
+        self.duration = duration
+        self.storage_state = storage_state
+        self.logger = get_logger("LoadGenerator")
+
+        self.histograms = {step: LatencyHistogram() for step in self.steps}
+        self.errors = {step: Counter() for step in (SESSION_STEP, *self.steps)}
+        self.journeys = Counter()
+        self.active_users = 0
+        self.peak_users = 0
+        self.elapsed = 0.0
+
+    @property
+    def users(self) -> int:
+        """Сколько посетителей подключится за прогон."""
+        return self.stages[-1][0]
+
+    async def run(
+        self,
+        browser_name: str = "chromium",
+        headless: bool = True,
+        launch_args: dict = None,
+        context_args: dict = None,
+    ) -> dict:
+        """
+        Выполнить прогон.
+
+        Args:
+            browser_name: chromium, firefox или webkit
+            headless: Запуск без окна
+            launch_args: Параметры запуска браузера
+            context_args: Параметры контекста (viewport, устройство...)
+
+        Returns:
+            dict: Результат report()
+        """
+        context_args = dict(context_args or {})
+        if self.storage_state:
+            context_args["storage_state"] = self.storage_state
+
+        started = time.perf_counter()
+        async with async_playwright() as playwright:
+            browser = await getattr(playwright, browser_name).launch(
+                **{"headless": headless, **(launch_args or {})}
+            )
+            try:
+                outcomes = await asyncio.gather(
+                    *(
+                        self._user(browser, index, offset, started, context_args)
+                        for index, offset in enumerate(ramp_offsets(self.stages))
+                    ),
+                    return_exceptions=True,
+                )
+                for index, outcome in enumerate(outcomes):
+                    if isinstance(outcome, Exception):
+                        self.logger.warning(f"Посетитель #{index + 1}: {outcome!r}")
+            finally:
+                await browser.close()
+        self.elapsed = time.perf_counter() - started
+        return self.report()
+
+    def report(self) -> dict:
+        """
+        Итоги прогона.
+
+        Returns:
+            dict: journey, project, users, peak_users, elapsed_s, journeys
+                (ok/failed), steps (сводка и корзины по шагам), errors
+        """
+        return {
+            "journey": self.journey,
+            "project": self.project,
+            "users": self.users,
+            "peak_users": self.peak_users,
+            "elapsed_s": round(self.elapsed, 1),
+            "journeys": {"ok": self.journeys["ok"], "failed": self.journeys["failed"]},
+            "steps": {
+                step: {**histogram.summary(), "buckets": histogram.buckets()}
+                for step, histogram in self.histograms.items()
+            },
+            "errors": {
+                step: dict(errors.most_common(5))
+                for step, errors in self.errors.items()
+                if errors
+            },
+        }
+
+    def record(self, **tags):
+        """
+        Записать сводку по шагам в файл замеров (попадает в историю метрик).
+
+        Args:
+            **tags: Метки (browser, device)
+        """
+        for step, histogram in self.histograms.items():
+            summary = histogram.summary()
+            total = summary["n"] + summary["errors"]
+            append_record(
+                {
+                    "ts": round(time.time(), 3),
+                    "kind": "load",
+                    "name": f"load_{self.journey}_{step}",
+                    "test": os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0],
+                    "environment": os.getenv("TEST_ENVIRONMENT", "dev"),
+                    "project": self.project,
+                    "route_type": self.route_type,
+                    **tags,
+                    "median_ms": summary["median"],
+                    "p95_ms": summary["p95"],
+                    "p99_ms": summary["p99"],
+                    "error_rate": (
+                        round(summary["errors"] / total, 3) if total else None
+                    ),
+                }
+            )
+
+    # ==================== ВНУТРЕННИЕ МЕТОДЫ ====================
+
+    async def _user(
+        self, browser, index: int, offset: float, started: float, context_args: dict
+    ):
+        """Посетитель: дождаться своего старта и проходить сценарий."""
+        await asyncio.sleep(max(0.0, started + offset - time.perf_counter()))
+        deadline = started + offset + self.duration
+
+        context = None
+        self.active_users += 1
+        self.peak_users = max(self.peak_users, self.active_users)
+        try:
+            try:
+                context = await browser.new_context(**context_args)
+                page = await context.new_page()
+            except Exception as e:
+                # Браузер не выдал контекст или страницу - сценарий не начат
+                self._record_error(SESSION_STEP, e, index)
+                self.journeys["failed"] += 1
+                return
+            user = VirtualUser(page, self.project, self.route_type)
+            while True:
+                await self._journey(user, index)
+                if time.perf_counter() >= deadline:
+                    break
+                await self._think()
+        finally:
+            if context is not None:
+                await context.close()
+            self.active_users -= 1
+
+    async def _journey(self, user: VirtualUser, index: int):
+        """Один проход сценария с замером каждого шага."""
+        for position, step in enumerate(self.steps):
+            if position:
+                await self._think()
+            step_started = time.perf_counter()
+            try:
+                await getattr(user, step)()
+            except Exception as e:
+                self.histograms[step].add_error()
+                self._record_error(step, e, index)
+                self.journeys["failed"] += 1
+                return
+            self.histograms[step].add((time.perf_counter() - step_started) * 1000)
+        self.journeys["ok"] += 1
+
+    def _record_error(self, step: str, error: Exception, index: int):
+        """Учесть ошибку шага (первая строка сообщения) в отчете."""
+        message = str(error).strip().splitlines()[0] if str(error).strip() else ""
+        self.errors[step][f"{type(error).__name__}: {message[:120]}"] += 1
+        self.logger.debug(f"Посетитель #{index + 1}, шаг {step}: {error}")
+
+    async def _think(self):
+        """Пауза посетителя между шагами."""
+        low, high = self.think_time
+        if high > 0:
+            await asyncio.sleep(random.uniform(low, high))
+
+
+def run_load(generator: LoadGenerator, **kwargs) -> dict:
+    """
+    Синхронная обертка над LoadGenerator.run (как run_scenarios).
+
+    Event loop запускается в отдельном потоке: в основном потоке может
+    работать sync Playwright из pytest-playwright.
+
+    Args:
+        generator: Настроенный прогон
+        **kwargs: Параметры LoadGenerator.run
+
+    Returns:
+        dict: Результат report()
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, generator.run(**kwargs)).result()
+
+
+def format_report(report: dict, histograms: Dict[str, LatencyHistogram] = None) -> str:
+    """
+    Отчет прогона для консоли и Allure.
+
+    Args:
+        report: Результат LoadGenerator.report()
+        histograms: Гистограммы шагов (LoadGenerator.histograms) для графиков
+
+    Returns:
+        str: Таблица по шагам, гистограммы и частые ошибки
+    """
+    journeys = report["journeys"]
+    lines = [
+        f"{report['journey']} / {report['project']}: {report['users']} посетителей "
+        f"(одновременно до {report['peak_users']}), {report['elapsed_s']}s, "
+        f"сценариев ok {journeys['ok']}, с ошибкой {journeys['failed']}",
+        f"{'step':<18} {'n':>5} {'err':>4} {'median':>9} {'p95':>9} {'p99':>9} {'max':>9}",
+    ]
+    for step, s in report["steps"].items():
+        cells = [
+            f"{s[key]:>9.0f}" if s[key] is not None else f"{'-':>9}"
+            for key in ("median", "p95", "p99", "max")
+        ]
+        lines.append(f"{step:<18} {s['n']:>5} {s['errors']:>4} {' '.join(cells)}")
+
+    for step, histogram in (histograms or {}).items():
+        if histogram.values:
+            lines += ["", step, histogram.format()]
+
+    for step, errors in report["errors"].items():
+        lines += ["", f"Ошибки {step}:"]
+        lines += [f"  {count:>4} x {message}" for message, count in errors.items()]
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    """Точка входа: python -m utils.load_generator."""
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон каталога")
+    parser.add_argument("--journey", choices=JOURNEYS, default="catalog")
+    parser.add_argument("--project", choices=LOAD_PROJECTS, default="arisha")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument(
+        "--ramp-up", type=float, default=0, help="За сколько секунд подключить --users"
+    )
+    parser.add_argument(
+        "--ramp", help='Этапы "посетителей:секунд" через запятую (вместо --users)'
+    )
+    parser.add_argument(
+        "--think-time", default="0", help='Пауза между шагами: "2" или "1-3" секунды'
+    )
+    parser.add_argument(
+        "--duration", type=float, default=0, help="Повторять сценарий N секунд"
+    )
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument(
+        "--storage-state", help="Storage state с авторизацией (например, .auth/...)"
+    )
+    parser.add_argument(
+        "--stand-in",
+        action="store_true",
+        help="Гонять против локальной подмены каталога (utils.stand_in_server)",
+    )
+    parser.add_argument("--stand-in-latency-ms", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    stand_in = None
+    if args.stand_in:
+        stand_in = StandInCatalog(latency_ms=args.stand_in_latency_ms).start()
+        os.environ.update(stand_in.environ())
+
+    generator = LoadGenerator(
+        args.journey,
+        args.project,
+        stages=parse_ramp(args.ramp) if args.ramp else [(args.users, args.ramp_up)],
+        think_time=parse_think_time(args.think_time),
+        duration=args.duration,
+        storage_state=args.storage_state,
+    )
+    try:
+        report = asyncio.run(generator.run(args.browser, headless=not args.headed))
+    finally:
+        if stand_in:
+            stand_in.stop()
+
+    generator.record(browser=args.browser, device="desktop")
+    print(format_report(report, generator.histograms))
+    return 1 if report["journeys"]["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,34 @@
+"""JSONL файл замеров производительности (web vitals, бенчмарки)."""
+
+import json
+import os
+
+from utils.logger import get_logger
+
+DEFAULT_METRICS_FILE = "reports/web_vitals.jsonl"
+
+logger = get_logger("MetricsFile")
+
+
+def get_metrics_path() -> str:
+    """Путь к файлу замеров (WEB_VITALS_FILE или DEFAULT_METRICS_FILE)."""
+    return os.getenv("WEB_VITALS_FILE", DEFAULT_METRICS_FILE)
+
+
+def append_record(record: dict):
+    """
+    Дописать замер в файл.
+
+    Одна строка за один write - воркеры xdist дописывают файл параллельно.
+    Ошибка записи не роняет тест, а только логируется.
+
+    Args:
+        record: Замер (kind, name, метки и числовые метрики)
+    """
+    path = get_metrics_path()
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.warning(f"Не удалось записать метрики в {path}: {e}")
@@ -0,0 +1,473 @@
+"""
+История метрик производительности в локальной SQLite базе.
+
+Запуск:
+    python -m utils.perf_history import --file reports/web_vitals.jsonl
+    python -m utils.perf_history compare --window 10
+
+compare сравнивает последний прогон с медианой предыдущих прогонов того же
+окружения и с бюджетами проектов. Код выхода 1 - превышен бюджет
+(с --fail-on-regression также при значимом замедлении).
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+from typing import Dict, Iterable, List, Optional
+
+from utils.logger import get_logger
+
+# Бюджеты: проект -> {"<name>.<metric>" или шаблон fnmatch: максимум},
+# "*" - для всех проектов.
+# Значения в мс, кроме cls (безразмерный), *_kb и fps (минимум, кадров в секунду).
+PERF_BUDGETS = {
+    "*": {
+        "open.lcp": 4000,
+        "open.cls": 0.25,
+        "open.total_blocking_ms": 1500,
+        "goto_project.lcp": 5000,
+        "goto_project.cls": 0.25,
+        "test.duration_ms": 180000,
+        "map_load_cold.markers_rendered_ms": 15000,
+        "map_load_warm.markers_rendered_ms": 10000,
+        "widget_cold.interactive_ms": 15000,
+        "widget_warm.interactive_ms": 10000,
+        # tour_360 и панорамы MARK (tour_360_yard...)
+        "tour_360*.first_frame_ms": 8000,
+        "tour_360*.fps": 30,
+    },
+    "mark": {
+        "goto_project.lcp": 6000,
+    },
+}
+
+# Минимальное абсолютное изменение метрики, которое считается замедлением:
+# метрика или шаблон fnmatch -> порог в единицах метрики. CLS и время блокировки
+# обычно 0 - без порога любое ненулевое значение было бы регрессией.
+MIN_DELTA = {
+    "cls": 0.05,
+    "long_tasks": 2,
+    "fps": 3,
+    "*_kb": 50,
+    "*_ms": 50,
+    "ttfb": 50,
+    "fcp": 50,
+    "lcp": 50,
+    "first_paint": 50,
+    "dom_content_loaded": 50,
+    "load": 50,
+}
+
+# Поля записей, которые не являются метриками
+_NON_METRIC_FIELDS = {"ts", "depth", "iteration", "time_origin", "failed", "navigated"}
+# Метрики, где хуже - меньше (бюджет для них - минимум)
+_HIGHER_IS_BETTER = {
+    "fps",
+    "compiled_per_s",
+    "recompiled_per_s",
+    "stream_items_per_s",
+}
+# Метки записи, попадающие в отдельные колонки
+_TAG_FIELDS = ("test", "project", "route_type", "browser", "device")
+
+
+class PerfHistory:
+    """
+    SQLite база метрик всех прогонов.
+
+    Прогон (runs) - одна сессия pytest или запуск бенчмарка. Каждая строка
+    metrics хранит одно числовое значение с окружением, браузером,
+    устройством и git SHA прогона, поэтому выборки не требуют join.
+    """
+
+    DEFAULT_PATH = ".perf_history.sqlite"
+    # Сколько предыдущих прогонов берется в базовую линию
+    DEFAULT_WINDOW = 10
+    # Минимум прогонов в базовой линии для вывода о регрессии
+    MIN_BASELINE_RUNS = 3
+    # Замедление значимо, если выше базы на K робастных сигм и на THRESHOLD от базы
+    SIGMA_K = 3.0
+    DEFAULT_THRESHOLD = 0.10
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at REAL NOT NULL,
+            environment TEXT,
+            git_sha TEXT,
+            label TEXT
+        );
+        CREATE TABLE IF NOT EXISTS metrics (
+            run_id INTEGER NOT NULL REFERENCES runs(id),
+            environment TEXT,
+            git_sha TEXT,
+            test TEXT,
+            project TEXT,
+            route_type TEXT,
+            browser TEXT,
+            device TEXT,
+            kind TEXT,
+            name TEXT,
+            metric TEXT,
+            value REAL
+        );
+        CREATE INDEX IF NOT EXISTS metrics_lookup
+            ON metrics (environment, project, test, kind, name, metric, run_id);
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Инициализация.
+
+        Args:
+            path: Путь к базе (по умолчанию PERF_HISTORY_DB или DEFAULT_PATH)
+        """
+        self.path = path or os.getenv("PERF_HISTORY_DB", self.DEFAULT_PATH)
+        self.logger = get_logger("PerfHistory")
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(self._SCHEMA)
+
+    def close(self):
+        """Закрыть соединение."""
+        self.db.close()
+
+    # ==================== ЗАПИСЬ ====================
+
+    def start_run(self, environment: str = None, label: str = None) -> int:
+        """
+        Начать прогон.
+
+        Args:
+            environment: Окружение (по умолчанию TEST_ENVIRONMENT)
+            label: Произвольная метка (pytest, benchmark...)
+
+        Returns:
+            int: id прогона
+        """
+        cursor = self.db.execute(
+            "INSERT INTO runs (started_at, environment, git_sha, label) VALUES (?, ?, ?, ?)",
+            (
+                time.time(),
+                environment or os.getenv("TEST_ENVIRONMENT", "dev"),
+                get_git_sha(),
+                label,
+            ),
+        )
+        self.db.commit()
+        return cursor.lastrowid
+
+    def add_records(self, run_id: int, records: Iterable[dict]) -> int:
+        """
+        Записать замеры прогона.
+
+        Запись - словарь в формате web vitals: kind, name, метки
+        (project, route_type, browser, device, test) и числовые поля-метрики.
+
+        Args:
+            run_id: id прогона
+            records: Замеры
+
+        Returns:
+            int: Сколько значений записано
+        """
+        run = self.db.execute(
+            "SELECT environment, git_sha FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        rows = []
+        for record in records:
+            tags = [record.get(field) for field in _TAG_FIELDS]
+            for metric, value in record.items():
+                if (
+                    metric in _NON_METRIC_FIELDS
+                    or isinstance(value, bool)
+                    or not isinstance(value, (int, float))
+                ):
+                    continue
+                rows.append(
+                    (
+                        run_id,
+                        record.get("environment") or run["environment"],
+                        run["git_sha"],
+                        *tags,
+                        record.get("kind"),
+                        record.get("name"),
+                        metric,
+                        float(value),
+                    )
+                )
+        self.db.executemany(
+            "INSERT INTO metrics (run_id, environment, git_sha, test, project, "
+            "route_type, browser, device, kind, name, metric, value) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.db.commit()
+        return len(rows)
+
+    def import_jsonl(self, run_id: int, path: str, offset: int = 0) -> int:
+        """
+        Импортировать замеры из JSONL файла (например, WEB_VITALS_FILE).
+
+        Args:
+            run_id: id прогона
+            path: Путь к файлу
+            offset: С какого байта читать (замеры только текущей сессии)
+
+        Returns:
+            int: Сколько значений записано
+        """
+        if not os.path.exists(path):
+            return 0
+        records = []
+        with open(path, encoding="utf-8") as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return self.add_records(run_id, records)
+
+    # ==================== СРАВНЕНИЕ ====================
+
+    def last_run_id(self, environment: str = None) -> Optional[int]:
+        """id последнего прогона с метриками (в окружении, если указано)."""
+        query = "SELECT MAX(run_id) FROM metrics"
+        params = ()
+        if environment:
+            query += " WHERE environment = ?"
+            params = (environment,)
+        return self.db.execute(query, params).fetchone()[0]
+
+    def compare(
+        self,
+        run_id: int = None,
+        window: int = DEFAULT_WINDOW,
+        threshold: float = DEFAULT_THRESHOLD,
+        budgets: Dict[str, dict] = None,
+    ) -> List[dict]:
+        """
+        Сравнить прогон с базовой линией и бюджетами.
+
+        Значение группы (окружение, тест, проект, браузер, устройство, замер,
+        метрика) в прогоне - медиана его замеров. База - медиана таких медиан
+        по `window` предыдущим прогонам, разброс - MAD. Замедление значимо,
+        если текущая медиана выше базы и на SIGMA_K * 1.4826 * MAD,
+        и на threshold от базы, и на MIN_DELTA метрики (шумные и нулевые
+        метрики не дают ложных срабатываний).
+        Для метрик _HIGHER_IS_BETTER (fps) значимо падение, а бюджет - минимум.
+
+        Args:
+            run_id: Прогон (по умолчанию последний)
+            window: Сколько предыдущих прогонов брать в базу
+            threshold: Минимальный относительный прирост
+            budgets: Бюджеты (по умолчанию PERF_BUDGETS)
+
+        Returns:
+            List[dict]: Находки {"type": "budget"|"regression", ...}
+        """
+        run_id = run_id or self.last_run_id()
+        if run_id is None:
+            return []
+        if budgets is None:
+            budgets = load_budgets()
+
+        current = self._run_medians("run_id = ?", (run_id,))
+        findings = []
+        for group, value in current.items():
+            environment, test, project, browser, device, kind, name, metric = group
+            finding_base = {
+                "environment": environment,
+                "test": test,
+                "project": project,
+                "browser": browser,
+                "device": device,
+                "kind": kind,
+                "metric": f"{name}.{metric}",
+                "value": round(value, 4),
+            }
+
+            # +1 - хуже больше, -1 - хуже меньше
+            worse = -1 if metric in _HIGHER_IS_BETTER else 1
+
+            budget = get_budget(budgets, project, f"{name}.{metric}")
+            if budget is not None and worse * (value - budget) > 0:
+                findings.append({"type": "budget", "limit": budget, **finding_base})
+
+            baseline = self._baseline(run_id, group, window)
+            if len(baseline) < self.MIN_BASELINE_RUNS:
+                continue
+            base = statistics.median(baseline)
+            mad = statistics.median(abs(v - base) for v in baseline)
+            margin = max(
+                self.SIGMA_K * 1.4826 * mad,
+                threshold * abs(base),
+                get_min_delta(metric),
+            )
+            if worse * (value - base) > margin:
+                findings.append(
+                    {
+                        "type": "regression",
+                        "baseline": round(base, 4),
+                        "baseline_runs": len(baseline),
+                        "change": round((value - base) / base, 3) if base else None,
+                        **finding_base,
+                    }
+                )
+        return findings
+
+    def _run_medians(self, where: str, params: tuple) -> Dict[tuple, float]:
+        """Медианы значений по группам для выборки прогонов."""
+        rows = self.db.execute(
+            "SELECT environment, test, project, browser, device, kind, name, metric, "
+            f"value FROM metrics WHERE {where}",
+            params,
+        ).fetchall()
+        groups = {}
+        for row in rows:
+            groups.setdefault(tuple(row)[:8], []).append(row["value"])
+        return {group: statistics.median(values) for group, values in groups.items()}
+
+    def _baseline(self, run_id: int, group: tuple, window: int) -> List[float]:
+        """Медианы группы в `window` предыдущих прогонах."""
+        condition = (
+            "environment IS ? AND test IS ? AND project IS ? AND browser IS ? "
+            "AND device IS ? AND kind IS ? AND name IS ? AND metric IS ?"
+        )
+        rows = self.db.execute(
+            "SELECT run_id, value FROM metrics WHERE run_id IN ("
+            f"  SELECT DISTINCT run_id FROM metrics WHERE run_id < ? AND {condition} "
+            "  ORDER BY run_id DESC LIMIT ?"
+            f") AND {condition}",
+            (run_id, *group, window, *group),
+        ).fetchall()
+        per_run = {}
+        for row in rows:
+            per_run.setdefault(row["run_id"], []).append(row["value"])
+        return [statistics.median(values) for values in per_run.values()]
+
+
+def get_git_sha() -> Optional[str]:
+    """SHA текущего коммита (GITHUB_SHA в CI, иначе git rev-parse)."""
+    sha = os.getenv("GITHUB_SHA") or os.getenv("GIT_SHA")
+    if sha:
+        return sha
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def load_budgets() -> Dict[str, dict]:
+    """PERF_BUDGETS, дополненные JSON файлом из PERF_BUDGETS_FILE."""
+    budgets = {project: dict(limits) for project, limits in PERF_BUDGETS.items()}
+    path = os.getenv("PERF_BUDGETS_FILE")
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for project, limits in json.load(f).items():
+                budgets.setdefault(project, {}).update(limits)
+    return budgets
+
+
+def get_budget(budgets: Dict[str, dict], project: str, key: str) -> Optional[float]:
+    """Бюджет метрики: проектный или общий ("*"), точное имя, затем шаблон."""
+    for scope in (project, "*"):
+        limits = budgets.get(scope, {})
+        if key in limits:
+            return limits[key]
+        for pattern, limit in limits.items():
+            if fnmatch.fnmatchcase(key, pattern):
+                return limit
+    return None
+
+
+def get_min_delta(metric: str) -> float:
+    """Порог MIN_DELTA метрики: точное имя, затем шаблон (0 - без порога)."""
+    if metric in MIN_DELTA:
+        return MIN_DELTA[metric]
+    for pattern, delta in MIN_DELTA.items():
+        if fnmatch.fnmatchcase(metric, pattern):
+            return delta
+    return 0.0
+
+
+def format_findings(findings: List[dict]) -> str:
+    """Отчет сравнения для консоли."""
+    if not findings:
+        return "Регрессий и превышений бюджета нет"
+    lines = []
+    for f in sorted(findings, key=lambda f: (f["type"], f["project"] or "")):
+        where = f"{f['project']}/{f['browser']}/{f['device']} {f['metric']}"
+        if f["test"]:
+            where += f" [{f['test']}]"
+        if f["type"] == "budget":
+            sign = ">" if f["value"] > f["limit"] else "<"
+            lines.append(f"BUDGET      {where}: {f['value']} {sign} {f['limit']}")
+        else:
+            change = f" ({f['change'] * 100:+.0f}%)" if f["change"] else ""
+            lines.append(
+                f"REGRESSION  {where}: {f['value']} vs {f['baseline']}{change}, "
+                f"база {f['baseline_runs']} прогонов"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    """Точка входа: python -m utils.perf_history."""
+    parser = argparse.ArgumentParser(description="История метрик производительности")
+    parser.add_argument("--db", help="Путь к базе (PERF_HISTORY_DB)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Импортировать JSONL замеры")
+    import_parser.add_argument(
+        "--file", default=os.getenv("WEB_VITALS_FILE", "reports/web_vitals.jsonl")
+    )
+    import_parser.add_argument("--label", default="import")
+
+    compare_parser = commands.add_parser("compare", help="Сравнить с базой и бюджетами")
+    compare_parser.add_argument(
+        "--run", type=int, help="id прогона (по умолчанию последний)"
+    )
+    compare_parser.add_argument(
+        "--window", type=int, default=PerfHistory.DEFAULT_WINDOW
+    )
+    compare_parser.add_argument(
+        "--threshold", type=float, default=PerfHistory.DEFAULT_THRESHOLD
+    )
+    compare_parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Код выхода 1 также при значимом замедлении",
+    )
+    args = parser.parse_args(argv)
+
+    history = PerfHistory(args.db)
+    try:
+        if args.command == "import":
+            run_id = history.start_run(label=args.label)
+            count = history.import_jsonl(run_id, args.file)
+            print(f"Прогон {run_id}: записано {count} значений из {args.file}")
+            return 0
+
+        findings = history.compare(args.run, args.window, args.threshold)
+    finally:
+        history.close()
+
+    print(format_findings(findings))
+    failing = {"budget", "regression"} if args.fail_on_regression else {"budget"}
+    return 1 if any(f["type"] in failing for f in findings) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
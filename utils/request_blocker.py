@@ -0,0 +1,120 @@
+import re
+from typing import List
+
+
+class RequestBlocker:
+    """
+    Блокировка сторонних и необязательных запросов через route контекста.
+
+    Запрос блокируется, если URL совпадает с одним из паттернов block и не
+    совпадает ни с одним из allow. В режиме audit запросы не блокируются,
+    а только учитываются вместе с фактическим размером ответа - так можно
+    оценить выигрыш и настроить профиль до включения блокировки.
+    """
+
+    def __init__(self, block: List[str], allow: List[str] = None, audit=False):
+        """
+        Инициализация.
+
+        Args:
+            block: Регулярные выражения URL, которые нужно блокировать
+            allow: Регулярные выражения URL, которые блокировать нельзя
+            audit: Только учитывать совпадения, не блокируя их
+        """
+        self.block = [re.compile(pattern) for pattern in block]
+        self.allow = [re.compile(pattern) for pattern in allow or []]
+        self.audit = audit
+        # Учтенные запросы: url, тип ресурса, размер ответа (только в audit)
+        self.blocked = []
+        self._audited = {}
+
+    def attach(self, context):
+        """
+        Подключить блокировку к контексту браузера.
+
+        Регистрировать после остальных route обработчиков: Playwright вызывает
+        последний зарегистрированный первым, и заблокированный запрос не дойдет
+        до кэша или HAR.
+
+        Args:
+            context: BrowserContext Playwright
+        """
+        context.route("**/*", self._handle_route)
+        if self.audit:
+            context.on("requestfinished", self._on_request_finished)
+
+    def detach(self, context):
+        """
+        Отключить обработчики от контекста (перед возвратом контекста в пул).
+
+        Args:
+            context: BrowserContext Playwright
+        """
+        context.unroute("**/*", self._handle_route)
+        if self.audit:
+            context.remove_listener("requestfinished", self._on_request_finished)
+
+    def is_blocked(self, url: str) -> bool:
+        """
+        Проверить, попадает ли URL под профиль блокировки.
+
+        Args:
+            url: URL запроса
+
+        Returns:
+            bool: True, если запрос нужно блокировать
+        """
+        if any(pattern.search(url) for pattern in self.allow):
+            return False
+        return any(pattern.search(url) for pattern in self.block)
+
+    def get_summary(self) -> dict:
+        """
+        Итог по тесту.
+
+        Returns:
+            dict: requests - число запросов, bytes - размер ответов (только audit)
+        """
+        return {
+            "requests": len(self.blocked),
+            "bytes": sum(entry["bytes"] for entry in self.blocked),
+        }
+
+    def format_report(self) -> str:
+        """Список учтенных запросов для вложения в Allure."""
+        action = "Совпало с профилем (audit)" if self.audit else "Заблокировано"
+        lines = [f"{action}: {len(self.blocked)}"]
+        for entry in self.blocked:
+            size = f" {entry['bytes']} B" if self.audit else ""
+            lines.append(f"[{entry['resource_type']}]{size} {entry['url']}")
+        return "\n".join(lines)
+
+    def _handle_route(self, route):
+        """Обработчик route: заблокировать запрос или передать дальше."""
+        request = route.request
+        if not self.is_blocked(request.url):
+            route.fallback()
+            return
+
+        entry = {
+            "url": request.url,
+            "resource_type": request.resource_type,
+            "bytes": 0,
+        }
+        self.blocked.append(entry)
+        if self.audit:
+            self._audited[request] = entry
+            route.fallback()
+        else:
+            route.abort("blockedbyclient")
+
+    def _on_request_finished(self, request):
+        """В audit режиме фиксируем размер ответа учтенного запроса."""
+        entry = self._audited.pop(request, None)
+        if entry is None:
+            return
+        try:
+            sizes = request.sizes()
+            entry["bytes"] = sizes["responseBodySize"] + sizes["responseHeadersSize"]
+        except Exception:
+            pass
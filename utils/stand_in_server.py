@@ -0,0 +1,617 @@
+"""
+Локальная подмена каталога для офлайн прогонов.
+
+Отдает минимальные страницы Qube каталога (Arisha, Elire, Cubix) с теми же
+data-test-id и классами, на которые опираются page objects: карта с
+маркерами и Explore, навигация по зданиям и этажам с планом этажа,
+Explore Amenities (public-zone-info-flow-modal), 360 тур
+(rotation-view-360-modal), каталог с замками и пагинацией, апартамент с
+iframe виджета (2D/3D) и Sales Offer с PDF на агентском роуте. API
+/api/projects/{project}/units отдает те же апартаменты в формате
+utils.catalog_schemas.UNITS_SCHEMA.
+
+Запуск:
+    python -m utils.stand_in_server --port 8000 --latency-ms 50 --jitter-ms 20
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+from utils.logger import get_logger
+
+# Проект -> aria-label маркера на карте (как у MapComponent)
+STAND_IN_PROJECTS = {
+    "arisha": "ARISHA TERRACES",
+    "elire": "Elire",
+    "cubix": "CUBIX RESIDENCE",
+}
+
+# Здания и этажи проекта (nav-desktop-building-{n}, nav-desktop-floor-{n})
+STAND_IN_BUILDINGS = 2
+STAND_IN_FLOORS = 3
+# Апартаментов на странице каталога (li.ant-pagination-item-{n})
+STAND_IN_PAGE_SIZE = 8
+# Кадров 360 тура и слайдов amenities
+STAND_IN_TOUR_FRAMES = 8
+STAND_IN_AMENITIES_SLIDES = 5
+
+# Минимальный валидный PDF для Sales Offer
+_PDF_BODY = (
+    b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Kids[]/Count 0>>endobj\n"
+    b"trailer<</Root 1 0 R>>\n%%EOF\n"
+)
+
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ margin: 0; font-family: sans-serif; }}
+[data-testid="map"] {{ position: relative; width: 960px; height: 600px; background: #cde; }}
+.marker {{ position: absolute; width: 40px; height: 40px; border-radius: 50%;
+    background: #c33; cursor: pointer; }}
+.ant-card {{ position: absolute; left: 600px; top: 40px; padding: 16px; background: #fff; }}
+section {{ display: inline-block; width: 200px; margin: 8px; padding: 8px; border: 1px solid #999; }}
+iframe {{ width: 800px; height: 600px; border: 0; }}
+nav li {{ display: inline-block; position: relative; margin-right: 16px; }}
+nav ul ul {{ position: absolute; z-index: 5; background: #fff; padding: 4px; }}
+[data-test-id="rotation-view-360-overlay"], [data-test-id="public-zone-info-flow-modal"] {{
+    position: fixed; inset: 0; z-index: 10; background: rgba(0, 0, 0, .6); }}
+[data-test-id="rotation-view-360-modal"] {{ margin: 40px auto; width: 800px; background: #000; }}
+.slick-list img {{ display: none; width: 640px; height: 360px; }}
+.slick-list img.slick-current {{ display: block; }}
+.ant-pagination li {{ display: inline-block; padding: 4px 8px; cursor: pointer; }}
+.ant-pagination-item-active {{ border: 1px solid #1677ff; }}
+</style></head>
+<body>{body}</body></html>
+"""
+
+_MAP_BODY = """
+<div data-testid="map">{markers}</div>
+<div class="ant-card _projectInfo_standin" hidden></div>
+<script>
+document.querySelectorAll('.marker').forEach((marker) => marker.addEventListener('click', () => {{
+    const card = document.querySelector('.ant-card');
+    card.innerHTML = `<h3>${{marker.getAttribute('aria-label')}}</h3>
+        <button data-test-id="map-project-point-button-desktop-${{marker.dataset.project}}"
+            onclick="location.href='${{marker.dataset.href}}'">Explore Project</button>`;
+    card.hidden = false;
+}}));
+</script>
+"""
+
+_MARKER = (
+    '<div class="marker" role="button" aria-label="{label}" data-project="{project}"'
+    ' data-href="{href}" style="left: {left}px; top: 200px"></div>'
+)
+
+_NAV = """
+<nav><ul>
+<li data-test-id="nav-desktop-map"><a href="{root}/map">Map</a></li>
+<li><a data-test-id="nav-desktop-catalog2d-standalone" href="{project_url}/catalog_2d">All units</a></li>
+<li><button data-test-id="nav-desktop-building" data-dropdown>Building</button>
+<ul hidden>{buildings}</ul></li>
+<li><button data-test-id="nav-desktop-floor" data-dropdown>Floor</button>
+<ul hidden>{floors}</ul></li>
+<li><button data-test-id="nav-rotation-view-controls-button">360 Area Tour</button></li>
+<li><button data-test-id="project-info-window-explore-amenities">Explore Amenities</button></li>
+</ul></nav>
+"""
+
+_NAV_JS = """
+<script>
+document.querySelectorAll('[data-dropdown]').forEach((button) => button.addEventListener(
+    'click', () => { button.nextElementSibling.hidden = !button.nextElementSibling.hidden; }));
+</script>
+"""
+
+_NAV_ITEM = '<li data-test-id="{test_id}"><a href="{href}">{label}</a></li>'
+
+# План этажа: апартаменты - группы svg, замок внутри группы
+_FLOOR_PLAN = """
+<svg width="720" height="240" data-floor="{floor}">{apartments}</svg>
+"""
+
+_FLOOR_PLAN_JS = """
+<script>
+document.querySelectorAll('svg .apartment').forEach((apartment) => apartment.addEventListener(
+    'click', () => { location.href = apartment.dataset.href; }));
+</script>
+"""
+
+_FLOOR_APARTMENT = """
+<g class="apartment" data-href="{project_url}/apartment/{unit}">
+<rect x="{x}" y="20" width="100" height="200" fill="#9c6"></rect>{lock}</g>
+"""
+
+_FLOOR_LOCK = (
+    '<foreignObject x="{x}" y="100" width="24" height="24">'
+    '<span class="anticon anticon-lock" aria-label="lock">L</span></foreignObject>'
+)
+
+# Explore Amenities: модалка со слайдером (стрелки, точки, картинки)
+_AMENITIES_MODAL = """
+<div data-test-id="public-zone-info-flow-modal" hidden>
+<h1>Amenities</h1>
+<button><span aria-label="close">x</span></button>
+<div class="slick-slider">
+<button aria-label="left">&lt;</button>
+<div class="slick-list">{slides}</div>
+<button aria-label="right">&gt;</button>
+<ul class="slick-dots">{dots}</ul>
+</div>
+</div>
+"""
+
+_AMENITIES_MODAL_JS = """
+<script>
+(() => {
+    const modal = document.querySelector('[data-test-id="public-zone-info-flow-modal"]');
+    const slides = modal.querySelectorAll('.slick-list img');
+    const dots = modal.querySelectorAll('.slick-dots li');
+    let current = 0;
+    const show = (index) => {
+        current = (index + slides.length) % slides.length;
+        slides.forEach((slide, i) => slide.classList.toggle('slick-current', i === current));
+        dots.forEach((dot, i) => dot.classList.toggle('slick-active', i === current));
+    };
+    document.querySelector('[data-test-id="project-info-window-explore-amenities"]')
+        .addEventListener('click', () => { show(0); modal.hidden = false; });
+    modal.querySelector('[aria-label="close"]').closest('button')
+        .addEventListener('click', () => { modal.hidden = true; });
+    modal.querySelector('[aria-label="left"]').addEventListener('click', () => show(current - 1));
+    modal.querySelector('[aria-label="right"]').addEventListener('click', () => show(current + 1));
+    dots.forEach((dot, i) => dot.addEventListener('click', () => show(i)));
+})();
+</script>
+"""
+
+# 360 тур: кадры турнтейбла грузятся при открытии и при перетаскивании
+_TOUR_MODAL = """
+<div data-test-id="rotation-view-360-overlay" hidden>
+<div data-test-id="rotation-view-360-modal">
+<button data-test-id="rotation-view-360-close-button"><span aria-label="close">x</span></button>
+<img class="__react-image-turntable-img" alt="360" width="800" height="450">
+</div>
+</div>
+<script>
+(() => {
+    const overlay = document.querySelector('[data-test-id="rotation-view-360-overlay"]');
+    const image = overlay.querySelector('img');
+    const frames = %(frames)d;
+    let frame = 0, startX = null;
+    const show = (index) => {
+        frame = (index + frames) %% frames;
+        image.src = `/img/tour-%(project)s-${frame}.svg`;
+    };
+    const close = () => { overlay.hidden = true; };
+    document.querySelector('[data-test-id="nav-rotation-view-controls-button"]')
+        .addEventListener('click', () => { show(0); overlay.hidden = false; });
+    overlay.querySelector('[data-test-id="rotation-view-360-close-button"]')
+        .addEventListener('click', close);
+    document.addEventListener('keydown', (event) => { if (event.key === 'Escape') close(); });
+    image.addEventListener('pointerdown', (event) => { startX = event.clientX; });
+    image.addEventListener('pointerup', () => { startX = null; });
+    image.addEventListener('pointermove', (event) => {
+        if (startX === null || !event.buttons) return;
+        const step = Math.trunc((event.clientX - startX) / 40);
+        if (step) { show(frame + step); startX = event.clientX; }
+    });
+})();
+</script>
+"""
+
+_IMAGE = """<svg xmlns="http://www.w3.org/2000/svg" width="800" height="450">
+<rect width="800" height="450" fill="hsl({hue}, 45%, 55%)"/>
+<text x="40" y="80" font-size="48" fill="#fff">{label}</text></svg>
+"""
+
+_UNIT = """
+<section data-page="{page}"{hidden}><button onclick="location.href='{project_url}/apartment/{unit}'">
+<span>{unit}</span> <span>VIEW APARTMENT</span></button>{lock}</section>
+"""
+
+_LOCK = '<span class="anticon anticon-lock" aria-label="lock"></span>'
+
+_PAGINATION = """
+<ul class="ant-pagination">{items}</ul>
+"""
+
+_PAGINATION_JS = """
+<script>
+document.querySelectorAll('.ant-pagination-item').forEach((item) => item.addEventListener(
+    'click', () => {
+        document.querySelectorAll('.ant-pagination-item').forEach((other) =>
+            other.classList.toggle('ant-pagination-item-active', other === item));
+        document.querySelectorAll('section[data-page]').forEach((section) => {
+            section.hidden = section.dataset.page !== item.title;
+        });
+    }));
+</script>
+"""
+
+_PAGINATION_ITEM = (
+    '<li title="{page}" class="ant-pagination-item ant-pagination-item-{page}{active}">'
+    "<a>{page}</a></li>"
+)
+
+_SALES_OFFER = """
+<button id="sales-offer" onclick="document.getElementById('offer').hidden = false">
+<span>Sales Offer</span></button>
+<div id="offer" hidden>
+<button onclick="location.href='/pdf/{project}/{unit}.pdf'"><span>Download PDF</span></button>
+</div>
+"""
+
+_WIDGET_BODY = """
+<canvas width="640" height="400"></canvas>
+<div>
+<button class="widget-control-button control-2d">2D</button>
+<button class="widget-control-button control-360 active">3D</button>
+</div>
+<div class="widget-arrow-controls arrow-controls-plan">
+<button class="arrow-button">&lt;</button><div class="widget-arrow-controls__text">1/2</div>
+<button class="arrow-button arrow-button--reverse">&gt;</button></div>
+<div class="widget-arrow-controls arrow-controls-plan">
+<button class="arrow-button">&lt;</button><div class="widget-arrow-controls__text">1/2</div>
+<button class="arrow-button arrow-button--reverse">&gt;</button></div>
+<script>
+const context = document.querySelector('canvas').getContext('2d');
+requestAnimationFrame(() => {
+    context.fillStyle = '#8a6';
+    context.fillRect(0, 0, 640, 400);
+});
+document.querySelectorAll('.widget-control-button').forEach((button) =>
+    button.addEventListener('click', () => {
+        document.querySelectorAll('.widget-control-button')
+            .forEach((other) => other.classList.toggle('active', other === button));
+    }));
+</script>
+"""
+
+# Роуты: (роут, проект, страница, апартамент)
+_PROJECT_ROUTE = re.compile(
+    r"^(?P<route>/agent|/client)?/project/(?P<project>[\w-]+)/"
+    r"(?P<page>area|catalog_2d|apartment/(?P<unit>[\w-]+)"
+    r"|building/(?P<building>\d+)|floor/(?P<floor_building>\d+)/(?P<floor>\d+))/?$"
+)
+_MAP_ROUTE = re.compile(r"^(?P<route>/agent|/client)?/map/?$")
+_WIDGET_ROUTE = re.compile(r"^/widget/(?P<project>[\w-]+)/(?P<unit>[\w-]+)/?$")
+_PDF_ROUTE = re.compile(r"^/pdf/(?P<project>[\w-]+)/(?P<unit>[\w-]+)\.pdf$")
+_UNITS_API_ROUTE = re.compile(r"^/api/projects/(?P<project>[\w-]+)/units/?$")
+_IMAGE_ROUTE = re.compile(r"^/img/(?P<name>[\w-]+)\.svg$")
+
+
+class StandInCatalog:
+    """
+    HTTP сервер-подмена каталога в фоновом потоке.
+
+    Используется как context manager:
+
+        with StandInCatalog(latency_ms=50) as stand_in:
+            os.environ.update(stand_in.environ())
+            ...
+
+    Каждый третий апартамент каталога закрыт замком, первый - тоже,
+    чтобы поиск доступного апартамента не сводился к первому элементу.
+    Каждый ответ задерживается на latency_ms +- jitter_ms (равномерно),
+    с seed разброс повторяется от прогона к прогону.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: int = 0,
+        units: int = 12,
+        jitter_ms: int = 0,
+        seed: int = None,
+    ):
+        """
+        Инициализация.
+
+        Args:
+            host: Адрес сервера
+            port: Порт (0 - любой свободный)
+            latency_ms: Задержка перед каждым ответом
+            units: Сколько апартаментов в каталоге проекта
+            jitter_ms: Разброс задержки в обе стороны
+            seed: Seed разброса (None - случайный)
+        """
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.units = units
+        self.jitter_ms = jitter_ms
+        self.logger = get_logger("StandInCatalog")
+        self._server = None
+        self._thread = None
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """Корневой URL запущенного сервера."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def api_url(self) -> str:
+        """URL API каталога (CATALOG_API_URL для AvailableUnitsProvider)."""
+        return f"{self.base_url}/api"
+
+    def environ(self) -> dict:
+        """Переменные окружения, направляющие URL Qube проектов на подмену."""
+        return {
+            "TEST_ENVIRONMENT": "dev",
+            "DEV_BASE_URL": f"{self.base_url}/map",
+            "DEV_AGENT_BASE_URL": f"{self.base_url}/agent/map",
+            "DEV_CLIENT_BASE_URL": f"{self.base_url}/client/map",
+        }
+
+    def start(self) -> "StandInCatalog":
+        """Запустить сервер в фоновом потоке."""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.handle(self)
+
+            def log_message(self, format, *args):
+                stand_in.logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Подмена каталога запущена: {self.base_url}")
+        return self
+
+    def stop(self):
+        """Остановить сервер."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandInCatalog":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def delay_ms(self) -> float:
+        """Задержка очередного ответа: latency_ms +- jitter_ms, не меньше нуля."""
+        if not self.jitter_ms:
+            return self.latency_ms
+        with self._random_lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, self.latency_ms + jitter)
+
+    def handle(self, request: BaseHTTPRequestHandler):
+        """Ответить на запрос: задержка, затем страница, PDF, картинка или 404."""
+        delay = self.delay_ms()
+        if delay:
+            time.sleep(delay / 1000)
+
+        response = self.render(request.path.split("?", 1)[0])
+        if response is None:
+            request.send_error(404)
+            return
+        content_type, body, headers = response
+        request.send_response(200)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(body)
+
+    def render(self, path: str) -> Optional[Tuple[str, bytes, dict]]:
+        """
+        Содержимое по пути.
+
+        Args:
+            path: Путь запроса без query
+
+        Returns:
+            (content type, тело, доп. заголовки) или None, если пути нет
+        """
+        match = _MAP_ROUTE.match(path)
+        if match:
+            return self._html("Map", self._map(match["route"] or ""))
+
+        match = _PROJECT_ROUTE.match(path)
+        if match and match["project"] in STAND_IN_PROJECTS:
+            return self._html(STAND_IN_PROJECTS[match["project"]], self._project(match))
+
+        match = _WIDGET_ROUTE.match(path)
+        if match:
+            return self._html("Widget", _WIDGET_BODY)
+
+        match = _PDF_ROUTE.match(path)
+        if match:
+            filename = f"sales-offer-{match['project']}-{match['unit']}.pdf"
+            return (
+                "application/pdf",
+                _PDF_BODY,
+                {"Content-Disposition": f'attachment; filename="{filename}"'},
+            )
+
+        match = _UNITS_API_ROUTE.match(path)
+        if match and match["project"] in STAND_IN_PROJECTS:
+            body = json.dumps({"data": self.units_data()})
+            return "application/json", body.encode("utf-8"), {}
+
+        match = _IMAGE_ROUTE.match(path)
+        if match:
+            name = match["name"]
+            image = _IMAGE.format(hue=sum(map(ord, name)) % 360, label=escape(name))
+            return "image/svg+xml", image.encode("utf-8"), {"Cache-Control": "no-store"}
+        return None
+
+    def units_data(self) -> list:
+        """Апартаменты каталога в формате API (замки - как в каталоге)."""
+        return [
+            {
+                "id": 101 + index,
+                "status": "sold" if index % 3 == 0 else "available",
+                "locked": index % 3 == 0,
+                "floor": index // 4 + 1,
+            }
+            for index in range(self.units)
+        ]
+
+    # ==================== ВНУТРЕННИЕ МЕТОДЫ ====================
+
+    @staticmethod
+    def _html(title: str, body: str) -> Tuple[str, bytes, dict]:
+        """HTML ответ."""
+        page = _PAGE.format(title=escape(title), body=body)
+        return "text/html; charset=utf-8", page.encode("utf-8"), {}
+
+    @staticmethod
+    def _map(root: str) -> str:
+        """Карта с маркерами всех проектов."""
+        markers = "".join(
+            _MARKER.format(
+                label=escape(label),
+                project=project,
+                href=f"{root}/project/{project}/area",
+                left=120 + index * 160,
+            )
+            for index, (project, label) in enumerate(STAND_IN_PROJECTS.items())
+        )
+        return _MAP_BODY.format(markers=markers)
+
+    def _project(self, match: re.Match) -> str:
+        """Страница проекта: навигация, модалки и содержимое страницы."""
+        root = match["route"] or ""
+        project = match["project"]
+        project_url = f"{root}/project/{project}"
+        building = match["building"] or match["floor_building"] or "1"
+
+        body = _NAV.format(
+            root=root,
+            project_url=project_url,
+            buildings=_nav_items(
+                "building", STAND_IN_BUILDINGS, lambda n: f"{project_url}/building/{n}"
+            ),
+            floors=_nav_items(
+                "floor",
+                STAND_IN_FLOORS,
+                lambda n: f"{project_url}/floor/{building}/{n}",
+            ),
+        )
+        body += _AMENITIES_MODAL.format(
+            slides="".join(
+                f'<img src="/img/amenity-{project}-{i}.svg" alt="amenity {i}">'
+                for i in range(STAND_IN_AMENITIES_SLIDES)
+            ),
+            dots="".join(
+                f"<li><button>{i + 1}</button></li>"
+                for i in range(STAND_IN_AMENITIES_SLIDES)
+            ),
+        )
+        body += _NAV_JS + _AMENITIES_MODAL_JS
+        body += _TOUR_MODAL % {"frames": STAND_IN_TOUR_FRAMES, "project": project}
+
+        if match["page"] == "catalog_2d":
+            body += self._catalog(project_url)
+        elif match["floor"]:
+            body += self._floor_plan(project_url, building, match["floor"])
+        elif match["unit"]:
+            body += self._apartment(root, project, match["unit"])
+        return body
+
+    def _catalog(self, project_url: str) -> str:
+        """Каталог апартаментов с замками, по STAND_IN_PAGE_SIZE на странице."""
+        sections = "".join(
+            _UNIT.format(
+                project_url=project_url,
+                unit=f"{101 + index}",
+                lock=_LOCK if index % 3 == 0 else "",
+                page=index // STAND_IN_PAGE_SIZE + 1,
+                hidden=" hidden" if index >= STAND_IN_PAGE_SIZE else "",
+            )
+            for index in range(self.units)
+        )
+        pages = (self.units + STAND_IN_PAGE_SIZE - 1) // STAND_IN_PAGE_SIZE
+        items = "".join(
+            _PAGINATION_ITEM.format(
+                page=page, active=" ant-pagination-item-active" if page == 1 else ""
+            )
+            for page in range(1, pages + 1)
+        )
+        return sections + _PAGINATION.format(items=items) + _PAGINATION_JS
+
+    @staticmethod
+    def _floor_plan(project_url: str, building: str, floor: str) -> str:
+        """План этажа: по апартаменту на секцию, первый закрыт замком."""
+        apartments = "".join(
+            _FLOOR_APARTMENT.format(
+                project_url=project_url,
+                unit=f"{building}{floor}{index + 1:02d}",
+                x=20 + index * 120,
+                lock=_FLOOR_LOCK.format(x=60 + index * 120) if index == 0 else "",
+            )
+            for index in range(5)
+        )
+        return _FLOOR_PLAN.format(floor=floor, apartments=apartments) + _FLOOR_PLAN_JS
+
+    @staticmethod
+    def _apartment(root: str, project: str, unit: str) -> str:
+        """Страница апартамента: виджет и Sales Offer на агентском роуте."""
+        body = (
+            f'<h1>{escape(unit)}</h1><iframe class="_iframe_standin" '
+            f'src="/widget/{project}/{escape(unit)}"></iframe>'
+        )
+        if root == "/agent":
+            body += _SALES_OFFER.format(project=project, unit=escape(unit))
+        return body
+
+
+def _nav_items(kind: str, count: int, href) -> str:
+    """Пункты выпадающего меню nav-desktop-{kind}-{n}."""
+    return "".join(
+        _NAV_ITEM.format(
+            test_id=f"nav-desktop-{kind}-{n}", href=href(n), label=f"{kind.title()} {n}"
+        )
+        for n in range(1, count + 1)
+    )
+
+
+def main(argv=None) -> int:
+    """Точка входа: python -m utils.stand_in_server."""
+    parser = argparse.ArgumentParser(description="Локальная подмена каталога")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--jitter-ms", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    stand_in = StandInCatalog(
+        args.host,
+        args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        seed=args.seed,
+    )
+    stand_in.start()
+    print("\n".join(f"export {k}={v}" for k, v in stand_in.environ().items()))
+    try:
+        stand_in._thread.join()
+    except KeyboardInterrupt:
+        stand_in.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+import json
+import os
+from typing import Dict, Optional
+
+from utils.logger import get_logger
+
+
+class TimingsDB:
+    """
+    Локальная база длительностей тестов.
+
+    Ключ записи - (nodeid, браузер, устройство). Значение сглаживается
+    экспоненциальным средним, чтобы один медленный прогон не ломал оценку.
+    """
+
+    DEFAULT_PATH = ".test_timings.json"
+    # Оценка (сек) для теста без истории и без соседей по модулю
+    DEFAULT_ESTIMATE = 30.0
+    # Вес нового замера в экспоненциальном среднем
+    SMOOTHING = 0.3
+
+    def __init__(self, path: str = None):
+        """
+        Инициализация.
+
+        Args:
+            path: Путь к JSON файлу базы (по умолчанию TEST_TIMINGS_DB или DEFAULT_PATH)
+        """
+        self.path = path or os.getenv("TEST_TIMINGS_DB", self.DEFAULT_PATH)
+        self.logger = get_logger("TimingsDB")
+        self.data = self._load()
+        self._module_estimates = None
+
+    @staticmethod
+    def make_key(nodeid: str, browser: str, device: str) -> str:
+        """Сформировать ключ записи."""
+        return f"{nodeid}|{browser}|{device}"
+
+    @staticmethod
+    def get_module(nodeid: str) -> str:
+        """Получить путь модуля из nodeid."""
+        return nodeid.split("::", 1)[0]
+
+    def record(self, nodeid: str, browser: str, device: str, duration: float):
+        """
+        Записать длительность прогона теста.
+
+        Args:
+            nodeid: nodeid теста
+            browser: Имя браузера
+            device: Имя устройства (desktop, iphone_13...)
+            duration: Длительность setup + call + teardown (сек)
+        """
+        key = self.make_key(nodeid, browser, device)
+        entry = self.data.get(key)
+        if entry is None:
+            entry = {"duration": duration, "runs": 0}
+        else:
+            entry["duration"] = (
+                self.SMOOTHING * duration + (1 - self.SMOOTHING) * entry["duration"]
+            )
+        entry["runs"] += 1
+        entry["last"] = round(duration, 3)
+        entry["duration"] = round(entry["duration"], 3)
+        self.data[key] = entry
+        self._module_estimates = None
+
+    def estimate(self, nodeid: str, browser: str, device: str) -> float:
+        """
+        Оценить длительность теста.
+
+        Порядок: точная запись -> тот же модуль с тем же браузером/устройством
+        -> тот же модуль в любой конфигурации -> DEFAULT_ESTIMATE.
+
+        Args:
+            nodeid: nodeid теста
+            browser: Имя браузера
+            device: Имя устройства
+
+        Returns:
+            float: Оценка длительности в секундах
+        """
+        entry = self.data.get(self.make_key(nodeid, browser, device))
+        if entry:
+            return entry["duration"]
+
+        estimates = self._get_module_estimates()
+        module = self.get_module(nodeid)
+        for key in ((module, browser, device), (module, None, None)):
+            if key in estimates:
+                return estimates[key]
+        return self.DEFAULT_ESTIMATE
+
+    def save(self):
+        """Сохранить базу на диск (атомарно)."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.logger.info(f"Длительности тестов сохранены: {self.path}")
+
+    def _load(self) -> Dict[str, dict]:
+        """Загрузить базу с диска."""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Не удалось прочитать {self.path}: {e}")
+            return {}
+
+    def _get_module_estimates(self) -> Dict[tuple, float]:
+        """Средние длительности по модулю (с браузером/устройством и без)."""
+        if self._module_estimates is not None:
+            return self._module_estimates
+
+        sums = {}
+        for key, entry in self.data.items():
+            nodeid, browser, device = self._split_key(key)
+            if nodeid is None:
+                continue
+            module = self.get_module(nodeid)
+            for group in ((module, browser, device), (module, None, None)):
+                total, count = sums.get(group, (0.0, 0))
+                sums[group] = (total + entry["duration"], count + 1)
+
+        self._module_estimates = {
+            group: total / count for group, (total, count) in sums.items()
+        }
+        return self._module_estimates
+
+    @staticmethod
+    def _split_key(key: str) -> tuple:
+        """Разобрать ключ записи на (nodeid, browser, device)."""
+        parts = key.rsplit("|", 2)
+        if len(parts) != 3:
+            return None, None, None
+        return parts[0], parts[1], parts[2]
+
+
+def get_nodeid_browser(nodeid: str, default: Optional[str] = "unknown") -> str:
+    """
+    Определить браузер по nodeid (pytest-playwright добавляет его в параметры).
+
+    Args:
+        nodeid: nodeid теста, например tests/ui/...::test_x[chromium-map]
+        default: Значение, если браузер не найден
+
+    Returns:
+        str: chromium, firefox, webkit или default
+    """
+    if "[" not in nodeid:
+        return default
+    params = nodeid[nodeid.index("[") + 1 : -1].split("-")
+    for name in ("chromium", "firefox", "webkit"):
+        if name in params:
+            return name
+    return default
@@ -0,0 +1,208 @@
+"""Доступные апартаменты проектов без поиска по каталогу в UI."""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.api_client import APIClient, parse_body
+from utils.catalog_crawler import find_inventory_apartments
+from utils.catalog_schemas import UNITS_SCHEMA
+from utils.json_schema import format_errors, validate
+from utils.logger import get_logger
+
+# Endpoint списка апартаментов проекта относительно CATALOG_API_URL
+DEFAULT_UNITS_ENDPOINT = "/projects/{project}/units"
+
+# Статусы доступного для просмотра апартамента в ответе API
+AVAILABLE_STATUSES = {"available", "free", "on_sale", "for_sale"}
+
+# Ключи, под которыми API может вернуть список апартаментов
+_LIST_KEYS = ("data", "items", "units", "results")
+# Ключи идентификатора апартамента (как в URL /apartment/{id})
+_ID_KEYS = ("id", "slug", "apartment", "number")
+
+
+def parse_units(body: Any) -> List[str]:
+    """
+    Доступные апартаменты из ответа API каталога.
+
+    Ответ - список апартаментов или объект со списком в data/items/units/results.
+    Доступность решает самое конкретное из полей апартамента: available,
+    если есть; иначе status (из AVAILABLE_STATUSES); иначе locked = false.
+    Апартамент без этих полей недоступен.
+
+    Args:
+        body: Разобранный JSON ответа
+
+    Returns:
+        List[str]: Идентификаторы доступных апартаментов в порядке ответа
+    """
+    if isinstance(body, dict):
+        body = next(
+            (body[key] for key in _LIST_KEYS if isinstance(body.get(key), list)), []
+        )
+    if not isinstance(body, list):
+        return []
+
+    units = []
+    for unit in body:
+        if not isinstance(unit, dict):
+            continue
+        unit_id = next(
+            (unit[key] for key in _ID_KEYS if unit.get(key) not in (None, "")), None
+        )
+        if unit_id is not None and _is_available(unit):
+            units.append(str(unit_id))
+    return units
+
+
+def _is_available(unit: Dict) -> bool:
+    """Доступен ли апартамент: available, затем status, затем locked."""
+    if unit.get("available") is not None:
+        return unit["available"] is True
+    if unit.get("status") not in (None, ""):
+        return str(unit["status"]).lower() in AVAILABLE_STATUSES
+    return unit.get("locked") is False
+
+
+class AvailableUnitsProvider:
+    """
+    Источник доступных апартаментов для тестов.
+
+    Ответственность:
+    - Запрос доступных апартаментов у API каталога (APIClient)
+    - Инвентарь utils.catalog_crawler, если API не настроен или не ответил
+    - Кэш ответа на сессию с TTL, общий для всех тестов процесса
+
+    API включается переменной CATALOG_API_URL, путь задает
+    CATALOG_UNITS_ENDPOINT ({project} - имя проекта), TTL кэша - UNITS_CACHE_TTL.
+    Если источник ничего не знает, тест ищет апартамент в UI как раньше.
+    """
+
+    DEFAULT_TTL = 600
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        api_url: str = None,
+        endpoint: str = None,
+        ttl: float = None,
+        client: APIClient = None,
+    ):
+        """
+        Инициализация.
+
+        Args:
+            api_url: Базовый URL API каталога (по умолчанию CATALOG_API_URL)
+            endpoint: Путь списка апартаментов (по умолчанию CATALOG_UNITS_ENDPOINT)
+            ttl: Время жизни кэша, секунды (по умолчанию UNITS_CACHE_TTL)
+            client: Готовый APIClient (например, с токеном авторизации)
+        """
+        self.api_url = api_url or os.getenv("CATALOG_API_URL")
+        self.endpoint = endpoint or os.getenv(
+            "CATALOG_UNITS_ENDPOINT", DEFAULT_UNITS_ENDPOINT
+        )
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else float(os.getenv("UNITS_CACHE_TTL", self.DEFAULT_TTL))
+        )
+        self.client = client or (APIClient(self.api_url) if self.api_url else None)
+        self.logger = get_logger("AvailableUnitsProvider")
+
+        # (окружение, проект) -> (время запроса, апартаменты)
+        self._cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "AvailableUnitsProvider":
+        """Общий экземпляр на процесс: кэш переживает отдельные тесты."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get_available_units(self, project: str) -> List[str]:
+        """
+        Доступные апартаменты проекта (из кэша, пока не истек TTL).
+
+        Args:
+            project: Проект (arisha, elire, mark...)
+
+        Returns:
+            List[str]: Идентификаторы апартаментов (пусто - источник не знает)
+        """
+        key = (os.getenv("TEST_ENVIRONMENT", "dev"), project.lower())
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.ttl:
+                return list(cached[1])
+
+        units = self._fetch(project.lower())
+        with self._lock:
+            self._cache[key] = (time.monotonic(), units)
+        return list(units)
+
+    def get_available_unit(self, project: str) -> Optional[str]:
+        """Первый доступный апартамент проекта или None."""
+        units = self.get_available_units(project)
+        return units[0] if units else None
+
+    def invalidate(self, project: str, unit: str = None):
+        """
+        Убрать апартамент из кэша (по прямой ссылке он не открылся).
+
+        Args:
+            project: Проект
+            unit: Апартамент (None - сбросить кэш проекта целиком)
+        """
+        key = (os.getenv("TEST_ENVIRONMENT", "dev"), project.lower())
+        with self._lock:
+            if unit is None or key not in self._cache:
+                self._cache.pop(key, None)
+                return
+            fetched_at, units = self._cache[key]
+            self._cache[key] = (fetched_at, [u for u in units if u != unit])
+
+    # ==================== ВНУТРЕННИЕ МЕТОДЫ ====================
+
+    def _fetch(self, project: str) -> List[str]:
+        """Спросить API, а если он не настроен или не ответил - инвентарь."""
+        units = self._fetch_from_api(project)
+        if units:
+            return units
+        units = find_inventory_apartments(project)
+        if units:
+            self.logger.info(
+                f"{project}: {len(units)} апартаментов из инвентаря обхода"
+            )
+        return units
+
+    def _fetch_from_api(self, project: str) -> List[str]:
+        """Доступные апартаменты из API каталога."""
+        if not self.client:
+            return []
+        endpoint = self.endpoint.format(project=project)
+        try:
+            response = self.client.get(endpoint)
+        except Exception as e:
+            self.logger.warning(f"API каталога недоступно ({endpoint}): {e}")
+            return []
+        if response.status_code != 200:
+            self.logger.warning(
+                f"API каталога вернуло {response.status_code} для {endpoint}"
+            )
+            return []
+        body = parse_body(response)
+        errors = validate(body, UNITS_SCHEMA)
+        if errors:
+            self.logger.warning(
+                f"Ответ {endpoint} не соответствует схеме {UNITS_SCHEMA['$id']}:\n"
+                f"{format_errors(errors, limit=5)}"
+            )
+        units = parse_units(body)
+        self.logger.info(f"{project}: {len(units)} доступных апартаментов из API")
+        return units